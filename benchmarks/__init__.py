@@ -0,0 +1,3 @@
+"""
+Performance benchmarks for DoubleML, run with airspeed velocity (asv), see ``asv.conf.json``.
+"""
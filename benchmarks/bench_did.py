@@ -0,0 +1,24 @@
+import doubleml as dml
+from doubleml.datasets import make_did_SZ2020
+
+from .common import _DoubleMLSuite, ml_regressor, ml_classifier, N_OBS, N_FOLDS, N_REP, N_JOBS
+
+
+class DID(_DoubleMLSuite):
+    # the number of covariates is fixed by the data generating process
+    params = (N_OBS, N_FOLDS, N_REP, N_JOBS)
+    param_names = ['n_obs', 'n_folds', 'n_rep', 'n_jobs']
+
+    def make_data(self, n_obs, **param_dict):
+        return make_did_SZ2020(n_obs=n_obs)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLDID(dml_data, ml_regressor(), ml_classifier(), n_folds=n_folds, n_rep=n_rep)
+
+
+class DIDCS(DID):
+    def make_data(self, n_obs, **param_dict):
+        return make_did_SZ2020(n_obs=n_obs, cross_sectional_data=True)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLDIDCS(dml_data, ml_regressor(), ml_classifier(), n_folds=n_folds, n_rep=n_rep)
@@ -0,0 +1,108 @@
+import numpy as np
+
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+from doubleml import DoubleMLFramework
+from doubleml.utils.resampling import DoubleMLResampling, DoubleMLClusterResampling
+from doubleml.utils._estimation import _dml_cv_predict, _var_est
+
+from .common import SEED, N_OBS, DIM_X, N_FOLDS, N_JOBS, N_WAY_CLUSTER
+
+
+class CVPredict:
+    params = (N_OBS, DIM_X, N_FOLDS, N_JOBS, ['predict', 'predict_proba'])
+    param_names = ['n_obs', 'dim_x', 'n_folds', 'n_jobs', 'method']
+    timeout = 600
+
+    def setup(self, n_obs, dim_x, n_folds, n_jobs, method):
+        rng = np.random.default_rng(SEED)
+        self.x = rng.normal(size=(n_obs, dim_x))
+        linear_predictor = self.x[:, 0] + rng.normal(size=n_obs)
+        if method == 'predict':
+            self.learner = LinearRegression()
+            self.y = linear_predictor
+        else:
+            self.learner = LogisticRegression()
+            self.y = (linear_predictor > 0).astype(float)
+        np.random.seed(SEED)
+        self.smpls = DoubleMLResampling(n_folds=n_folds, n_rep=1, n_obs=n_obs, stratify=None).split_samples()[0]
+
+    def time_cv_predict(self, n_obs, dim_x, n_folds, n_jobs, method):
+        _dml_cv_predict(self.learner, self.x, self.y, smpls=self.smpls, n_jobs=n_jobs, method=method)
+
+    def time_cv_predict_return_models(self, n_obs, dim_x, n_folds, n_jobs, method):
+        _dml_cv_predict(self.learner, self.x, self.y, smpls=self.smpls, n_jobs=n_jobs, method=method,
+                        return_models=True)
+
+    def peakmem_cv_predict(self, n_obs, dim_x, n_folds, n_jobs, method):
+        _dml_cv_predict(self.learner, self.x, self.y, smpls=self.smpls, n_jobs=n_jobs, method=method)
+
+
+class VarEst:
+    params = (N_OBS, N_FOLDS, [0] + N_WAY_CLUSTER)
+    param_names = ['n_obs', 'n_folds', 'n_way_cluster']
+
+    def setup(self, n_obs, n_folds, n_way_cluster):
+        rng = np.random.default_rng(SEED)
+        self.psi = rng.normal(size=n_obs)
+        self.psi_deriv = -np.ones(n_obs)
+        np.random.seed(SEED)
+        if n_way_cluster == 0:
+            self.cluster_vars = None
+            self.smpls = DoubleMLResampling(n_folds=n_folds, n_rep=1, n_obs=n_obs, stratify=None).split_samples()[0]
+            self.smpls_cluster = None
+        else:
+            n_clusters = int(np.sqrt(n_obs))
+            self.cluster_vars = rng.integers(n_clusters, size=(n_obs, n_way_cluster))
+            resampling = DoubleMLClusterResampling(n_folds=n_folds, n_rep=1, n_obs=n_obs, n_cluster_vars=n_way_cluster,
+                                                   cluster_vars=self.cluster_vars)
+            all_smpls, all_smpls_cluster = resampling.split_samples()
+            self.smpls = all_smpls[0]
+            self.smpls_cluster = all_smpls_cluster[0]
+
+    def time_var_est(self, n_obs, n_folds, n_way_cluster):
+        _var_est(self.psi, self.psi_deriv, self.smpls, is_cluster_data=n_way_cluster > 0,
+                 cluster_vars=self.cluster_vars, smpls_cluster=self.smpls_cluster, n_folds_per_cluster=n_folds)
+
+
+class Framework:
+    params = (N_OBS, [1, 10], [1, 3], ['normal', 'Bayes', 'wild'])
+    param_names = ['n_obs', 'n_thetas', 'n_rep', 'method']
+    timeout = 600
+
+    def setup(self, n_obs, n_thetas, n_rep, method):
+        rng = np.random.default_rng(SEED)
+        scaled_psi = rng.normal(size=(n_obs, n_thetas, n_rep))
+        all_thetas = rng.normal(size=(n_thetas, n_rep))
+        all_ses = np.sqrt(np.mean(np.square(scaled_psi), axis=0) / n_obs)
+        self.doubleml_dict = {
+            'thetas': np.median(all_thetas, axis=1),
+            'all_thetas': all_thetas,
+            'ses': np.median(all_ses, axis=1),
+            'all_ses': all_ses,
+            'var_scaling_factors': np.full(n_thetas, n_obs),
+            'scaled_psi': scaled_psi,
+        }
+        np.random.seed(SEED)
+        self.framework = DoubleMLFramework(self.doubleml_dict)
+        self.framework.bootstrap(method=method, n_rep_boot=500)
+
+    def time_bootstrap(self, n_obs, n_thetas, n_rep, method):
+        np.random.seed(SEED)
+        self.framework.bootstrap(method=method, n_rep_boot=500)
+
+    def peakmem_bootstrap(self, n_obs, n_thetas, n_rep, method):
+        np.random.seed(SEED)
+        self.framework.bootstrap(method=method, n_rep_boot=500)
+
+    def time_confint_joint(self, n_obs, n_thetas, n_rep, method):
+        self.framework.confint(joint=True)
+
+    def time_p_adjust_romano_wolf(self, n_obs, n_thetas, n_rep, method):
+        self.framework.p_adjust(method='romano-wolf')
+
+    def time_p_adjust_holm(self, n_obs, n_thetas, n_rep, method):
+        self.framework.p_adjust(method='holm')
+
+    def time_framework(self, n_obs, n_thetas, n_rep, method):
+        DoubleMLFramework(self.doubleml_dict)
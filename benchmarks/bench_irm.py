@@ -0,0 +1,69 @@
+import doubleml as dml
+from doubleml.datasets import make_irm_data, make_iivm_data, make_ssm_data, make_irm_data_discrete_treatments
+
+from .common import _DoubleMLSuite, ml_regressor, ml_classifier, N_OBS, N_FOLDS, N_REP, N_JOBS
+
+
+class IRM(_DoubleMLSuite):
+    def make_data(self, n_obs, dim_x, **param_dict):
+        return make_irm_data(n_obs=n_obs, dim_x=dim_x)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLIRM(dml_data, ml_regressor(), ml_classifier(), n_folds=n_folds, n_rep=n_rep)
+
+
+class IIVM(_DoubleMLSuite):
+    def make_data(self, n_obs, dim_x, **param_dict):
+        return make_iivm_data(n_obs=n_obs, dim_x=dim_x)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLIIVM(dml_data, ml_regressor(), ml_classifier(), ml_classifier(), n_folds=n_folds, n_rep=n_rep)
+
+
+class APOS(_DoubleMLSuite):
+    # the number of covariates is fixed by the data generating process
+    params = (N_OBS, N_FOLDS, N_REP, N_JOBS)
+    param_names = ['n_obs', 'n_folds', 'n_rep', 'n_jobs']
+
+    def make_data(self, n_obs, **param_dict):
+        data = make_irm_data_discrete_treatments(n_obs=n_obs, n_levels=3)
+        return dml.DoubleMLData.from_arrays(data['x'], data['y'], data['d'])
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLAPOS(dml_data, ml_regressor(), ml_classifier(), treatment_levels=[0, 1, 2],
+                                n_folds=n_folds, n_rep=n_rep)
+
+
+class QTE(_DoubleMLSuite):
+    def make_data(self, n_obs, dim_x, **param_dict):
+        return make_irm_data(n_obs=n_obs, dim_x=dim_x)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLQTE(dml_data, ml_classifier(), ml_classifier(), quantiles=[0.25, 0.5, 0.75],
+                               n_folds=n_folds, n_rep=n_rep)
+
+
+class PQ(QTE):
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLPQ(dml_data, ml_classifier(), ml_classifier(), n_folds=n_folds, n_rep=n_rep)
+
+
+class LPQ(_DoubleMLSuite):
+    def make_data(self, n_obs, dim_x, **param_dict):
+        return make_iivm_data(n_obs=n_obs, dim_x=dim_x)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLLPQ(dml_data, ml_classifier(), ml_classifier(), n_folds=n_folds, n_rep=n_rep)
+
+
+class CVAR(QTE):
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLCVAR(dml_data, ml_regressor(), ml_classifier(), n_folds=n_folds, n_rep=n_rep)
+
+
+class SSM(_DoubleMLSuite):
+    def make_data(self, n_obs, dim_x, **param_dict):
+        return make_ssm_data(n_obs=n_obs, dim_x=dim_x, mar=True)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLSSM(dml_data, ml_regressor(), ml_classifier(), ml_classifier(), n_folds=n_folds, n_rep=n_rep)
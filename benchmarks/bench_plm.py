@@ -0,0 +1,56 @@
+import numpy as np
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_pliv_CHS2015, make_pliv_multiway_cluster_CKMS2021
+
+from .common import _DoubleMLSuite, ml_regressor, N_OBS, DIM_X, N_FOLDS, N_REP, N_JOBS, N_WAY_CLUSTER
+
+
+def _make_cluster_data(n_obs, dim_x, n_way_cluster, instrument):
+    n_clusters = int(np.sqrt(n_obs))
+    df = make_pliv_multiway_cluster_CKMS2021(N=n_clusters, M=n_clusters, dim_X=dim_x, return_type='DataFrame')
+    cluster_cols = ['cluster_var_i', 'cluster_var_j'][:n_way_cluster]
+    x_cols = [f'X{i + 1}' for i in range(dim_x)]
+    z_cols = 'Z' if instrument else None
+    return dml.DoubleMLClusterData(df, 'Y', 'D', cluster_cols, x_cols, z_cols)
+
+
+class PLR(_DoubleMLSuite):
+    def make_data(self, n_obs, dim_x, **param_dict):
+        return make_plr_CCDDHNR2018(n_obs=n_obs, dim_x=dim_x)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLPLR(dml_data, ml_regressor(), ml_regressor(), n_folds=n_folds, n_rep=n_rep)
+
+
+class PLRIVType(PLR):
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLPLR(dml_data, ml_regressor(), ml_regressor(), ml_regressor(),
+                               n_folds=n_folds, n_rep=n_rep, score='IV-type')
+
+
+class PLRCluster(_DoubleMLSuite):
+    params = (N_OBS, DIM_X, N_FOLDS, N_REP, N_JOBS, N_WAY_CLUSTER)
+    param_names = ['n_obs', 'dim_x', 'n_folds', 'n_rep', 'n_jobs', 'n_way_cluster']
+
+    def make_data(self, n_obs, dim_x, n_way_cluster, **param_dict):
+        return _make_cluster_data(n_obs, dim_x, n_way_cluster, instrument=False)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLPLR(dml_data, ml_regressor(), ml_regressor(), n_folds=n_folds, n_rep=n_rep)
+
+
+class PLIV(_DoubleMLSuite):
+    def make_data(self, n_obs, dim_x, **param_dict):
+        return make_pliv_CHS2015(n_obs=n_obs, dim_x=dim_x, dim_z=1)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLPLIV(dml_data, ml_regressor(), ml_regressor(), ml_regressor(), n_folds=n_folds, n_rep=n_rep)
+
+
+class PLIVCluster(PLRCluster):
+    def make_data(self, n_obs, dim_x, n_way_cluster, **param_dict):
+        return _make_cluster_data(n_obs, dim_x, n_way_cluster, instrument=True)
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        return dml.DoubleMLPLIV(dml_data, ml_regressor(), ml_regressor(), ml_regressor(), n_folds=n_folds, n_rep=n_rep)
@@ -0,0 +1,56 @@
+import numpy as np
+
+from sklearn.dummy import DummyClassifier, DummyRegressor
+
+# seed for the data generating processes and the sample splitting
+SEED = 3141
+
+N_OBS = [1000, 10000]
+DIM_X = [10, 50]
+N_FOLDS = [2, 5]
+N_REP = [1, 3]
+N_JOBS = [1, 2]
+N_WAY_CLUSTER = [1, 2]
+
+
+def ml_regressor():
+    # constant learners isolate the overhead of the package from the cost of the learners
+    return DummyRegressor(strategy='mean')
+
+
+def ml_classifier():
+    return DummyClassifier(strategy='prior')
+
+
+class _DoubleMLSuite:
+    """Base class for benchmarks of the ``fit()`` method of a DoubleML model.
+
+    Subclasses set ``params`` and ``param_names`` and implement ``make_data()`` and ``make_model()``. The parameters
+    ``n_folds``, ``n_rep`` and ``n_jobs`` are handled by the base class.
+    """
+    params = (N_OBS, DIM_X, N_FOLDS, N_REP, N_JOBS)
+    param_names = ['n_obs', 'dim_x', 'n_folds', 'n_rep', 'n_jobs']
+    timeout = 600
+
+    def setup(self, *params):
+        self.param_dict = dict(zip(self.param_names, params))
+        np.random.seed(SEED)
+        self.dml_data = self.make_data(**self.param_dict)
+
+    def make_data(self, **param_dict):
+        raise NotImplementedError
+
+    def make_model(self, dml_data, n_folds, n_rep, **param_dict):
+        raise NotImplementedError
+
+    def fit(self):
+        np.random.seed(SEED)
+        dml_obj = self.make_model(self.dml_data, **self.param_dict)
+        dml_obj.fit(n_jobs_cv=self.param_dict['n_jobs'])
+        return dml_obj
+
+    def time_fit(self, *params):
+        self.fit()
+
+    def peakmem_fit(self, *params):
+        self.fit()
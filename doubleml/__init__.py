@@ -1,3 +1,4 @@
+import importlib
 import importlib.metadata
 
 from .double_ml_framework import concat
@@ -43,3 +44,10 @@ __all__ = [
 ]
 
 __version__ = importlib.metadata.version('doubleml')
+
+
+def __getattr__(name):
+    # the dataset helpers are not needed for the estimation and are only imported on first access
+    if name == 'datasets':
+        return importlib.import_module('.datasets', __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
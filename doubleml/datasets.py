@@ -129,7 +129,84 @@ def _m(x, nu=0., gamma=1.):
     return 0.5/np.pi*(np.sinh(gamma))/(np.cosh(gamma)-np.cos(x-nu))
 
 
-def make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type='DoubleMLData', **kwargs):
+# number of observations which are drawn with the same random generator in the seeded simulations, such that the
+# simulated observations neither depend on n_obs nor on the chunk_size
+_SIMULATION_BLOCK_SIZE = 2 ** 14
+
+
+def _seed_sequence(random_state):
+    # None refers to the global random state of numpy (np.random.seed)
+    if random_state is None or isinstance(random_state, np.random.SeedSequence):
+        return random_state
+    if isinstance(random_state, np.random.Generator):
+        return np.random.SeedSequence(random_state.integers(2 ** 63))
+    if isinstance(random_state, bool) or not isinstance(random_state, (int, np.integer)):
+        raise TypeError('random_state must be None, an integer, a numpy.random.SeedSequence or a numpy.random.Generator. '
+                        f'Got {str(random_state)}.')
+    return np.random.SeedSequence(random_state)
+
+
+def _block_rng(seed_sequence, block):
+    # the generator of each block of observations is spawned from the seed sequence of the simulation
+    block_seed_sequence = np.random.SeedSequence(seed_sequence.entropy, spawn_key=seed_sequence.spawn_key + (block, ))
+    return np.random.default_rng(block_seed_sequence)
+
+
+def _toeplitz_normal(rng, n_obs, dim, rho, scale=1.):
+    # draws from N(0, scale^2 * Sigma) with Sigma_kj = rho^|j-k|; the global random state uses the dense covariance
+    # (reproducing the data of earlier versions), generators use the AR(1) recursion over the columns in O(n_obs * dim)
+    if rng is np.random:
+        cov_mat = np.power(scale, 2) * toeplitz([np.power(rho, k) for k in range(dim)])
+        return np.random.multivariate_normal(np.zeros(dim), cov_mat, size=[n_obs, ])
+    x = rng.standard_normal(size=(dim, n_obs))
+    innovation_scale = np.sqrt(1 - np.power(rho, 2))
+    for k in range(1, dim):
+        x[k, :] = rho * x[k - 1, :] + innovation_scale * x[k, :]
+    return scale * x.T
+
+
+def _simulate_rows(draw, seed_sequence, start, stop, cache=None):
+    # observations start, ..., stop - 1 of the seeded simulation; each block of observations is drawn with its own
+    # generator, the blocks of the previous call can be reused via the cache
+    blocks = range(start // _SIMULATION_BLOCK_SIZE, (stop - 1) // _SIMULATION_BLOCK_SIZE + 1)
+    if cache is None:
+        cache = dict()
+    block_arrays = [cache[block] if block in cache else draw(_block_rng(seed_sequence, block), _SIMULATION_BLOCK_SIZE)
+                    for block in blocks]
+    cache.clear()
+    cache[blocks[-1]] = block_arrays[-1]
+    offset = blocks[0] * _SIMULATION_BLOCK_SIZE
+    return tuple(np.concatenate(arrays)[start - offset:stop - offset] for arrays in zip(*block_arrays))
+
+
+def _simulate_chunks(draw, to_return_type, n_obs, seed_sequence, chunk_size):
+    cache = dict()
+    for start in range(0, n_obs, chunk_size):
+        stop = min(start + chunk_size, n_obs)
+        yield to_return_type(_simulate_rows(draw, seed_sequence, start, stop, cache), pd.RangeIndex(start, stop))
+
+
+def _simulate(draw, to_return_type, n_obs, seed_sequence, chunk_size, return_type):
+    # draw(rng, n_obs) returns the simulated arrays and to_return_type(arrays, index) converts them to the return_type
+    if seed_sequence is None:
+        if chunk_size is not None:
+            raise ValueError('A random_state has to be specified to simulate the data in chunks.')
+        return to_return_type(draw(np.random, n_obs))
+    if chunk_size is None:
+        return to_return_type(_simulate_rows(draw, seed_sequence, 0, n_obs))
+
+    if isinstance(chunk_size, bool) or not isinstance(chunk_size, (int, np.integer)) or chunk_size < 1:
+        raise ValueError(f'chunk_size must be None or a positive integer. Got {str(chunk_size)}.')
+    if return_type in _dml_data_alias:
+        raise ValueError('Chunks can only be returned as np.ndarray\'s or pd.DataFrame\'s. '
+                         f'Got return_type {str(return_type)}.')
+    if return_type not in _array_alias + _data_frame_alias:
+        raise ValueError('Invalid return_type.')
+    return _simulate_chunks(draw, to_return_type, n_obs, seed_sequence, chunk_size)
+
+
+def make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type='DoubleMLData', random_state=None, chunk_size=None,
+                         **kwargs):
     """
     Generates data from a partially linear regression model used in Chernozhukov et al. (2018) for Figure 1.
     The data generating process is defined as
@@ -165,6 +242,15 @@ def make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type='DoubleMLDa
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d)``.
+    random_state :
+        If ``None``, the data is drawn with the global random state of numpy (see ``np.random.seed``). Otherwise, an
+        integer, a ``np.random.SeedSequence`` or a ``np.random.Generator`` which determines the data independently of
+        ``n_obs`` and ``chunk_size``, i.e., the first observations coincide for different ``n_obs``; the covariates are
+        then drawn by an AR(1) recursion over the columns instead of a dense covariance matrix. Default is ``None``.
+    chunk_size :
+        If not ``None``, a generator of chunks of at most ``chunk_size`` observations in the format of ``return_type``
+        (``np.ndarray``'s or a ``pd.DataFrame`` indexed by the observations) is returned, which requires a
+        ``random_state``. Default is ``None``.
     **kwargs
         Additional keyword arguments to set non-default values for the parameters
         :math:`a_0=1`, :math:`a_1=0.25`, :math:`s_1=1`, :math:`b_0=1`, :math:`b_1=0.25` or :math:`s_2=1`.
@@ -183,26 +269,31 @@ def make_plr_CCDDHNR2018(n_obs=500, dim_x=20, alpha=0.5, return_type='DoubleMLDa
     b_1 = kwargs.get('b_1', 0.25)
     s_2 = kwargs.get('s_2', 1.)
 
-    cov_mat = toeplitz([np.power(0.7, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
-
-    d = a_0 * x[:, 0] + a_1 * np.divide(np.exp(x[:, 2]), 1 + np.exp(x[:, 2])) \
-        + s_1 * np.random.standard_normal(size=[n_obs, ])
-    y = alpha * d + b_0 * np.divide(np.exp(x[:, 0]), 1 + np.exp(x[:, 0])) \
-        + b_1 * x[:, 2] + s_2 * np.random.standard_normal(size=[n_obs, ])
+    def draw(rng, n_obs):
+        x = _toeplitz_normal(rng, n_obs, dim_x, 0.7)
 
-    if return_type in _array_alias:
+        d = a_0 * x[:, 0] + a_1 * np.divide(np.exp(x[:, 2]), 1 + np.exp(x[:, 2])) \
+            + s_1 * rng.standard_normal(size=[n_obs, ])
+        y = alpha * d + b_0 * np.divide(np.exp(x[:, 0]), 1 + np.exp(x[:, 0])) \
+            + b_1 * x[:, 2] + s_2 * rng.standard_normal(size=[n_obs, ])
         return x, y, d
-    elif return_type in _data_frame_alias + _dml_data_alias:
-        x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
-        data = pd.DataFrame(np.column_stack((x, y, d)),
-                            columns=x_cols + ['y', 'd'])
-        if return_type in _data_frame_alias:
-            return data
+
+    def to_return_type(arrays, index=None):
+        x, y, d = arrays
+        if return_type in _array_alias:
+            return x, y, d
+        elif return_type in _data_frame_alias + _dml_data_alias:
+            x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
+            data = pd.DataFrame(np.column_stack((x, y, d)),
+                                columns=x_cols + ['y', 'd'], index=index)
+            if return_type in _data_frame_alias:
+                return data
+            else:
+                return DoubleMLData(data, 'y', 'd', x_cols)
         else:
-            return DoubleMLData(data, 'y', 'd', x_cols)
-    else:
-        raise ValueError('Invalid return_type.')
+            raise ValueError('Invalid return_type.')
+
+    return _simulate(draw, to_return_type, n_obs, _seed_sequence(random_state), chunk_size, return_type)
 
 
 def make_plr_turrell2018(n_obs=100, dim_x=20, theta=0.5, return_type='DoubleMLData', **kwargs):
@@ -277,7 +368,8 @@ def make_plr_turrell2018(n_obs=100, dim_x=20, theta=0.5, return_type='DoubleMLDa
         raise ValueError('Invalid return_type.')
 
 
-def make_irm_data(n_obs=500, dim_x=20, theta=0, R2_d=0.5, R2_y=0.5, return_type='DoubleMLData'):
+def make_irm_data(n_obs=500, dim_x=20, theta=0, R2_d=0.5, R2_y=0.5, return_type='DoubleMLData', random_state=None,
+                  chunk_size=None):
     """
     Generates data from a interactive regression (IRM) model.
     The data generating process is defined as
@@ -320,6 +412,15 @@ def make_irm_data(n_obs=500, dim_x=20, theta=0, R2_d=0.5, R2_y=0.5, return_type=
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d)``.
+    random_state :
+        If ``None``, the data is drawn with the global random state of numpy (see ``np.random.seed``). Otherwise, an
+        integer, a ``np.random.SeedSequence`` or a ``np.random.Generator`` which determines the data independently of
+        ``n_obs`` and ``chunk_size``, i.e., the first observations coincide for different ``n_obs``; the covariates are
+        then drawn by an AR(1) recursion over the columns instead of a dense covariance matrix. Default is ``None``.
+    chunk_size :
+        If not ``None``, a generator of chunks of at most ``chunk_size`` observations in the format of ``return_type``
+        (``np.ndarray``'s or a ``pd.DataFrame`` indexed by the observations) is returned, which requires a
+        ``random_state``. Default is ``None``.
 
     References
     ----------
@@ -327,37 +428,44 @@ def make_irm_data(n_obs=500, dim_x=20, theta=0, R2_d=0.5, R2_y=0.5, return_type=
     High‐Dimensional Data. Econometrica, 85: 233-298.
     """
     # inspired by https://onlinelibrary.wiley.com/doi/abs/10.3982/ECTA12723, see suplement
-    v = np.random.uniform(size=[n_obs, ])
-    zeta = np.random.standard_normal(size=[n_obs, ])
-
     cov_mat = toeplitz([np.power(0.5, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
-
     beta = [1 / (k**2) for k in range(1, dim_x + 1)]
     b_sigma_b = np.dot(np.dot(cov_mat, beta), beta)
     c_y = np.sqrt(R2_y/((1-R2_y) * b_sigma_b))
     c_d = np.sqrt(np.pi**2 / 3. * R2_d/((1-R2_d) * b_sigma_b))
 
-    xx = np.exp(np.dot(x, np.multiply(beta, c_d)))
-    d = 1. * ((xx/(1+xx)) > v)
+    def draw(rng, n_obs):
+        v = rng.uniform(size=[n_obs, ])
+        zeta = rng.standard_normal(size=[n_obs, ])
 
-    y = d * theta + d * np.dot(x, np.multiply(beta, c_y)) + zeta
+        x = _toeplitz_normal(rng, n_obs, dim_x, 0.5)
 
-    if return_type in _array_alias:
+        xx = np.exp(np.dot(x, np.multiply(beta, c_d)))
+        d = 1. * ((xx/(1+xx)) > v)
+
+        y = d * theta + d * np.dot(x, np.multiply(beta, c_y)) + zeta
         return x, y, d
-    elif return_type in _data_frame_alias + _dml_data_alias:
-        x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
-        data = pd.DataFrame(np.column_stack((x, y, d)),
-                            columns=x_cols + ['y', 'd'])
-        if return_type in _data_frame_alias:
-            return data
+
+    def to_return_type(arrays, index=None):
+        x, y, d = arrays
+        if return_type in _array_alias:
+            return x, y, d
+        elif return_type in _data_frame_alias + _dml_data_alias:
+            x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
+            data = pd.DataFrame(np.column_stack((x, y, d)),
+                                columns=x_cols + ['y', 'd'], index=index)
+            if return_type in _data_frame_alias:
+                return data
+            else:
+                return DoubleMLData(data, 'y', 'd', x_cols)
         else:
-            return DoubleMLData(data, 'y', 'd', x_cols)
-    else:
-        raise ValueError('Invalid return_type.')
+            raise ValueError('Invalid return_type.')
+
+    return _simulate(draw, to_return_type, n_obs, _seed_sequence(random_state), chunk_size, return_type)
 
 
-def make_iivm_data(n_obs=500, dim_x=20, theta=1., alpha_x=0.2, return_type='DoubleMLData'):
+def make_iivm_data(n_obs=500, dim_x=20, theta=1., alpha_x=0.2, return_type='DoubleMLData', random_state=None,
+                   chunk_size=None):
     """
     Generates data from a interactive IV regression (IIVM) model.
     The data generating process is defined as
@@ -398,6 +506,15 @@ def make_iivm_data(n_obs=500, dim_x=20, theta=1., alpha_x=0.2, return_type='Doub
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d, z)``.
+    random_state :
+        If ``None``, the data is drawn with the global random state of numpy (see ``np.random.seed``). Otherwise, an
+        integer, a ``np.random.SeedSequence`` or a ``np.random.Generator`` which determines the data independently of
+        ``n_obs`` and ``chunk_size``, i.e., the first observations coincide for different ``n_obs``; the covariates are
+        then drawn by an AR(1) recursion over the columns instead of a dense covariance matrix. Default is ``None``.
+    chunk_size :
+        If not ``None``, a generator of chunks of at most ``chunk_size`` observations in the format of ``return_type``
+        (``np.ndarray``'s or a ``pd.DataFrame`` indexed by the observations) is returned, which requires a
+        ``random_state``. Default is ``None``.
 
     References
     ----------
@@ -405,34 +522,39 @@ def make_iivm_data(n_obs=500, dim_x=20, theta=1., alpha_x=0.2, return_type='Doub
     Paper No. 13-2020. Available at SSRN: http://dx.doi.org/10.2139/ssrn.3619201.
     """
     # inspired by https://papers.ssrn.com/sol3/papers.cfm?abstract_id=3619201
-    xx = np.random.multivariate_normal(np.zeros(2),
-                                       np.array([[1., 0.3], [0.3, 1.]]),
-                                       size=[n_obs, ])
-    u = xx[:, 0]
-    v = xx[:, 1]
-
-    cov_mat = toeplitz([np.power(0.5, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
-
     beta = [1 / (k**2) for k in range(1, dim_x + 1)]
 
-    z = np.random.binomial(p=0.5, n=1, size=[n_obs, ])
-    d = 1. * (alpha_x * z + v > 0)
+    def draw(rng, n_obs):
+        xx = rng.multivariate_normal(np.zeros(2),
+                                     np.array([[1., 0.3], [0.3, 1.]]),
+                                     size=[n_obs, ])
+        u = xx[:, 0]
+        v = xx[:, 1]
 
-    y = d * theta + np.dot(x, beta) + u
+        x = _toeplitz_normal(rng, n_obs, dim_x, 0.5)
 
-    if return_type in _array_alias:
+        z = rng.binomial(p=0.5, n=1, size=[n_obs, ])
+        d = 1. * (alpha_x * z + v > 0)
+
+        y = d * theta + np.dot(x, beta) + u
         return x, y, d, z
-    elif return_type in _data_frame_alias + _dml_data_alias:
-        x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
-        data = pd.DataFrame(np.column_stack((x, y, d, z)),
-                            columns=x_cols + ['y', 'd', 'z'])
-        if return_type in _data_frame_alias:
-            return data
+
+    def to_return_type(arrays, index=None):
+        x, y, d, z = arrays
+        if return_type in _array_alias:
+            return x, y, d, z
+        elif return_type in _data_frame_alias + _dml_data_alias:
+            x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
+            data = pd.DataFrame(np.column_stack((x, y, d, z)),
+                                columns=x_cols + ['y', 'd', 'z'], index=index)
+            if return_type in _data_frame_alias:
+                return data
+            else:
+                return DoubleMLData(data, 'y', 'd', x_cols, 'z')
         else:
-            return DoubleMLData(data, 'y', 'd', x_cols, 'z')
-    else:
-        raise ValueError('Invalid return_type.')
+            raise ValueError('Invalid return_type.')
+
+    return _simulate(draw, to_return_type, n_obs, _seed_sequence(random_state), chunk_size, return_type)
 
 
 def _make_pliv_data(n_obs=100, dim_x=20, theta=0.5, gamma_z=0.4, return_type='DoubleMLData'):
@@ -462,7 +584,8 @@ def _make_pliv_data(n_obs=100, dim_x=20, theta=0.5, gamma_z=0.4, return_type='Do
         raise ValueError('Invalid return_type.')
 
 
-def make_pliv_CHS2015(n_obs, alpha=1., dim_x=200, dim_z=150, return_type='DoubleMLData'):
+def make_pliv_CHS2015(n_obs, alpha=1., dim_x=200, dim_z=150, return_type='DoubleMLData', random_state=None,
+                      chunk_size=None):
     """
     Generates data from a partially linear IV regression model used in Chernozhukov, Hansen and Spindler (2015).
     The data generating process is defined as
@@ -505,6 +628,15 @@ def make_pliv_CHS2015(n_obs, alpha=1., dim_x=200, dim_z=150, return_type='Double
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d, z)``.
+    random_state :
+        If ``None``, the data is drawn with the global random state of numpy (see ``np.random.seed``). Otherwise, an
+        integer, a ``np.random.SeedSequence`` or a ``np.random.Generator`` which determines the data independently of
+        ``n_obs`` and ``chunk_size``, i.e., the first observations coincide for different ``n_obs``; the covariates are
+        then drawn by an AR(1) recursion over the columns instead of a dense covariance matrix. Default is ``None``.
+    chunk_size :
+        If not ``None``, a generator of chunks of at most ``chunk_size`` observations in the format of ``return_type``
+        (``np.ndarray``'s or a ``pd.DataFrame`` indexed by the observations) is returned, which requires a
+        ``random_state``. Default is ``None``.
 
     References
     ----------
@@ -513,44 +645,44 @@ def make_pliv_CHS2015(n_obs, alpha=1., dim_x=200, dim_z=150, return_type='Double
     """
     assert dim_x >= dim_z
     # see https://assets.aeaweb.org/asset-server/articles-attachments/aer/app/10505/P2015_1022_app.pdf
-    xx = np.random.multivariate_normal(np.zeros(2),
-                                       np.array([[1., 0.6], [0.6, 1.]]),
-                                       size=[n_obs, ])
-    epsilon = xx[:, 0]
-    u = xx[:, 1]
-
-    sigma = toeplitz([np.power(0.5, k) for k in range(0, dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x),
-                                      sigma,
-                                      size=[n_obs, ])
-
-    I_z = np.eye(dim_z)
-    xi = np.random.multivariate_normal(np.zeros(dim_z),
-                                       0.25*I_z,
-                                       size=[n_obs, ])
-
     beta = [1 / (k**2) for k in range(1, dim_x + 1)]
     gamma = beta
     delta = [1 / (k**2) for k in range(1, dim_z + 1)]
-    Pi = np.hstack((I_z, np.zeros((dim_z, dim_x-dim_z))))
-
-    z = np.dot(x, np.transpose(Pi)) + xi
-    d = np.dot(x, gamma) + np.dot(z, delta) + u
-    y = alpha * d + np.dot(x, beta) + epsilon
 
-    if return_type in _array_alias:
+    def draw(rng, n_obs):
+        xx = rng.multivariate_normal(np.zeros(2),
+                                     np.array([[1., 0.6], [0.6, 1.]]),
+                                     size=[n_obs, ])
+        epsilon = xx[:, 0]
+        u = xx[:, 1]
+
+        x = _toeplitz_normal(rng, n_obs, dim_x, 0.5)
+        # xi ~ N(0, 0.25 * I_z)
+        xi = _toeplitz_normal(rng, n_obs, dim_z, 0., scale=0.5)
+
+        # Pi = (I_z, 0) selects the first dim_z covariates
+        z = x[:, :dim_z] + xi
+        d = np.dot(x, gamma) + np.dot(z, delta) + u
+        y = alpha * d + np.dot(x, beta) + epsilon
         return x, y, d, z
-    elif return_type in _data_frame_alias + _dml_data_alias:
-        x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
-        z_cols = [f'Z{i + 1}' for i in np.arange(dim_z)]
-        data = pd.DataFrame(np.column_stack((x, y, d, z)),
-                            columns=x_cols + ['y', 'd'] + z_cols)
-        if return_type in _data_frame_alias:
-            return data
+
+    def to_return_type(arrays, index=None):
+        x, y, d, z = arrays
+        if return_type in _array_alias:
+            return x, y, d, z
+        elif return_type in _data_frame_alias + _dml_data_alias:
+            x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
+            z_cols = [f'Z{i + 1}' for i in np.arange(dim_z)]
+            data = pd.DataFrame(np.column_stack((x, y, d, z)),
+                                columns=x_cols + ['y', 'd'] + z_cols, index=index)
+            if return_type in _data_frame_alias:
+                return data
+            else:
+                return DoubleMLData(data, 'y', 'd', x_cols, z_cols)
         else:
-            return DoubleMLData(data, 'y', 'd', x_cols, z_cols)
-    else:
-        raise ValueError('Invalid return_type.')
+            raise ValueError('Invalid return_type.')
+
+    return _simulate(draw, to_return_type, n_obs, _seed_sequence(random_state), chunk_size, return_type)
 
 
 def make_pliv_multiway_cluster_CKMS2021(N=25, M=25, dim_X=100, theta=1., return_type='DoubleMLClusterData', **kwargs):
@@ -709,7 +841,8 @@ def make_pliv_multiway_cluster_CKMS2021(N=25, M=25, dim_X=100, theta=1., return_
         raise ValueError('Invalid return_type.')
 
 
-def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_type='DoubleMLData', **kwargs):
+def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_type='DoubleMLData', random_state=None,
+                    chunk_size=None, **kwargs):
     """
     Generates data from a difference-in-differences model used in Sant'Anna and Zhao (2020).
     The data generating process is defined as follows. For a generic :math:`W=(W_1, W_2, W_3, W_4)^T`, let
@@ -785,6 +918,16 @@ def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_ty
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d)``
         or ``(x, y, d, t)``.
+    random_state :
+        If ``None``, the data is drawn with the global random state of numpy (see ``np.random.seed``). Otherwise, an
+        integer, a ``np.random.SeedSequence`` or a ``np.random.Generator`` which determines the data independently of
+        ``chunk_size``; the covariates are then drawn by an AR(1) recursion over the columns instead of a dense
+        covariance matrix and :math:`\\tilde{Z}` is standardized with the moments of all ``n_obs`` observations.
+        Default is ``None``.
+    chunk_size :
+        If not ``None``, a generator of chunks of at most ``chunk_size`` observations in the format of ``return_type``
+        (``np.ndarray``'s or a ``pd.DataFrame`` indexed by the observations) is returned, which requires a
+        ``random_state``. Default is ``None``.
     **kwargs
         Additional keyword arguments to set non-default values for the parameter
         :math:`xi=0.75`, :math:`c=0.0` and :math:`\\lambda_T=0.5`.
@@ -808,93 +951,104 @@ def make_did_SZ2020(n_obs=500, dgp_type=1, cross_sectional_data=False, return_ty
         return res
 
     dim_x = 4
-    cov_mat = toeplitz([np.power(c, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
-
-    z_tilde_1 = np.exp(0.5*x[:, 0])
-    z_tilde_2 = 10 + x[:, 1] / (1 + np.exp(x[:, 0]))
-    z_tilde_3 = (0.6 + x[:, 0]*x[:, 2]/25)**3
-    z_tilde_4 = (20 + x[:, 1] + x[:, 3])**2
+    if dgp_type not in range(1, 7):
+        raise ValueError('The dgp_type is not valid.')
 
-    z_tilde = np.column_stack((z_tilde_1, z_tilde_2, z_tilde_3, z_tilde_4))
-    z = (z_tilde - np.mean(z_tilde, axis=0)) / np.std(z_tilde, axis=0)
+    seed_sequence = _seed_sequence(random_state)
+    if seed_sequence is not None:
+        # the standardization uses the moments of all n_obs observations, such that the chunks are identical to the
+        # corresponding rows of the data simulated at once
+        z_moments = _did_z_moments(seed_sequence, n_obs, c)
 
-    # error terms
-    epsilon_0 = np.random.normal(loc=0, scale=1, size=n_obs)
-    epsilon_1 = np.random.normal(loc=0, scale=1, size=[n_obs, 2])
+    def draw(rng, n_obs):
+        x = _toeplitz_normal(rng, n_obs, dim_x, c)
 
-    if dgp_type == 1:
-        features_ps = z
-        features_reg = z
-    elif dgp_type == 2:
-        features_ps = x
-        features_reg = z
-    elif dgp_type == 3:
-        features_ps = z
-        features_reg = x
-    elif dgp_type == 4:
-        features_ps = x
-        features_reg = x
-    elif dgp_type == 5:
-        features_ps = None
-        features_reg = z
-    elif dgp_type == 6:
-        features_ps = None
-        features_reg = x
-    else:
-        raise ValueError('The dgp_type is not valid.')
-
-    # treatment and propensities
-    is_experimental = (dgp_type == 5) or (dgp_type == 6)
-    if is_experimental:
-        # Set D to be experimental
-        p = 0.5 * np.ones(n_obs)
-    else:
-        p = np.exp(f_ps(features_ps, xi)) / (1 + np.exp(f_ps(features_ps, xi)))
-    u = np.random.uniform(low=0, high=1, size=n_obs)
-    d = 1.0 * (p >= u)
+        z_tilde = _did_z_tilde(x)
+        if seed_sequence is None:
+            z = (z_tilde - np.mean(z_tilde, axis=0)) / np.std(z_tilde, axis=0)
+        else:
+            z = (z_tilde - z_moments[0]) / z_moments[1]
 
-    # potential outcomes
-    nu = np.random.normal(loc=d*f_reg(features_reg), scale=1, size=n_obs)
-    y0 = f_reg(features_reg) + nu + epsilon_0
-    y1_d0 = 2 * f_reg(features_reg) + nu + epsilon_1[:, 0]
-    y1_d1 = 2 * f_reg(features_reg) + nu + epsilon_1[:, 1]
-    y1 = d * y1_d1 + (1-d) * y1_d0
+        # error terms
+        epsilon_0 = rng.normal(loc=0, scale=1, size=n_obs)
+        epsilon_1 = rng.normal(loc=0, scale=1, size=[n_obs, 2])
 
-    if not cross_sectional_data:
-        y = y1 - y0
+        features_ps = {1: z, 2: x, 3: z, 4: x, 5: None, 6: None}[dgp_type]
+        features_reg = {1: z, 2: z, 3: x, 4: x, 5: z, 6: x}[dgp_type]
 
-        if return_type in _array_alias:
+        # treatment and propensities
+        is_experimental = (dgp_type == 5) or (dgp_type == 6)
+        if is_experimental:
+            # Set D to be experimental
+            p = 0.5 * np.ones(n_obs)
+        else:
+            p = np.exp(f_ps(features_ps, xi)) / (1 + np.exp(f_ps(features_ps, xi)))
+        u = rng.uniform(low=0, high=1, size=n_obs)
+        d = 1.0 * (p >= u)
+
+        # potential outcomes
+        nu = rng.normal(loc=d*f_reg(features_reg), scale=1, size=n_obs)
+        y0 = f_reg(features_reg) + nu + epsilon_0
+        y1_d0 = 2 * f_reg(features_reg) + nu + epsilon_1[:, 0]
+        y1_d1 = 2 * f_reg(features_reg) + nu + epsilon_1[:, 1]
+        y1 = d * y1_d1 + (1-d) * y1_d0
+
+        if not cross_sectional_data:
+            y = y1 - y0
             return z, y, d
-        elif return_type in _data_frame_alias + _dml_data_alias:
-            z_cols = [f'Z{i + 1}' for i in np.arange(dim_x)]
-            data = pd.DataFrame(np.column_stack((z, y, d)),
-                                columns=z_cols + ['y', 'd'])
-            if return_type in _data_frame_alias:
-                return data
-            else:
-                return DoubleMLData(data, 'y', 'd', z_cols)
         else:
-            raise ValueError('Invalid return_type.')
-
-    else:
-        u_t = np.random.uniform(low=0, high=1, size=n_obs)
-        t = 1.0 * (u_t <= lambda_t)
-        y = t * y1 + (1-t)*y0
+            u_t = rng.uniform(low=0, high=1, size=n_obs)
+            t = 1.0 * (u_t <= lambda_t)
+            y = t * y1 + (1-t)*y0
+            return z, y, d, t
 
+    def to_return_type(arrays, index=None):
         if return_type in _array_alias:
-            return z, y, d, t
+            return arrays
         elif return_type in _data_frame_alias + _dml_data_alias:
             z_cols = [f'Z{i + 1}' for i in np.arange(dim_x)]
-            data = pd.DataFrame(np.column_stack((z, y, d, t)),
-                                columns=z_cols + ['y', 'd', 't'])
+            if not cross_sectional_data:
+                data = pd.DataFrame(np.column_stack(arrays),
+                                    columns=z_cols + ['y', 'd'], index=index)
+            else:
+                data = pd.DataFrame(np.column_stack(arrays),
+                                    columns=z_cols + ['y', 'd', 't'], index=index)
             if return_type in _data_frame_alias:
                 return data
+            elif not cross_sectional_data:
+                return DoubleMLData(data, 'y', 'd', z_cols)
             else:
                 return DoubleMLData(data, 'y', 'd', z_cols, t_col='t')
         else:
             raise ValueError('Invalid return_type.')
 
+    return _simulate(draw, to_return_type, n_obs, seed_sequence, chunk_size, return_type)
+
+
+def _did_z_tilde(x):
+    z_tilde_1 = np.exp(0.5*x[:, 0])
+    z_tilde_2 = 10 + x[:, 1] / (1 + np.exp(x[:, 0]))
+    z_tilde_3 = (0.6 + x[:, 0]*x[:, 2]/25)**3
+    z_tilde_4 = (20 + x[:, 1] + x[:, 3])**2
+    return np.column_stack((z_tilde_1, z_tilde_2, z_tilde_3, z_tilde_4))
+
+
+def _did_z_moments(seed_sequence, n_obs, c):
+    # mean and standard deviation of z_tilde over the first n_obs observations of the seeded simulation; the
+    # covariates are the first draw of each block and the moments of the blocks are combined pairwise (Chan et al.)
+    n, mean, m2 = 0, np.zeros(4), np.zeros(4)
+    for block in range(-(-n_obs // _SIMULATION_BLOCK_SIZE)):
+        n_block = min(_SIMULATION_BLOCK_SIZE, n_obs - block * _SIMULATION_BLOCK_SIZE)
+        x = _toeplitz_normal(_block_rng(seed_sequence, block), _SIMULATION_BLOCK_SIZE, 4, c)[:n_block, :]
+        z_tilde = _did_z_tilde(x)
+        mean_block = np.mean(z_tilde, axis=0)
+        m2_block = np.sum(np.square(z_tilde - mean_block), axis=0)
+        delta = mean_block - mean
+        m2 = m2 + m2_block + np.square(delta) * n * n_block / (n + n_block)
+        mean = mean + delta * n_block / (n + n_block)
+        n += n_block
+    return mean, np.sqrt(m2 / n)
+
 
 def make_confounded_irm_data(n_obs=500, theta=0.0, gamma_a=0.127, beta_a=0.58, linear=False, **kwargs):
     """
@@ -1399,7 +1553,8 @@ def make_heterogeneous_data(n_obs=200, p=30, support_size=5, n_x=1, binary_treat
     return res_dict
 
 
-def make_ssm_data(n_obs=8000, dim_x=100, theta=1, mar=True, return_type='DoubleMLData'):
+def make_ssm_data(n_obs=8000, dim_x=100, theta=1, mar=True, return_type='DoubleMLData', random_state=None,
+                  chunk_size=None):
     """
     Generates data from a sample selection model (SSM).
     The data generating process is defined as
@@ -1440,6 +1595,15 @@ def make_ssm_data(n_obs=8000, dim_x=100, theta=1, mar=True, return_type='DoubleM
         If ``'DataFrame'``, ``'pd.DataFrame'`` or ``pd.DataFrame``, returns a ``pd.DataFrame``.
 
         If ``'array'``, ``'np.ndarray'``, ``'np.array'`` or ``np.ndarray``, returns ``np.ndarray``'s ``(x, y, d, z, s)``.
+    random_state :
+        If ``None``, the data is drawn with the global random state of numpy (see ``np.random.seed``). Otherwise, an
+        integer, a ``np.random.SeedSequence`` or a ``np.random.Generator`` which determines the data independently of
+        ``n_obs`` and ``chunk_size``, i.e., the first observations coincide for different ``n_obs``; the covariates are
+        then drawn by an AR(1) recursion over the columns instead of a dense covariance matrix. Default is ``None``.
+    chunk_size :
+        If not ``None``, a generator of chunks of at most ``chunk_size`` observations in the format of ``return_type``
+        (``np.ndarray``'s or a ``pd.DataFrame`` indexed by the observations) is returned, which requires a
+        ``random_state``. Default is ``None``.
 
     References
     ----------
@@ -1453,38 +1617,43 @@ def make_ssm_data(n_obs=8000, dim_x=100, theta=1, mar=True, return_type='DoubleM
         sigma = np.array([[1, 0.8], [0.8, 1]])
         gamma = 1
 
-    e = np.random.multivariate_normal(mean=[0, 0], cov=sigma, size=n_obs).T
-
-    cov_mat = toeplitz([np.power(0.5, k) for k in range(dim_x)])
-    x = np.random.multivariate_normal(np.zeros(dim_x), cov_mat, size=[n_obs, ])
-
     beta = [0.4 / (k**2) for k in range(1, dim_x + 1)]
 
-    d = np.where(np.dot(x, beta) + np.random.randn(n_obs) > 0, 1, 0)
-    z = np.random.randn(n_obs)
-    s = np.where(np.dot(x, beta) + d + gamma * z + e[0] > 0, 1, 0)
+    def draw(rng, n_obs):
+        e = rng.multivariate_normal(mean=[0, 0], cov=sigma, size=n_obs).T
 
-    y = np.dot(x, beta) + theta * d + e[1]
-    y[s == 0] = 0
+        x = _toeplitz_normal(rng, n_obs, dim_x, 0.5)
 
-    if return_type in _array_alias:
+        d = np.where(np.dot(x, beta) + rng.standard_normal(n_obs) > 0, 1, 0)
+        z = rng.standard_normal(n_obs)
+        s = np.where(np.dot(x, beta) + d + gamma * z + e[0] > 0, 1, 0)
+
+        y = np.dot(x, beta) + theta * d + e[1]
+        y[s == 0] = 0
         return x, y, d, z, s
-    elif return_type in _data_frame_alias + _dml_data_alias:
-        x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
-        if mar:
-            data = pd.DataFrame(np.column_stack((x, y, d, s)),
-                                columns=x_cols + ['y', 'd', 's'])
-        else:
-            data = pd.DataFrame(np.column_stack((x, y, d, z, s)),
-                                columns=x_cols + ['y', 'd', 'z', 's'])
-        if return_type in _data_frame_alias:
-            return data
-        else:
+
+    def to_return_type(arrays, index=None):
+        x, y, d, z, s = arrays
+        if return_type in _array_alias:
+            return x, y, d, z, s
+        elif return_type in _data_frame_alias + _dml_data_alias:
+            x_cols = [f'X{i + 1}' for i in np.arange(dim_x)]
             if mar:
-                return DoubleMLData(data, 'y', 'd', x_cols, None, None, 's')
-            return DoubleMLData(data, 'y', 'd', x_cols, 'z', None, 's')
-    else:
-        raise ValueError('Invalid return_type.')
+                data = pd.DataFrame(np.column_stack((x, y, d, s)),
+                                    columns=x_cols + ['y', 'd', 's'], index=index)
+            else:
+                data = pd.DataFrame(np.column_stack((x, y, d, z, s)),
+                                    columns=x_cols + ['y', 'd', 'z', 's'], index=index)
+            if return_type in _data_frame_alias:
+                return data
+            else:
+                if mar:
+                    return DoubleMLData(data, 'y', 'd', x_cols, None, None, 's')
+                return DoubleMLData(data, 'y', 'd', x_cols, 'z', None, 's')
+        else:
+            raise ValueError('Invalid return_type.')
+
+    return _simulate(draw, to_return_type, n_obs, _seed_sequence(random_state), chunk_size, return_type)
 
 
 def make_irm_data_discrete_treatments(n_obs=200, n_levels=3, linear=False, random_state=None, **kwargs):
@@ -1646,3 +1815,47 @@ def make_irm_data_discrete_treatments(n_obs=200, n_levels=3, linear=False, rando
     }
 
     return resul_dict
+
+
+def make_memmap_data(make_data, filename, n_obs, random_state, chunk_size=_SIMULATION_BLOCK_SIZE, **kwargs):
+    """
+    Simulates a large data set in chunks into a memory-mapped ``.npy`` file.
+
+    Only one chunk of observations is held in memory while the data is written, such that the number of observations
+    is only limited by the disk space. The data is identical to the data simulated at once with the same
+    ``random_state`` and does not depend on ``chunk_size``.
+
+    Parameters
+    ----------
+    make_data :
+        The data generator, one of :func:`make_plr_CCDDHNR2018`, :func:`make_irm_data`, :func:`make_iivm_data`,
+        :func:`make_pliv_CHS2015`, :func:`make_did_SZ2020` or :func:`make_ssm_data`.
+    filename :
+        The path of the ``.npy`` file. An existing file is overwritten.
+    n_obs :
+        The number of observations to simulate.
+    random_state :
+        An integer, a ``np.random.SeedSequence`` or a ``np.random.Generator`` to draw the data reproducibly.
+    chunk_size :
+        The number of observations which are simulated and written at once. Default is ``16384``.
+    **kwargs
+        Additional keyword arguments which are passed to ``make_data``.
+
+    Returns
+    -------
+    data : pd.DataFrame
+        The simulated data (with the columns of ``make_data(..., return_type='DataFrame')``), which is backed by the
+        memory-mapped file. It can be passed to :class:`DoubleMLData` or later be reloaded via
+        ``np.load(filename, mmap_mode='r')``.
+    """
+    if random_state is None:
+        raise ValueError('A random_state has to be specified to simulate the data in chunks.')
+    data = None
+    for chunk in make_data(n_obs=n_obs, random_state=random_state, chunk_size=chunk_size, return_type='DataFrame',
+                           **kwargs):
+        if data is None:
+            columns = chunk.columns
+            data = np.lib.format.open_memmap(filename, mode='w+', dtype=np.float64, shape=(n_obs, chunk.shape[1]))
+        data[chunk.index.start:chunk.index.stop, :] = chunk.to_numpy(dtype=np.float64)
+    data.flush()
+    return pd.DataFrame(data, columns=columns, copy=False)
@@ -138,6 +138,7 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
         _check_trimming(self._trimming_rule, self._trimming_threshold)
         self._sensitivity_implemented = True
         self._external_predictions_implemented = True
+        self._oob_implemented = True
 
     @property
     def in_sample_normalization(self):
@@ -206,7 +207,9 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
         else:
             g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d0, n_jobs=n_jobs_cv,
                                      est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+                                     return_models=return_models, cross_fit=self._cross_fit,
+                                     x_groups=self._dml_data.x_groups, learner_name='ml_g0',
+                                     fused_tuning=self._fused_tuning)
 
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
@@ -221,7 +224,9 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
         else:
             g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d1, n_jobs=n_jobs_cv,
                                      est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+                                     return_models=return_models, cross_fit=self._cross_fit,
+                                     x_groups=self._dml_data.x_groups, learner_name='ml_g1',
+                                     fused_tuning=self._fused_tuning)
 
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
@@ -239,7 +244,9 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
             else:
                 m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
                                         est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                        return_models=return_models)
+                                        return_models=return_models, cross_fit=self._cross_fit,
+                                        x_groups=self._dml_data.x_groups, learner_name='ml_m',
+                                        fused_tuning=self._fused_tuning)
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
             m_hat['preds'] = _trimm(m_hat['preds'], self.trimming_rule, self.trimming_threshold)
@@ -349,7 +356,7 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
         return element_dict
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                         search_mode, n_iter_randomized_search):
+                         search_mode, n_iter_randomized_search, halving_params):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d,
@@ -366,10 +373,10 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
         train_inds_d1 = [train_index for (train_index, _) in smpls_d1]
         g0_tune_res = _dml_tune(y, x, train_inds_d0,
                                 self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
         g1_tune_res = _dml_tune(y, x, train_inds_d1,
                                 self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
 
         g0_best_params = [xx.best_params_ for xx in g0_tune_res]
         g1_best_params = [xx.best_params_ for xx in g1_tune_res]
@@ -378,7 +385,7 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
         if self.score == 'observational':
             m_tune_res = _dml_tune(d, x, train_inds,
                                    self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                                   n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                   n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_m'])
             m_best_params = [xx.best_params_ for xx in m_tune_res]
             params = {'ml_g0': g0_best_params,
                       'ml_g1': g1_best_params,
@@ -139,6 +139,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
 
         self._sensitivity_implemented = True
         self._external_predictions_implemented = True
+        self._oob_implemented = True
 
     @property
     def in_sample_normalization(self):
@@ -231,7 +232,9 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
         else:
             g_hat_d0_t0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d0_t0, n_jobs=n_jobs_cv,
                                           est_params=self._get_params('ml_g_d0_t0'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+                                          return_models=return_models, cross_fit=self._cross_fit,
+                                          x_groups=self._dml_data.x_groups, learner_name='ml_g_d0_t0',
+                                          fused_tuning=self._fused_tuning)
 
             g_hat_d0_t0['targets'] = g_hat_d0_t0['targets'].astype(float)
             g_hat_d0_t0['targets'][np.invert((d == 0) & (t == 0))] = np.nan
@@ -242,7 +245,9 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
         else:
             g_hat_d0_t1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d0_t1, n_jobs=n_jobs_cv,
                                           est_params=self._get_params('ml_g_d0_t1'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+                                          return_models=return_models, cross_fit=self._cross_fit,
+                                          x_groups=self._dml_data.x_groups, learner_name='ml_g_d0_t1',
+                                          fused_tuning=self._fused_tuning)
             g_hat_d0_t1['targets'] = g_hat_d0_t1['targets'].astype(float)
             g_hat_d0_t1['targets'][np.invert((d == 0) & (t == 1))] = np.nan
         if external_predictions['ml_g_d1_t0'] is not None:
@@ -252,7 +257,9 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
         else:
             g_hat_d1_t0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d1_t0, n_jobs=n_jobs_cv,
                                           est_params=self._get_params('ml_g_d1_t0'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+                                          return_models=return_models, cross_fit=self._cross_fit,
+                                          x_groups=self._dml_data.x_groups, learner_name='ml_g_d1_t0',
+                                          fused_tuning=self._fused_tuning)
             g_hat_d1_t0['targets'] = g_hat_d1_t0['targets'].astype(float)
             g_hat_d1_t0['targets'][np.invert((d == 1) & (t == 0))] = np.nan
         if external_predictions['ml_g_d1_t1'] is not None:
@@ -262,7 +269,9 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
         else:
             g_hat_d1_t1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d1_t1, n_jobs=n_jobs_cv,
                                           est_params=self._get_params('ml_g_d1_t1'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+                                          return_models=return_models, cross_fit=self._cross_fit,
+                                          x_groups=self._dml_data.x_groups, learner_name='ml_g_d1_t1',
+                                          fused_tuning=self._fused_tuning)
             g_hat_d1_t1['targets'] = g_hat_d1_t1['targets'].astype(float)
             g_hat_d1_t1['targets'][np.invert((d == 1) & (t == 1))] = np.nan
 
@@ -277,7 +286,9 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
             else:
                 m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
                                         est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                        return_models=return_models)
+                                        return_models=return_models, cross_fit=self._cross_fit,
+                                        x_groups=self._dml_data.x_groups, learner_name='ml_m',
+                                        fused_tuning=self._fused_tuning)
                 _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
                 _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
             m_hat['preds'] = _trimm(m_hat['preds'], self.trimming_rule, self.trimming_threshold)
@@ -482,7 +493,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
         return element_dict
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                         search_mode, n_iter_randomized_search):
+                         search_mode, n_iter_randomized_search, halving_params):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d,
@@ -504,25 +515,25 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
 
         g_d0_t0_tune_res = _dml_tune(y, x, train_inds_d0_t0,
                                      self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                     n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                     n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
 
         g_d0_t1_tune_res = _dml_tune(y, x, train_inds_d0_t1,
                                      self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                     n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                     n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
 
         g_d1_t0_tune_res = _dml_tune(y, x, train_inds_d1_t0,
                                      self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                     n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                     n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
 
         g_d1_t1_tune_res = _dml_tune(y, x, train_inds_d1_t1,
                                      self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                     n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                     n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
 
         m_tune_res = list()
         if self.score == 'observational':
             m_tune_res = _dml_tune(d, x, train_inds,
                                    self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                                   n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                   n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_m'])
 
         g_d0_t0_best_params = [xx.best_params_ for xx in g_d0_t0_tune_res]
         g_d0_t1_best_params = [xx.best_params_ for xx in g_d0_t1_tune_res]
@@ -4,18 +4,29 @@ import warnings
 import copy
 
 from sklearn.base import is_regressor, is_classifier
+from sklearn.utils import check_array
 
 from scipy.stats import norm
 
 from abc import ABC, abstractmethod
 
-from .double_ml_data import DoubleMLBaseData, DoubleMLClusterData
+from .double_ml_data import DoubleMLBaseData, DoubleMLClusterData, DoubleMLData
 from .double_ml_framework import DoubleMLFramework
 
 from .utils.resampling import DoubleMLResampling, DoubleMLClusterResampling
-from .utils._estimation import _rmse, _aggregate_coefs_and_ses, _var_est, _set_external_predictions
-from .utils._checks import _check_external_predictions, _check_sample_splitting
+from .utils._estimation import _rmse, _aggregate_coefs_and_ses, _var_est, _set_external_predictions, \
+    _dml_ensemble_predict
+from .utils._checks import _check_external_predictions, _check_sample_splitting, _check_dtype, _check_integer
 from .utils.gain_statistics import gain_statistics
+from .utils.instrumentation import DoubleMLCallback, DoubleMLRecorder
+from .utils.model_store import DoubleMLModelStore
+from .utils.nuisance_store import DoubleMLNuisanceStore
+from .utils.tuning_cache import DoubleMLTuningCache
+from .utils._instrumentation import _instrumentation, _stage
+from .utils._nuisance_store import _nuisance_store
+from .utils._resources import _split_resources, _limit_threads
+from .utils._tuning_cache import _tuning_cache
+from .utils._fused_tuning import _FusedTuning
 
 _implemented_data_backends = ['DoubleMLData', 'DoubleMLClusterData']
 
@@ -52,10 +63,19 @@ class DoubleML(ABC):
         # initialize predictions and target to None which are only stored if method fit is called with store_predictions=True
         self._predictions = None
         self._nuisance_targets = None
+        self._nuisance_targets_rep = None
         self._nuisance_loss = None
 
         # initialize models to None which are only stored if method fit is called with store_models=True
         self._models = None
+        self._model_store = None
+
+        # initialize the number of iterations which is only determined if method fit is called with early_stopping
+        self._early_stopping_params = None
+        self._learner_selection = None
+        # parameter grids, early stopping settings and learner candidates which are passed to the nuisance estimation
+        # during fit() and select_learners()
+        self._fused_tuning = None
 
         # initialize sensitivity elements to None (only available if implemented for the class
         self._sensitivity_implemented = False
@@ -65,6 +85,26 @@ class DoubleML(ABC):
         # initialize external predictions
         self._external_predictions_implemented = False
 
+        # initialize joint fitting of nuisance functions with multi-output learners (only available if implemented)
+        self._multi_output_implemented = False
+        self._multi_output = False
+
+        # initialize the cross-fitting mode (out-of-bag predictions only available if implemented for the class)
+        self._oob_implemented = False
+        self._cross_fit = 'kfold'
+
+        # initialize the prediction of the nuisance functions for new data (only available if implemented)
+        self._predict_nuisance_implemented = False
+
+        # initialize instrumentation callbacks
+        self._callbacks = list()
+
+        # initialize the store of cross-fitted nuisance predictions which can be shared between models
+        self._nuisance_store = None
+
+        # floating point precision of the stored scores, predictions and sensitivity elements
+        self._dtype = np.dtype(np.float64)
+
         # check resampling specifications
         if not isinstance(n_folds, int):
             raise TypeError('The number of folds must be of int type. '
@@ -137,6 +177,7 @@ class DoubleML(ABC):
         else:
             resampling_info = f'No. folds: {self.n_folds}\n' \
                               f'No. repeated sample splits: {self.n_rep}\n'
+        resampling_info += f'Cross-fitting: {self.cross_fit}\n'
         fit_summary = str(self.summary)
         res = header + \
             '\n------------------ Data summary      ------------------\n' + data_summary + \
@@ -146,6 +187,46 @@ class DoubleML(ABC):
             '\n------------------ Fit summary       ------------------\n' + fit_summary
         return res
 
+    @property
+    def cross_fit(self):
+        """
+        The cross-fitting mode (``'kfold'`` or ``'oob'``) used in the last call of ``fit()``.
+        """
+        return self._cross_fit
+
+    @property
+    def dtype(self):
+        """
+        The floating point precision (``float32`` or ``float64``) used to store scores, predictions, targets and
+        sensitivity elements (see ``fit()``).
+        """
+        return self._dtype
+
+    @property
+    def callbacks(self):
+        """
+        The instrumentation callbacks (see ``set_callbacks()``).
+        """
+        return self._callbacks
+
+    @property
+    def nuisance_store(self):
+        """
+        The store of cross-fitted nuisance predictions (see ``set_nuisance_store()``).
+        """
+        return self._nuisance_store
+
+    @property
+    def instrumentation(self):
+        """
+        A :class:`pandas.DataFrame` with the records of all :class:`doubleml.utils.DoubleMLRecorder` callbacks
+        (``None`` if no recorder is set).
+        """
+        records = [callback.records for callback in self._callbacks if isinstance(callback, DoubleMLRecorder)]
+        if len(records) == 0:
+            return None
+        return pd.concat(records, ignore_index=True)
+
     @property
     def n_folds(self):
         """
@@ -217,6 +298,25 @@ class DoubleML(ABC):
         """
         return self._params
 
+    @property
+    def early_stopping_params(self):
+        """
+        The hyperparameters with the number of iterations found by early stopping (only available after ``fit()`` with
+        ``early_stopping``) in form of a nested dictionary with keys for the learners and treatment variables and lists
+        over repetitions and folds. The parameters can be set with ``set_ml_nuisance_params()`` to freeze the number of
+        iterations for later fits.
+        """
+        return self._early_stopping_params
+
+    @property
+    def learner_selection(self):
+        """
+        The results of ``select_learners()`` in form of a nested dictionary with keys for the nuisance functions and
+        ``'loss'`` and ``'weights'``. The arrays of shape ``(n_rep, n_coefs, n_candidates)`` contain the losses (RMSE or
+        log loss) of the candidates and the weights of the candidates in the predictions of the nuisance function.
+        """
+        return self._learner_selection
+
     @property
     def params_names(self):
         """
@@ -235,9 +335,21 @@ class DoubleML(ABC):
     @property
     def nuisance_targets(self):
         """
-        The outcome of the nuisance models.
-        """
-        return self._nuisance_targets
+        The outcome of the nuisance models in form of a dictinary.
+        Each key refers to a nuisance element with a read-only array of values of shape ``(n_obs, n_rep, n_coefs)``.
+        Targets which are identical across repetitions are stored only once per treatment variable.
+        """
+        if self._nuisance_targets is None:
+            return None
+        nuisance_targets = dict()
+        for learner, targets in self._nuisance_targets.items():
+            if self._nuisance_targets_rep[learner] is None:
+                nuisance_targets[learner] = np.broadcast_to(
+                    targets[:, np.newaxis, :], (self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs))
+            else:
+                nuisance_targets[learner] = self._nuisance_targets_rep[learner].view()
+                nuisance_targets[learner].flags.writeable = False
+        return nuisance_targets
 
     @property
     def nuisance_loss(self):
@@ -249,7 +361,9 @@ class DoubleML(ABC):
     @property
     def models(self):
         """
-        The fitted nuisance models.
+        The fitted nuisance models in form of a nested dictionary with keys for the learners and treatment variables and
+        lists over repetitions and folds. If ``fit()`` was called with a :class:`doubleml.utils.DoubleMLModelStore`, the
+        models are :class:`doubleml.utils.DoubleMLModelHandle` objects which load the models on access.
         """
         return self._models
 
@@ -456,23 +570,28 @@ class DoubleML(ABC):
     def __all_se(self):
         return self._all_se[self._i_treat, self._i_rep]
 
-    def fit(self, n_jobs_cv=None, store_predictions=True, external_predictions=None, store_models=False):
+    def fit(self, n_jobs_cv=None, store_predictions=True, external_predictions=None, store_models=False,
+            multi_output=False, cross_fit='kfold', dtype='float64', tune=None, early_stopping=False, tune_settings=None):
         """
         Estimate DoubleML models.
 
         Parameters
         ----------
         n_jobs_cv : None or int
-            The number of CPUs to use to fit the learners. ``None`` means ``1``.
+            The number of CPUs to use to fit the learners. ``None`` means ``1``, also with an active
+            :class:`doubleml.utils.DoubleMLResourceManager` (the whole core budget is then passed on to the learners);
+            parallel jobs within the budget are requested with negative values (e.g. ``-1``) or values larger than one.
             Default is ``None``.
 
         store_predictions : bool
             Indicates whether the predictions for the nuisance functions should be stored in ``predictions``.
             Default is ``True``.
 
-        store_models : bool
+        store_models : bool or :class:`doubleml.utils.DoubleMLModelStore`
             Indicates whether the fitted models for the nuisance functions should be stored in ``models``. This allows
-            to analyze the fitted models or extract information like variable importance.
+            to analyze the fitted models or extract information like variable importance. If a
+            :class:`doubleml.utils.DoubleMLModelStore` is supplied, the models are serialized to disk after the
+            nuisance estimation of each repetition and treatment variable and ``models`` contains lazy handles.
             Default is ``False``.
 
         external_predictions : None or dict
@@ -482,41 +601,273 @@ class DoubleML(ABC):
             corresponding learners.
             Default is `None`.
 
+        multi_output : bool
+            Indicates whether nuisance functions which share the covariates and the sample splits should be fitted
+            jointly, i.e., with one multi-output model per fold. Only nuisance functions with identical learners
+            (and parameters) which natively support multiple targets are stacked, all others are fitted separately.
+            For learners which fit the targets independently (e.g. linear models) the estimates are unchanged, whereas
+            tree-based learners choose the splits jointly for all stacked targets.
+            Default is ``False``.
+
+        cross_fit : str
+            A str (``'kfold'`` or ``'oob'``) specifying how the held-out nuisance predictions are obtained. For
+            ``'kfold'`` the learners are fitted on the training folds of the sample splitting. For ``'oob'`` bagged
+            ensembles (e.g. :class:`sklearn.ensemble.RandomForestRegressor` with ``bootstrap=True``) are fitted once on
+            all training observations and their out-of-bag predictions are used instead; all other learners are
+            cross-fitted as for ``'kfold'``.
+            Default is ``'kfold'``.
+
+        dtype : str or :class:`numpy.dtype`
+            The floating point precision (``'float32'`` or ``'float64'``) used to store the scores, their elements and
+            derivatives, the predictions and targets of the nuisance functions and the sensitivity elements. With
+            ``'float32'`` the memory of these arrays is halved, whereas the parameter estimates, the variance
+            estimation and the bootstrap are still computed in double precision; the estimates then agree with the
+            ``'float64'`` results up to float32 rounding of the stored values (relative error of about ``1e-6``).
+            Default is ``'float64'``.
+
+        tune : None or dict
+            A dict with parameter grids for the learners (keys of ``learner_names``) or for single nuisance functions
+            (keys of ``params_names``, e.g. ``'ml_g0'``). If supplied, the hyperparameters of the corresponding
+            nuisance functions are tuned within the cross-fitting: on each training fold a search (by default
+            :class:`sklearn.model_selection.GridSearchCV` with 5 folds and the default scoring of the learner, see
+            ``tune_settings``) is performed and the refitted best estimator predicts the test fold. In contrast to
+            ``tune()`` with ``tune_on_folds=True`` the learners are not fitted again with the chosen hyperparameters. The
+            chosen hyperparameters are set as fold-specific parameters (see ``params``).
+            Default is ``None``.
+
+        early_stopping : bool or str
+            Indicates whether learners with early stopping (learners with the parameters ``validation_fraction`` and
+            ``n_iter_no_change``, e.g. :class:`sklearn.ensemble.HistGradientBoostingRegressor`) are fitted with early
+            stopping on an inner validation split of each training fold (of size ``validation_fraction``). For
+            ``'refit'`` the learners are refitted on the whole training fold with the number of iterations found by
+            early stopping. The number of iterations per fold is available in ``early_stopping_params``. Learners
+            which are tuned via ``tune`` are not early stopped.
+            Default is ``False``.
+
+        tune_settings : None or dict
+            A dict with the settings of the search for ``tune`` with keys ``'scoring_methods'``, ``'n_folds_tune'``,
+            ``'search_mode'``, ``'n_iter_randomized_search'`` and ``'halving_params'`` (see :meth:`tune`). Settings
+            which are not supplied take the defaults of :meth:`tune`.
+            Default is ``None``.
+
         Returns
         -------
         self : object
         """
 
-        self._check_fit(n_jobs_cv, store_predictions, external_predictions, store_models)
+        self._check_fit(n_jobs_cv, store_predictions, external_predictions, store_models, multi_output, cross_fit, dtype)
+        fused_tuning = self._check_fused_tuning(tune, tune_settings, early_stopping, multi_output)
+        return self._fit(n_jobs_cv, store_predictions, external_predictions, store_models, multi_output, cross_fit, dtype,
+                         fused_tuning)
+
+    def _fit(self, n_jobs_cv, store_predictions, external_predictions, store_models, multi_output, cross_fit, dtype,
+             fused_tuning=None):
+        self._multi_output = multi_output
+        self._cross_fit = cross_fit
+        if np.dtype(dtype) != self._dtype:
+            self._dtype = np.dtype(dtype)
+            self._psi, self._psi_deriv, self._psi_elements, self._var_scaling_factors, \
+                self._coef, self._se, self._all_coef, self._all_se = self._initialize_arrays()
         self._initalize_fit(store_predictions, store_models)
 
-        for i_rep in range(self.n_rep):
-            self._i_rep = i_rep
-            for i_d in range(self._dml_data.n_treat):
-                self._i_treat = i_d
+        # with an active resource manager the core budget is split across the folds and the learners
+        n_jobs_cv, learner_resources = _split_resources(self.n_folds, n_jobs_cv)
+        # the fused tuning is passed to the nuisance estimation of the model (and not to nested models)
+        self._fused_tuning = fused_tuning
+        with _instrumentation(self._callbacks) as instrumentation, _nuisance_store(self._nuisance_store), \
+                _limit_threads(learner_resources):
+            for i_rep in range(self.n_rep):
+                self._i_rep = i_rep
+                for i_d in range(self._dml_data.n_treat):
+                    self._i_treat = i_d
+                    self._set_instrumentation_info(instrumentation, i_rep, i_d)
 
-                # this step could be skipped for the single treatment variable case
-                if self._dml_data.n_treat > 1:
-                    self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
+                    # this step could be skipped for the single treatment variable case
+                    if self._dml_data.n_treat > 1:
+                        self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
 
-                # predictions have to be stored in loop for sensitivity analysis
-                nuisance_predictions = self._fit_nuisance_and_score_elements(
-                    n_jobs_cv,
-                    store_predictions,
-                    external_predictions,
-                    store_models)
+                    # predictions have to be stored in loop for sensitivity analysis
+                    nuisance_predictions = self._fit_nuisance_and_score_elements(
+                        n_jobs_cv,
+                        store_predictions,
+                        external_predictions,
+                        store_models)
 
-                self._solve_score_and_estimate_se()
+                    if fused_tuning is not None:
+                        fused_tuning.collect(i_rep, self._dml_data.d_cols[i_d])
 
-                # sensitivity elements can depend on the estimated parameter
-                self._fit_sensitivity_elements(nuisance_predictions)
+                    self._solve_score_and_estimate_se()
 
-        # aggregated parameter estimates and standard errors from repeated cross-fitting
-        self.coef, self.se = _aggregate_coefs_and_ses(self._all_coef, self._all_se, self._var_scaling_factors)
+                    # sensitivity elements can depend on the estimated parameter
+                    self._fit_sensitivity_elements(nuisance_predictions)
+
+            self._set_instrumentation_info(instrumentation)
+
+            self._set_fused_tuning_results(fused_tuning)
+            self._fused_tuning = None
+
+            # aggregated parameter estimates and standard errors from repeated cross-fitting
+            self.coef, self.se = _aggregate_coefs_and_ses(self._all_coef, self._all_se, self._var_scaling_factors)
+
+            # construct framework for inference
+            with _stage('framework'):
+                self._framework = self.construct_framework()
+
+        return self
+
+    def select_learners(self, candidates, method='loss', n_jobs_cv=None, store_predictions=True, store_models=False):
+        """
+        Estimate DoubleML models with the best of several candidate learners for each nuisance function.
+
+        All candidates are fitted on all training folds of the sample splitting in one pass, i.e., each candidate is
+        fitted exactly once per fold. For each nuisance function (and repetition and treatment variable) the candidates
+        are compared by the loss (RMSE or log loss) of the cross-fitted predictions and the predictions of the best
+        candidate (``method='loss'``) or of a non-negative combination of the candidates (``method='stacking'``, with
+        weights from a non-negative least squares fit of the targets on the cross-fitted predictions of the
+        candidates, normalized to sum up to one) are used to compute the score. The losses and weights are available
+        in ``learner_selection``. The learners of the model are not replaced, i.e., a later ``fit()`` uses the
+        original learners.
+
+        Parameters
+        ----------
+        candidates : dict
+            A dictionary with learner keys of ``learner_names`` (e.g. ``'ml_g'``) and non-empty lists of estimators
+            of the same type (regressor or classifier) as the corresponding learners. The hyperparameters of the
+            learners (see ``params``) are not used for the candidates.
+
+        method : str
+            A str (``'loss'`` or ``'stacking'``) specifying how the candidates are combined.
+            Default is ``'loss'``.
+
+        n_jobs_cv : None or int
+            The number of CPUs to use to fit the candidates. ``None`` means ``1``.
+            Default is ``None``.
+
+        store_predictions : bool
+            Indicates whether the predictions for the nuisance functions should be stored in ``predictions``.
+            Default is ``True``.
+
+        store_models : bool
+            Indicates whether the fitted models of the selected candidates should be stored in ``models``.
+            Default is ``False``.
+
+        Returns
+        -------
+        self : object
+        """
+        if (not isinstance(candidates, dict)) | (not all(k in self.learner_names for k in candidates)):
+            raise ValueError('Invalid candidates ' + str(candidates) + '. ' +
+                             'candidates must be a dictionary. ' +
+                             'Valid keys are ' + ' and '.join(self.learner_names) + '.')
+        for learner_key, learner_candidates in candidates.items():
+            if (not isinstance(learner_candidates, list)) or (len(learner_candidates) == 0):
+                raise ValueError(f'The candidates for {learner_key} must be a non-empty list. '
+                                 f'{str(learner_candidates)} was passed.')
+            for learner in learner_candidates:
+                is_classifier = self._check_learner(learner, learner_key, regressor=True, classifier=True)
+                if is_classifier != (self._predict_method[learner_key] == 'predict_proba'):
+                    learner_type = 'classifier' if self._predict_method[learner_key] == 'predict_proba' else 'regressor'
+                    raise ValueError(f'The candidates for {learner_key} have to be of type {learner_type}. '
+                                     f'{str(learner)} was passed.')
+        if (not isinstance(method, str)) | (method not in ['loss', 'stacking']):
+            raise ValueError('method must be "loss" or "stacking". '
+                             f'Got {str(method)}.')
+        self._check_fit(n_jobs_cv, store_predictions, None, store_models, False, 'kfold', self._dtype.name)
+
+        # the candidates of a learner are compared for all nuisance functions of the learner (e.g. ml_g0 and ml_g1)
+        params_candidates = {params_name: candidates[learner_key]
+                             for learner_key in candidates for params_name in self.params_names
+                             if learner_key in params_name}
+        fused_tuning = _FusedTuning(candidates=params_candidates, selection_method=method)
+        return self._fit(n_jobs_cv, store_predictions, None, store_models, False, 'kfold', self._dtype.name,
+                         fused_tuning)
+
+    def refit(self, learners, ml_learners=None, n_jobs_cv=None):
+        """
+        Refit selected nuisance functions and reuse the stored predictions of all other nuisance functions.
+
+        The nuisance functions in ``learners`` are fitted on the existing sample splitting. For all other nuisance
+        functions the predictions of the previous fit are supplied as external predictions (for each repetition and
+        treatment variable). Afterwards the score elements, the coefficients, the sensitivity elements and the
+        :class:`doubleml.DoubleMLFramework` are recomputed. The losses, targets and (if stored) models of the reused
+        nuisance functions are retained.
+
+        Parameters
+        ----------
+        learners : list
+            A list of strings which correspond to the nuisance functions to refit, e.g. ``['ml_m']``.
+
+        ml_learners : None or dict
+            A dictionary with learner keys of ``learner`` (e.g. ``'ml_m'``) and estimators which replace the
+            corresponding learners. The replaced learners have to be of the same type (regressor or classifier)
+            and all nuisance functions which depend on them have to be contained in ``learners``.
+            Default is ``None``.
 
-        # construct framework for inference
-        self._framework = self.construct_framework()
+        n_jobs_cv : None or int
+            The number of CPUs to use to fit the learners. ``None`` means ``1``, also with an active
+            :class:`doubleml.utils.DoubleMLResourceManager` (the whole core budget is then passed on to the learners);
+            parallel jobs within the budget are requested with negative values (e.g. ``-1``) or values larger than one.
+            Default is ``None``.
 
+        Returns
+        -------
+        self : object
+        """
+        if not self._external_predictions_implemented:
+            raise NotImplementedError(f"Partial refit not implemented for {self.__class__.__name__}.")
+        if self._predictions is None:
+            raise ValueError('Apply fit() with store_predictions=True before refit().')
+        if (not isinstance(learners, list)) or (len(learners) == 0) or \
+                (not all(learner in self.params_names for learner in learners)):
+            raise ValueError(f'The learners have to be a non-empty subset of {str(self.params_names)}. '
+                             f'Learners {str(learners)} provided.')
+
+        if ml_learners is not None:
+            if not isinstance(ml_learners, dict):
+                raise TypeError('ml_learners must be a dictionary. '
+                                f'{str(ml_learners)} of type {str(type(ml_learners))} was passed.')
+            for learner_key, learner in ml_learners.items():
+                if learner_key not in self._learner.keys():
+                    raise ValueError(f'Invalid learner key {str(learner_key)}. '
+                                     f'Valid learner keys are {str(list(self._learner.keys()))}.')
+                dependent_learners = [name for name in self.params_names if learner_key in name]
+                if not all(name in learners for name in dependent_learners):
+                    raise ValueError(f'The nuisance functions {str(dependent_learners)} depend on {learner_key} and '
+                                     'have to be refitted.')
+                is_classifier = self._check_learner(learner, learner_key, regressor=True, classifier=True)
+                if is_classifier != (self._predict_method[learner_key] == 'predict_proba'):
+                    learner_type = 'classifier' if self._predict_method[learner_key] == 'predict_proba' else 'regressor'
+                    raise ValueError(f'The learner {learner_key} has to be a {learner_type}. '
+                                     f'{str(learner)} was passed.')
+            for learner_key, learner in ml_learners.items():
+                self._learner[learner_key] = learner
+
+        reused_learners = [learner for learner in self.params_names if learner not in learners]
+        external_predictions = {
+            treat_var: {learner: np.asarray(self._predictions[learner][:, :, i_treat], dtype=np.float64)
+                        for learner in reused_learners}
+            for i_treat, treat_var in enumerate(self._dml_data.d_cols)}
+        reused_state = {learner: (self._nuisance_loss[learner],
+                                  self._nuisance_targets[learner],
+                                  self._nuisance_targets_rep[learner],
+                                  None if self._models is None else self._models[learner])
+                        for learner in reused_learners}
+
+        # the models are stored again if they have been stored in the previous fit
+        if self._models is None:
+            store_models = False
+        else:
+            store_models = self._model_store if self._model_store is not None else True
+        self.fit(n_jobs_cv=n_jobs_cv, store_predictions=True, external_predictions=external_predictions,
+                 store_models=store_models, multi_output=self._multi_output, cross_fit=self._cross_fit,
+                 dtype=self._dtype.name)
+
+        for learner, (loss, targets, targets_rep, models) in reused_state.items():
+            self._nuisance_loss[learner] = loss
+            self._nuisance_targets[learner] = targets
+            self._nuisance_targets_rep[learner] = targets_rep
+            if store_models is not False:
+                self._models[learner] = models
         return self
 
     def construct_framework(self):
@@ -531,7 +882,7 @@ class DoubleML(ABC):
         doubleml_framework : doubleml.DoubleMLFramework
         """
         # standardize the score function and reshape to (n_obs, n_coefs, n_rep)
-        scaled_psi = np.divide(self.psi, np.mean(self.psi_deriv, axis=0))
+        scaled_psi = np.divide(self.psi, np.mean(self.psi_deriv, axis=0, dtype=np.float64), dtype=self._dtype)
         scaled_psi_reshape = np.transpose(scaled_psi, (0, 2, 1))
 
         doubleml_dict = {
@@ -567,7 +918,7 @@ class DoubleML(ABC):
                 }
             })
 
-        doubleml_framework = DoubleMLFramework(doubleml_dict)
+        doubleml_framework = DoubleMLFramework(doubleml_dict, dtype=self._dtype)
         return doubleml_framework
 
     def bootstrap(self, method='normal', n_rep_boot=500):
@@ -589,7 +940,8 @@ class DoubleML(ABC):
         """
         if self._framework is None:
             raise ValueError('Apply fit() before bootstrap().')
-        self._framework.bootstrap(method=method, n_rep_boot=n_rep_boot)
+        with _instrumentation(self._callbacks), _stage('bootstrap'):
+            self._framework.bootstrap(method=method, n_rep_boot=n_rep_boot)
 
         return self
 
@@ -656,13 +1008,17 @@ class DoubleML(ABC):
              n_iter_randomized_search=100,
              n_jobs_cv=None,
              set_as_params=True,
-             return_tune_res=False):
+             return_tune_res=False,
+             halving_params=None,
+             tuning_cache=None):
         """
         Hyperparameter-tuning for DoubleML models.
 
         The hyperparameter-tuning is performed using either an exhaustive search over specified parameter values
         implemented in :class:`sklearn.model_selection.GridSearchCV` or via a randomized search implemented in
-        :class:`sklearn.model_selection.RandomizedSearchCV`.
+        :class:`sklearn.model_selection.RandomizedSearchCV`. Alternatively, the candidates can be evaluated via
+        successive halving implemented in :class:`sklearn.model_selection.HalvingGridSearchCV` and
+        :class:`sklearn.model_selection.HalvingRandomSearchCV`.
 
         Parameters
         ----------
@@ -684,16 +1040,23 @@ class DoubleML(ABC):
             Default is ``5``.
 
         search_mode : str
-            A str (``'grid_search'`` or ``'randomized_search'``) specifying whether hyperparameters are optimized via
-            :class:`sklearn.model_selection.GridSearchCV` or :class:`sklearn.model_selection.RandomizedSearchCV`.
+            A str (``'grid_search'``, ``'randomized_search'``, ``'halving_grid_search'`` or
+            ``'halving_randomized_search'``) specifying whether hyperparameters are optimized via
+            :class:`sklearn.model_selection.GridSearchCV`, :class:`sklearn.model_selection.RandomizedSearchCV`,
+            :class:`sklearn.model_selection.HalvingGridSearchCV` or :class:`sklearn.model_selection.HalvingRandomSearchCV`.
             Default is ``'grid_search'``.
 
         n_iter_randomized_search : int
-            If ``search_mode == 'randomized_search'``. The number of parameter settings that are sampled.
+            If ``search_mode == 'randomized_search'`` or ``search_mode == 'halving_randomized_search'``. The number of
+            parameter settings that are sampled.
             Default is ``100``.
 
         n_jobs_cv : None or int
-            The number of CPUs to use to tune the learners. ``None`` means ``1``.
+            The number of CPUs to use to tune the learners. ``None`` means ``1``, also with an active
+            :class:`doubleml.utils.DoubleMLResourceManager` (the whole core budget is then passed on to the learners);
+            parallel jobs within the budget are requested with negative values (e.g. ``-1``) or values larger than one. If
+            ``tune_on_folds=True``, the grid or randomized search of a learner is evaluated for all folds in one pool of
+            jobs (folds x candidates x inner folds) and the best candidates are refitted per fold.
             Default is ``None``.
 
         set_as_params : bool
@@ -704,6 +1067,20 @@ class DoubleML(ABC):
             Indicates whether detailed tuning results should be returned.
             Default is ``False``.
 
+        halving_params : None or dict
+            If ``search_mode`` is ``'halving_grid_search'`` or ``'halving_randomized_search'``. The settings of the
+            successive halving (``'resource'``, ``'factor'``, ``'min_resources'``, ``'max_resources'`` and
+            ``'aggressive_elimination'``) can be set per nuisance model via a dict (see attribute ``learner_names`` for
+            the keys). E.g., ``{'ml_l': {'resource': 'n_estimators', 'max_resources': 500}}`` increases the number of
+            trees instead of the number of samples for the learner ``ml_l``. If None, the defaults of scikit-learn are
+            used (the resource is the number of samples).
+            Default is ``None``.
+
+        tuning_cache : None or :class:`doubleml.utils.DoubleMLTuningCache`
+            A cache of tuning results. Searches which are already cached are not repeated, only the best candidate is
+            refitted.
+            Default is ``None``.
+
         Returns
         -------
         self : object
@@ -718,39 +1095,12 @@ class DoubleML(ABC):
             raise ValueError('Invalid param_grids ' + str(param_grids) + '. '
                              'param_grids must be a dictionary with keys ' + ' and '.join(self.learner_names) + '.')
 
-        if scoring_methods is not None:
-            if (not isinstance(scoring_methods, dict)) | (not all(k in self.learner_names for k in scoring_methods)):
-                raise ValueError('Invalid scoring_methods ' + str(scoring_methods) + '. ' +
-                                 'scoring_methods must be a dictionary. ' +
-                                 'Valid keys are ' + ' and '.join(self.learner_names) + '.')
-            if not all(k in scoring_methods for k in self.learner_names):
-                # if there are learners for which no scoring_method was set, we fall back to None, i.e., default scoring
-                for learner in self.learner_names:
-                    if learner not in scoring_methods:
-                        scoring_methods[learner] = None
-
         if not isinstance(tune_on_folds, bool):
             raise TypeError('tune_on_folds must be True or False. '
                             f'Got {str(tune_on_folds)}.')
 
-        if not isinstance(n_folds_tune, int):
-            raise TypeError('The number of folds used for tuning must be of int type. '
-                            f'{str(n_folds_tune)} of type {str(type(n_folds_tune))} was passed.')
-        if n_folds_tune < 2:
-            raise ValueError('The number of folds used for tuning must be at least two. '
-                             f'{str(n_folds_tune)} was passed.')
-
-        if (not isinstance(search_mode, str)) | (search_mode not in ['grid_search', 'randomized_search']):
-            raise ValueError('search_mode must be "grid_search" or "randomized_search". '
-                             f'Got {str(search_mode)}.')
-
-        if not isinstance(n_iter_randomized_search, int):
-            raise TypeError('The number of parameter settings sampled for the randomized search must be of int type. '
-                            f'{str(n_iter_randomized_search)} of type '
-                            f'{str(type(n_iter_randomized_search))} was passed.')
-        if n_iter_randomized_search < 2:
-            raise ValueError('The number of parameter settings sampled for the randomized search must be at least two. '
-                             f'{str(n_iter_randomized_search)} was passed.')
+        scoring_methods, halving_params = self._check_tune_settings(scoring_methods, n_folds_tune, search_mode,
+                                                                    n_iter_randomized_search, halving_params)
 
         if n_jobs_cv is not None:
             if not isinstance(n_jobs_cv, int):
@@ -765,51 +1115,63 @@ class DoubleML(ABC):
             raise TypeError('return_tune_res must be True or False. '
                             f'Got {str(return_tune_res)}.')
 
+        if (tuning_cache is not None) and (not isinstance(tuning_cache, DoubleMLTuningCache)):
+            raise TypeError('tuning_cache must be a DoubleMLTuningCache or None. '
+                            f'{str(tuning_cache)} of type {str(type(tuning_cache))} was passed.')
+
         if tune_on_folds:
             tuning_res = [[None] * self.n_rep] * self._dml_data.n_treat
         else:
             tuning_res = [None] * self._dml_data.n_treat
 
-        for i_d in range(self._dml_data.n_treat):
-            self._i_treat = i_d
-            # this step could be skipped for the single treatment variable case
-            if self._dml_data.n_treat > 1:
-                self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
+        # with an active resource manager the core budget is split across the candidate fits and the learners
+        n_jobs_cv, learner_resources = _split_resources(None, n_jobs_cv)
+        with _instrumentation(self._callbacks) as instrumentation, _limit_threads(learner_resources), \
+                _tuning_cache(tuning_cache):
+            for i_d in range(self._dml_data.n_treat):
+                self._i_treat = i_d
+                # this step could be skipped for the single treatment variable case
+                if self._dml_data.n_treat > 1:
+                    self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
 
-            if tune_on_folds:
-                nuisance_params = list()
-                for i_rep in range(self.n_rep):
-                    self._i_rep = i_rep
+                if tune_on_folds:
+                    nuisance_params = list()
+                    for i_rep in range(self.n_rep):
+                        self._i_rep = i_rep
+                        self._set_instrumentation_info(instrumentation, i_rep, i_d)
 
-                    # tune hyperparameters
-                    res = self._nuisance_tuning(self.__smpls,
-                                                param_grids, scoring_methods,
-                                                n_folds_tune,
-                                                n_jobs_cv,
-                                                search_mode, n_iter_randomized_search)
+                        # tune hyperparameters
+                        with _stage('tune'):
+                            res = self._nuisance_tuning(self.__smpls,
+                                                        param_grids, scoring_methods,
+                                                        n_folds_tune,
+                                                        n_jobs_cv,
+                                                        search_mode, n_iter_randomized_search, halving_params)
 
-                    tuning_res[i_rep][i_d] = res
-                    nuisance_params.append(res['params'])
+                        tuning_res[i_rep][i_d] = res
+                        nuisance_params.append(res['params'])
 
-                if set_as_params:
-                    for nuisance_model in nuisance_params[0].keys():
-                        params = [x[nuisance_model] for x in nuisance_params]
-                        self.set_ml_nuisance_params(nuisance_model, self._dml_data.d_cols[i_d], params)
+                    if set_as_params:
+                        for nuisance_model in nuisance_params[0].keys():
+                            params = [x[nuisance_model] for x in nuisance_params]
+                            self.set_ml_nuisance_params(nuisance_model, self._dml_data.d_cols[i_d], params)
 
-            else:
-                smpls = [(np.arange(self._dml_data.n_obs), np.arange(self._dml_data.n_obs))]
-                # tune hyperparameters
-                res = self._nuisance_tuning(smpls,
-                                            param_grids, scoring_methods,
-                                            n_folds_tune,
-                                            n_jobs_cv,
-                                            search_mode, n_iter_randomized_search)
-                tuning_res[i_d] = res
-
-                if set_as_params:
-                    for nuisance_model in res['params'].keys():
-                        params = res['params'][nuisance_model]
-                        self.set_ml_nuisance_params(nuisance_model, self._dml_data.d_cols[i_d], params[0])
+                else:
+                    smpls = [(np.arange(self._dml_data.n_obs), np.arange(self._dml_data.n_obs))]
+                    self._set_instrumentation_info(instrumentation, i_treat=i_d)
+                    # tune hyperparameters
+                    with _stage('tune'):
+                        res = self._nuisance_tuning(smpls,
+                                                    param_grids, scoring_methods,
+                                                    n_folds_tune,
+                                                    n_jobs_cv,
+                                                    search_mode, n_iter_randomized_search, halving_params)
+                    tuning_res[i_d] = res
+
+                    if set_as_params:
+                        for nuisance_model in res['params'].keys():
+                            params = res['params'][nuisance_model]
+                            self.set_ml_nuisance_params(nuisance_model, self._dml_data.d_cols[i_d], params[0])
 
         if return_tune_res:
             return tuning_res
@@ -870,7 +1232,7 @@ class DoubleML(ABC):
 
     @abstractmethod
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                         search_mode, n_iter_randomized_search):
+                         search_mode, n_iter_randomized_search, halving_params):
         pass
 
     @staticmethod
@@ -917,7 +1279,130 @@ class DoubleML(ABC):
 
         return learner_is_classifier
 
-    def _check_fit(self, n_jobs_cv, store_predictions, external_predictions, store_models):
+    def _check_tune_settings(self, scoring_methods, n_folds_tune, search_mode, n_iter_randomized_search, halving_params):
+        if scoring_methods is not None:
+            if (not isinstance(scoring_methods, dict)) | (not all(k in self.learner_names for k in scoring_methods)):
+                raise ValueError('Invalid scoring_methods ' + str(scoring_methods) + '. ' +
+                                 'scoring_methods must be a dictionary. ' +
+                                 'Valid keys are ' + ' and '.join(self.learner_names) + '.')
+            # if there are learners for which no scoring_method was set, we fall back to None, i.e., default scoring
+            scoring_methods = {learner: scoring_methods.get(learner) for learner in self.learner_names}
+
+        if not isinstance(n_folds_tune, int):
+            raise TypeError('The number of folds used for tuning must be of int type. '
+                            f'{str(n_folds_tune)} of type {str(type(n_folds_tune))} was passed.')
+        if n_folds_tune < 2:
+            raise ValueError('The number of folds used for tuning must be at least two. '
+                             f'{str(n_folds_tune)} was passed.')
+
+        valid_search_modes = ['grid_search', 'randomized_search', 'halving_grid_search', 'halving_randomized_search']
+        if (not isinstance(search_mode, str)) | (search_mode not in valid_search_modes):
+            raise ValueError('search_mode must be "grid_search", "randomized_search", "halving_grid_search" or '
+                             f'"halving_randomized_search". Got {str(search_mode)}.')
+
+        if not isinstance(n_iter_randomized_search, int):
+            raise TypeError('The number of parameter settings sampled for the randomized search must be of int type. '
+                            f'{str(n_iter_randomized_search)} of type '
+                            f'{str(type(n_iter_randomized_search))} was passed.')
+        if n_iter_randomized_search < 2:
+            raise ValueError('The number of parameter settings sampled for the randomized search must be at least two. '
+                             f'{str(n_iter_randomized_search)} was passed.')
+
+        return scoring_methods, self._check_halving_params(halving_params)
+
+    def _check_halving_params(self, halving_params):
+        valid_keys = ['resource', 'factor', 'min_resources', 'max_resources', 'aggressive_elimination']
+        if halving_params is None:
+            halving_params = dict()
+        if (not isinstance(halving_params, dict)) | (not all(k in self.learner_names for k in halving_params)):
+            raise ValueError('Invalid halving_params ' + str(halving_params) + '. ' +
+                             'halving_params must be a dictionary. ' +
+                             'Valid keys are ' + ' and '.join(self.learner_names) + '.')
+        for learner, params in halving_params.items():
+            if (not isinstance(params, dict)) | (not all(k in valid_keys for k in params)):
+                raise ValueError(f'Invalid halving_params for {learner}: ' + str(params) + '. ' +
+                                 'The settings must be a dictionary with keys in ' + ', '.join(valid_keys) + '.')
+        # learners without settings use the defaults of the successive halving
+        return {learner: halving_params.get(learner, dict()) for learner in self.learner_names}
+
+    def _check_fused_tuning(self, tune, tune_settings, early_stopping, multi_output):
+        if (not isinstance(early_stopping, (bool, str))) | (isinstance(early_stopping, str) & (early_stopping != 'refit')):
+            raise ValueError('early_stopping must be True, False or "refit". '
+                             f'Got {str(early_stopping)}.')
+        valid_settings = ['scoring_methods', 'n_folds_tune', 'search_mode', 'n_iter_randomized_search', 'halving_params']
+        if tune_settings is None:
+            tune_settings = dict()
+        if (not isinstance(tune_settings, dict)) | (not all(k in valid_settings for k in tune_settings)):
+            raise ValueError('Invalid tune_settings ' + str(tune_settings) + '. ' +
+                             'tune_settings must be None or a dictionary. ' +
+                             'Valid keys are ' + ', '.join(valid_settings) + '.')
+        # settings which are not supplied take the defaults of tune()
+        settings = {'scoring_methods': None, 'n_folds_tune': 5, 'search_mode': 'grid_search',
+                    'n_iter_randomized_search': 100, 'halving_params': None, **tune_settings}
+        scoring_methods, halving_params = self._check_tune_settings(**settings)
+        if tune is None:
+            return None if early_stopping is False else _FusedTuning(dict(), early_stopping=early_stopping)
+        valid_keys = self.learner_names + [learner for learner in self.params_names if learner not in self.learner_names]
+        if (not isinstance(tune, dict)) | (not all(k in valid_keys for k in tune)):
+            raise ValueError('Invalid tune ' + str(tune) + '. ' +
+                             'tune must be None or a dictionary. ' +
+                             'Valid keys are ' + ' and '.join(valid_keys) + '.')
+        if multi_output:
+            raise NotImplementedError('Tuning within the cross-fitting (tune) not implemented for multi-output '
+                                      'nuisance fitting.')
+        # the grid of a learner is used for all nuisance functions of the learner (e.g. ml_g for ml_g0 and ml_g1)
+        # unless a grid for the nuisance function is supplied; the scoring and halving settings are set per learner
+        param_grids = dict()
+        params_scoring_methods = dict()
+        params_halving_params = dict()
+        for params_name in self.params_names:
+            learners = [learner for learner in tune if params_name.startswith(learner)]
+            if len(learners) > 0:
+                param_grids[params_name] = tune[max(learners, key=len)]
+                learner = max([learner for learner in self.learner_names if params_name.startswith(learner)], key=len,
+                              default=params_name)
+                params_scoring_methods[params_name] = None if scoring_methods is None else scoring_methods.get(learner)
+                params_halving_params[params_name] = halving_params.get(learner, dict())
+        return _FusedTuning(param_grids, scoring_methods=params_scoring_methods, n_folds_tune=settings['n_folds_tune'],
+                            search_mode=settings['search_mode'],
+                            n_iter_randomized_search=settings['n_iter_randomized_search'],
+                            halving_params=params_halving_params, early_stopping=early_stopping)
+
+    def _fused_tuning_results(self, fused_tuning, kind, learner):
+        # results of a nuisance function over treatment variables and repetitions (None if not available)
+        results = fused_tuning.results[kind].get(learner, dict())
+        return {d_col: [results.get(d_col, dict()).get(i_rep) for i_rep in range(self.n_rep)]
+                for d_col in self._dml_data.d_cols}
+
+    def _set_fused_tuning_results(self, fused_tuning):
+        self._early_stopping_params = None
+        self._learner_selection = None
+        if fused_tuning is None:
+            return
+        if len(fused_tuning.candidates) > 0:
+            self._learner_selection = dict()
+            for learner in fused_tuning.candidates:
+                selection = self._fused_tuning_results(fused_tuning, 'selection', learner)
+                self._learner_selection[learner] = {
+                    key: np.stack([np.stack([rep_selection[key] for rep_selection in selection[d_col]])
+                                   for d_col in self._dml_data.d_cols], axis=1)
+                    for key in ['loss', 'weights']}
+        if fused_tuning.early_stopping is not False:
+            self._early_stopping_params = {learner: self._fused_tuning_results(fused_tuning, 'early_stopping_params', learner)
+                                           for learner in self.params_names
+                                           if learner in fused_tuning.results['early_stopping_params']}
+        for learner in fused_tuning.param_grids:
+            tuned_params = self._fused_tuning_results(fused_tuning, 'tuned_params', learner)
+            for d_col in self._dml_data.d_cols:
+                params = tuned_params[d_col]
+                if all((rep_params is not None) and (len(rep_params) == self.n_folds) for rep_params in params):
+                    self.set_ml_nuisance_params(learner, d_col, params)
+                else:
+                    warnings.warn(f'The hyperparameters of {learner} for the treatment variable {d_col} were not '
+                                  'tuned within the cross-fitting (e.g. as external predictions were supplied).')
+
+    def _check_fit(self, n_jobs_cv, store_predictions, external_predictions, store_models, multi_output, cross_fit,
+                   dtype='float64'):
         if n_jobs_cv is not None:
             if not isinstance(n_jobs_cv, int):
                 raise TypeError('The number of CPUs used to fit the learners must be of int type. '
@@ -927,8 +1412,8 @@ class DoubleML(ABC):
             raise TypeError('store_predictions must be True or False. '
                             f'Got {str(store_predictions)}.')
 
-        if not isinstance(store_models, bool):
-            raise TypeError('store_models must be True or False. '
+        if not isinstance(store_models, (bool, DoubleMLModelStore)):
+            raise TypeError('store_models must be True, False or a DoubleMLModelStore. '
                             f'Got {str(store_models)}.')
 
         # check if external predictions are implemented
@@ -941,6 +1426,20 @@ class DoubleML(ABC):
         elif not self._external_predictions_implemented and external_predictions is not None:
             raise NotImplementedError(f"External predictions not implemented for {self.__class__.__name__}.")
 
+        if not isinstance(multi_output, bool):
+            raise TypeError('multi_output must be True or False. '
+                            f'Got {str(multi_output)}.')
+        if multi_output and not self._multi_output_implemented:
+            raise NotImplementedError(f"Multi-output nuisance fitting not implemented for {self.__class__.__name__}.")
+
+        if (not isinstance(cross_fit, str)) | (cross_fit not in ['kfold', 'oob']):
+            raise ValueError('cross_fit must be "kfold" or "oob". '
+                             f'Got {str(cross_fit)}.')
+        if (cross_fit == 'oob') and not self._oob_implemented:
+            raise NotImplementedError(f"Out-of-bag cross-fitting not implemented for {self.__class__.__name__}.")
+
+        _check_dtype(dtype)
+
     def _initalize_fit(self, store_predictions, store_models):
         # initialize loss arrays for nuisance functions evaluation
         self._initialize_nuisance_loss()
@@ -948,8 +1447,9 @@ class DoubleML(ABC):
         if store_predictions:
             self._initialize_predictions_and_targets()
 
-        if store_models:
+        if store_models is not False:
             self._initialize_models()
+            self._model_store = store_models if isinstance(store_models, DoubleMLModelStore) else None
 
         if self._sensitivity_implemented:
             self._sensitivity_elements = self._initialize_sensitivity_elements((self._dml_data.n_obs,
@@ -965,7 +1465,7 @@ class DoubleML(ABC):
         # ml estimation of nuisance models and computation of score elements
         score_elements, preds = self._nuisance_est(self.__smpls, n_jobs_cv,
                                                    external_predictions=ext_prediction_dict,
-                                                   return_models=store_models)
+                                                   return_models=store_models is not False)
 
         self._set_score_elements(score_elements, self._i_rep, self._i_treat)
 
@@ -973,28 +1473,36 @@ class DoubleML(ABC):
         self._calc_nuisance_loss(preds['predictions'], preds['targets'])
         if store_predictions:
             self._store_predictions_and_targets(preds['predictions'], preds['targets'])
-        if store_models:
+        if store_models is not False:
             self._store_models(preds['models'])
 
         return preds
 
     def _solve_score_and_estimate_se(self):
-        # estimate the causal parameter
-        self._all_coef[self._i_treat, self._i_rep] = \
-            self._est_causal_pars(self._get_score_elements(self._i_rep, self._i_treat))
+        with _stage('score'):
+            # estimate the causal parameter
+            self._all_coef[self._i_treat, self._i_rep] = \
+                self._est_causal_pars(self._get_score_elements(self._i_rep, self._i_treat))
 
-        # compute score (depends on the estimated causal parameter)
-        self._psi[:, self._i_rep, self._i_treat] = self._compute_score(
-            self._get_score_elements(self._i_rep, self._i_treat),
-            self._all_coef[self._i_treat, self._i_rep])
+            # compute score (depends on the estimated causal parameter)
+            self._psi[:, self._i_rep, self._i_treat] = self._compute_score(
+                self._get_score_elements(self._i_rep, self._i_treat),
+                self._all_coef[self._i_treat, self._i_rep])
 
-        # compute score derivative (can depend on the estimated causal parameter)
-        self._psi_deriv[:, self._i_rep, self._i_treat] = self._compute_score_deriv(
-            self._get_score_elements(self._i_rep, self._i_treat),
-            self._all_coef[self._i_treat, self._i_rep])
+            # compute score derivative (can depend on the estimated causal parameter)
+            self._psi_deriv[:, self._i_rep, self._i_treat] = self._compute_score_deriv(
+                self._get_score_elements(self._i_rep, self._i_treat),
+                self._all_coef[self._i_treat, self._i_rep])
 
         # compute standard errors for causal parameter
-        self._all_se[self._i_treat, self._i_rep], self._var_scaling_factors[self._i_treat] = self._se_causal_pars()
+        with _stage('var_est'):
+            self._all_se[self._i_treat, self._i_rep], self._var_scaling_factors[self._i_treat] = self._se_causal_pars()
+
+    def _set_instrumentation_info(self, instrumentation, i_rep=None, i_treat=None):
+        # context (repetition and treatment variable) of the stages reported to the callbacks
+        if instrumentation is not None:
+            instrumentation.info['rep'] = i_rep
+            instrumentation.info['treatment'] = None if i_treat is None else self._dml_data.d_cols[i_treat]
 
     def _fit_sensitivity_elements(self, nuisance_predictions):
         if self._sensitivity_implemented:
@@ -1007,8 +1515,8 @@ class DoubleML(ABC):
 
     def _initialize_arrays(self):
         # scores
-        psi = np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan)
-        psi_deriv = np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan)
+        psi = np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan, dtype=self._dtype)
+        psi_deriv = np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan, dtype=self._dtype)
         psi_elements = self._initialize_score_elements((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs))
 
         var_scaling_factors = np.full(self._dml_data.n_treat, np.nan)
@@ -1023,10 +1531,15 @@ class DoubleML(ABC):
         return psi, psi_deriv, psi_elements, var_scaling_factors, coef, se, all_coef, all_se
 
     def _initialize_predictions_and_targets(self):
-        self._predictions = {learner: np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan)
+        score_dim = (self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs)
+        self._predictions = {learner: np.full(score_dim, np.nan, dtype=self._dtype)
                              for learner in self.params_names}
-        self._nuisance_targets = {learner: np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan)
+        # the targets are stored once per treatment variable; repetition-specific targets (e.g. targets depending on
+        # fold-wise preliminary estimates) are stored in an override array which is only allocated if required
+        self._nuisance_targets = {learner: np.full((self._dml_data.n_obs, self._dml_data.n_coefs), np.nan,
+                                                   dtype=self._dtype)
                                   for learner in self.params_names}
+        self._nuisance_targets_rep = {learner: None for learner in self.params_names}
 
     def _initialize_nuisance_loss(self):
         self._nuisance_loss = {
@@ -1041,7 +1554,21 @@ class DoubleML(ABC):
     def _store_predictions_and_targets(self, preds, targets):
         for learner in self.params_names:
             self._predictions[learner][:, self._i_rep, self._i_treat] = preds[learner]
-            self._nuisance_targets[learner][:, self._i_rep, self._i_treat] = targets[learner]
+            self._store_targets(learner, targets[learner])
+
+    def _store_targets(self, learner, targets):
+        stored_targets = self._nuisance_targets[learner]
+        if self._i_rep == 0:
+            stored_targets[:, self._i_treat] = targets
+        elif self._nuisance_targets_rep[learner] is not None:
+            self._nuisance_targets_rep[learner][:, self._i_rep, self._i_treat] = targets
+        else:
+            rep_targets = np.full(self._dml_data.n_obs, np.nan, dtype=self._dtype)
+            rep_targets[:] = targets
+            if not np.array_equal(rep_targets, stored_targets[:, self._i_treat], equal_nan=True):
+                # targets differ between the repetitions: materialize the override for all repetitions
+                self._nuisance_targets_rep[learner] = np.repeat(stored_targets[:, np.newaxis, :], self.n_rep, axis=1)
+                self._nuisance_targets_rep[learner][:, self._i_rep, self._i_treat] = rep_targets
 
     def _calc_nuisance_loss(self, preds, targets):
         self._is_classifier = {key: False for key in self.params_names}
@@ -1072,6 +1599,16 @@ class DoubleML(ABC):
                 self._nuisance_loss[learner][self._i_rep, self._i_treat] = loss
 
     def _store_models(self, models):
+        if self._model_store is not None:
+            # serialize each distinct model once, shared models (multi-output, out-of-bag) share the handle
+            handles = {id(None): None}
+            for learner in self.params_names:
+                if models[learner] is None:
+                    continue
+                for model in models[learner]:
+                    if id(model) not in handles:
+                        handles[id(model)] = self._model_store.save(model)
+                models[learner] = [handles[id(model)] for model in models[learner]]
         for learner in self.params_names:
             self._models[learner][self._dml_data.d_cols[self._i_treat]][self._i_rep] = models[learner]
 
@@ -1146,6 +1683,101 @@ class DoubleML(ABC):
             raise ValueError(f'The learners have to be a subset of {str(self.params_names)}. '
                              f'Learners {str(learners)} provided.')
 
+    def predict_nuisance(self, new_x, learners=None, aggregate='mean', chunk_size=None, n_jobs=None):
+        """
+        Predict the nuisance functions for new observations with the stored cross-fitted models.
+
+        For each repetition the predictions of the fold-wise models are aggregated. The training data is not required,
+        i.e., the models can be stored in a :class:`doubleml.utils.DoubleMLModelStore`.
+
+        Parameters
+        ----------
+        new_x : :class:`numpy.ndarray` or :class:`pandas.DataFrame`
+            The covariates of the new observations. Has to have the shape ``(n_new, n_x)``. A
+            :class:`pandas.DataFrame` has to contain the columns ``x_cols`` of the data backend.
+
+        learners : None or list
+            A list of strings which correspond to the nuisance functions of the model. ``None`` means all nuisance
+            functions.
+            Default is ``None``.
+
+        aggregate : str
+            A str (``'mean'`` or ``'median'``) specifying how the predictions of the fold-wise models are aggregated.
+            Default is ``'mean'``.
+
+        chunk_size : None or int
+            The number of rows of ``new_x`` which are predicted at once. ``None`` means all rows.
+            Default is ``None``.
+
+        n_jobs : None or int
+            The number of CPUs to use to evaluate the fold-wise models. ``None`` means ``1``.
+            Default is ``None``.
+
+        Returns
+        -------
+        predictions : dict
+            A dictionary with the nuisance functions as keys and arrays of shape ``(n_new, n_rep, n_coefs)``.
+        """
+        if not self._predict_nuisance_implemented:
+            raise NotImplementedError(f"Nuisance predictions for new data not implemented for {self.__class__.__name__}.")
+        if self._models is None:
+            raise ValueError('Apply fit() with store_models=True before predict_nuisance().')
+        if self._multi_output:
+            raise NotImplementedError('Nuisance predictions for new data not implemented for multi-output nuisance models.')
+        if self._dml_data.n_treat > 1:
+            raise NotImplementedError('Only implemented for single treatment. ' +
+                                      f'Number of treatments is {str(self._dml_data.n_treat)}.')
+
+        if learners is None:
+            learners = self.params_names
+        if not all(learner in self.params_names for learner in learners):
+            raise ValueError(f'The learners have to be a subset of {str(self.params_names)}. '
+                             f'Learners {str(learners)} provided.')
+        if (not isinstance(aggregate, str)) | (aggregate not in ['mean', 'median']):
+            raise ValueError('aggregate must be "mean" or "median". '
+                             f'Got {str(aggregate)}.')
+        if chunk_size is not None:
+            _check_integer(chunk_size, 'chunk_size', 1)
+        if n_jobs is not None:
+            _check_integer(n_jobs, 'n_jobs')
+
+        x_cols = self._dml_data.x_cols
+        if isinstance(new_x, pd.DataFrame):
+            missing_cols = [col for col in x_cols if col not in new_x.columns]
+            if missing_cols:
+                raise ValueError(f'new_x has to contain the covariates {str(x_cols)}. '
+                                 f'Columns {str(missing_cols)} are missing.')
+            new_x = new_x[x_cols]
+        new_x = check_array(new_x, force_all_finite=False)
+        if new_x.shape[1] != len(x_cols):
+            raise ValueError(f'new_x has to have {len(x_cols)} columns. '
+                             f'Array with {new_x.shape[1]} columns was passed.')
+
+        treat_var = self._dml_data.d_cols[0]
+        model_groups = list()
+        methods = list()
+        for learner in learners:
+            if any(models is None for models in self._models[learner][treat_var]):
+                raise ValueError(f'No fitted models are stored for learner {learner}. '
+                                 'Nuisance functions with external predictions cannot be predicted.')
+            learner_key = [key for key in self._learner.keys() if key in learner][0]
+            model_groups += self._models[learner][treat_var]
+            methods += [self._predict_method[learner_key]] * self.n_rep
+
+        preds = _dml_ensemble_predict(model_groups, new_x, methods, aggregate=aggregate,
+                                      chunk_size=chunk_size, n_jobs=n_jobs)
+        predictions = {learner: preds[:, (i_learner * self.n_rep):((i_learner + 1) * self.n_rep), np.newaxis]
+                       for i_learner, learner in enumerate(learners)}
+        return predictions
+
+    def _check_new_data(self, new_data):
+        if not isinstance(new_data, DoubleMLData):
+            raise TypeError('new_data must be of DoubleMLData type. '
+                            f'{str(new_data)} of type {str(type(new_data))} was passed.')
+        if new_data.n_treat != self._dml_data.n_treat:
+            raise ValueError(f'new_data has to contain {self._dml_data.n_treat} treatment variable(s). '
+                             f'{new_data.n_treat} treatment variable(s) were passed.')
+
     def draw_sample_splitting(self):
         """
         Draw sample splitting for DoubleML models.
@@ -1173,6 +1805,56 @@ class DoubleML(ABC):
 
         return self
 
+    def set_callbacks(self, callbacks):
+        """
+        Set instrumentation callbacks which are notified about the stages of ``fit()``, ``tune()`` and ``bootstrap()``.
+
+        Parameters
+        ----------
+        callbacks : list or None
+            A list of :class:`doubleml.utils.DoubleMLCallback` objects, e.g., a
+            :class:`doubleml.utils.DoubleMLRecorder` to record wall time, CPU time and peak memory of all stages.
+            ``None`` or an empty list removes all callbacks.
+
+        Returns
+        -------
+        self : object
+        """
+        if callbacks is None:
+            callbacks = list()
+        if not isinstance(callbacks, list):
+            raise TypeError('callbacks must be a list of DoubleMLCallback objects. '
+                            f'{str(callbacks)} of type {str(type(callbacks))} was passed.')
+        for callback in callbacks:
+            if not isinstance(callback, DoubleMLCallback):
+                raise TypeError('callbacks must be a list of DoubleMLCallback objects. '
+                                f'{str(callback)} of type {str(type(callback))} was passed.')
+        self._callbacks = callbacks
+        return self
+
+    def set_nuisance_store(self, nuisance_store):
+        """
+        Set a store of cross-fitted nuisance predictions which can be shared between several DoubleML models.
+
+        Nuisance functions which have already been cross-fitted with the same target, conditioning subset, sample
+        splitting, features and learner (e.g. by another model fitted on the same data and sample splitting) are
+        served from the store instead of being refitted in ``fit()``.
+
+        Parameters
+        ----------
+        nuisance_store : :class:`doubleml.utils.DoubleMLNuisanceStore` or None
+            The nuisance store. ``None`` removes the store.
+
+        Returns
+        -------
+        self : object
+        """
+        if (nuisance_store is not None) and (not isinstance(nuisance_store, DoubleMLNuisanceStore)):
+            raise TypeError('nuisance_store must be a DoubleMLNuisanceStore or None. '
+                            f'{str(nuisance_store)} of type {str(type(nuisance_store))} was passed.')
+        self._nuisance_store = nuisance_store
+        return self
+
     def set_sample_splitting(self, all_smpls, all_smpls_cluster=None):
         """
         Set the sample splitting for DoubleML models.
@@ -1324,7 +2006,9 @@ class DoubleML(ABC):
         pass
 
     def _get_score_elements(self, i_rep, i_treat):
-        psi_elements = {key: value[:, i_rep, i_treat] for key, value in self.psi_elements.items()}
+        # the parameters are always estimated in double precision (no copy for float64 storage)
+        psi_elements = {key: np.asarray(value[:, i_rep, i_treat], dtype=np.float64)
+                        for key, value in self.psi_elements.items()}
         return psi_elements
 
     def _set_score_elements(self, psi_elements, i_rep, i_treat):
@@ -1340,7 +2024,7 @@ class DoubleML(ABC):
         return
 
     def _initialize_score_elements(self, score_dim):
-        psi_elements = {key: np.full(score_dim, np.nan) for key in self._score_element_names}
+        psi_elements = {key: np.full(score_dim, np.nan, dtype=self._dtype) for key in self._score_element_names}
         return psi_elements
 
     # Sensitivity estimation and elements
@@ -1356,13 +2040,14 @@ class DoubleML(ABC):
     def _initialize_sensitivity_elements(self, score_dim):
         sensitivity_elements = {'sigma2': np.full((1, score_dim[1], score_dim[2]), np.nan),
                                 'nu2': np.full((1, score_dim[1], score_dim[2]), np.nan),
-                                'psi_sigma2': np.full(score_dim, np.nan),
-                                'psi_nu2': np.full(score_dim, np.nan),
-                                'riesz_rep': np.full(score_dim, np.nan)}
+                                'psi_sigma2': np.full(score_dim, np.nan, dtype=self._dtype),
+                                'psi_nu2': np.full(score_dim, np.nan, dtype=self._dtype),
+                                'riesz_rep': np.full(score_dim, np.nan, dtype=self._dtype)}
         return sensitivity_elements
 
     def _get_sensitivity_elements(self, i_rep, i_treat):
-        sensitivity_elements = {key: value[:, i_rep, i_treat] for key, value in self.sensitivity_elements.items()}
+        sensitivity_elements = {key: np.asarray(value[:, i_rep, i_treat], dtype=np.float64)
+                                for key, value in self.sensitivity_elements.items()}
         return sensitivity_elements
 
     def _set_sensitivity_elements(self, sensitivity_elements, i_rep, i_treat):
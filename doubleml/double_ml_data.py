@@ -126,6 +126,20 @@ class DoubleMLData(DoubleMLBaseData):
         in the covariates ``x``.
         Default is ``True``.
 
+    compress_duplicates : bool
+        Indicates whether duplicate rows of the covariates ``x`` should be collapsed into unique covariate patterns
+        for the estimation of the nuisance functions. Learners which accept a ``sample_weight`` are then trained on the
+        unique patterns with the frequencies as weights and the predictions are expanded back to the observations.
+        The sample splitting is still done on the observation level. For regression the mean target of a pattern is
+        used, i.e., only regressors with squared loss are compressed (least squares, ridge, lasso and elastic net or
+        learners with ``loss`` and ``criterion`` ``'squared_error'``); classifiers are compressed to the unique
+        patterns and classes. Learners with bootstrap or subsampling of the observations (e.g.
+        :class:`sklearn.ensemble.RandomForestRegressor` with ``bootstrap=True``), minimum numbers of observations
+        (``min_samples_leaf``, ``min_samples_split``), internal cross-validation or shuffled stochastic optimization
+        and all other regressors (e.g. :class:`sklearn.linear_model.HuberRegressor`) are fitted on all observations,
+        such that the estimates are unchanged by the compression (up to numerical precision).
+        Default is ``False``.
+
     Examples
     --------
     >>> from doubleml import DoubleMLData
@@ -146,7 +160,8 @@ class DoubleMLData(DoubleMLBaseData):
                  t_col=None,
                  s_col=None,
                  use_other_treat_as_covariate=True,
-                 force_all_x_finite=True):
+                 force_all_x_finite=True,
+                 compress_duplicates=False):
         DoubleMLBaseData.__init__(self, data)
 
         self.y_col = y_col
@@ -158,6 +173,7 @@ class DoubleMLData(DoubleMLBaseData):
         self._check_disjoint_sets_y_d_x_z_t_s()
         self.use_other_treat_as_covariate = use_other_treat_as_covariate
         self.force_all_x_finite = force_all_x_finite
+        self.compress_duplicates = compress_duplicates
         self._binary_treats = self._check_binary_treats()
         self._binary_outcome = self._check_binary_outcome()
         self._set_y_z_t_s()
@@ -184,11 +200,13 @@ class DoubleMLData(DoubleMLBaseData):
         if self.s_col is not None:
             data_summary += f'Selection variable: {self.s_col}\n'
         data_summary += f'No. Observations: {self.n_obs}\n'
+        if self.compress_duplicates:
+            data_summary += f'No. unique covariate patterns: {np.max(self.x_groups) + 1}\n'
         return data_summary
 
     @classmethod
     def from_arrays(cls, x, y, d, z=None, t=None, s=None, use_other_treat_as_covariate=True,
-                    force_all_x_finite=True):
+                    force_all_x_finite=True, compress_duplicates=False):
         """
         Initialize :class:`DoubleMLData` from :class:`numpy.ndarray`'s.
 
@@ -228,6 +246,11 @@ class DoubleMLData(DoubleMLBaseData):
             in the covariates ``x``.
             Default is ``True``.
 
+        compress_duplicates : bool
+            Indicates whether duplicate rows of the covariates ``x`` should be collapsed into unique covariate patterns
+            for the estimation of the nuisance functions.
+            Default is ``False``.
+
         Examples
         --------
         >>> from doubleml import DoubleMLData
@@ -299,7 +322,8 @@ class DoubleMLData(DoubleMLBaseData):
         if s is not None:
             data[s_col] = s
 
-        return cls(data, y_col, d_cols, x_cols, z_cols, t_col, s_col, use_other_treat_as_covariate, force_all_x_finite)
+        return cls(data, y_col, d_cols, x_cols, z_cols, t_col, s_col, use_other_treat_as_covariate, force_all_x_finite,
+                   compress_duplicates)
 
     @property
     def x(self):
@@ -599,6 +623,32 @@ class DoubleMLData(DoubleMLBaseData):
             # by default, we initialize to the first treatment variable
             self.set_x_d(self.d_cols[0])
 
+    @property
+    def compress_duplicates(self):
+        """
+        Indicates whether duplicate rows of the covariates ``x`` are collapsed for the estimation of the nuisance functions.
+        """
+        return self._compress_duplicates
+
+    @compress_duplicates.setter
+    def compress_duplicates(self, value):
+        if not isinstance(value, bool):
+            raise TypeError('compress_duplicates must be True or False. '
+                            f'Got {str(value)}.')
+        self._compress_duplicates = value
+        self._x_groups = None
+
+    @property
+    def x_groups(self):
+        """
+        Integer codes of the unique covariate patterns in ``x`` (only available if ``compress_duplicates=True``).
+        """
+        if not self.compress_duplicates:
+            return None
+        if self._x_groups is None:
+            self._x_groups = self._X.groupby(list(self._X.columns), dropna=False, sort=False).ngroup().values
+        return self._x_groups
+
     def _set_y_z_t_s(self):
         assert_all_finite(self.data.loc[:, self.y_col])
         self._y = self.data.loc[:, self.y_col]
@@ -648,6 +698,8 @@ class DoubleMLData(DoubleMLBaseData):
                               allow_nan=self.force_all_x_finite == 'allow-nan')
         self._d = self.data.loc[:, treatment_var]
         self._X = self.data.loc[:, xd_list]
+        # the covariate patterns depend on the active treatment variable
+        self._x_groups = None
 
     def _check_binary_treats(self):
         is_binary = pd.Series(dtype=bool, index=self.d_cols)
@@ -4,13 +4,12 @@ import copy
 
 from scipy.stats import norm
 from scipy.optimize import minimize_scalar
-from statsmodels.stats.multitest import multipletests
 
 from .utils._estimation import _draw_weights, _aggregate_coefs_and_ses, _var_est
-from .utils._checks import _check_bootstrap, _check_framework_compatibility, _check_in_zero_one, \
+from .utils._checks import _check_bootstrap, _check_framework_compatibility, _check_in_zero_one, _check_dtype, \
     _check_float, _check_integer, _check_bool, _check_benchmarks
 from .utils._descriptive import generate_summary
-from .utils._plots import _sensitivity_contour_plot
+from .utils._resources import _get_resources, _limit_threads
 
 
 class DoubleMLFramework():
@@ -23,11 +22,18 @@ class DoubleMLFramework():
         'all_thetas', 'all_ses', 'var_scaling_factors' and 'scaled_psi'.
         Values have to be numpy arrays with the corresponding shapes.
 
+    dtype : None, str or :class:`numpy.dtype`
+        The floating point precision (``'float32'`` or ``'float64'``) used to store ``scaled_psi`` and the
+        observation-wise sensitivity elements. All estimates, variances and bootstrap statistics are computed in double
+        precision. If ``None``, the precision of ``scaled_psi`` is used.
+        Default is ``None``.
+
     """
 
     def __init__(
             self,
             doubleml_dict=None,
+            dtype=None,
     ):
         self._is_cluster_data = False
 
@@ -48,7 +54,12 @@ class DoubleMLFramework():
         self._all_thetas = doubleml_dict['all_thetas']
         self._all_ses = doubleml_dict['all_ses']
         self._var_scaling_factors = doubleml_dict['var_scaling_factors']
-        self._scaled_psi = doubleml_dict['scaled_psi']
+
+        if dtype is None:
+            dtype = doubleml_dict['scaled_psi'].dtype
+        _check_dtype(dtype)
+        self._dtype = np.dtype(dtype)
+        self._scaled_psi = doubleml_dict['scaled_psi'].astype(self._dtype, copy=False)
 
         # initialize cluster data
         self._check_and_set_cluster_data(doubleml_dict)
@@ -90,6 +101,13 @@ class DoubleMLFramework():
         """
         return self._n_obs
 
+    @property
+    def dtype(self):
+        """
+        The floating point precision of ``scaled_psi`` and the observation-wise sensitivity elements.
+        """
+        return self._dtype
+
     @property
     def thetas(self):
         """
@@ -291,7 +309,7 @@ class DoubleMLFramework():
 
             # compute standard errors
             sigma2_hat = np.divide(
-                np.mean(np.square(scaled_psi), axis=0),
+                np.mean(np.square(scaled_psi), axis=0, dtype=np.float64),
                 var_scaling_factors.reshape(-1, 1))
             all_ses = np.sqrt(sigma2_hat)
             thetas, ses = _aggregate_coefs_and_ses(all_thetas, all_ses, var_scaling_factors)
@@ -312,7 +330,7 @@ class DoubleMLFramework():
                 nu2_score_element = self._sensitivity_elements['psi_nu2'] + other._sensitivity_elements['psi_nu2'] - \
                      np.multiply(2.0, np.multiply(self._sensitivity_elements['riesz_rep'],
                                                   self._sensitivity_elements['riesz_rep']))
-                nu2 = np.mean(nu2_score_element, axis=0, keepdims=True)
+                nu2 = np.mean(nu2_score_element, axis=0, keepdims=True, dtype=np.float64)
                 psi_nu2 = nu2_score_element - nu2
 
                 sensitivity_elements = {
@@ -324,7 +342,7 @@ class DoubleMLFramework():
                 }
                 doubleml_dict['sensitivity_elements'] = sensitivity_elements
 
-            new_obj = DoubleMLFramework(doubleml_dict)
+            new_obj = DoubleMLFramework(doubleml_dict, dtype=np.result_type(self._dtype, other._dtype))
         else:
             raise TypeError(f"Unsupported operand type: {type(other)}")
 
@@ -350,7 +368,7 @@ class DoubleMLFramework():
 
             # compute standard errors
             sigma2_hat = np.divide(
-                np.mean(np.square(scaled_psi), axis=0),
+                np.mean(np.square(scaled_psi), axis=0, dtype=np.float64),
                 var_scaling_factors.reshape(-1, 1))
             all_ses = np.sqrt(sigma2_hat)
             thetas, ses = _aggregate_coefs_and_ses(all_thetas, all_ses, var_scaling_factors)
@@ -371,7 +389,7 @@ class DoubleMLFramework():
                 nu2_score_element = self._sensitivity_elements['psi_nu2'] - other._sensitivity_elements['psi_nu2'] + \
                      np.multiply(2.0, np.multiply(self._sensitivity_elements['riesz_rep'],
                                                   self._sensitivity_elements['riesz_rep']))
-                nu2 = np.mean(nu2_score_element, axis=0, keepdims=True)
+                nu2 = np.mean(nu2_score_element, axis=0, keepdims=True, dtype=np.float64)
                 psi_nu2 = nu2_score_element - nu2
 
                 sensitivity_elements = {
@@ -383,7 +401,7 @@ class DoubleMLFramework():
                 }
                 doubleml_dict['sensitivity_elements'] = sensitivity_elements
 
-            new_obj = DoubleMLFramework(doubleml_dict)
+            new_obj = DoubleMLFramework(doubleml_dict, dtype=np.result_type(self._dtype, other._dtype))
         else:
             raise TypeError(f"Unsupported operand type: {type(other)}")
 
@@ -417,7 +435,7 @@ class DoubleMLFramework():
             # sensitivity combination only available for linear models
             if self._sensitivity_implemented:
                 nu2_score_element = np.multiply(np.square(other), self._sensitivity_elements['psi_nu2'])
-                nu2 = np.mean(nu2_score_element, axis=0, keepdims=True)
+                nu2 = np.mean(nu2_score_element, axis=0, keepdims=True, dtype=np.float64)
                 psi_nu2 = nu2_score_element - nu2
 
                 sensitivity_elements = {
@@ -429,7 +447,7 @@ class DoubleMLFramework():
                 }
                 doubleml_dict['sensitivity_elements'] = sensitivity_elements
 
-            new_obj = DoubleMLFramework(doubleml_dict)
+            new_obj = DoubleMLFramework(doubleml_dict, dtype=self._dtype)
         else:
             raise TypeError(f"Unsupported operand type: {type(other)}")
 
@@ -724,10 +742,13 @@ class DoubleMLFramework():
         # initialize bootstrap distribution array
         self._boot_t_stat = np.full((n_rep_boot, self.n_thetas, self._n_rep), np.nan)
         var_scaling = self._var_scaling_factors.reshape(-1, 1) * self._all_ses
-        for i_rep in range(self.n_rep):
-            weights = _draw_weights(method, n_rep_boot, self._n_obs)
-            bootstraped_scaled_psi = np.matmul(weights, np.divide(self._scaled_psi[:, :, i_rep], var_scaling[:, i_rep]))
-            self._boot_t_stat[:, :, i_rep] = bootstraped_scaled_psi
+        # the BLAS threads of the matrix products are limited to the core budget of an active resource manager
+        with _limit_threads(_get_resources()):
+            for i_rep in range(self.n_rep):
+                weights = _draw_weights(method, n_rep_boot, self._n_obs)
+                bootstraped_scaled_psi = np.matmul(weights,
+                                                   np.divide(self._scaled_psi[:, :, i_rep], var_scaling[:, i_rep]))
+                self._boot_t_stat[:, :, i_rep] = bootstraped_scaled_psi
 
         return self
 
@@ -791,6 +812,7 @@ class DoubleMLFramework():
                 # reorder p-values
                 p_vals_corrected_tmp = p_vals_corrected_tmp_sorted[ro]
             else:
+                from statsmodels.stats.multitest import multipletests
                 _, p_vals_corrected_tmp, _, _ = multipletests(p_vals_tmp, method=method)
 
             all_p_vals_corrected[:, i_rep] = p_vals_corrected_tmp
@@ -921,6 +943,8 @@ class DoubleMLFramework():
                 )
                 benchmark_values[benchmark_idx] = sens_dict_bench[value][bound][idx_treatment]
             benchmark_dict['value'] = benchmark_values
+        # plotly is only loaded if a plot is requested
+        from .utils._plots import _sensitivity_contour_plot
         fig = _sensitivity_contour_plot(x=cf_d_vec,
                                         y=cf_y_vec,
                                         contour_values=contour_values,
@@ -978,9 +1002,9 @@ class DoubleMLFramework():
             sensitivity_elements = {
                 'sigma2': doubleml_dict['sensitivity_elements']['sigma2'],
                 'nu2': doubleml_dict['sensitivity_elements']['nu2'],
-                'psi_sigma2': doubleml_dict['sensitivity_elements']['psi_sigma2'],
-                'psi_nu2': doubleml_dict['sensitivity_elements']['psi_nu2'],
-                'riesz_rep': doubleml_dict['sensitivity_elements']['riesz_rep'],
+                'psi_sigma2': doubleml_dict['sensitivity_elements']['psi_sigma2'].astype(self._dtype, copy=False),
+                'psi_nu2': doubleml_dict['sensitivity_elements']['psi_nu2'].astype(self._dtype, copy=False),
+                'riesz_rep': doubleml_dict['sensitivity_elements']['riesz_rep'].astype(self._dtype, copy=False),
             }
 
         self._sensitivity_implemented = sensitivity_implemented
@@ -1085,7 +1109,7 @@ def concat(objs):
 
         doubleml_dict['sensitivity_elements'] = sensitivity_elements
 
-    new_obj = DoubleMLFramework(doubleml_dict)
+    new_obj = DoubleMLFramework(doubleml_dict, dtype=np.result_type(*[obj.dtype for obj in objs]))
 
     # check internal consistency of new object
     new_obj._check_framework_shapes()
@@ -7,6 +7,7 @@ from sklearn.utils import check_X_y
 from ..double_ml import DoubleML
 
 from ..utils.blp import DoubleMLBLP
+from ..utils._blp import _group_dummies
 from ..double_ml_score_mixins import LinearScoreMixin
 
 from ..utils._estimation import _dml_cv_predict, _dml_tune, _get_cond_smpls, _cond_targets, _trimm, \
@@ -130,6 +131,7 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
 
         self._sensitivity_implemented = True
         self._external_predictions_implemented = True
+        self._oob_implemented = True
 
         # APO weights
         _check_weights(weights, score="ATE", n_obs=obj_dml_data.n_obs, n_rep=self.n_rep)
@@ -223,7 +225,9 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
         else:
             g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d0, n_jobs=n_jobs_cv,
                                      est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+                                     return_models=return_models, cross_fit=self._cross_fit,
+                                     x_groups=self._dml_data.x_groups, learner_name='ml_g0',
+                                     fused_tuning=self._fused_tuning)
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             g_hat0['targets'] = _cond_targets(g_hat0['targets'], cond_sample=(treated == 0))
 
@@ -238,7 +242,9 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
         else:
             g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d1, n_jobs=n_jobs_cv,
                                      est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+                                     return_models=return_models, cross_fit=self._cross_fit,
+                                     x_groups=self._dml_data.x_groups, learner_name='ml_g1',
+                                     fused_tuning=self._fused_tuning)
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat1['targets'] = _cond_targets(g_hat1['targets'], cond_sample=(treated == 1))
@@ -255,7 +261,9 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
         else:
             m_hat = _dml_cv_predict(self._learner['ml_m'], x, treated, smpls=smpls, n_jobs=n_jobs_cv,
                                     est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+                                    return_models=return_models, cross_fit=self._cross_fit,
+                                    x_groups=self._dml_data.x_groups, learner_name='ml_m',
+                                    fused_tuning=self._fused_tuning)
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
 
@@ -324,7 +332,7 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
         return element_dict
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                         search_mode, n_iter_randomized_search):
+                         search_mode, n_iter_randomized_search, halving_params):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
         x, treated = check_X_y(x, self.treated,
@@ -341,14 +349,14 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
         train_inds_d1 = [train_index for (train_index, _) in smpls_d1]
         g0_tune_res = _dml_tune(y, x, train_inds_d0,
                                 self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
         g1_tune_res = _dml_tune(y, x, train_inds_d1,
                                 self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
 
         m_tune_res = _dml_tune(treated, x, train_inds,
                                self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_m'])
 
         g0_best_params = [xx.best_params_ for xx in g0_tune_res]
         g1_best_params = [xx.best_params_ for xx in g1_tune_res]
@@ -393,6 +401,9 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
         """
         Calculate conditional average potential outcomes (CAPO) for a given basis.
 
+        For several repetitions of the cross-fitting, the coefficients and covariances of the best linear predictor
+        are aggregated over the repetitions with the median.
+
         Parameters
         ----------
         basis : :class:`pandas.DataFrame`
@@ -404,7 +415,8 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
             Default is ``False``.
 
         **kwargs: dict
-            Additional keyword arguments to be passed to :meth:`statsmodels.regression.linear_model.OLS.fit` e.g. ``cov_type``.
+            Additional keyword arguments to be passed to :meth:`doubleml.DoubleMLBLP.fit` e.g. ``cov_type`` or
+            ``backend``. For several repetitions of the cross-fitting only the ``'numpy'`` backend is supported.
 
         Returns
         -------
@@ -416,12 +428,10 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
             raise ValueError('Invalid score ' + self.score + '. ' +
                              'Valid score ' + ' or '.join(valid_score) + '.')
 
-        if self.n_rep != 1:
-            raise NotImplementedError('Only implemented for one repetition. ' +
-                                      f'Number of repetitions is {str(self.n_rep)}.')
-
-        # define the orthogonal signal
-        orth_signal = self.psi_elements['psi_b'].reshape(-1)
+        # define the orthogonal signal (for several repetitions the signals of all repetitions are fitted at once)
+        orth_signal = self.psi_elements['psi_b'][:, :, 0]
+        if self.n_rep == 1:
+            orth_signal = orth_signal.reshape(-1)
         # fit the best linear predictor
         model = DoubleMLBLP(orth_signal, basis=basis, is_gate=is_gate)
         model.fit(**kwargs)
@@ -437,9 +447,12 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
             The group indicator for estimating the best linear predictor. Groups should be mutually exclusive.
             Has to be dummy coded with shape ``(n_obs, d)``, where ``n_obs`` is the number of observations
             and ``d`` is the number of groups or ``(n_obs, 1)`` and contain the corresponding groups (as str).
+            A single column is dummy coded as sparse :class:`pandas.DataFrame`. For many groups, ``backend='numpy'``
+            (see :meth:`doubleml.DoubleMLBLP.fit`) estimates the group effects as group means without a dense basis.
 
         **kwargs: dict
-            Additional keyword arguments to be passed to :meth:`statsmodels.regression.linear_model.OLS.fit` e.g. ``cov_type``.
+            Additional keyword arguments to be passed to :meth:`doubleml.DoubleMLBLP.fit` e.g. ``cov_type`` or
+            ``backend``. For several repetitions of the cross-fitting only the ``'numpy'`` backend is supported.
 
         Returns
         -------
@@ -452,7 +465,7 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
 
         if not all(groups.dtypes == bool) or all(groups.dtypes == int):
             if groups.shape[1] == 1:
-                groups = pd.get_dummies(groups, prefix='Group', prefix_sep='_')
+                groups = _group_dummies(groups)
             else:
                 raise TypeError('Columns of groups must be of bool type or int type (dummy coded). '
                                 'Alternatively, groups should only contain one column.')
@@ -16,6 +16,7 @@ from ..utils.resampling import DoubleMLResampling
 from ..utils._descriptive import generate_summary
 from ..utils._checks import _check_score, _check_trimming, _check_weights, _check_sample_splitting
 from ..utils.gain_statistics import gain_statistics
+from ..utils._resources import _resources, _split_resources
 
 
 class DoubleMLAPOS:
@@ -352,7 +353,9 @@ class DoubleMLAPOS:
         Parameters
         ----------
         n_jobs_models : None or int
-            The number of CPUs to use to fit the treatment_levels. ``None`` means ``1``.
+            The number of CPUs to use to fit the treatment_levels. ``None`` means ``1``, also with an active
+            :class:`doubleml.utils.DoubleMLResourceManager` (the whole core budget is then passed on to the models);
+            parallel jobs within the budget are requested with negative values (e.g. ``-1``) or values larger than one.
             Default is ``None``.
 
         n_jobs_cv : None or int
@@ -364,9 +367,11 @@ class DoubleMLAPOS:
             Indicates whether the predictions for the nuisance functions should be stored in ``predictions``.
             Default is ``True``.
 
-        store_models : bool
+        store_models : bool or :class:`doubleml.utils.DoubleMLModelStore`
             Indicates whether the fitted models for the nuisance functions should be stored in ``models``. This allows
-            to analyze the fitted models or extract information like variable importance.
+            to analyze the fitted models or extract information like variable importance. If a
+            :class:`doubleml.utils.DoubleMLModelStore` is supplied, the models of all sub-models are serialized to
+            disk.
             Default is ``False``.
 
         external_predictions : dict or None
@@ -386,7 +391,8 @@ class DoubleMLAPOS:
         else:
             ext_pred_dict = None
 
-        # parallel estimation of the models
+        # parallel estimation of the models (with an active resource manager the core budget is split across the models)
+        n_jobs_models, model_resources = _split_resources(self.n_treatment_levels, n_jobs_models)
         parallel = Parallel(n_jobs=n_jobs_models, verbose=0, pre_dispatch='2*n_jobs')
         fitted_models = parallel(
             delayed(self._fit_model)(
@@ -394,7 +400,8 @@ class DoubleMLAPOS:
                 n_jobs_cv,
                 store_predictions,
                 store_models,
-                ext_pred_dict)
+                ext_pred_dict,
+                model_resources)
             for i_level in range(self.n_treatment_levels)
         )
 
@@ -744,15 +751,17 @@ class DoubleMLAPOS:
         acc.treatment_names = all_treatment_names
         return acc
 
-    def _fit_model(self, i_level, n_jobs_cv=None, store_predictions=True, store_models=False, external_predictions_dict=None):
+    def _fit_model(self, i_level, n_jobs_cv=None, store_predictions=True, store_models=False, external_predictions_dict=None,
+                   resources=None):
 
         model = self.modellist[i_level]
         if external_predictions_dict is not None:
             external_predictions = external_predictions_dict[self.treatment_levels[i_level]]
         else:
             external_predictions = None
-        model.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models,
-                  external_predictions=external_predictions)
+        with _resources(resources):
+            model.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models,
+                      external_predictions=external_predictions)
         return model
 
     def _check_treatment_levels(self, treatment_levels):
@@ -236,7 +236,8 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
             # get a copy of ml_m as a preliminary learner
             ml_m_prelim = clone(fitted_models['ml_m'][i_fold])
             m_hat_prelim = _dml_cv_predict(ml_m_prelim, x_train_1, d_train_1,
-                                           method='predict_proba', smpls=smpls_prelim)['preds']
+                                           method='predict_proba', smpls=smpls_prelim,
+                                           learner_name='ml_m_prelim')['preds']
 
             m_hat_prelim = _trimm(m_hat_prelim, self.trimming_rule, self.trimming_threshold)
 
@@ -315,7 +316,7 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
         return psi_elements, preds
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                         search_mode, n_iter_randomized_search):
+                         search_mode, n_iter_randomized_search, halving_params):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d,
@@ -335,11 +336,11 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
         g_target_approx = np.max(np.column_stack((g_target_1, g_target_2)), 1)
         g_tune_res = _dml_tune(g_target_approx, x, train_inds_treat,
                                self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
 
         m_tune_res = _dml_tune(d, x, train_inds,
                                self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_m'])
 
         g_best_params = [xx.best_params_ for xx in g_tune_res]
         m_best_params = [xx.best_params_ for xx in m_tune_res]
@@ -186,6 +186,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                                 f'Got {str(subgroups["never_takers"])}.')
         self.subgroups = subgroups
         self._external_predictions_implemented = True
+        self._oob_implemented = True
 
     @property
     def normalize_ipw(self):
@@ -258,7 +259,9 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
         else:
             g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_z0, n_jobs=n_jobs_cv,
                                      est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+                                     return_models=return_models, cross_fit=self._cross_fit,
+                                     x_groups=self._dml_data.x_groups, learner_name='ml_g0',
+                                     fused_tuning=self._fused_tuning)
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat0['targets'] = g_hat0['targets'].astype(float)
@@ -275,7 +278,9 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
         else:
             g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_z1, n_jobs=n_jobs_cv,
                                      est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+                                     return_models=return_models, cross_fit=self._cross_fit,
+                                     x_groups=self._dml_data.x_groups, learner_name='ml_g1',
+                                     fused_tuning=self._fused_tuning)
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat1['targets'] = g_hat1['targets'].astype(float)
@@ -293,7 +298,9 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
         else:
             m_hat = _dml_cv_predict(self._learner['ml_m'], x, z, smpls=smpls, n_jobs=n_jobs_cv,
                                     est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+                                    return_models=return_models, cross_fit=self._cross_fit,
+                                    x_groups=self._dml_data.x_groups, learner_name='ml_m',
+                                    fused_tuning=self._fused_tuning)
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
         # also trimm external predictions
@@ -309,7 +316,9 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
             else:
                 r_hat0 = _dml_cv_predict(self._learner['ml_r'], x, d, smpls=smpls_z0, n_jobs=n_jobs_cv,
                                          est_params=self._get_params('ml_r0'), method=self._predict_method['ml_r'],
-                                         return_models=return_models)
+                                         return_models=return_models, cross_fit=self._cross_fit,
+                                         x_groups=self._dml_data.x_groups, learner_name='ml_r0',
+                                         fused_tuning=self._fused_tuning)
         else:
             r_hat0 = {'preds': np.zeros_like(d), 'targets': np.zeros_like(d), 'models': None}
         if not r0:
@@ -327,7 +336,9 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
             else:
                 r_hat1 = _dml_cv_predict(self._learner['ml_r'], x, d, smpls=smpls_z1, n_jobs=n_jobs_cv,
                                          est_params=self._get_params('ml_r1'), method=self._predict_method['ml_r'],
-                                         return_models=return_models)
+                                         return_models=return_models, cross_fit=self._cross_fit,
+                                         x_groups=self._dml_data.x_groups, learner_name='ml_r1',
+                                         fused_tuning=self._fused_tuning)
         else:
             r_hat1 = {'preds': np.ones_like(d), 'targets': np.ones_like(d), 'models': None}
         if not r1:
@@ -389,7 +400,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
         return psi_a, psi_b
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                         search_mode, n_iter_randomized_search):
+                         search_mode, n_iter_randomized_search, halving_params):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
         x, z = check_X_y(x, np.ravel(self._dml_data.z),
@@ -411,18 +422,18 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
 
         g0_tune_res = _dml_tune(y, x, train_inds_z0,
                                 self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
         g1_tune_res = _dml_tune(y, x, train_inds_z1,
                                 self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
         m_tune_res = _dml_tune(z, x, train_inds,
                                self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_m'])
 
         if self.subgroups['always_takers']:
             r0_tune_res = _dml_tune(d, x, train_inds_z0,
                                     self._learner['ml_r'], param_grids['ml_r'], scoring_methods['ml_r'],
-                                    n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                    n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_r'])
             r0_best_params = [xx.best_params_ for xx in r0_tune_res]
         else:
             r0_tune_res = None
@@ -430,7 +441,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
         if self.subgroups['never_takers']:
             r1_tune_res = _dml_tune(d, x, train_inds_z1,
                                     self._learner['ml_r'], param_grids['ml_r'], scoring_methods['ml_r'],
-                                    n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                    n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_r'])
             r1_best_params = [xx.best_params_ for xx in r1_tune_res]
         else:
             r1_tune_res = None
@@ -7,6 +7,7 @@ from sklearn.utils.multiclass import type_of_target
 from ..double_ml import DoubleML
 
 from ..utils.blp import DoubleMLBLP
+from ..utils._blp import _group_dummies
 from ..utils.policytree import DoubleMLPolicyTree
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
@@ -163,6 +164,8 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
 
         self._sensitivity_implemented = True
         self._external_predictions_implemented = True
+        self._oob_implemented = True
+        self._predict_nuisance_implemented = True
 
         _check_weights(weights, score, obj_dml_data.n_obs, self.n_rep)
         self._initialize_weights(weights)
@@ -270,7 +273,9 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
         else:
             g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d0, n_jobs=n_jobs_cv,
                                      est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+                                     return_models=return_models, cross_fit=self._cross_fit,
+                                     x_groups=self._dml_data.x_groups, learner_name='ml_g0',
+                                     fused_tuning=self._fused_tuning)
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             g_hat0['targets'] = _cond_targets(g_hat0['targets'], cond_sample=(d == 0))
 
@@ -285,7 +290,9 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
         else:
             g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d1, n_jobs=n_jobs_cv,
                                      est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+                                     return_models=return_models, cross_fit=self._cross_fit,
+                                     x_groups=self._dml_data.x_groups, learner_name='ml_g1',
+                                     fused_tuning=self._fused_tuning)
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat1['targets'] = _cond_targets(g_hat1['targets'], cond_sample=(d == 1))
@@ -302,7 +309,9 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
         else:
             m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
                                     est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+                                    return_models=return_models, cross_fit=self._cross_fit,
+                                    x_groups=self._dml_data.x_groups, learner_name='ml_m',
+                                    fused_tuning=self._fused_tuning)
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
         # also trimm external predictions
@@ -389,7 +398,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
         return element_dict
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                         search_mode, n_iter_randomized_search):
+                         search_mode, n_iter_randomized_search, halving_params):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d,
@@ -406,14 +415,14 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
         train_inds_d1 = [train_index for (train_index, _) in smpls_d1]
         g0_tune_res = _dml_tune(y, x, train_inds_d0,
                                 self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
         g1_tune_res = _dml_tune(y, x, train_inds_d1,
                                 self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
 
         m_tune_res = _dml_tune(d, x, train_inds,
                                self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_m'])
 
         g0_best_params = [xx.best_params_ for xx in g0_tune_res]
         g1_best_params = [xx.best_params_ for xx in g1_tune_res]
@@ -431,10 +440,13 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
 
         return res
 
-    def cate(self, basis, is_gate=False, **kwargs):
+    def cate(self, basis, is_gate=False, new_data=None, chunk_size=None, n_jobs=None, **kwargs):
         """
         Calculate conditional average treatment effects (CATE) for a given basis.
 
+        For several repetitions of the cross-fitting, the best linear predictor is fitted to the orthogonal signals of
+        all repetitions at once and the coefficients and covariances are aggregated with the median.
+
         Parameters
         ----------
         basis : :class:`pandas.DataFrame`
@@ -445,8 +457,24 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
             Indicates whether the basis is constructed for GATEs (dummy-basis).
             Default is ``False``.
 
+        new_data : None or :class:`DoubleMLData`
+            If ``None`` the orthogonal signal of the estimation sample is used. Otherwise, the orthogonal signal is
+            evaluated for the observations of ``new_data`` with the stored nuisance models (see
+            :meth:`predict_nuisance`), e.g. to evaluate the effect heterogeneity in a new population. Then ``basis``
+            has to have as many rows as ``new_data``.
+            Default is ``None``.
+
+        chunk_size : None or int
+            The number of rows of ``new_data`` which are predicted at once. ``None`` means all rows.
+            Default is ``None``.
+
+        n_jobs : None or int
+            The number of CPUs to use to evaluate the nuisance models on ``new_data``. ``None`` means ``1``.
+            Default is ``None``.
+
         **kwargs: dict
-            Additional keyword arguments to be passed to :meth:`statsmodels.regression.linear_model.OLS.fit` e.g. ``cov_type``.
+            Additional keyword arguments to be passed to :meth:`doubleml.DoubleMLBLP.fit` e.g. ``cov_type`` or
+            ``backend``. For several repetitions of the cross-fitting only the ``'numpy'`` backend is supported.
 
         Returns
         -------
@@ -458,18 +486,19 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
             raise ValueError('Invalid score ' + self.score + '. ' +
                              'Valid score ' + ' or '.join(valid_score) + '.')
 
-        if self.n_rep != 1:
-            raise NotImplementedError('Only implemented for one repetition. ' +
-                                      f'Number of repetitions is {str(self.n_rep)}.')
-
-        # define the orthogonal signal
-        orth_signal = self.psi_elements['psi_b'].reshape(-1)
+        # define the orthogonal signal (for several repetitions the signals of all repetitions are fitted at once)
+        if new_data is None:
+            orth_signal = self.psi_elements['psi_b'][:, :, 0]
+            if self.n_rep == 1:
+                orth_signal = orth_signal.reshape(-1)
+        else:
+            orth_signal = self._new_data_orth_signal(new_data, chunk_size, n_jobs)
         # fit the best linear predictor
         model = DoubleMLBLP(orth_signal, basis=basis, is_gate=is_gate)
         model.fit(**kwargs)
         return model
 
-    def gate(self, groups, **kwargs):
+    def gate(self, groups, new_data=None, chunk_size=None, n_jobs=None, **kwargs):
         """
         Calculate group average treatment effects (GATE) for groups.
 
@@ -479,9 +508,24 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
             The group indicator for estimating the best linear predictor. Groups should be mutually exclusive.
             Has to be dummy coded with shape ``(n_obs, d)``, where ``n_obs`` is the number of observations
             and ``d`` is the number of groups or ``(n_obs, 1)`` and contain the corresponding groups (as str).
+            A single column is dummy coded as sparse :class:`pandas.DataFrame`. For many groups, ``backend='numpy'``
+            (see :meth:`doubleml.DoubleMLBLP.fit`) estimates the group effects as group means without a dense basis.
+
+        new_data : None or :class:`DoubleMLData`
+            If supplied, the GATEs are evaluated for the observations of ``new_data`` (see :meth:`cate`).
+            Default is ``None``.
+
+        chunk_size : None or int
+            The number of rows of ``new_data`` which are predicted at once. ``None`` means all rows.
+            Default is ``None``.
+
+        n_jobs : None or int
+            The number of CPUs to use to evaluate the nuisance models on ``new_data``. ``None`` means ``1``.
+            Default is ``None``.
 
         **kwargs: dict
-            Additional keyword arguments to be passed to :meth:`statsmodels.regression.linear_model.OLS.fit` e.g. ``cov_type``.
+            Additional keyword arguments to be passed to :meth:`doubleml.DoubleMLBLP.fit` e.g. ``cov_type`` or
+            ``backend``. For several repetitions of the cross-fitting only the ``'numpy'`` backend is supported.
 
         Returns
         -------
@@ -494,7 +538,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
 
         if not all(groups.dtypes == bool) or all(groups.dtypes == int):
             if groups.shape[1] == 1:
-                groups = pd.get_dummies(groups, prefix='Group', prefix_sep='_')
+                groups = _group_dummies(groups)
             else:
                 raise TypeError('Columns of groups must be of bool type or int type (dummy coded). '
                                 'Alternatively, groups should only contain one column.')
@@ -502,10 +546,31 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
         if any(groups.sum(0) <= 5):
             warnings.warn('At least one group effect is estimated with less than 6 observations.')
 
-        model = self.cate(groups, is_gate=True, **kwargs)
+        model = self.cate(groups, is_gate=True, new_data=new_data, chunk_size=chunk_size, n_jobs=n_jobs, **kwargs)
         return model
 
-    def policy_tree(self, features, depth=2, **tree_params):
+    def _new_data_orth_signal(self, new_data, chunk_size=None, n_jobs=None):
+        self._check_new_data(new_data)
+        if (not np.all(self._weights['weights'] == 1.)) or ('weights_bar' in self._weights.keys()):
+            raise NotImplementedError('Evaluation on new data not implemented for weighted scores.')
+
+        y = new_data.y.reshape(-1, 1)
+        d = new_data.d.reshape(-1, 1)
+        preds = self.predict_nuisance(new_data.data, chunk_size=chunk_size, n_jobs=n_jobs)
+        g_hat0 = preds['ml_g0'][:, :, 0]
+        g_hat1 = preds['ml_g1'][:, :, 0]
+        m_hat = _trimm(preds['ml_m'][:, :, 0], self.trimming_rule, self.trimming_threshold)
+        if self.normalize_ipw:
+            m_hat = np.column_stack([_normalize_ipw(m_hat[:, i_rep], d[:, 0]) for i_rep in range(self.n_rep)])
+
+        orth_signal = g_hat1 - g_hat0 \
+            + np.divide(np.multiply(d, y - g_hat1), m_hat) \
+            - np.divide(np.multiply(1.0 - d, y - g_hat0), 1.0 - m_hat)
+        if self.n_rep == 1:
+            orth_signal = orth_signal.reshape(-1)
+        return orth_signal
+
+    def policy_tree(self, features, depth=2, method='greedy', n_bins=None, **tree_params):
         """
         Estimate a decision tree for optimal treatment policy by weighted classification.
 
@@ -520,10 +585,21 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
             Has to be of shape ``(n_obs, d)``, where ``n_obs`` is the number of observations
             and ``d`` is the number of covariates to be included.
 
+        method : str
+            A str (``'greedy'`` or ``'exact'``) specifying whether the policy tree is learned by greedy weighted
+            classification or by an exact search of the optimal tree of depth ``1``, ``2`` or ``3``
+            (see :class:`doubleml.DoubleMLPolicyTree`).
+            Default is ``'greedy'``.
+
+        n_bins : None or int
+            The number of quantile bins of each feature which restrict the candidate split points of the exact search,
+            e.g. to fit trees for large samples. ``None`` means all midpoints of distinct feature values.
+            Default is ``None``.
+
         **tree_params : dict
             Parameters that are forwarded to the :class:`sklearn.tree.DecisionTreeClassifier`.
             Note that by default we perform minimal pruning by setting the ``ccp_alpha = 0.01`` and
-            ``min_samples_leaf = 8``. This can be adjusted.
+            ``min_samples_leaf = 8``. This can be adjusted. For ``method='exact'`` only ``min_samples_leaf`` is supported.
 
         Returns
         -------
@@ -547,6 +623,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
 
         orth_signal = self.psi_elements['psi_b'].reshape(-1)
 
-        model = DoubleMLPolicyTree(orth_signal, depth=depth, features=features, **tree_params).fit()
+        model = DoubleMLPolicyTree(orth_signal, depth=depth, features=features, method=method, n_bins=n_bins,
+                                   **tree_params).fit()
 
         return model
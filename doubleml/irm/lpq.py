@@ -387,7 +387,8 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
                 # preliminary propensity for z
                 ml_m_z_prelim = clone(fitted_models["ml_m_z"][i_fold])
                 m_z_hat_prelim = _dml_cv_predict(ml_m_z_prelim, x_train_1, z_train_1,
-                                                 method="predict_proba", smpls=smpls_prelim)[
+                                                 method="predict_proba", smpls=smpls_prelim,
+                                                 learner_name="ml_m_z_prelim")[
                     "preds"
                 ]
 
@@ -559,7 +560,15 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         return psi_elements, preds
 
     def _nuisance_tuning(
-        self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search
+        self,
+        smpls,
+        param_grids,
+        scoring_methods,
+        n_folds_tune,
+        n_jobs_cv,
+        search_mode,
+        n_iter_randomized_search,
+        halving_params,
     ):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y, force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d, force_all_finite=False)
@@ -586,6 +595,7 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
             n_jobs_cv,
             search_mode,
             n_iter_randomized_search,
+            halving_params["ml_m_z"],
         )
         m_d_z0_tune_res = _dml_tune(
             d,
@@ -598,6 +608,7 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
             n_jobs_cv,
             search_mode,
             n_iter_randomized_search,
+            halving_params["ml_m_d_z0"],
         )
         m_d_z1_tune_res = _dml_tune(
             d,
@@ -610,6 +621,7 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
             n_jobs_cv,
             search_mode,
             n_iter_randomized_search,
+            halving_params["ml_m_d_z1"],
         )
         g_du_z0_tune_res = _dml_tune(
             du,
@@ -622,6 +634,7 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
             n_jobs_cv,
             search_mode,
             n_iter_randomized_search,
+            halving_params["ml_g_du_z0"],
         )
         g_du_z1_tune_res = _dml_tune(
             du,
@@ -634,6 +647,7 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
             n_jobs_cv,
             search_mode,
             n_iter_randomized_search,
+            halving_params["ml_g_du_z1"],
         )
 
         m_z_best_params = [xx.best_params_ for xx in m_z_tune_res]
@@ -326,7 +326,8 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
                     # get a copy of ml_m as a preliminary learner
                     ml_m_prelim = clone(fitted_models["ml_m"][i_fold])
                     m_hat_prelim = _dml_cv_predict(
-                        ml_m_prelim, x_train_1, d_train_1, method="predict_proba", smpls=smpls_prelim
+                        ml_m_prelim, x_train_1, d_train_1, method="predict_proba", smpls=smpls_prelim,
+                        learner_name="ml_m_prelim",
                     )["preds"]
                 else:
                     m_hat_prelim = m_hat["preds"][np.concatenate([test for _, test in smpls_prelim])]
@@ -400,7 +401,15 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
         return psi_elements, preds
 
     def _nuisance_tuning(
-        self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search
+        self,
+        smpls,
+        param_grids,
+        scoring_methods,
+        n_folds_tune,
+        n_jobs_cv,
+        search_mode,
+        n_iter_randomized_search,
+        halving_params,
     ):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y, force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d, force_all_finite=False)
@@ -424,6 +433,7 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
             n_jobs_cv,
             search_mode,
             n_iter_randomized_search,
+            halving_params["ml_g"],
         )
 
         m_tune_res = _dml_tune(
@@ -437,6 +447,7 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
             n_jobs_cv,
             search_mode,
             n_iter_randomized_search,
+            halving_params["ml_m"],
         )
 
         g_best_params = [xx.best_params_ for xx in g_tune_res]
@@ -16,6 +16,7 @@ from ..utils.resampling import DoubleMLResampling
 from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_sample_splitting
 
 from ..utils._descriptive import generate_summary
+from ..utils._resources import _resources, _split_resources
 
 
 class DoubleMLQTE:
@@ -373,7 +374,9 @@ class DoubleMLQTE:
         Parameters
         ----------
         n_jobs_models : None or int
-            The number of CPUs to use to fit the quantiles. ``None`` means ``1``.
+            The number of CPUs to use to fit the quantiles. ``None`` means ``1``, also with an active
+            :class:`doubleml.utils.DoubleMLResourceManager` (the whole core budget is then passed on to the models);
+            parallel jobs within the budget are requested with negative values (e.g. ``-1``) or values larger than one.
             Default is ``None``.
 
         n_jobs_cv : None or int
@@ -385,9 +388,11 @@ class DoubleMLQTE:
             Indicates whether the predictions for the nuisance functions should be stored in ``predictions``.
             Default is ``True``.
 
-        store_models : bool
+        store_models : bool or :class:`doubleml.utils.DoubleMLModelStore`
             Indicates whether the fitted models for the nuisance functions should be stored in ``models``. This allows
-            to analyze the fitted models or extract information like variable importance.
+            to analyze the fitted models or extract information like variable importance. If a
+            :class:`doubleml.utils.DoubleMLModelStore` is supplied, the models of all sub-models are serialized to
+            disk.
             Default is ``False``.
 
         Returns
@@ -398,9 +403,12 @@ class DoubleMLQTE:
         if external_predictions is not None:
             raise NotImplementedError(f"External predictions not implemented for {self.__class__.__name__}.")
 
-        # parallel estimation of the quantiles
+        # parallel estimation of the quantiles (with an active resource manager the core budget is split across the
+        # quantiles)
+        n_jobs_models, model_resources = _split_resources(self.n_quantiles, n_jobs_models)
         parallel = Parallel(n_jobs=n_jobs_models, verbose=0, pre_dispatch='2*n_jobs')
-        fitted_models = parallel(delayed(self._fit_quantile)(i_quant, n_jobs_cv, store_predictions, store_models)
+        fitted_models = parallel(delayed(self._fit_quantile)(i_quant, n_jobs_cv, store_predictions, store_models,
+                                                             model_resources)
                                  for i_quant in range(self.n_quantiles))
 
         # combine the estimates and scores
@@ -584,13 +592,14 @@ class DoubleMLQTE:
 
         return p_val
 
-    def _fit_quantile(self, i_quant, n_jobs_cv=None, store_predictions=True, store_models=False):
+    def _fit_quantile(self, i_quant, n_jobs_cv=None, store_predictions=True, store_models=False, resources=None):
 
         model_0 = self.modellist_0[i_quant]
         model_1 = self.modellist_1[i_quant]
 
-        model_0.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models)
-        model_1.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models)
+        with _resources(resources):
+            model_0.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models)
+            model_1.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models)
 
         return model_0, model_1
 
@@ -222,27 +222,31 @@ class DoubleMLSSM(LinearScoreMixin, DoubleML):
         if self._score == 'missing-at-random':
             pi_hat = _dml_cv_predict(self._learner['ml_pi'], dx, s, smpls=smpls, n_jobs=n_jobs_cv,
                                      est_params=self._get_params('ml_pi'), method=self._predict_method['ml_pi'],
-                                     return_models=return_models)
+                                     return_models=return_models, learner_name='ml_pi',
+                                     fused_tuning=self._fused_tuning)
             pi_hat['targets'] = pi_hat['targets'].astype(float)
             _check_finite_predictions(pi_hat['preds'], self._learner['ml_pi'], 'ml_pi', smpls)
 
             # propensity score m
             m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
                                     est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+                                    return_models=return_models, learner_name='ml_m',
+                                    fused_tuning=self._fused_tuning)
             m_hat['targets'] = m_hat['targets'].astype(float)
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
 
             # conditional outcome
             g_hat_d1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d1_s1, n_jobs=n_jobs_cv,
                                        est_params=self._get_params('ml_g_d1'), method=self._predict_method['ml_g'],
-                                       return_models=return_models)
+                                       return_models=return_models, learner_name='ml_g_d1',
+                                       fused_tuning=self._fused_tuning)
             g_hat_d1['targets'] = g_hat_d1['targets'].astype(float)
             _check_finite_predictions(g_hat_d1['preds'], self._learner['ml_g'], 'ml_g_d1', smpls)
 
             g_hat_d0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d0_s1, n_jobs=n_jobs_cv,
                                        est_params=self._get_params('ml_g_d0'), method=self._predict_method['ml_g'],
-                                       return_models=return_models)
+                                       return_models=return_models, learner_name='ml_g_d0',
+                                       fused_tuning=self._fused_tuning)
             g_hat_d0['targets'] = g_hat_d0['targets'].astype(float)
             _check_finite_predictions(g_hat_d0['preds'], self._learner['ml_g'], 'ml_g_d0', smpls)
 
@@ -402,7 +406,7 @@ class DoubleMLSSM(LinearScoreMixin, DoubleML):
         return psi_a, psi_b
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                         search_mode, n_iter_randomized_search):
+                         search_mode, n_iter_randomized_search, halving_params):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d,
@@ -430,16 +434,16 @@ class DoubleMLSSM(LinearScoreMixin, DoubleML):
         # hyperparameter tuning for ML
         g_d0_tune_res = _dml_tune(y, x, train_inds_d0_s1,
                                   self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                  n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                  n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
         g_d1_tune_res = _dml_tune(y, x, train_inds_d1_s1,
                                   self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                  n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                  n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
         pi_tune_res = _dml_tune(s, dx, train_inds,
                                 self._learner['ml_pi'], param_grids['ml_pi'], scoring_methods['ml_pi'],
-                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_pi'])
         m_tune_res = _dml_tune(d, x, train_inds,
                                self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_m'])
 
         g_d0_best_params = [xx.best_params_ for xx in g_d0_tune_res]
         g_d1_best_params = [xx.best_params_ for xx in g_d1_tune_res]
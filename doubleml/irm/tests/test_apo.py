@@ -252,3 +252,31 @@ def test_dml_apo_capo_gapo(treatment_level, cov_type):
     assert isinstance(gapo_2.confint(), pd.DataFrame)
     assert all(gapo_2.confint().index == ["Group_1", "Group_2"])
     assert gapo_2.blp_model.cov_type == cov_type
+
+
+@pytest.mark.ci
+def test_dml_apo_capo_gapo_n_rep(treatment_level, cov_type):
+    n = 100
+    n_rep = 3
+    np.random.seed(42)
+    obj_dml_data = make_irm_data(n_obs=n, dim_x=2)
+    dml_obj = dml.DoubleMLAPO(obj_dml_data,
+                              ml_m=LogisticRegression(),
+                              ml_g=LinearRegression(),
+                              treatment_level=treatment_level,
+                              trimming_threshold=0.05,
+                              n_folds=2,
+                              n_rep=n_rep)
+    dml_obj.fit()
+    random_basis = pd.DataFrame(np.random.normal(0, 1, size=(n, 3)))
+    capo = dml_obj.capo(random_basis, cov_type=cov_type)
+
+    capos_manual = [dml.DoubleMLBLP(dml_obj.psi_elements['psi_b'][:, i_rep, 0], random_basis).fit(cov_type=cov_type)
+                    for i_rep in range(n_rep)]
+    all_params = np.column_stack([capo_manual.blp_model.params for capo_manual in capos_manual])
+    assert np.allclose(capo.blp_model.all_params, all_params)
+    assert np.allclose(capo.blp_model.params, np.median(all_params, axis=1))
+
+    groups = pd.DataFrame(np.random.choice(["1", "2"], n))
+    gapo = dml_obj.gapo(groups, cov_type=cov_type)
+    assert all(gapo.confint().index == ["Group_1", "Group_2"])
@@ -240,6 +240,40 @@ def test_dml_irm_cate_gate(cov_type):
     assert gate_2.blp_model.cov_type == cov_type
 
 
+@pytest.mark.ci
+def test_dml_irm_cate_gate_n_rep(cov_type):
+    n = 100
+    n_rep = 3
+    np.random.seed(42)
+    obj_dml_data = make_irm_data(n_obs=n, dim_x=2)
+    dml_irm_obj = dml.DoubleMLIRM(obj_dml_data,
+                                  ml_m=LogisticRegression(),
+                                  ml_g=LinearRegression(),
+                                  trimming_threshold=0.05,
+                                  n_folds=2,
+                                  n_rep=n_rep)
+    dml_irm_obj.fit()
+    random_basis = pd.DataFrame(np.random.normal(0, 1, size=(n, 3)))
+    cate = dml_irm_obj.cate(random_basis, cov_type=cov_type)
+
+    # manual: best linear predictor for the orthogonal signal of each repetition
+    cates_manual = [dml.DoubleMLBLP(dml_irm_obj.psi_elements['psi_b'][:, i_rep, 0], random_basis).fit(cov_type=cov_type)
+                    for i_rep in range(n_rep)]
+    all_params = np.column_stack([cate_manual.blp_model.params for cate_manual in cates_manual])
+    assert np.allclose(cate.blp_model.all_params, all_params)
+    assert np.allclose(cate.blp_model.params, np.median(all_params, axis=1))
+    assert cate.blp_model.cov_type == cov_type
+    assert cate.confint(random_basis, joint=True, n_rep_boot=100).shape == (n, 3)
+
+    groups = pd.DataFrame(np.random.choice(["1", "2"], n))
+    gate = dml_irm_obj.gate(groups, cov_type=cov_type)
+    assert all(gate.confint().index == ["Group_1", "Group_2"])
+    # the group effects are the medians of the group means of the orthogonal signals
+    psi_b = dml_irm_obj.psi_elements['psi_b'][:, :, 0]
+    group_means = np.column_stack([np.mean(psi_b[groups[0] == group, :], axis=0) for group in ["1", "2"]])
+    assert np.allclose(gate.blp_model.all_params, group_means.T)
+
+
 @pytest.fixture(scope='module',
                 params=[1, 3])
 def n_rep(request):
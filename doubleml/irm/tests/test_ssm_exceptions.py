@@ -128,7 +128,7 @@ def test_ssm_exception_fit():
     msg = 'store_predictions must be True or False. Got 1.'
     with pytest.raises(TypeError, match=msg):
         dml_ssm_mar.fit(store_predictions=1)
-    msg = 'store_models must be True or False. Got 1.'
+    msg = 'store_models must be True, False or a DoubleMLModelStore. Got 1.'
     with pytest.raises(TypeError, match=msg):
         dml_ssm_mar.fit(store_models=1)
 
@@ -1,7 +1,5 @@
 import numpy as np
 from sklearn.utils import check_X_y
-from sklearn.model_selection import KFold
-from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
 from sklearn.linear_model import LinearRegression
 from sklearn.dummy import DummyRegressor
 
@@ -11,7 +9,7 @@ from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _dml_tune
+from ..utils._estimation import _dml_cv_predict, _dml_cv_predict_multi_output, _dml_tune, _get_search
 from ..utils._checks import _check_finite_predictions
 
 
@@ -134,6 +132,8 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
             self._predict_method['ml_g'] = 'predict'
         self._initialize_ml_nuisance_params()
         self._external_predictions_implemented = True
+        self._multi_output_implemented = True
+        self._oob_implemented = True
 
     @classmethod
     def _partialX(cls,
@@ -272,17 +272,17 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         return psi_elements, preds
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                         search_mode, n_iter_randomized_search):
+                         search_mode, n_iter_randomized_search, halving_params):
         if self.partialX & (not self.partialZ):
             res = self._nuisance_tuning_partial_x(smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                                                  search_mode, n_iter_randomized_search)
+                                                  search_mode, n_iter_randomized_search, halving_params)
         elif (not self.partialX) & self.partialZ:
             res = self._nuisance_tuning_partial_z(smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                                                  search_mode, n_iter_randomized_search)
+                                                  search_mode, n_iter_randomized_search, halving_params)
         else:
             assert (self.partialX & self.partialZ)
             res = self._nuisance_tuning_partial_xz(smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                                                   search_mode, n_iter_randomized_search)
+                                                   search_mode, n_iter_randomized_search, halving_params)
 
         return res
 
@@ -292,15 +292,41 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         x, d = check_X_y(x, self._dml_data.d,
                          force_all_finite=False)
 
+        # nuisance l, m and r share the covariates and sample splits and can be fitted jointly with multi-output learners
+        joint_hat = dict()
+        if self._multi_output:
+            z = self._dml_data.z.reshape(self._dml_data.n_obs, -1)
+            if self._dml_data.n_instr == 1:
+                m_names = ['ml_m']
+            else:
+                m_names = ['ml_m_' + z_col for z_col in self._dml_data.z_cols]
+            nuisance_specs = [('ml_l', 'ml_l', y)] + \
+                [(m_name, 'ml_m', z[:, i_instr]) for i_instr, m_name in enumerate(m_names)] + \
+                [('ml_r', 'ml_r', d)]
+            nuisance_specs = [spec for spec in nuisance_specs if external_predictions[spec[0]] is None]
+            joint_hat = _dml_cv_predict_multi_output({name: self._learner[learner] for name, learner, _ in nuisance_specs},
+                                                     x, {name: target for name, _, target in nuisance_specs},
+                                                     smpls=smpls, n_jobs=n_jobs_cv,
+                                                     est_params={name: self._get_params(name)
+                                                                 for name, _, _ in nuisance_specs},
+                                                     methods={name: self._predict_method[learner]
+                                                              for name, learner, _ in nuisance_specs},
+                                                     return_models=return_models, cross_fit=self._cross_fit,
+                                                     x_groups=self._dml_data.x_groups, fused_tuning=self._fused_tuning)
+
         # nuisance l
         if external_predictions['ml_l'] is not None:
             l_hat = {'preds': external_predictions['ml_l'],
                      'targets': None,
                      'models': None}
+        elif 'ml_l' in joint_hat:
+            l_hat = joint_hat['ml_l']
         else:
             l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
                                     est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                    return_models=return_models)
+                                    return_models=return_models, cross_fit=self._cross_fit,
+                                    x_groups=self._dml_data.x_groups, learner_name='ml_l',
+                                    fused_tuning=self._fused_tuning)
         _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
 
         predictions = {'ml_l': l_hat['preds']}
@@ -315,10 +341,14 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                 m_hat = {'preds': external_predictions['ml_m'],
                          'targets': None,
                          'models': None}
+            elif 'ml_m' in joint_hat:
+                m_hat = joint_hat['ml_m']
             else:
                 m_hat = _dml_cv_predict(self._learner['ml_m'], x, z, smpls=smpls, n_jobs=n_jobs_cv,
                                         est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                        return_models=return_models)
+                                        return_models=return_models, cross_fit=self._cross_fit,
+                                        x_groups=self._dml_data.x_groups, learner_name='ml_m',
+                                        fused_tuning=self._fused_tuning)
             predictions['ml_m'] = m_hat['preds']
             targets['ml_m'] = m_hat['targets']
             models['ml_m'] = m_hat['models']
@@ -338,9 +368,17 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                     targets['ml_m_' + self._dml_data.z_cols[i_instr]] = None
                     models['ml_m_' + self._dml_data.z_cols[i_instr]] = None
                 else:
-                    res_cv_predict = _dml_cv_predict(self._learner['ml_m'], x, this_z, smpls=smpls, n_jobs=n_jobs_cv,
-                                                     est_params=self._get_params('ml_m_' + self._dml_data.z_cols[i_instr]),
-                                                     method=self._predict_method['ml_m'], return_models=return_models)
+                    if 'ml_m_' + self._dml_data.z_cols[i_instr] in joint_hat:
+                        res_cv_predict = joint_hat['ml_m_' + self._dml_data.z_cols[i_instr]]
+                    else:
+                        res_cv_predict = _dml_cv_predict(self._learner['ml_m'], x, this_z, smpls=smpls, n_jobs=n_jobs_cv,
+                                                         est_params=self._get_params('ml_m_' +
+                                                                                     self._dml_data.z_cols[i_instr]),
+                                                         method=self._predict_method['ml_m'],
+                                                         return_models=return_models, cross_fit=self._cross_fit,
+                                                         x_groups=self._dml_data.x_groups,
+                                                         learner_name='ml_m_' + self._dml_data.z_cols[i_instr],
+                                                         fused_tuning=self._fused_tuning)
 
                     m_hat['preds'][:, i_instr] = res_cv_predict['preds']
 
@@ -355,10 +393,14 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
             r_hat = {'preds': external_predictions['ml_r'],
                      'targets': None,
                      'models': None}
+        elif 'ml_r' in joint_hat:
+            r_hat = joint_hat['ml_r']
         else:
             r_hat = _dml_cv_predict(self._learner['ml_r'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
                                     est_params=self._get_params('ml_r'), method=self._predict_method['ml_r'],
-                                    return_models=return_models)
+                                    return_models=return_models, cross_fit=self._cross_fit,
+                                    x_groups=self._dml_data.x_groups, learner_name='ml_r',
+                                    fused_tuning=self._fused_tuning)
         _check_finite_predictions(r_hat['preds'], self._learner['ml_r'], 'ml_r', smpls)
         predictions['ml_r'] = r_hat['preds']
         targets['ml_r'] = r_hat['targets']
@@ -379,7 +421,9 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                 # nuisance g
                 g_hat = _dml_cv_predict(self._learner['ml_g'], x, y - theta_initial * d, smpls=smpls, n_jobs=n_jobs_cv,
                                         est_params=self._get_params('ml_g'), method=self._predict_method['ml_g'],
-                                        return_models=return_models)
+                                        return_models=return_models, cross_fit=self._cross_fit,
+                                        x_groups=self._dml_data.x_groups, learner_name='ml_g',
+                                        fused_tuning=self._fused_tuning)
             _check_finite_predictions(g_hat['preds'], self._learner['ml_g'], 'ml_g', smpls)
 
         predictions['ml_g'] = g_hat['preds']
@@ -444,7 +488,8 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         # nuisance m
         r_hat = _dml_cv_predict(self._learner['ml_r'], xz, d, smpls=smpls, n_jobs=n_jobs_cv,
                                 est_params=self._get_params('ml_r'), method=self._predict_method['ml_r'],
-                                return_models=return_models)
+                                return_models=return_models, cross_fit=self._cross_fit, learner_name='ml_r',
+                                fused_tuning=self._fused_tuning)
         _check_finite_predictions(r_hat['preds'], self._learner['ml_r'], 'ml_r', smpls)
 
         if isinstance(self.score, str):
@@ -475,19 +520,24 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         # nuisance l
         l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
                                 est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                return_models=return_models)
+                                return_models=return_models, cross_fit=self._cross_fit,
+                                x_groups=self._dml_data.x_groups, learner_name='ml_l',
+                                fused_tuning=self._fused_tuning)
         _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
 
         # nuisance m
         m_hat = _dml_cv_predict(self._learner['ml_m'], xz, d, smpls=smpls, n_jobs=n_jobs_cv,
                                 est_params=self._get_params('ml_m'), return_train_preds=True,
-                                method=self._predict_method['ml_m'], return_models=return_models)
+                                method=self._predict_method['ml_m'], return_models=return_models, cross_fit=self._cross_fit,
+                                learner_name='ml_m',
+                                fused_tuning=self._fused_tuning)
         _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
 
         # nuisance r
         m_hat_tilde = _dml_cv_predict(self._learner['ml_r'], x, m_hat['train_preds'], smpls=smpls, n_jobs=n_jobs_cv,
                                       est_params=self._get_params('ml_r'), method=self._predict_method['ml_r'],
-                                      return_models=return_models)
+                                      return_models=return_models, cross_fit=self._cross_fit, learner_name='ml_r',
+                                      fused_tuning=self._fused_tuning)
         _check_finite_predictions(m_hat_tilde['preds'], self._learner['ml_r'], 'ml_r', smpls)
 
         # compute residuals
@@ -518,7 +568,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         return psi_elements, preds
 
     def _nuisance_tuning_partial_x(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                                   search_mode, n_iter_randomized_search):
+                                   search_mode, n_iter_randomized_search, halving_params):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d,
@@ -533,7 +583,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         train_inds = [train_index for (train_index, _) in smpls]
         l_tune_res = _dml_tune(y, x, train_inds,
                                self._learner['ml_l'], param_grids['ml_l'], scoring_methods['ml_l'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_l'])
 
         if self._dml_data.n_instr > 1:
             # several instruments: 2SLS
@@ -546,18 +596,18 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                                                                        self._learner['ml_m'], param_grids['ml_m'],
                                                                        scoring_methods['ml_m'],
                                                                        n_folds_tune, n_jobs_cv, search_mode,
-                                                                       n_iter_randomized_search)
+                                                                       n_iter_randomized_search, halving_params['ml_m'])
         else:
             # one instrument: just identified
             x, z = check_X_y(x, np.ravel(self._dml_data.z),
                              force_all_finite=False)
             m_tune_res = _dml_tune(z, x, train_inds,
                                    self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                                   n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                   n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_m'])
 
         r_tune_res = _dml_tune(d, x, train_inds,
                                self._learner['ml_r'], param_grids['ml_r'], scoring_methods['ml_r'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_r'])
 
         l_best_params = [xx.best_params_ for xx in l_tune_res]
         r_best_params = [xx.best_params_ for xx in r_tune_res]
@@ -586,7 +636,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                 theta_initial = -np.nanmean(psi_b) / np.nanmean(psi_a)
                 g_tune_res = _dml_tune(y - theta_initial * d, x, train_inds,
                                        self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                       n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                       n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
                 g_best_params = [xx.best_params_ for xx in g_tune_res]
 
                 params = {'ml_l': l_best_params,
@@ -611,7 +661,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         return res
 
     def _nuisance_tuning_partial_z(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                                   search_mode, n_iter_randomized_search):
+                                   search_mode, n_iter_randomized_search, halving_params):
         xz, d = check_X_y(np.hstack((self._dml_data.x, self._dml_data.z)),
                           self._dml_data.d,
                           force_all_finite=False)
@@ -622,7 +672,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         train_inds = [train_index for (train_index, _) in smpls]
         m_tune_res = _dml_tune(d, xz, train_inds,
                                self._learner['ml_r'], param_grids['ml_r'], scoring_methods['ml_r'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_r'])
 
         m_best_params = [xx.best_params_ for xx in m_tune_res]
 
@@ -636,7 +686,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         return res
 
     def _nuisance_tuning_partial_xz(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                                    search_mode, n_iter_randomized_search):
+                                    search_mode, n_iter_randomized_search, halving_params):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
         xz, d = check_X_y(np.hstack((self._dml_data.x, self._dml_data.z)),
@@ -653,25 +703,17 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         train_inds = [train_index for (train_index, _) in smpls]
         l_tune_res = _dml_tune(y, x, train_inds,
                                self._learner['ml_l'], param_grids['ml_l'], scoring_methods['ml_l'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_l'])
         m_tune_res = _dml_tune(d, xz, train_inds,
                                self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_m'])
 
         r_tune_res = list()
         for idx, (train_index, _) in enumerate(smpls):
             m_hat = m_tune_res[idx].predict(xz[train_index, :])
-            r_tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
-            if search_mode == 'grid_search':
-                r_grid_search = GridSearchCV(self._learner['ml_r'], param_grids['ml_r'],
-                                             scoring=scoring_methods['ml_r'],
-                                             cv=r_tune_resampling, n_jobs=n_jobs_cv)
-            else:
-                assert search_mode == 'randomized_search'
-                r_grid_search = RandomizedSearchCV(self._learner['ml_r'], param_grids['ml_r'],
-                                                   scoring=scoring_methods['ml_r'],
-                                                   cv=r_tune_resampling, n_jobs=n_jobs_cv,
-                                                   n_iter=n_iter_randomized_search)
+            r_grid_search = _get_search(self._learner['ml_r'], param_grids['ml_r'], scoring_methods['ml_r'],
+                                        n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search,
+                                        halving_params['ml_r'])
             r_tune_res.append(r_grid_search.fit(x[train_index, :], m_hat))
 
         l_best_params = [xx.best_params_ for xx in l_tune_res]
@@ -9,8 +9,9 @@ from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 from ..utils.blp import DoubleMLBLP
+from ..utils._blp import _group_dummies
 
-from ..utils._estimation import _dml_cv_predict, _dml_tune
+from ..utils._estimation import _dml_cv_predict, _dml_cv_predict_multi_output, _dml_tune
 from ..utils._checks import _check_score, _check_finite_predictions, _check_is_propensity, _check_binary_predictions
 
 
@@ -140,6 +141,9 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         self._initialize_ml_nuisance_params()
         self._sensitivity_implemented = True
         self._external_predictions_implemented = True
+        self._multi_output_implemented = True
+        self._oob_implemented = True
+        self._predict_nuisance_implemented = True
 
     def _initialize_ml_nuisance_params(self):
         self._params = {learner: {key: [None] * self.n_rep for key in self._dml_data.d_cols}
@@ -168,6 +172,18 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         else:
             g_external = False
 
+        # nuisance l and m share the covariates and sample splits and can be fitted jointly with multi-output learners
+        fit_l_m_jointly = self._multi_output and not (l_external or m_external or
+                                                      (self._score == "IV-type" and g_external))
+        if fit_l_m_jointly:
+            l_m_hat = _dml_cv_predict_multi_output({'ml_l': self._learner['ml_l'], 'ml_m': self._learner['ml_m']},
+                                                   x, {'ml_l': y, 'ml_m': d}, smpls=smpls, n_jobs=n_jobs_cv,
+                                                   est_params={'ml_l': self._get_params('ml_l'),
+                                                               'ml_m': self._get_params('ml_m')},
+                                                   methods=self._predict_method, return_models=return_models,
+                                                   cross_fit=self._cross_fit, x_groups=self._dml_data.x_groups,
+                                                   fused_tuning=self._fused_tuning)
+
         # nuisance l
         if l_external:
             l_hat = {'preds': external_predictions['ml_l'],
@@ -177,10 +193,15 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
             l_hat = {'preds': None,
                      'targets': None,
                      'models': None}
+        elif fit_l_m_jointly:
+            l_hat = l_m_hat['ml_l']
+            _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
         else:
             l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
                                     est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                    return_models=return_models)
+                                    return_models=return_models, cross_fit=self._cross_fit,
+                                    x_groups=self._dml_data.x_groups, learner_name='ml_l',
+                                    fused_tuning=self._fused_tuning)
             _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
 
         # nuisance m
@@ -188,10 +209,15 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
             m_hat = {'preds': external_predictions['ml_m'],
                      'targets': None,
                      'models': None}
+        elif fit_l_m_jointly:
+            m_hat = l_m_hat['ml_m']
+            _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
         else:
             m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
                                     est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+                                    return_models=return_models, cross_fit=self._cross_fit,
+                                    x_groups=self._dml_data.x_groups, learner_name='ml_m',
+                                    fused_tuning=self._fused_tuning)
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
         if self._check_learner(self._learner['ml_m'], 'ml_m', regressor=True, classifier=True):
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
@@ -214,7 +240,9 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                 theta_initial = -np.nanmean(psi_b) / np.nanmean(psi_a)
                 g_hat = _dml_cv_predict(self._learner['ml_g'], x, y - theta_initial*d, smpls=smpls, n_jobs=n_jobs_cv,
                                         est_params=self._get_params('ml_g'), method=self._predict_method['ml_g'],
-                                        return_models=return_models)
+                                        return_models=return_models, cross_fit=self._cross_fit,
+                                        x_groups=self._dml_data.x_groups, learner_name='ml_g',
+                                        fused_tuning=self._fused_tuning)
                 _check_finite_predictions(g_hat['preds'], self._learner['ml_g'], 'ml_g', smpls)
 
         psi_a, psi_b = self._score_elements(y, d, l_hat['preds'], m_hat['preds'], g_hat['preds'], smpls)
@@ -286,7 +314,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         return element_dict
 
     def _nuisance_tuning(self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
-                         search_mode, n_iter_randomized_search):
+                         search_mode, n_iter_randomized_search, halving_params):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y,
                          force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d,
@@ -300,10 +328,10 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         train_inds = [train_index for (train_index, _) in smpls]
         l_tune_res = _dml_tune(y, x, train_inds,
                                self._learner['ml_l'], param_grids['ml_l'], scoring_methods['ml_l'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_l'])
         m_tune_res = _dml_tune(d, x, train_inds,
                                self._learner['ml_m'], param_grids['ml_m'], scoring_methods['ml_m'],
-                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_m'])
 
         l_best_params = [xx.best_params_ for xx in l_tune_res]
         m_best_params = [xx.best_params_ for xx in m_tune_res]
@@ -321,7 +349,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
             theta_initial = -np.nanmean(psi_b) / np.nanmean(psi_a)
             g_tune_res = _dml_tune(y - theta_initial*d, x, train_inds,
                                    self._learner['ml_g'], param_grids['ml_g'], scoring_methods['ml_g'],
-                                   n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+                                   n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params['ml_g'])
 
             g_best_params = [xx.best_params_ for xx in g_tune_res]
             params = {'ml_l': l_best_params,
@@ -341,10 +369,13 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
 
         return res
 
-    def cate(self, basis, is_gate=False, **kwargs):
+    def cate(self, basis, is_gate=False, new_data=None, chunk_size=None, n_jobs=None, **kwargs):
         """
         Calculate conditional average treatment effects (CATE) for a given basis.
 
+        For several repetitions of the cross-fitting, the best linear predictor is fitted for the partialled out
+        quantities of each repetition and the coefficients and covariances are aggregated with the median.
+
         Parameters
         ----------
         basis : :class:`pandas.DataFrame`
@@ -355,8 +386,24 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
             Indicates whether the basis is constructed for GATEs (dummy-basis).
             Default is ``False``.
 
+        new_data : None or :class:`DoubleMLData`
+            If ``None`` the partialled out outcome and treatment of the estimation sample are used. Otherwise, they are
+            evaluated for the observations of ``new_data`` with the stored nuisance models (see
+            :meth:`predict_nuisance`), e.g. to evaluate the effect heterogeneity in a new population. Then ``basis``
+            has to have as many rows as ``new_data``.
+            Default is ``None``.
+
+        chunk_size : None or int
+            The number of rows of ``new_data`` which are predicted at once. ``None`` means all rows.
+            Default is ``None``.
+
+        n_jobs : None or int
+            The number of CPUs to use to evaluate the nuisance models on ``new_data``. ``None`` means ``1``.
+            Default is ``None``.
+
         **kwargs: dict
-            Additional keyword arguments to be passed to :meth:`statsmodels.regression.linear_model.OLS.fit` e.g. ``cov_type``.
+            Additional keyword arguments to be passed to :meth:`doubleml.DoubleMLBLP.fit` e.g. ``cov_type`` or
+            ``backend``. For several repetitions of the cross-fitting only the ``'numpy'`` backend is supported.
 
         Returns
         -------
@@ -366,22 +413,21 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         if self._dml_data.n_treat > 1:
             raise NotImplementedError('Only implemented for single treatment. ' +
                                       f'Number of treatments is {str(self._dml_data.n_treat)}.')
-        if self.n_rep != 1:
-            raise NotImplementedError('Only implemented for one repetition. ' +
-                                      f'Number of repetitions is {str(self.n_rep)}.')
+        Y_tilde, D_tilde = self._partial_out(new_data, chunk_size, n_jobs)
+        if self.n_rep == 1:
+            Y_tilde, D_tilde = Y_tilde.reshape(-1), D_tilde.reshape(-1)
 
-        Y_tilde, D_tilde = self._partial_out()
-
-        D_basis = basis * D_tilde
+        # the basis is weighted with the partialled out treatment (of each repetition)
         model = DoubleMLBLP(
-            orth_signal=Y_tilde.reshape(-1),
-            basis=D_basis,
+            orth_signal=Y_tilde,
+            basis=basis,
             is_gate=is_gate,
+            basis_weights=D_tilde,
         )
         model.fit(**kwargs)
         return model
 
-    def gate(self, groups, **kwargs):
+    def gate(self, groups, new_data=None, chunk_size=None, n_jobs=None, **kwargs):
         """
         Calculate group average treatment effects (GATE) for groups.
 
@@ -391,9 +437,23 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
             The group indicator for estimating the best linear predictor. Groups should be mutually exclusive.
             Has to be dummy coded with shape ``(n_obs, d)``, where ``n_obs`` is the number of observations
             and ``d`` is the number of groups or ``(n_obs, 1)`` and contain the corresponding groups (as str).
+            A single column is dummy coded as sparse :class:`pandas.DataFrame`.
+
+        new_data : None or :class:`DoubleMLData`
+            If supplied, the GATEs are evaluated for the observations of ``new_data`` (see :meth:`cate`).
+            Default is ``None``.
+
+        chunk_size : None or int
+            The number of rows of ``new_data`` which are predicted at once. ``None`` means all rows.
+            Default is ``None``.
+
+        n_jobs : None or int
+            The number of CPUs to use to evaluate the nuisance models on ``new_data``. ``None`` means ``1``.
+            Default is ``None``.
 
         **kwargs: dict
-            Additional keyword arguments to be passed to :meth:`statsmodels.regression.linear_model.OLS.fit` e.g. ``cov_type``.
+            Additional keyword arguments to be passed to :meth:`doubleml.DoubleMLBLP.fit` e.g. ``cov_type`` or
+            ``backend``. For several repetitions of the cross-fitting only the ``'numpy'`` backend is supported.
 
         Returns
         -------
@@ -406,7 +466,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                             f'Groups of type {str(type(groups))} was passed.')
         if not all(groups.dtypes == bool) or all(groups.dtypes == int):
             if groups.shape[1] == 1:
-                groups = pd.get_dummies(groups, prefix='Group', prefix_sep='_')
+                groups = _group_dummies(groups)
             else:
                 raise TypeError('Columns of groups must be of bool type or int type (dummy coded). '
                                 'Alternatively, groups should only contain one column.')
@@ -414,14 +474,28 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         if any(groups.sum(0) <= 5):
             warnings.warn('At least one group effect is estimated with less than 6 observations.')
 
-        model = self.cate(groups, is_gate=True, **kwargs)
+        model = self.cate(groups, is_gate=True, new_data=new_data, chunk_size=chunk_size, n_jobs=n_jobs, **kwargs)
         return model
 
-    def _partial_out(self):
+    def _partial_out(self, new_data=None, chunk_size=None, n_jobs=None):
         """
         Helper function. Returns the partialled out quantities of Y and D.
         Works with multiple repetitions.
 
+        Parameters
+        ----------
+        new_data : None or :class:`DoubleMLData`
+            If supplied, the quantities are evaluated for ``new_data`` with the stored nuisance models.
+            Default is ``None``.
+
+        chunk_size : None or int
+            The number of rows of ``new_data`` which are predicted at once.
+            Default is ``None``.
+
+        n_jobs : None or int
+            The number of CPUs to use to evaluate the nuisance models on ``new_data``.
+            Default is ``None``.
+
         Returns
         -------
         Y_tilde : :class:`numpy.ndarray`
@@ -429,20 +503,27 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         D_tilde : :class:`numpy.ndarray`
             The residual of the regression of D on X.
         """
-        if self.predictions is None:
-            raise ValueError('predictions are None. Call .fit(store_predictions=True) to store the predictions.')
+        if new_data is None:
+            if self.predictions is None:
+                raise ValueError('predictions are None. Call .fit(store_predictions=True) to store the predictions.')
+            y = self._dml_data.y.reshape(-1, 1)
+            d = self._dml_data.d.reshape(-1, 1)
+            predictions = self.predictions
+        else:
+            self._check_new_data(new_data)
+            y = new_data.y.reshape(-1, 1)
+            d = new_data.d.reshape(-1, 1)
+            predictions = self.predict_nuisance(new_data.data, chunk_size=chunk_size, n_jobs=n_jobs)
 
-        y = self._dml_data.y.reshape(-1, 1)
-        d = self._dml_data.d.reshape(-1, 1)
-        ml_m = self.predictions["ml_m"].squeeze(axis=2)
+        ml_m = predictions["ml_m"].squeeze(axis=2)
 
         if self.score == "partialling out":
-            ml_l = self.predictions["ml_l"].squeeze(axis=2)
+            ml_l = predictions["ml_l"].squeeze(axis=2)
             Y_tilde = y - ml_l
             D_tilde = d - ml_m
         else:
             assert self.score == "IV-type"
-            ml_g = self.predictions["ml_g"].squeeze(axis=2)
+            ml_g = predictions["ml_g"].squeeze(axis=2)
             Y_tilde = y - (self.coef * ml_m) - ml_g
             D_tilde = d - ml_m
 
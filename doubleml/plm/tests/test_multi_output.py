@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import LinearRegression, Lasso, Ridge
+from sklearn.ensemble import RandomForestRegressor
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_pliv_CHS2015
+from doubleml.utils._estimation import _dml_cv_predict, _dml_cv_predict_multi_output
+from doubleml.utils._checks import _check_is_partition
+
+
+@pytest.fixture(scope='module',
+                params=[LinearRegression(),
+                        Lasso(alpha=0.1)])
+def learner(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=['IV-type', 'partialling out'])
+def score(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[1, 2])
+def n_rep(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_multi_output_fixture(learner, score, n_rep):
+    n_folds = 3
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=10)
+
+    kwargs = {'n_folds': n_folds, 'n_rep': n_rep, 'score': score}
+    if score == 'IV-type':
+        kwargs['ml_g'] = learner
+    np.random.seed(3141)
+    dml_plr = dml.DoubleMLPLR(dml_data, learner, learner, **kwargs)
+    dml_plr.fit(store_models=True)
+
+    dml_plr_multi_output = dml.DoubleMLPLR(dml_data, learner, learner, draw_sample_splitting=False, **kwargs)
+    dml_plr_multi_output.set_sample_splitting(dml_plr.smpls)
+    dml_plr_multi_output.fit(store_models=True, multi_output=True)
+
+    res_dict = {'dml_plr': dml_plr,
+                'dml_plr_multi_output': dml_plr_multi_output}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_multi_output_coef(dml_plr_multi_output_fixture):
+    assert np.allclose(dml_plr_multi_output_fixture['dml_plr'].coef,
+                       dml_plr_multi_output_fixture['dml_plr_multi_output'].coef,
+                       rtol=1e-9, atol=1e-4)
+    assert np.allclose(dml_plr_multi_output_fixture['dml_plr'].se,
+                       dml_plr_multi_output_fixture['dml_plr_multi_output'].se,
+                       rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_plr_multi_output_predictions(dml_plr_multi_output_fixture):
+    dml_plr = dml_plr_multi_output_fixture['dml_plr']
+    dml_plr_multi_output = dml_plr_multi_output_fixture['dml_plr_multi_output']
+    for learner in ['ml_l', 'ml_m']:
+        assert np.allclose(dml_plr.predictions[learner], dml_plr_multi_output.predictions[learner],
+                           rtol=1e-9, atol=1e-4)
+        assert np.array_equal(dml_plr.nuisance_targets[learner], dml_plr_multi_output.nuisance_targets[learner])
+
+
+@pytest.mark.ci
+def test_dml_plr_multi_output_models(dml_plr_multi_output_fixture):
+    dml_plr_multi_output = dml_plr_multi_output_fixture['dml_plr_multi_output']
+    # the same fitted multi-output model is shared between ml_l and ml_m
+    for i_rep in range(dml_plr_multi_output.n_rep):
+        for i_fold in range(dml_plr_multi_output.n_folds):
+            assert dml_plr_multi_output.models['ml_l']['d'][i_rep][i_fold] is \
+                dml_plr_multi_output.models['ml_m']['d'][i_rep][i_fold]
+
+
+@pytest.mark.ci
+def test_dml_pliv_partial_x_multi_output():
+    np.random.seed(3141)
+    dml_data = make_pliv_CHS2015(n_obs=200, dim_x=10, dim_z=2)
+    learner = LinearRegression()
+    np.random.seed(3141)
+    dml_pliv = dml.DoubleMLPLIV(dml_data, learner, learner, learner, n_folds=3)
+    dml_pliv.fit()
+    dml_pliv_multi_output = dml.DoubleMLPLIV(dml_data, learner, learner, learner, n_folds=3,
+                                             draw_sample_splitting=False)
+    dml_pliv_multi_output.set_sample_splitting(dml_pliv.smpls)
+    dml_pliv_multi_output.fit(multi_output=True)
+
+    assert np.allclose(dml_pliv.coef, dml_pliv_multi_output.coef, rtol=1e-9, atol=1e-4)
+    assert np.allclose(dml_pliv.se, dml_pliv_multi_output.se, rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_cv_predict_multi_output_grouping():
+    np.random.seed(3141)
+    n_obs = 100
+    x = np.random.normal(size=(n_obs, 5))
+    targets = {'ml_a': np.random.normal(size=n_obs),
+               'ml_b': np.random.normal(size=n_obs),
+               'ml_c': np.random.normal(size=n_obs)}
+    learners = {'ml_a': Lasso(alpha=0.1), 'ml_b': Lasso(alpha=0.1), 'ml_c': Lasso(alpha=0.2)}
+    smpls = [(np.arange(50, 100), np.arange(0, 50)), (np.arange(0, 50), np.arange(50, 100))]
+    assert _check_is_partition(smpls, n_obs)
+
+    res = _dml_cv_predict_multi_output(learners, x, targets, smpls=smpls, return_models=True)
+    # ml_a and ml_b are stacked, ml_c is fitted separately
+    assert res['ml_a']['models'][0] is res['ml_b']['models'][0]
+    assert res['ml_a']['models'][0] is not res['ml_c']['models'][0]
+    for name in targets.keys():
+        res_single = _dml_cv_predict(learners[name], x, targets[name], smpls=smpls)
+        assert np.allclose(res[name]['preds'], res_single['preds'], rtol=1e-9, atol=1e-4)
+        assert np.array_equal(res[name]['targets'], targets[name])
+
+
+@pytest.mark.ci
+def test_dml_cv_predict_multi_output_array_params():
+    np.random.seed(3141)
+    n_obs = 100
+    x = np.random.normal(size=(n_obs, 5))
+    targets = {'ml_a': np.random.normal(size=n_obs),
+               'ml_b': np.random.normal(size=n_obs),
+               'ml_c': np.random.normal(size=n_obs)}
+    learners = {name: Ridge() for name in targets.keys()}
+    smpls = [(np.arange(50, 100), np.arange(0, 50)), (np.arange(0, 50), np.arange(50, 100))]
+    # array-valued (one penalty per stacked target) and fold-specific parameters are compared element-wise
+    est_params = {'ml_a': [{'alpha': np.array([1., 2.])}, {'alpha': np.array([3., 4.])}],
+                  'ml_b': [{'alpha': np.array([1., 2.])}, {'alpha': np.array([3., 4.])}],
+                  'ml_c': [{'alpha': 1.}, {'alpha': 3.}]}
+
+    res = _dml_cv_predict_multi_output(learners, x, targets, smpls=smpls, est_params=est_params, return_models=True)
+    assert res['ml_a']['models'][0] is res['ml_b']['models'][0]
+    assert res['ml_a']['models'][0] is not res['ml_c']['models'][0]
+    for i_target, name in enumerate(['ml_a', 'ml_b']):
+        target_params = [{'alpha': params['alpha'][i_target]} for params in est_params[name]]
+        res_single = _dml_cv_predict(learners[name], x, targets[name], smpls=smpls, est_params=target_params)
+        assert np.allclose(res[name]['preds'], res_single['preds'], rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_plr_multi_output_array_params():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=10)
+    dml_plr = dml.DoubleMLPLR(dml_data, Ridge(), Ridge(), n_folds=3)
+    # one penalty per stacked target (ml_l and ml_m)
+    dml_plr.set_ml_nuisance_params('ml_l', 'd', {'alpha': np.array([1., 2.])})
+    dml_plr.set_ml_nuisance_params('ml_m', 'd', {'alpha': np.array([1., 2.])})
+    dml_plr.fit(multi_output=True)
+
+    dml_plr_single = dml.DoubleMLPLR(dml_data, Ridge(alpha=1.), Ridge(alpha=2.), n_folds=3, draw_sample_splitting=False)
+    dml_plr_single.set_sample_splitting(dml_plr.smpls)
+    dml_plr_single.fit()
+    assert np.allclose(dml_plr.coef, dml_plr_single.coef, rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_plr_multi_output_tree_learner():
+    # tree-based learners choose the splits jointly for all targets, i.e., the predictions are generally different
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=10)
+    learner = RandomForestRegressor(max_depth=2, n_estimators=10, random_state=42)
+    dml_plr = dml.DoubleMLPLR(dml_data, learner, learner, n_folds=3)
+    dml_plr.fit(store_models=True, multi_output=True)
+
+    assert np.all(np.isfinite(dml_plr.predictions['ml_l']))
+    assert np.all(np.isfinite(dml_plr.predictions['ml_m']))
+    assert dml_plr.models['ml_l']['d'][0][0].n_outputs_ == 2
@@ -350,3 +350,52 @@ def test_dml_plr_cate_gate(score, cov_type):
     assert isinstance(gate_2.confint(), pd.DataFrame)
     assert all(gate_2.confint().index == ["Group_1", "Group_2"])
     assert gate_2.blp_model.cov_type == cov_type
+
+
+@pytest.mark.ci
+def test_dml_plr_cate_gate_n_rep(score, cov_type):
+    n = 100
+    n_rep = 3
+    np.random.seed(42)
+    obj_dml_data = dml.datasets.make_plr_CCDDHNR2018(n_obs=n)
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data,
+                                  LinearRegression(), LinearRegression(), LinearRegression(),
+                                  n_folds=2,
+                                  n_rep=n_rep,
+                                  score=score)
+    dml_plr_obj.fit()
+    random_basis = pd.DataFrame(np.random.normal(0, 1, size=(n, 3)))
+    cate = dml_plr_obj.cate(random_basis, cov_type=cov_type)
+
+    # manual: best linear predictor with the partialled out quantities of each repetition
+    Y_tilde, D_tilde = dml_plr_obj._partial_out()
+    cates_manual = [dml.DoubleMLBLP(Y_tilde[:, i_rep], random_basis.mul(D_tilde[:, i_rep], axis=0)).fit(cov_type=cov_type)
+                    for i_rep in range(n_rep)]
+    all_params = np.column_stack([cate_manual.blp_model.params for cate_manual in cates_manual])
+    assert np.allclose(cate.blp_model.all_params, all_params)
+    assert np.allclose(cate.blp_model.params, np.median(all_params, axis=1))
+    assert cate.blp_model.cov_type == cov_type
+    assert cate.confint(random_basis, joint=True, n_rep_boot=100).shape == (n, 3)
+
+    groups = pd.DataFrame(np.random.choice(["1", "2"], n))
+    gate = dml_plr_obj.gate(groups, cov_type=cov_type)
+    assert all(gate.confint().index == ["Group_1", "Group_2"])
+
+    # the same convention for a single repetition: the partialled out treatment weights the (unweighted) basis
+    dml_plr_obj_single = dml.DoubleMLPLR(obj_dml_data,
+                                         LinearRegression(), LinearRegression(), LinearRegression(),
+                                         n_folds=2,
+                                         score=score)
+    dml_plr_obj_single.fit()
+    cate_single = dml_plr_obj_single.cate(random_basis, cov_type=cov_type)
+    Y_tilde, D_tilde = dml_plr_obj_single._partial_out()
+    cate_manual = dml.DoubleMLBLP(Y_tilde[:, 0], random_basis.mul(D_tilde[:, 0], axis=0)).fit(cov_type=cov_type)
+    for model in [cate, cate_single]:
+        assert model.basis is random_basis
+        assert model.basis_weights.shape == model.orth_signal.shape
+        assert list(model.confint().index) == list(random_basis.columns)
+    assert np.allclose(cate_single.basis_weights, D_tilde[:, 0])
+    assert np.allclose(cate_single.confint(), cate_manual.confint())
+    msg = 'The statsmodels backend does not support orthogonal signals of several repetitions.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.cate(random_basis, backend='statsmodels')
@@ -0,0 +1,199 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklearn.linear_model import LinearRegression, Lasso, LogisticRegression
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import HuberRegressor, LassoCV, QuantileRegressor, SGDRegressor
+from sklearn.svm import SVR
+from sklearn.tree import DecisionTreeRegressor
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+import doubleml as dml
+from doubleml.utils._estimation import _dml_cv_predict, _is_compressible_learner
+
+
+@pytest.fixture(scope='module')
+def duplicate_data():
+    np.random.seed(3141)
+    n_obs = 1000
+    x = np.column_stack((np.random.binomial(1, 0.5, size=n_obs),
+                         np.random.choice(4, size=n_obs),
+                         np.random.choice(3, size=n_obs)))
+    d = np.random.binomial(1, 0.3 + 0.1 * x[:, 1], size=n_obs)
+    y = 0.5 * d + x[:, 0] - 0.3 * x[:, 1] + x[:, 2] + np.random.normal(size=n_obs)
+    return x, y, d
+
+
+@pytest.fixture(scope='module',
+                params=[LinearRegression(),
+                        Lasso(alpha=0.01),
+                        DecisionTreeRegressor(max_depth=3)])
+def learner_g(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=['plr', 'irm'])
+def model(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_compress_fixture(duplicate_data, learner_g, model):
+    x, y, d = duplicate_data
+    dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    dml_data_compressed = dml.DoubleMLData.from_arrays(x, y, d, compress_duplicates=True)
+
+    if model == 'plr':
+        dml_obj = dml.DoubleMLPLR(dml_data, learner_g, LogisticRegression(), n_folds=3)
+        dml_obj_compressed = dml.DoubleMLPLR(dml_data_compressed, learner_g, LogisticRegression(), n_folds=3,
+                                             draw_sample_splitting=False)
+    else:
+        dml_obj = dml.DoubleMLIRM(dml_data, learner_g, LogisticRegression(), n_folds=3)
+        dml_obj_compressed = dml.DoubleMLIRM(dml_data_compressed, learner_g, LogisticRegression(), n_folds=3,
+                                             draw_sample_splitting=False)
+    dml_obj.fit()
+    dml_obj_compressed.set_sample_splitting(dml_obj.smpls)
+    dml_obj_compressed.fit()
+
+    res_dict = {'dml_obj': dml_obj,
+                'dml_obj_compressed': dml_obj_compressed}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_compress_duplicates(dml_compress_fixture):
+    dml_obj = dml_compress_fixture['dml_obj']
+    dml_obj_compressed = dml_compress_fixture['dml_obj_compressed']
+    assert np.allclose(dml_obj.coef, dml_obj_compressed.coef, rtol=1e-6, atol=1e-6)
+    assert np.allclose(dml_obj.se, dml_obj_compressed.se, rtol=1e-6, atol=1e-6)
+    for learner in dml_obj.params_names:
+        assert np.allclose(dml_obj.predictions[learner], dml_obj_compressed.predictions[learner],
+                           rtol=1e-6, atol=1e-6)
+        assert np.array_equal(dml_obj.nuisance_targets[learner], dml_obj_compressed.nuisance_targets[learner],
+                              equal_nan=True)
+
+
+@pytest.mark.ci
+def test_dml_data_x_groups(duplicate_data):
+    x, y, d = duplicate_data
+    dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    assert dml_data.x_groups is None
+
+    dml_data.compress_duplicates = True
+    x_groups = dml_data.x_groups
+    assert len(x_groups) == dml_data.n_obs
+    assert np.max(x_groups) + 1 == len(np.unique(x, axis=0))
+    # observations with the same code share the covariate pattern
+    for group in np.unique(x_groups):
+        assert np.all(x[x_groups == group] == x[x_groups == group][0])
+    assert 'No. unique covariate patterns: 24' in str(dml_data)
+
+    msg = 'compress_duplicates must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        dml_data.compress_duplicates = 1
+
+
+@pytest.mark.ci
+def test_dml_cv_predict_compressed(duplicate_data):
+    x, y, d = duplicate_data
+    x_groups = pd.DataFrame(x).groupby([0, 1, 2]).ngroup().values
+    smpls = [(np.arange(500, 1000), np.arange(0, 500)), (np.arange(0, 500), np.arange(500, 1000))]
+
+    res = _dml_cv_predict(LogisticRegression(), x, d, smpls=smpls, method='predict_proba', x_groups=x_groups,
+                          return_models=True)
+    res_full = _dml_cv_predict(LogisticRegression(), x, d, smpls=smpls, method='predict_proba')
+    assert np.allclose(res['preds'], res_full['preds'], rtol=1e-6, atol=1e-6)
+    assert np.array_equal(res['targets'], d)
+    assert len(res['models']) == 2
+
+    # learners without sample weights are fitted on all observations
+    learner = make_pipeline(StandardScaler(), Lasso(alpha=0.01))
+    res = _dml_cv_predict(learner, x, y, smpls=smpls, x_groups=x_groups)
+    res_full = _dml_cv_predict(learner, x, y, smpls=smpls)
+    assert np.array_equal(res['preds'], res_full['preds'])
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('learner', [Lasso(alpha=0.01), DecisionTreeRegressor(max_depth=3)])
+def test_dml_plr_multi_output_compressed(duplicate_data, learner):
+    x, y, d = duplicate_data
+    dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    dml_data_compressed = dml.DoubleMLData.from_arrays(x, y, d, compress_duplicates=True)
+    dml_plr = dml.DoubleMLPLR(dml_data, learner, learner, n_folds=3)
+    dml_plr.fit(multi_output=True)
+    dml_plr_compressed = dml.DoubleMLPLR(dml_data_compressed, learner, learner, n_folds=3, draw_sample_splitting=False)
+    dml_plr_compressed.set_sample_splitting(dml_plr.smpls)
+    dml_plr_compressed.fit(multi_output=True, store_models=True)
+
+    assert np.allclose(dml_plr.coef, dml_plr_compressed.coef, rtol=1e-6, atol=1e-6)
+    assert np.allclose(dml_plr.se, dml_plr_compressed.se, rtol=1e-6, atol=1e-6)
+    for learner_name in ['ml_l', 'ml_m']:
+        assert np.allclose(dml_plr.predictions[learner_name], dml_plr_compressed.predictions[learner_name],
+                           rtol=1e-6, atol=1e-6)
+    # the jointly fitted models are fitted on the unique covariate patterns of the training folds
+    for i_fold, (train_index, _) in enumerate(dml_plr_compressed.smpls[0]):
+        model = dml_plr_compressed.models['ml_l']['d'][0][i_fold]
+        assert model is dml_plr_compressed.models['ml_m']['d'][0][i_fold]
+        if isinstance(model, DecisionTreeRegressor):
+            assert model.tree_.n_node_samples[0] == len(np.unique(x[train_index, :], axis=0))
+
+
+@pytest.mark.ci
+def test_dml_compress_duplicates_inexact_learners(duplicate_data):
+    x, y, d = duplicate_data
+    assert _is_compressible_learner(LinearRegression())
+    assert _is_compressible_learner(DecisionTreeRegressor(max_depth=3))
+    assert _is_compressible_learner(RandomForestRegressor(bootstrap=False))
+    assert _is_compressible_learner(GradientBoostingRegressor())
+    assert not _is_compressible_learner(make_pipeline(StandardScaler(), Lasso()))
+    assert not _is_compressible_learner(RandomForestRegressor())
+    assert not _is_compressible_learner(GradientBoostingRegressor(subsample=0.5))
+    assert not _is_compressible_learner(HistGradientBoostingRegressor())
+    assert not _is_compressible_learner(DecisionTreeRegressor(min_samples_leaf=5))
+    assert not _is_compressible_learner(SGDRegressor())
+    # the mean target of a pattern is only exact for squared loss
+    assert not _is_compressible_learner(HuberRegressor())
+    assert not _is_compressible_learner(QuantileRegressor())
+    assert not _is_compressible_learner(SVR())
+    assert not _is_compressible_learner(GradientBoostingRegressor(loss='absolute_error'))
+    assert not _is_compressible_learner(DecisionTreeRegressor(criterion='absolute_error'))
+    assert not _is_compressible_learner(LassoCV())
+    # parameters which are set for the learner (or single folds) are taken into account
+    assert not _is_compressible_learner(DecisionTreeRegressor(), {'min_samples_leaf': 5})
+    assert not _is_compressible_learner(DecisionTreeRegressor(), [{'max_depth': 2}, {'min_samples_split': 10}])
+
+    # the weighted fit of bootstrap learners differs from the fit on all observations, i.e., they are not compressed
+    learner = RandomForestRegressor(n_estimators=10, max_depth=3, random_state=42)
+    dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    dml_data_compressed = dml.DoubleMLData.from_arrays(x, y, d, compress_duplicates=True)
+    dml_plr = dml.DoubleMLPLR(dml_data, learner, LogisticRegression(), n_folds=3)
+    dml_plr.fit()
+    dml_plr_compressed = dml.DoubleMLPLR(dml_data_compressed, learner, LogisticRegression(), n_folds=3,
+                                         draw_sample_splitting=False)
+    dml_plr_compressed.set_sample_splitting(dml_plr.smpls)
+    dml_plr_compressed.fit()
+    assert np.array_equal(dml_plr.predictions['ml_l'], dml_plr_compressed.predictions['ml_l'])
+    assert np.allclose(dml_plr.coef, dml_plr_compressed.coef, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('learner', [HuberRegressor(),
+                                     GradientBoostingRegressor(loss='absolute_error', n_estimators=20, max_depth=2,
+                                                               random_state=42),
+                                     DecisionTreeRegressor(criterion='absolute_error', max_depth=3)])
+def test_dml_compress_duplicates_non_squared_loss(duplicate_data, learner):
+    # regressors with other losses than squared loss are fitted on all observations
+    x, y, d = duplicate_data
+    dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    dml_data_compressed = dml.DoubleMLData.from_arrays(x, y, d, compress_duplicates=True)
+    dml_plr = dml.DoubleMLPLR(dml_data, learner, LinearRegression(), n_folds=3)
+    dml_plr.fit()
+    dml_plr_compressed = dml.DoubleMLPLR(dml_data_compressed, learner, LinearRegression(), n_folds=3,
+                                         draw_sample_splitting=False)
+    dml_plr_compressed.set_sample_splitting(dml_plr.smpls)
+    dml_plr_compressed.fit()
+    assert np.array_equal(dml_plr.predictions['ml_l'], dml_plr_compressed.predictions['ml_l'])
+    assert np.allclose(dml_plr.coef, dml_plr_compressed.coef, rtol=1e-9, atol=1e-9)
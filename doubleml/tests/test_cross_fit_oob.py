@@ -0,0 +1,127 @@
+import numpy as np
+import warnings
+import pytest
+
+from sklearn.base import clone
+from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier, ExtraTreesRegressor
+from sklearn.linear_model import LinearRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+from doubleml.utils._estimation import _dml_cv_predict, _n_oob_estimators
+
+
+@pytest.fixture(scope='module',
+                params=['plr', 'irm'])
+def model(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_oob_fixture(model):
+    np.random.seed(3141)
+    ml_g = RandomForestRegressor(n_estimators=50, max_depth=3, random_state=42)
+    if model == 'plr':
+        dml_data = make_plr_CCDDHNR2018(n_obs=300, dim_x=5)
+        dml_obj = dml.DoubleMLPLR(dml_data, ml_g, clone(ml_g), n_folds=3, n_rep=2)
+    else:
+        dml_data = make_irm_data(n_obs=300, dim_x=5)
+        ml_m = RandomForestClassifier(n_estimators=50, max_depth=3, random_state=42)
+        dml_obj = dml.DoubleMLIRM(dml_data, ml_g, ml_m, n_folds=3, n_rep=2, trimming_threshold=0.05)
+    dml_obj.fit(store_models=True, cross_fit='oob')
+
+    res_dict = {'dml_obj': dml_obj}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_oob_fit(dml_oob_fixture):
+    dml_obj = dml_oob_fixture['dml_obj']
+    assert dml_obj.cross_fit == 'oob'
+    assert 'Cross-fitting: oob' in str(dml_obj)
+    assert np.all(np.isfinite(dml_obj.coef))
+    assert np.all(np.isfinite(dml_obj.se))
+    for learner in dml_obj.params_names:
+        assert np.all(np.isfinite(dml_obj.predictions[learner]))
+        # one ensemble per repetition is shared by all folds
+        fold_models = dml_obj.models[learner]['d'][0]
+        assert all(fold_model is fold_models[0] for fold_model in fold_models)
+        assert hasattr(fold_models[0], 'oob_score_')
+
+
+@pytest.mark.ci
+def test_dml_cv_predict_oob():
+    np.random.seed(3141)
+    n_obs = 200
+    x = np.random.normal(size=(n_obs, 5))
+    y = x[:, 0] + np.random.normal(size=n_obs)
+    d = np.random.binomial(1, 0.5, size=n_obs)
+    smpls = [(np.where(np.arange(n_obs) % 2 == 0)[0], np.where(np.arange(n_obs) % 2 == 1)[0]),
+             (np.where(np.arange(n_obs) % 2 == 1)[0], np.where(np.arange(n_obs) % 2 == 0)[0])]
+    smpls_d1 = [(np.intersect1d(np.where(d == 1)[0], train), test) for train, test in smpls]
+    learner = RandomForestRegressor(n_estimators=50, random_state=42)
+
+    res = _dml_cv_predict(learner, x, y, smpls=smpls_d1, cross_fit='oob', return_models=True)
+    model = res['models'][0]
+    is_d1 = d == 1
+    assert np.allclose(res['preds'][is_d1], model.oob_prediction_)
+    assert np.allclose(res['preds'][~is_d1], model.predict(x[~is_d1, :]))
+    assert np.array_equal(res['targets'], y)
+
+    # learners without out-of-bag predictions are cross-fitted
+    res_linear = _dml_cv_predict(LinearRegression(), x, y, smpls=smpls, cross_fit='oob')
+    res_kfold = _dml_cv_predict(LinearRegression(), x, y, smpls=smpls)
+    assert np.allclose(res_linear['preds'], res_kfold['preds'])
+
+    # ensembles without bootstrap (also if set via the parameters) are cross-fitted
+    learner = ExtraTreesRegressor(n_estimators=10, random_state=42)
+    res_extra_trees = _dml_cv_predict(learner, x, y, smpls=smpls, cross_fit='oob')
+    res_kfold = _dml_cv_predict(learner, x, y, smpls=smpls)
+    assert np.allclose(res_extra_trees['preds'], res_kfold['preds'])
+    res_no_bootstrap = _dml_cv_predict(RandomForestRegressor(n_estimators=10, random_state=42), x, y, smpls=smpls,
+                                       est_params={'bootstrap': False}, cross_fit='oob')
+    res_kfold = _dml_cv_predict(RandomForestRegressor(n_estimators=10, random_state=42), x, y, smpls=smpls,
+                                est_params={'bootstrap': False})
+    assert np.allclose(res_no_bootstrap['preds'], res_kfold['preds'])
+
+
+@pytest.mark.ci
+def test_dml_plr_oob_no_bootstrap():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    learner = ExtraTreesRegressor(n_estimators=10, max_depth=3, random_state=42)
+    dml_plr = dml.DoubleMLPLR(dml_data, learner, learner, n_folds=2)
+    dml_plr.fit(cross_fit='oob')
+    dml_plr_kfold = dml.DoubleMLPLR(dml_data, learner, learner, n_folds=2, draw_sample_splitting=False)
+    dml_plr_kfold.set_sample_splitting(dml_plr.smpls)
+    dml_plr_kfold.fit()
+    assert np.allclose(dml_plr.coef, dml_plr_kfold.coef)
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('learner, method',
+                         [(RandomForestRegressor(n_estimators=2, random_state=42), 'predict'),
+                          (RandomForestClassifier(n_estimators=3, max_samples=0.5, random_state=42), 'predict_proba')])
+def test_dml_cv_predict_oob_not_oob_obs(learner, method):
+    np.random.seed(3141)
+    n_obs = 200
+    x = np.random.normal(size=(n_obs, 5))
+    y = np.random.binomial(1, 0.5, size=n_obs) if method == 'predict_proba' else x[:, 0] + np.random.normal(size=n_obs)
+    smpls = [(np.where(np.arange(n_obs) % 2 == 0)[0], np.where(np.arange(n_obs) % 2 == 1)[0]),
+             (np.where(np.arange(n_obs) % 2 == 1)[0], np.where(np.arange(n_obs) % 2 == 0)[0])]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        res = _dml_cv_predict(learner, x, y, smpls=smpls, method=method, cross_fit='oob', return_models=True)
+    model = res['models'][0]
+    is_not_oob = _n_oob_estimators(model, n_obs) == 0
+    assert np.any(is_not_oob) and np.any(~is_not_oob)
+    assert not np.any(np.isnan(res['preds']))
+
+    # observations which are in the bootstrap samples of all estimators are cross-fitted
+    res_kfold = _dml_cv_predict(learner, x, y, smpls=smpls, method=method)
+    assert np.allclose(res['preds'][is_not_oob], res_kfold['preds'][is_not_oob])
+    if method == 'predict_proba':
+        assert np.allclose(res['preds'][~is_not_oob], model.oob_decision_function_[~is_not_oob, 1])
+    else:
+        assert np.allclose(res['preds'][~is_not_oob], model.oob_prediction_[~is_not_oob])
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from sklearn.model_selection import KFold, cross_val_predict
+from sklearn.linear_model import LinearRegression, Ridge
+
+from doubleml.utils._estimation import _dml_cv_predict, _dml_cv_predict_linear, _dml_cv_predict_stacked, \
+    _is_linear_downdating_learner
+
+
+@pytest.fixture(scope='module',
+                params=[LinearRegression(),
+                        LinearRegression(fit_intercept=False),
+                        Ridge(alpha=2.),
+                        Ridge(alpha=0.5, fit_intercept=False)])
+def learner(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[1, 3])
+def n_targets(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def cv_predict_linear_fixture(learner, n_targets):
+    np.random.seed(3141)
+    n_obs = 500
+    x = np.random.normal(loc=2., size=(n_obs, 10))
+    y = x @ np.random.normal(size=(10, n_targets)) + 1. + np.random.normal(size=(n_obs, n_targets))
+    smpls = [(train, test) for train, test in KFold(n_splits=5, shuffle=True).split(x)]
+
+    preds = _dml_cv_predict_linear(learner, x, y, smpls)
+    preds_sklearn = cross_val_predict(learner, x, y, cv=smpls).reshape(n_obs, n_targets)
+
+    res_dict = {'preds': preds,
+                'preds_sklearn': preds_sklearn}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_cv_predict_linear(cv_predict_linear_fixture):
+    assert np.allclose(cv_predict_linear_fixture['preds'],
+                       cv_predict_linear_fixture['preds_sklearn'],
+                       rtol=1e-9, atol=1e-8)
+
+
+@pytest.mark.ci
+def test_cv_predict_linear_dispatch():
+    np.random.seed(3141)
+    n_obs = 200
+    x = np.random.normal(size=(n_obs, 5))
+    y = np.random.normal(size=(n_obs, 2))
+    smpls = [(train, test) for train, test in KFold(n_splits=4, shuffle=True).split(x)]
+
+    assert _is_linear_downdating_learner(LinearRegression())
+    assert _is_linear_downdating_learner(Ridge())
+    assert not _is_linear_downdating_learner(LinearRegression(positive=True))
+    assert not _is_linear_downdating_learner(Ridge(alpha=np.ones(2)))
+
+    res = _dml_cv_predict(Ridge(), x, y[:, 0], smpls=smpls, est_params={'alpha': 3.})
+    assert np.allclose(res['preds'], cross_val_predict(Ridge(alpha=3.), x, y[:, 0], cv=smpls),
+                       rtol=1e-9, atol=1e-8)
+
+    res = _dml_cv_predict_stacked(LinearRegression(), x, {'ml_a': y[:, 0], 'ml_b': y[:, 1]}, smpls=smpls)
+    preds_sklearn = cross_val_predict(LinearRegression(), x, y, cv=smpls)
+    assert np.allclose(res['ml_a']['preds'], preds_sklearn[:, 0], rtol=1e-9, atol=1e-8)
+    assert np.allclose(res['ml_b']['preds'], preds_sklearn[:, 1], rtol=1e-9, atol=1e-8)
+
+
+@pytest.mark.ci
+def test_cv_predict_linear_singular_design():
+    np.random.seed(3141)
+    n_obs = 200
+    x = np.random.normal(size=(n_obs, 3))
+    x = np.column_stack((x, x[:, 0]))
+    y = np.random.normal(size=n_obs)
+    smpls = [(train, test) for train, test in KFold(n_splits=4, shuffle=True).split(x)]
+
+    # singular designs are not solved in closed form
+    assert _dml_cv_predict_linear(LinearRegression(), x, y, smpls) is None
+    res = _dml_cv_predict(LinearRegression(), x, y, smpls=smpls)
+    assert np.allclose(res['preds'], cross_val_predict(LinearRegression(), x, y, cv=smpls))
+
+
+@pytest.mark.ci
+def test_cv_predict_linear_conditional_smpls():
+    np.random.seed(3141)
+    n_obs = 300
+    x = np.random.normal(size=(n_obs, 5))
+    y = np.random.normal(size=n_obs)
+    d = np.random.binomial(1, 0.5, size=n_obs)
+    smpls = [(train, test) for train, test in KFold(n_splits=3, shuffle=True).split(x)]
+    smpls_d1 = [(np.intersect1d(np.where(d == 1)[0], train), test) for train, test in smpls]
+
+    preds = _dml_cv_predict_linear(LinearRegression(), x, y, smpls_d1)
+    preds_manual = np.full(n_obs, np.nan)
+    for train, test in smpls_d1:
+        preds_manual[test] = LinearRegression().fit(x[train, :], y[train]).predict(x[test, :])
+    assert np.allclose(preds, preds_manual, rtol=1e-9, atol=1e-8)
+
+    # training folds which are not the complement of the test folds are not solved in closed form
+    smpls_overlap = [(np.arange(n_obs), test) for _, test in smpls]
+    assert _dml_cv_predict_linear(LinearRegression(), x, y, smpls_overlap) is None
@@ -6,7 +6,7 @@ from doubleml import DoubleMLData, DoubleMLClusterData
 from doubleml.datasets import fetch_401K, fetch_bonus, make_plr_CCDDHNR2018, make_plr_turrell2018, \
     make_irm_data, make_iivm_data, _make_pliv_data, make_pliv_CHS2015, make_pliv_multiway_cluster_CKMS2021, \
     make_did_SZ2020, make_confounded_irm_data, make_confounded_plr_data, make_heterogeneous_data, make_ssm_data, \
-    make_irm_data_discrete_treatments
+    make_irm_data_discrete_treatments, make_memmap_data
 
 msg_inv_return_type = 'Invalid return_type.'
 
@@ -291,6 +291,102 @@ def test_make_ssm_data_return_types():
         _ = make_ssm_data(n_obs=100, return_type='matrix')
 
 
+@pytest.fixture(scope='module',
+                params=[(make_plr_CCDDHNR2018, {'dim_x': 5}),
+                        (make_irm_data, {'dim_x': 5}),
+                        (make_iivm_data, {'dim_x': 5}),
+                        (make_pliv_CHS2015, {'dim_x': 5, 'dim_z': 2}),
+                        (make_did_SZ2020, {'dgp_type': 2, 'c': 0.5}),
+                        (make_did_SZ2020, {'cross_sectional_data': True}),
+                        (make_ssm_data, {'dim_x': 5, 'mar': False})])
+def seeded_generator(request):
+    return request.param
+
+
+@pytest.mark.ci
+def test_make_data_seeded_chunks(seeded_generator):
+    make_data, kwargs = seeded_generator
+    n_obs = 20000
+    df = make_data(n_obs=n_obs, random_state=42, return_type='DataFrame', **kwargs)
+    assert df.shape[0] == n_obs
+    # the global random state is not used
+    np.random.seed(3141)
+    assert df.equals(make_data(n_obs=n_obs, random_state=np.random.SeedSequence(42), return_type='DataFrame', **kwargs))
+    assert not df.equals(make_data(n_obs=n_obs, random_state=43, return_type='DataFrame', **kwargs))
+
+    # the chunks do not depend on the chunk_size
+    for chunk_size in [999, 16384, n_obs]:
+        chunks = list(make_data(n_obs=n_obs, random_state=42, return_type='DataFrame', chunk_size=chunk_size, **kwargs))
+        assert len(chunks) == -(-n_obs // chunk_size)
+        assert pd.concat(chunks).equals(df)
+    arrays = make_data(n_obs=n_obs, random_state=42, return_type='array', **kwargs)
+    array_chunks = list(make_data(n_obs=n_obs, random_state=42, return_type='array', chunk_size=5000, **kwargs))
+    for i_array, array in enumerate(arrays):
+        assert np.array_equal(np.concatenate([chunk[i_array] for chunk in array_chunks]), array)
+
+    # the first observations do not depend on n_obs (except for the standardized covariates of the DiD data)
+    if make_data is not make_did_SZ2020:
+        assert make_data(n_obs=100, random_state=42, return_type='DataFrame', **kwargs).equals(df.iloc[:100])
+
+
+@pytest.mark.ci
+def test_make_data_seeded_generator():
+    rng = np.random.default_rng(3141)
+    x_1, _, _ = make_plr_CCDDHNR2018(n_obs=100, random_state=rng, return_type='array')
+    x_2, _, _ = make_plr_CCDDHNR2018(n_obs=100, random_state=rng, return_type='array')
+    assert not np.array_equal(x_1, x_2)
+    x_3, _, _ = make_plr_CCDDHNR2018(n_obs=100, random_state=np.random.default_rng(3141), return_type='array')
+    assert np.array_equal(x_1, x_3)
+
+
+@pytest.mark.ci
+def test_make_data_seeded_covariates():
+    x, _, _ = make_plr_CCDDHNR2018(n_obs=100000, dim_x=6, random_state=3141, return_type='array')
+    cov_mat = np.power(0.7, np.abs(np.subtract.outer(np.arange(6), np.arange(6))))
+    assert np.allclose(np.cov(x, rowvar=False), cov_mat, atol=0.02)
+
+    x, _, _, z = make_pliv_CHS2015(n_obs=100000, dim_x=4, dim_z=2, random_state=3141, return_type='array')
+    assert np.allclose(np.var(z - x[:, :2], axis=0), 0.25, atol=0.01)
+
+    z, _, _ = make_did_SZ2020(n_obs=50000, random_state=3141, return_type='array')
+    assert np.allclose(np.mean(z, axis=0), 0.0)
+    assert np.allclose(np.std(z, axis=0), 1.0)
+
+
+@pytest.mark.ci
+def test_make_memmap_data(tmp_path):
+    filename = tmp_path / 'irm_data.npy'
+    df = make_memmap_data(make_irm_data, filename, n_obs=10000, random_state=3141, chunk_size=3000, dim_x=5)
+    df_full = make_irm_data(n_obs=10000, dim_x=5, random_state=3141, return_type='DataFrame')
+    assert df.equals(df_full)
+    assert np.array_equal(np.load(filename, mmap_mode='r'), df_full.to_numpy())
+    dml_data = DoubleMLData(df, 'y', 'd')
+    assert dml_data.n_obs == 10000
+
+
+@pytest.mark.ci
+def test_make_data_seeded_exceptions():
+    msg = 'A random_state has to be specified to simulate the data in chunks.'
+    with pytest.raises(ValueError, match=msg):
+        _ = make_irm_data(n_obs=100, chunk_size=10)
+    with pytest.raises(ValueError, match=msg):
+        _ = make_memmap_data(make_irm_data, 'irm_data.npy', n_obs=100, random_state=None)
+    msg = 'random_state must be None, an integer, a numpy.random.SeedSequence or a numpy.random.Generator. Got 1.5.'
+    with pytest.raises(TypeError, match=msg):
+        _ = make_irm_data(n_obs=100, random_state=1.5)
+    msg = 'chunk_size must be None or a positive integer. Got 0.'
+    with pytest.raises(ValueError, match=msg):
+        _ = make_irm_data(n_obs=100, random_state=42, chunk_size=0)
+    msg = "Chunks can only be returned as np.ndarray's or pd.DataFrame's. Got return_type DoubleMLData."
+    with pytest.raises(ValueError, match=msg):
+        _ = make_irm_data(n_obs=100, random_state=42, chunk_size=10)
+    with pytest.raises(ValueError, match=msg_inv_return_type):
+        _ = make_irm_data(n_obs=100, random_state=42, chunk_size=10, return_type='matrix')
+    msg = 'The dgp_type is not valid.'
+    with pytest.raises(ValueError, match=msg):
+        _ = make_did_SZ2020(n_obs=100, dgp_type=7, random_state=42, chunk_size=10)
+
+
 @pytest.fixture(scope='function',
                 params=[3, 5])
 def n_levels(request):
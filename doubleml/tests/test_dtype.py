@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+# float32 stores about seven significant digits; all accumulations are done in float64
+rtol_float32 = 1e-5
+
+
+@pytest.fixture(scope='module',
+                params=['plr', 'irm'])
+def model(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_dtype_fixture(model):
+    n_folds = 3
+    n_rep = 2
+    np.random.seed(3141)
+    if model == 'plr':
+        dml_data = make_plr_CCDDHNR2018(n_obs=500, dim_x=10)
+        dml_objs = [dml.DoubleMLPLR(dml_data, LinearRegression(), LinearRegression(), n_folds=n_folds, n_rep=n_rep)
+                    for _ in range(2)]
+    else:
+        dml_data = make_irm_data(n_obs=500, dim_x=5)
+        dml_objs = [dml.DoubleMLIRM(dml_data, LinearRegression(), LogisticRegression(), n_folds=n_folds, n_rep=n_rep)
+                    for _ in range(2)]
+    dml_obj_64, dml_obj_32 = dml_objs
+    dml_obj_32.set_sample_splitting(dml_obj_64.smpls)
+
+    dml_obj_64.fit()
+    dml_obj_32.fit(dtype='float32')
+
+    for dml_obj in dml_objs:
+        np.random.seed(3141)
+        dml_obj.bootstrap(n_rep_boot=499)
+        dml_obj.sensitivity_analysis(cf_y=0.03, cf_d=0.03)
+
+    res_dict = {'dml_obj_64': dml_obj_64,
+                'dml_obj_32': dml_obj_32}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_dtype_storage(dml_dtype_fixture):
+    dml_obj_64 = dml_dtype_fixture['dml_obj_64']
+    dml_obj_32 = dml_dtype_fixture['dml_obj_32']
+    assert dml_obj_64.dtype == np.float64
+    assert dml_obj_32.dtype == np.float32
+
+    arrays_32 = [dml_obj_32.psi, dml_obj_32.psi_deriv] + list(dml_obj_32.psi_elements.values()) + \
+        list(dml_obj_32.predictions.values()) + list(dml_obj_32.nuisance_targets.values()) + \
+        [dml_obj_32.sensitivity_elements[key] for key in ['psi_sigma2', 'psi_nu2', 'riesz_rep']] + \
+        [dml_obj_32.framework.scaled_psi]
+    assert all(array.dtype == np.float32 for array in arrays_32)
+    assert dml_obj_32.framework.dtype == np.float32
+    assert dml_obj_64.psi.dtype == np.float64
+    assert dml_obj_64.framework.scaled_psi.dtype == np.float64
+    # the parameter estimates are computed in double precision
+    assert dml_obj_32.coef.dtype == np.float64
+    assert dml_obj_32.se.dtype == np.float64
+
+
+@pytest.mark.ci
+def test_dml_dtype_accuracy(dml_dtype_fixture):
+    dml_obj_64 = dml_dtype_fixture['dml_obj_64']
+    dml_obj_32 = dml_dtype_fixture['dml_obj_32']
+    assert np.allclose(dml_obj_32.all_coef, dml_obj_64.all_coef, rtol=rtol_float32, atol=1e-6)
+    assert np.allclose(dml_obj_32.all_se, dml_obj_64.all_se, rtol=rtol_float32, atol=1e-7)
+    assert np.allclose(dml_obj_32.psi, dml_obj_64.psi, rtol=rtol_float32, atol=1e-5, equal_nan=True)
+    for learner in dml_obj_64.params_names:
+        assert np.allclose(dml_obj_32.predictions[learner], dml_obj_64.predictions[learner],
+                           rtol=rtol_float32, atol=1e-6)
+
+
+@pytest.mark.ci
+def test_dml_dtype_inference(dml_dtype_fixture):
+    dml_obj_64 = dml_dtype_fixture['dml_obj_64']
+    dml_obj_32 = dml_dtype_fixture['dml_obj_32']
+    assert np.allclose(dml_obj_32.confint(joint=True), dml_obj_64.confint(joint=True), rtol=1e-4, atol=1e-5)
+    assert np.allclose(dml_obj_32.framework.boot_t_stat, dml_obj_64.framework.boot_t_stat, rtol=1e-4, atol=1e-4)
+    for key in ['theta', 'se', 'ci']:
+        for bound in ['lower', 'upper']:
+            assert np.allclose(dml_obj_32.sensitivity_params[key][bound], dml_obj_64.sensitivity_params[key][bound],
+                               rtol=1e-4, atol=1e-5)
+    for key in ['rv', 'rva']:
+        assert np.allclose(dml_obj_32.sensitivity_params[key], dml_obj_64.sensitivity_params[key],
+                           rtol=1e-3, atol=1e-5)
+
+
+@pytest.mark.ci
+def test_dml_dtype_framework_operations(dml_dtype_fixture):
+    framework_32 = dml_dtype_fixture['dml_obj_32'].framework
+    framework_64 = dml_dtype_fixture['dml_obj_64'].framework
+    assert (2 * framework_32).dtype == np.float32
+    assert (framework_32 - framework_32).dtype == np.float32
+    assert dml.concat([framework_32, framework_32]).dtype == np.float32
+    assert (framework_32 + framework_64).dtype == np.float64
+    assert np.allclose((framework_32 + framework_32).all_ses, (framework_64 + framework_64).all_ses,
+                       rtol=rtol_float32, atol=1e-7)
@@ -8,6 +8,7 @@ from doubleml import DoubleMLPLR, DoubleMLIRM, DoubleMLIIVM, DoubleMLPLIV, Doubl
     DoubleMLDIDCS, DoubleMLBLP
 from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data, make_pliv_CHS2015, make_iivm_data, \
     make_pliv_multiway_cluster_CKMS2021, make_did_SZ2020
+from doubleml.utils import DoubleMLRecorder
 
 from ._utils import DummyDataClass
 
@@ -696,9 +697,37 @@ def test_doubleml_exception_fit():
     msg = 'store_predictions must be True or False. Got 1.'
     with pytest.raises(TypeError, match=msg):
         dml_plr.fit(store_predictions=1)
-    msg = 'store_models must be True or False. Got 1.'
+    msg = 'store_models must be True, False or a DoubleMLModelStore. Got 1.'
     with pytest.raises(TypeError, match=msg):
         dml_plr.fit(store_models=1)
+    msg = 'multi_output must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit(multi_output=1)
+    msg = 'Multi-output nuisance fitting not implemented for DoubleMLIRM.'
+    with pytest.raises(NotImplementedError, match=msg):
+        DoubleMLIRM(dml_data_irm, Lasso(), LogisticRegression()).fit(multi_output=True)
+    msg = 'cross_fit must be "kfold" or "oob". Got bagging.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit(cross_fit='bagging')
+    msg = 'Out-of-bag cross-fitting not implemented for DoubleMLPQ.'
+    with pytest.raises(NotImplementedError, match=msg):
+        DoubleMLPQ(dml_data_irm, LogisticRegression(), LogisticRegression(), treatment=1).fit(cross_fit='oob')
+    msg = 'dtype must be "float32" or "float64". Got int64.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.fit(dtype='int64')
+
+
+@pytest.mark.ci
+def test_doubleml_exception_set_callbacks():
+    msg = "callbacks must be a list of DoubleMLCallback objects. recorder of type <class 'str'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.set_callbacks('recorder')
+    msg = "callbacks must be a list of DoubleMLCallback objects. 1 of type <class 'int'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.set_callbacks([1])
+    msg = 'trace_memory must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        DoubleMLRecorder(trace_memory=1)
 
 
 @pytest.mark.ci
@@ -804,10 +833,19 @@ def test_doubleml_exception_tune():
     with pytest.raises(TypeError, match=msg):
         dml_plr.tune(param_grids, n_folds_tune=1.)
 
-    msg = 'search_mode must be "grid_search" or "randomized_search". Got gridsearch.'
+    msg = ('search_mode must be "grid_search", "randomized_search", "halving_grid_search" or '
+           '"halving_randomized_search". Got gridsearch.')
     with pytest.raises(ValueError, match=msg):
         dml_plr.tune(param_grids, search_mode='gridsearch')
 
+    msg = r"Invalid halving_params \{'ml_r': \{\}\}. halving_params must be a dictionary. Valid keys are ml_l and ml_m."
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.tune(param_grids, search_mode='halving_grid_search', halving_params={'ml_r': {}})
+    msg = (r"Invalid halving_params for ml_l: \{'n_resources': 10\}. The settings must be a dictionary with keys in "
+           "resource, factor, min_resources, max_resources, aggressive_elimination.")
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.tune(param_grids, search_mode='halving_grid_search', halving_params={'ml_l': {'n_resources': 10}})
+
     msg = 'The number of parameter settings sampled for the randomized search must be at least two. 1 was passed.'
     with pytest.raises(ValueError, match=msg):
         dml_plr.tune(param_grids, n_iter_randomized_search=1)
@@ -1297,19 +1335,6 @@ def test_doubleml_exception_gate():
     with pytest.raises(ValueError, match=msg):
         dml_irm_obj.gate(groups=groups)
 
-    dml_irm_obj = DoubleMLIRM(dml_data_irm,
-                              ml_g=Lasso(),
-                              ml_m=LogisticRegression(),
-                              trimming_threshold=0.05,
-                              n_folds=5,
-                              score='ATE',
-                              n_rep=2)
-    dml_irm_obj.fit()
-
-    msg = 'Only implemented for one repetition. Number of repetitions is 2.'
-    with pytest.raises(NotImplementedError, match=msg):
-        dml_irm_obj.gate(groups=groups)
-
 
 @pytest.mark.ci
 def test_doubleml_exception_cate():
@@ -1325,31 +1350,9 @@ def test_doubleml_exception_cate():
     with pytest.raises(ValueError, match=msg):
         dml_irm_obj.cate(basis=2)
 
-    dml_irm_obj = DoubleMLIRM(dml_data_irm,
-                              ml_g=Lasso(),
-                              ml_m=LogisticRegression(),
-                              trimming_threshold=0.05,
-                              n_folds=5,
-                              score='ATE',
-                              n_rep=2)
-    dml_irm_obj.fit()
-    msg = 'Only implemented for one repetition. Number of repetitions is 2.'
-    with pytest.raises(NotImplementedError, match=msg):
-        dml_irm_obj.cate(basis=2)
-
 
 @pytest.mark.ci
 def test_doubleml_exception_plr_cate():
-    dml_plr_obj = DoubleMLPLR(dml_data,
-                              ml_l=Lasso(),
-                              ml_m=Lasso(),
-                              n_folds=2,
-                              n_rep=2)
-    dml_plr_obj.fit()
-    msg = 'Only implemented for one repetition. Number of repetitions is 2.'
-    with pytest.raises(NotImplementedError, match=msg):
-        dml_plr_obj.cate(basis=2)
-
     dml_plr_obj = DoubleMLPLR(dml_data,
                               ml_l=Lasso(),
                               ml_m=Lasso(),
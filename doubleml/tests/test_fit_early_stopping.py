@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from sklearn.ensemble import HistGradientBoostingRegressor, GradientBoostingClassifier
+from sklearn.linear_model import Lasso, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+
+@pytest.fixture(scope='module',
+                params=[True, 'refit'])
+def early_stopping(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_early_stopping_fixture(early_stopping):
+    n_folds = 3
+    n_rep = 2
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=500, dim_x=5)
+    ml_l = HistGradientBoostingRegressor(max_iter=500, random_state=42)
+
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, ml_l, Lasso(), n_folds=n_folds, n_rep=n_rep)
+    dml_plr_obj.fit(early_stopping=early_stopping, store_models=True)
+    coef = dml_plr_obj.coef.copy()
+    models = dml_plr_obj.models
+    early_stopping_params = dml_plr_obj.early_stopping_params
+
+    # manual: early stopping on each training fold (with refit on the whole training fold)
+    n_iter_manual = list()
+    for i_rep in range(n_rep):
+        n_iter_manual.append(list())
+        for train_index, _ in dml_plr_obj.smpls[i_rep]:
+            learner = HistGradientBoostingRegressor(max_iter=500, random_state=42, early_stopping=True)
+            learner.fit(dml_data.x[train_index, :], dml_data.y[train_index])
+            n_iter_manual[i_rep].append(learner.n_iter_)
+
+    # the frozen number of iterations reproduces the estimates with refit
+    dml_plr_obj_frozen = dml.DoubleMLPLR(dml_data, ml_l, Lasso(), n_folds=n_folds, n_rep=n_rep,
+                                         draw_sample_splitting=False)
+    dml_plr_obj_frozen.set_sample_splitting(dml_plr_obj.smpls)
+    dml_plr_obj_frozen.set_ml_nuisance_params('ml_l', 'd', early_stopping_params['ml_l']['d'])
+    dml_plr_obj_frozen.fit()
+
+    res_dict = {'coef': coef,
+                'coef_frozen': dml_plr_obj_frozen.coef,
+                'models': models,
+                'early_stopping_params': early_stopping_params,
+                'n_iter_manual': n_iter_manual,
+                'early_stopping': early_stopping}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_early_stopping_params(dml_plr_early_stopping_fixture):
+    early_stopping_params = dml_plr_early_stopping_fixture['early_stopping_params']
+    # learners without early stopping are not reported
+    assert list(early_stopping_params.keys()) == ['ml_l']
+    n_iter = [[fold_params['max_iter'] for fold_params in rep_params]
+              for rep_params in early_stopping_params['ml_l']['d']]
+    assert n_iter == dml_plr_early_stopping_fixture['n_iter_manual']
+    assert all(fold_params['early_stopping'] is False
+               for rep_params in early_stopping_params['ml_l']['d'] for fold_params in rep_params)
+    assert all(n_iter_fold < 500 for rep_n_iter in n_iter for n_iter_fold in rep_n_iter)
+
+
+@pytest.mark.ci
+def test_dml_plr_early_stopping_models(dml_plr_early_stopping_fixture):
+    models = dml_plr_early_stopping_fixture['models']
+    n_iter = dml_plr_early_stopping_fixture['n_iter_manual']
+    for rep_models, rep_n_iter in zip(models['ml_l']['d'], n_iter):
+        assert all(isinstance(model, HistGradientBoostingRegressor) for model in rep_models)
+        assert [model.n_iter_ for model in rep_models] == rep_n_iter
+        if dml_plr_early_stopping_fixture['early_stopping'] == 'refit':
+            assert all(model.early_stopping is False for model in rep_models)
+        else:
+            assert all(model.early_stopping is True for model in rep_models)
+
+
+@pytest.mark.ci
+def test_dml_plr_early_stopping_frozen(dml_plr_early_stopping_fixture):
+    coef = dml_plr_early_stopping_fixture['coef']
+    coef_frozen = dml_plr_early_stopping_fixture['coef_frozen']
+    if dml_plr_early_stopping_fixture['early_stopping'] == 'refit':
+        assert np.allclose(coef, coef_frozen)
+    else:
+        assert np.isfinite(coef).all()
+
+
+@pytest.mark.ci
+def test_dml_irm_early_stopping_classifier():
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=300, dim_x=5)
+    ml_m = GradientBoostingClassifier(n_estimators=200, random_state=42)
+    dml_irm_obj = dml.DoubleMLIRM(dml_data, Lasso(), ml_m, n_folds=2)
+    dml_irm_obj.fit(early_stopping='refit')
+    m_params = dml_irm_obj.early_stopping_params['ml_m']['d'][0]
+    assert all(fold_params['n_iter_no_change'] is None for fold_params in m_params)
+    assert all(fold_params['n_estimators'] < 200 for fold_params in m_params)
+    assert np.all((dml_irm_obj.predictions['ml_m'] > 0) & (dml_irm_obj.predictions['ml_m'] < 1))
+
+    # without early stopping no iterations are reported
+    dml_irm_obj.fit()
+    assert dml_irm_obj.early_stopping_params is None
+
+
+@pytest.mark.ci
+def test_dml_early_stopping_exceptions():
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=100, dim_x=5)
+    dml_irm_obj = dml.DoubleMLIRM(dml_data, Lasso(), LogisticRegression(), n_folds=2)
+    msg = 'early_stopping must be True, False or "refit". Got 1.'
+    with pytest.raises(ValueError, match=msg):
+        dml_irm_obj.fit(early_stopping=1)
+    msg = 'early_stopping must be True, False or "refit". Got auto.'
+    with pytest.raises(ValueError, match=msg):
+        dml_irm_obj.fit(early_stopping='auto')
@@ -0,0 +1,179 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+from sklearn.model_selection import GridSearchCV, KFold
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+
+@pytest.fixture(scope='module',
+                params=[1, 2])
+def n_rep(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_fit_tune_fixture(n_rep):
+    n_folds = 3
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    param_grids = {'ml_l': {'alpha': np.linspace(0.05, 0.95, 5)},
+                   'ml_m': {'alpha': np.linspace(0.05, 0.95, 5)}}
+
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=n_folds, n_rep=n_rep)
+    np.random.seed(42)
+    dml_plr_obj.fit(tune=param_grids, store_models=True)
+    coef = dml_plr_obj.coef.copy()
+    models = dml_plr_obj.models
+
+    # manual: grid search on each training fold with the same inner splits and prediction of the test fold
+    np.random.seed(42)
+    preds_manual = {learner: np.full((dml_data.n_obs, n_rep), np.nan) for learner in ['ml_l', 'ml_m']}
+    params_manual = {learner: list() for learner in ['ml_l', 'ml_m']}
+    for i_rep in range(n_rep):
+        for learner, target in [('ml_l', dml_data.y), ('ml_m', dml_data.d)]:
+            params_manual[learner].append(list())
+            for train_index, test_index in dml_plr_obj.smpls[i_rep]:
+                search = GridSearchCV(Lasso(), param_grids[learner], cv=KFold(n_splits=5, shuffle=True))
+                search.fit(dml_data.x[train_index, :], target[train_index])
+                preds_manual[learner][test_index, i_rep] = search.predict(dml_data.x[test_index, :])
+                params_manual[learner][i_rep].append(search.best_params_)
+
+    # the chosen hyperparameters reproduce the estimates without tuning
+    dml_plr_obj.fit()
+
+    res_dict = {'dml_plr_obj': dml_plr_obj,
+                'coef': coef,
+                'models': models,
+                'preds_manual': preds_manual,
+                'params_manual': params_manual,
+                'n_folds': n_folds,
+                'n_rep': n_rep}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_fit_tune_params(dml_plr_fit_tune_fixture):
+    dml_plr_obj = dml_plr_fit_tune_fixture['dml_plr_obj']
+    for learner in ['ml_l', 'ml_m']:
+        assert dml_plr_obj.params[learner]['d'] == dml_plr_fit_tune_fixture['params_manual'][learner]
+
+
+@pytest.mark.ci
+def test_dml_plr_fit_tune_preds(dml_plr_fit_tune_fixture):
+    dml_plr_obj = dml_plr_fit_tune_fixture['dml_plr_obj']
+    for learner in ['ml_l', 'ml_m']:
+        assert np.allclose(dml_plr_obj.predictions[learner][:, :, 0], dml_plr_fit_tune_fixture['preds_manual'][learner])
+    assert np.allclose(dml_plr_obj.coef, dml_plr_fit_tune_fixture['coef'])
+
+
+@pytest.mark.ci
+def test_dml_plr_fit_tune_models(dml_plr_fit_tune_fixture):
+    models = dml_plr_fit_tune_fixture['models']
+    params = dml_plr_fit_tune_fixture['dml_plr_obj'].params
+    for learner in ['ml_l', 'ml_m']:
+        assert len(models[learner]['d']) == dml_plr_fit_tune_fixture['n_rep']
+        for rep_models, rep_params in zip(models[learner]['d'], params[learner]['d']):
+            assert len(rep_models) == dml_plr_fit_tune_fixture['n_folds']
+            assert all(isinstance(model, Lasso) for model in rep_models)
+            assert [model.alpha for model in rep_models] == [fold_params['alpha'] for fold_params in rep_params]
+
+
+@pytest.mark.ci
+def test_dml_irm_fit_tune_nuisance_grids():
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=200, dim_x=5)
+    dml_irm_obj = dml.DoubleMLIRM(dml_data, Lasso(), LogisticRegression(max_iter=500), n_folds=2)
+    dml_irm_obj.set_ml_nuisance_params('ml_m', 'd', {'max_iter': 250})
+    # grids for single nuisance functions take precedence over the grids of the learner
+    dml_irm_obj.fit(tune={'ml_g': {'alpha': [0.05, 0.5]}, 'ml_g1': {'alpha': [0.01]}, 'ml_m': {'C': [0.1, 1.0]}})
+    assert all(fold_params['alpha'] in [0.05, 0.5] for fold_params in dml_irm_obj.params['ml_g0']['d'][0])
+    assert dml_irm_obj.params['ml_g1']['d'][0] == [{'alpha': 0.01}] * 2
+    # parameters which are set for the learner are kept
+    assert all(fold_params['max_iter'] == 250 for fold_params in dml_irm_obj.params['ml_m']['d'][0])
+    assert all(fold_params['C'] in [0.1, 1.0] for fold_params in dml_irm_obj.params['ml_m']['d'][0])
+    assert np.isfinite(dml_irm_obj.coef).all()
+
+
+@pytest.mark.ci
+def test_dml_plr_fit_tune_settings():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    param_grids = {'ml_l': {'alpha': np.linspace(0.05, 0.95, 5)},
+                   'ml_m': {'alpha': np.linspace(0.05, 0.95, 5)}}
+    tune_settings = {'scoring_methods': {'ml_l': 'neg_mean_absolute_error'}, 'n_folds_tune': 3}
+
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=2)
+    np.random.seed(42)
+    dml_plr_obj.fit(tune=param_grids, tune_settings=tune_settings)
+    assert dml_plr_obj._fused_tuning is None
+
+    # manual: the scoring methods and the number of folds of the search are used within the cross-fitting
+    np.random.seed(42)
+    for learner, target, scoring in [('ml_l', dml_data.y, 'neg_mean_absolute_error'), ('ml_m', dml_data.d, None)]:
+        preds_manual = np.full(dml_data.n_obs, np.nan)
+        params_manual = list()
+        for train_index, test_index in dml_plr_obj.smpls[0]:
+            search = GridSearchCV(Lasso(), param_grids[learner], scoring=scoring, cv=KFold(n_splits=3, shuffle=True))
+            search.fit(dml_data.x[train_index, :], target[train_index])
+            preds_manual[test_index] = search.predict(dml_data.x[test_index, :])
+            params_manual.append(search.best_params_)
+        assert dml_plr_obj.params[learner]['d'] == [params_manual]
+        assert np.allclose(dml_plr_obj.predictions[learner][:, 0, 0], preds_manual)
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('search_mode', ['randomized_search', 'halving_grid_search', 'halving_randomized_search'])
+def test_dml_plr_fit_tune_search_mode(search_mode):
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    grid = {'alpha': np.linspace(0.05, 0.95, 10)}
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=2)
+    halving_params = {'ml_l': {'min_resources': 30}, 'ml_m': {'min_resources': 30}}
+    dml_plr_obj.fit(tune={'ml_l': grid, 'ml_m': grid}, store_models=True,
+                    tune_settings={'search_mode': search_mode, 'n_iter_randomized_search': 4, 'n_folds_tune': 3,
+                                   'halving_params': halving_params})
+    for learner in ['ml_l', 'ml_m']:
+        assert all(fold_params['alpha'] in grid['alpha'] for fold_params in dml_plr_obj.params[learner]['d'][0])
+        assert [model.alpha for model in dml_plr_obj.models[learner]['d'][0]] == \
+            [fold_params['alpha'] for fold_params in dml_plr_obj.params[learner]['d'][0]]
+    assert np.isfinite(dml_plr_obj.coef).all()
+
+
+@pytest.mark.ci
+def test_dml_fit_tune_exceptions():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=2)
+
+    msg = 'Invalid tune ml_r. tune must be None or a dictionary. Valid keys are ml_l and ml_m.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.fit(tune='ml_r')
+    msg = r"Invalid tune \{'ml_r': \{'alpha': \[0.1\]\}\}. tune must be None or a dictionary. Valid keys are ml_l and ml_m."
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.fit(tune={'ml_r': {'alpha': [0.1]}})
+    msg = ("Invalid tune_settings {'n_folds': 3}. tune_settings must be None or a dictionary. Valid keys are "
+           'scoring_methods, n_folds_tune, search_mode, n_iter_randomized_search, halving_params.')
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.fit(tune={'ml_l': {'alpha': [0.1]}}, tune_settings={'n_folds': 3})
+    msg = 'search_mode must be "grid_search", "randomized_search", "halving_grid_search" or "halving_randomized_search". '
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.fit(tune={'ml_l': {'alpha': [0.1]}}, tune_settings={'search_mode': 'bayes'})
+    msg = 'The number of folds used for tuning must be at least two. 1 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.fit(tune={'ml_l': {'alpha': [0.1]}}, tune_settings={'n_folds_tune': 1})
+    msg = 'Tuning within the cross-fitting \\(tune\\) not implemented for multi-output nuisance fitting.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_plr_obj.fit(tune={'ml_l': {'alpha': [0.1]}}, multi_output=True)
+
+    dml_plr_obj.fit()
+    external_predictions = {'d': {'ml_l': dml_plr_obj.predictions['ml_l'][:, :, 0]}}
+    msg = ('The hyperparameters of ml_l for the treatment variable d were not tuned within the cross-fitting '
+           r'\(e.g. as external predictions were supplied\).')
+    with pytest.warns(UserWarning, match=msg):
+        dml_plr_obj.fit(tune={'ml_l': {'alpha': [0.1, 0.5]}, 'ml_m': {'alpha': [0.1, 0.5]}},
+                        external_predictions=external_predictions)
+    assert dml_plr_obj.params['ml_l']['d'] == [None]
+    assert dml_plr_obj.params['ml_m']['d'][0] is not None
@@ -73,6 +73,10 @@ def test_input_exceptions():
     with pytest.raises(TypeError, match=msg):
         DoubleMLFramework(1.0)
 
+    msg = 'dtype must be "float32" or "float64". Got float16.'
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLFramework(doubleml_dict, dtype='float16')
+
     msg = "sensitivity_elements must be a dictionary."
     with pytest.raises(TypeError, match=msg):
         test_dict = doubleml_dict.copy()
@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import LinearRegression, LogisticRegression, Lasso
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+from doubleml.utils import DoubleMLCallback, DoubleMLRecorder
+
+
+class _EventCounter(DoubleMLCallback):
+    def __init__(self):
+        super().__init__()
+        self.n_start = 0
+        self.n_end = 0
+
+    def on_start(self, event, info):
+        self.n_start += 1
+
+    def on_end(self, event, info, stats):
+        self.n_end += 1
+
+
+@pytest.fixture(scope='module',
+                params=[None, 2])
+def n_jobs(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_instrumentation_fixture(n_jobs):
+    n_folds = 3
+    n_rep = 2
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+
+    np.random.seed(3141)
+    dml_obj = dml.DoubleMLPLR(dml_data, LinearRegression(), LinearRegression(), n_folds=n_folds, n_rep=n_rep)
+    dml_obj.fit()
+
+    recorder = DoubleMLRecorder()
+    counter = _EventCounter()
+    np.random.seed(3141)
+    dml_obj_instr = dml.DoubleMLPLR(dml_data, LinearRegression(), LinearRegression(), n_folds=n_folds, n_rep=n_rep)
+    dml_obj_instr.set_callbacks([recorder, counter])
+    dml_obj_instr.fit(n_jobs_cv=n_jobs)
+    dml_obj_instr.bootstrap(n_rep_boot=50)
+
+    res_dict = {'dml_obj': dml_obj,
+                'dml_obj_instr': dml_obj_instr,
+                'recorder': recorder,
+                'counter': counter,
+                'n_folds': n_folds,
+                'n_rep': n_rep}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_instrumentation_coef(dml_plr_instrumentation_fixture):
+    # instrumentation does not change the estimates
+    assert np.allclose(dml_plr_instrumentation_fixture['dml_obj'].coef,
+                       dml_plr_instrumentation_fixture['dml_obj_instr'].coef)
+    assert np.allclose(dml_plr_instrumentation_fixture['dml_obj'].se,
+                       dml_plr_instrumentation_fixture['dml_obj_instr'].se)
+
+
+@pytest.mark.ci
+def test_dml_plr_instrumentation_folds(dml_plr_instrumentation_fixture):
+    df = dml_plr_instrumentation_fixture['dml_obj_instr'].instrumentation
+    n_folds = dml_plr_instrumentation_fixture['n_folds']
+    n_rep = dml_plr_instrumentation_fixture['n_rep']
+    for event in ['fit_fold', 'predict_fold']:
+        df_event = df[df['event'] == event]
+        assert df_event.shape[0] == n_rep * 2 * n_folds
+        counts = df_event.groupby(['rep', 'treatment', 'learner']).size()
+        assert set(counts.index.get_level_values('learner')) == {'ml_l', 'ml_m'}
+        assert np.all(counts == n_folds)
+        assert set(df_event['fold']) == set(range(n_folds))
+    assert np.all(df['wall_time'] >= 0.)
+    assert np.all(df['cpu_time'] >= 0.)
+    assert np.all(df['peak_memory'].notna())
+
+
+@pytest.mark.ci
+def test_dml_plr_instrumentation_stages(dml_plr_instrumentation_fixture):
+    df = dml_plr_instrumentation_fixture['dml_obj_instr'].instrumentation
+    n_rep = dml_plr_instrumentation_fixture['n_rep']
+    counts = df['event'].value_counts()
+    assert counts['nuisance'] == n_rep * 2
+    assert counts['score'] == n_rep
+    assert counts['var_est'] == n_rep
+    assert counts['framework'] == 1
+    assert counts['bootstrap'] == 1
+    assert df.loc[df['event'] == 'bootstrap', 'rep'].isna().all()
+
+    counter = dml_plr_instrumentation_fixture['counter']
+    assert counter.n_start == counter.n_end == df.shape[0]
+
+
+@pytest.mark.ci
+def test_dml_irm_instrumentation_tune():
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=200, dim_x=5)
+    recorder = DoubleMLRecorder(trace_memory=False)
+    dml_obj = dml.DoubleMLIRM(dml_data, Lasso(), LogisticRegression(), n_folds=2)
+    dml_obj.set_callbacks([recorder])
+    param_grids = {'ml_g': {'alpha': [0.05, 0.1]}, 'ml_m': {'C': [0.5, 1.]}}
+    dml_obj.tune(param_grids, tune_on_folds=True, n_folds_tune=2)
+    dml_obj.fit()
+
+    df = recorder.records
+    assert df['peak_memory'].isna().all()
+    assert (df['event'] == 'tune').sum() == 1
+    # ml_g0, ml_g1 and ml_m are tuned on both folds
+    assert (df['event'] == 'tune_fold').sum() == 3 * 2
+    assert set(df.loc[df['event'] == 'nuisance', 'learner']) == {'ml_g0', 'ml_g1', 'ml_m'}
+
+    recorder.reset()
+    assert recorder.records.shape[0] == 0
+
+
+@pytest.mark.ci
+def test_dml_instrumentation_defaults():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_obj = dml.DoubleMLPLR(dml_data, LinearRegression(), LinearRegression())
+    assert dml_obj.callbacks == []
+    assert dml_obj.instrumentation is None
+    dml_obj.set_callbacks([_EventCounter()])
+    assert dml_obj.instrumentation is None
+    dml_obj.set_callbacks(None)
+    assert dml_obj.callbacks == []
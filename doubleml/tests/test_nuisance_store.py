@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.tree import DecisionTreeRegressor
+
+import doubleml as dml
+from doubleml.datasets import make_irm_data
+from doubleml.utils import DoubleMLNuisanceStore
+
+
+def _make_models(dml_data, n_folds, n_rep):
+    dml_plr = dml.DoubleMLPLR(dml_data, LinearRegression(), LogisticRegression(), n_folds=n_folds, n_rep=n_rep)
+    dml_irm = dml.DoubleMLIRM(dml_data, LinearRegression(), LogisticRegression(), n_folds=n_folds, n_rep=n_rep,
+                              draw_sample_splitting=False)
+    dml_apo = dml.DoubleMLAPO(dml_data, LinearRegression(), LogisticRegression(), treatment_level=1,
+                              n_folds=n_folds, n_rep=n_rep, draw_sample_splitting=False)
+    dml_irm.set_sample_splitting(dml_plr.smpls)
+    dml_apo.set_sample_splitting(dml_plr.smpls)
+    return dml_plr, dml_irm, dml_apo
+
+
+@pytest.fixture(scope='module')
+def dml_nuisance_store_fixture():
+    n_folds = 3
+    n_rep = 2
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=300, dim_x=5)
+
+    np.random.seed(3141)
+    dml_objs = _make_models(dml_data, n_folds, n_rep)
+    for dml_obj in dml_objs:
+        dml_obj.fit()
+
+    np.random.seed(3141)
+    store = DoubleMLNuisanceStore()
+    dml_objs_store = _make_models(dml_data, n_folds, n_rep)
+    for dml_obj in dml_objs_store:
+        dml_obj.set_nuisance_store(store).fit()
+
+    res_dict = {'dml_objs': dml_objs,
+                'dml_objs_store': dml_objs_store,
+                'store': store,
+                'n_rep': n_rep}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_nuisance_store_coef(dml_nuisance_store_fixture):
+    for dml_obj, dml_obj_store in zip(dml_nuisance_store_fixture['dml_objs'],
+                                      dml_nuisance_store_fixture['dml_objs_store']):
+        assert np.allclose(dml_obj.all_coef, dml_obj_store.all_coef)
+        assert np.allclose(dml_obj.all_se, dml_obj_store.all_se)
+        for learner in dml_obj.params_names:
+            assert np.allclose(dml_obj.predictions[learner], dml_obj_store.predictions[learner])
+            assert np.array_equal(dml_obj.nuisance_targets[learner], dml_obj_store.nuisance_targets[learner],
+                                  equal_nan=True)
+            assert np.allclose(dml_obj.nuisance_loss[learner], dml_obj_store.nuisance_loss[learner])
+
+
+@pytest.mark.ci
+def test_dml_nuisance_store_reuse(dml_nuisance_store_fixture):
+    store = dml_nuisance_store_fixture['store']
+    n_rep = dml_nuisance_store_fixture['n_rep']
+    dml_plr, dml_irm, dml_apo = dml_nuisance_store_fixture['dml_objs_store']
+    # PLR: ml_l and ml_m, IRM: ml_g0 and ml_g1 (ml_m from PLR), APO: all nuisance functions from IRM and PLR
+    assert store.n_fits == 4 * n_rep
+    assert store.n_hits == 4 * n_rep
+    assert len(store) == 4 * n_rep
+    # the propensity scores are trimmed in the IRM
+    assert np.array_equal(np.clip(dml_plr.predictions['ml_m'], 0.01, 0.99), dml_irm.predictions['ml_m'])
+    assert np.array_equal(dml_irm.predictions['ml_m'], dml_apo.predictions['ml_m'])
+    assert np.array_equal(dml_irm.predictions['ml_g0'], dml_apo.predictions['ml_g0'])
+    assert np.array_equal(dml_irm.predictions['ml_g1'], dml_apo.predictions['ml_g1'])
+
+
+@pytest.mark.ci
+def test_dml_nuisance_store_models():
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=200, dim_x=5)
+    store = DoubleMLNuisanceStore()
+    dml_irm = dml.DoubleMLIRM(dml_data, LinearRegression(), LogisticRegression(), n_folds=2)
+    dml_irm.set_nuisance_store(store).fit()
+    assert store.n_fits == 3
+
+    # stored predictions without models are refitted if the models are requested
+    dml_irm.fit(store_models=True)
+    assert store.n_fits == 6
+    assert store.n_hits == 0
+    dml_irm_2 = dml.DoubleMLIRM(dml_data, LinearRegression(), LogisticRegression(C=0.5), n_folds=2,
+                                draw_sample_splitting=False)
+    dml_irm_2.set_sample_splitting(dml_irm.smpls).set_nuisance_store(store).fit(store_models=True)
+    assert store.n_hits == 2
+    assert dml_irm_2.models['ml_g0']['d'][0] is dml_irm.models['ml_g0']['d'][0]
+    # a different learner specification is fitted separately
+    assert store.n_fits == 7
+    assert dml_irm_2.nuisance_store is store
+
+    store.clear()
+    assert len(store) == 0
+    dml_irm_2.set_nuisance_store(None)
+    assert dml_irm_2.nuisance_store is None
+
+
+@pytest.mark.ci
+def test_dml_nuisance_store_compressed():
+    np.random.seed(3141)
+    n_obs = 500
+    x = np.column_stack((np.random.binomial(1, 0.5, size=n_obs), np.random.choice(4, size=n_obs)))
+    d = x[:, 0] + 0.2 * x[:, 1] + np.random.normal(size=n_obs)
+    y = 0.5 * d + x[:, 1] + np.random.normal(size=n_obs)
+    dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    dml_data_compressed = dml.DoubleMLData.from_arrays(x, y, d, compress_duplicates=True)
+    # compressed fits are stored separately from the fits on all observations
+    learner = DecisionTreeRegressor(max_depth=2)
+
+    store = DoubleMLNuisanceStore()
+    dml_plr = dml.DoubleMLPLR(dml_data, learner, learner, n_folds=2)
+    dml_plr.set_nuisance_store(store).fit()
+    dml_plr_compressed = dml.DoubleMLPLR(dml_data_compressed, learner, learner, n_folds=2, draw_sample_splitting=False)
+    dml_plr_compressed.set_sample_splitting(dml_plr.smpls).set_nuisance_store(store).fit()
+    assert store.n_fits == 4
+    assert store.n_hits == 0
+
+    dml_plr_compressed_no_store = dml.DoubleMLPLR(dml_data_compressed, learner, learner, n_folds=2,
+                                                  draw_sample_splitting=False)
+    dml_plr_compressed_no_store.set_sample_splitting(dml_plr.smpls).fit()
+    for learner_name in ['ml_l', 'ml_m']:
+        assert np.array_equal(dml_plr_compressed.predictions[learner_name],
+                              dml_plr_compressed_no_store.predictions[learner_name])
+
+
+@pytest.mark.ci
+def test_dml_nuisance_store_exceptions():
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=100, dim_x=5)
+    dml_irm = dml.DoubleMLIRM(dml_data, LinearRegression(), LogisticRegression(), n_folds=2)
+    msg = "nuisance_store must be a DoubleMLNuisanceStore or None. 1 of type <class 'int'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_irm.set_nuisance_store(1)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+n_rep = 3
+
+
+@pytest.fixture(scope='module')
+def dml_plr_targets_fixture():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    dml_obj = dml.DoubleMLPLR(dml_data, LinearRegression(), LinearRegression(), n_folds=3, n_rep=n_rep)
+    dml_obj.fit()
+    return dml_obj
+
+
+@pytest.fixture(scope='module')
+def dml_pq_targets_fixture():
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=300, dim_x=5)
+    dml_obj = dml.DoubleMLPQ(dml_data, LogisticRegression(), LogisticRegression(), treatment=1, quantile=0.5,
+                             n_folds=3, n_rep=n_rep)
+    dml_obj.fit()
+    return dml_obj
+
+
+@pytest.mark.ci
+def test_dml_plr_targets_deduplicated(dml_plr_targets_fixture):
+    dml_obj = dml_plr_targets_fixture
+    y = dml_obj._dml_data.y
+    d = dml_obj._dml_data.d
+    targets = dml_obj.nuisance_targets
+    for learner, target in zip(['ml_l', 'ml_m'], [y, d]):
+        assert targets[learner].shape == (200, n_rep, 1)
+        assert not targets[learner].flags.writeable
+        # the targets are stored only once per treatment variable
+        assert targets[learner].strides[1] == 0
+        assert dml_obj._nuisance_targets_rep[learner] is None
+        assert np.array_equal(targets[learner], np.tile(target.reshape(-1, 1, 1), (1, n_rep, 1)))
+
+    # the evaluation of the learners is not affected
+    loss = dml_obj.evaluate_learners()
+    assert np.allclose(loss['ml_l'], dml_obj.nuisance_loss['ml_l'])
+    assert np.allclose(loss['ml_m'], dml_obj.nuisance_loss['ml_m'])
+
+
+@pytest.mark.ci
+def test_dml_pq_targets_rep_override(dml_pq_targets_fixture):
+    dml_obj = dml_pq_targets_fixture
+    d = dml_obj._dml_data.d
+    targets = dml_obj.nuisance_targets
+
+    # the propensity targets are identical across repetitions
+    assert dml_obj._nuisance_targets_rep['ml_m'] is None
+    assert targets['ml_m'].strides[1] == 0
+
+    # the targets of ml_g depend on the fold-wise preliminary ipw estimates
+    assert dml_obj._nuisance_targets_rep['ml_g'] is not None
+    assert not targets['ml_g'].flags.writeable
+    assert not np.array_equal(targets['ml_g'][:, 0, 0], targets['ml_g'][:, 1, 0], equal_nan=True)
+    for i_rep in range(n_rep):
+        # conditional targets are only available for the treated observations
+        assert np.array_equal(np.isnan(targets['ml_g'][:, i_rep, 0]), d != 1)
+        assert np.all(np.isin(targets['ml_g'][d == 1, i_rep, 0], [0., 1.]))
+        assert np.array_equal(targets['ml_m'][:, i_rep, 0], d)
+
+
+@pytest.mark.ci
+def test_dml_targets_read_only(dml_plr_targets_fixture, dml_pq_targets_fixture):
+    for dml_obj in [dml_plr_targets_fixture, dml_pq_targets_fixture]:
+        for target in dml_obj.nuisance_targets.values():
+            with pytest.raises(ValueError, match='read-only'):
+                target[0, 0, 0] = 0.
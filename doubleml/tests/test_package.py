@@ -1,7 +1,30 @@
 import pytest
+import subprocess
+import sys
 
 
 @pytest.mark.ci
 def test_version_is_string():
     import doubleml
     assert isinstance(doubleml.__version__, str)
+
+
+@pytest.mark.ci
+def test_import_is_lazy():
+    # plotting, statsmodels and the dataset helpers are only loaded on first use
+    code = ('import sys, doubleml; '
+            'print(",".join(sorted(m for m in sys.modules if m.split(".")[0] in ["doubleml", "plotly", "statsmodels", '
+            '"matplotlib"])))')
+    res = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    imported = set(res.stdout.strip().split(','))
+    assert not any(module.split('.')[0] in ['plotly', 'statsmodels', 'matplotlib'] for module in imported)
+    assert not {'doubleml.datasets', 'doubleml.utils._plots'} & imported
+
+
+@pytest.mark.ci
+def test_lazy_datasets():
+    import doubleml
+    dml_data = doubleml.datasets.make_plr_CCDDHNR2018(n_obs=50, dim_x=5)
+    assert isinstance(dml_data, doubleml.DoubleMLData)
+    with pytest.raises(AttributeError, match="module 'doubleml' has no attribute 'foo'"):
+        doubleml.foo
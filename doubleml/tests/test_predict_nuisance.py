@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.ensemble import RandomForestRegressor
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+from doubleml.utils import DoubleMLBLP, DoubleMLModelStore
+
+
+@pytest.fixture(scope='module',
+                params=['plr', 'irm'])
+def model(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[False, True])
+def use_model_store(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_predict_nuisance_fixture(model, use_model_store):
+    n_folds = 3
+    np.random.seed(3141)
+    if model == 'plr':
+        dml_data = make_plr_CCDDHNR2018(n_obs=300, dim_x=5)
+        new_data = make_plr_CCDDHNR2018(n_obs=150, dim_x=5)
+        dml_obj = dml.DoubleMLPLR(dml_data, LinearRegression(), RandomForestRegressor(n_estimators=10, max_depth=3),
+                                  n_folds=n_folds)
+    else:
+        dml_data = make_irm_data(n_obs=300, dim_x=5)
+        new_data = make_irm_data(n_obs=150, dim_x=5)
+        dml_obj = dml.DoubleMLIRM(dml_data, LinearRegression(), LogisticRegression(), n_folds=n_folds,
+                                  trimming_threshold=0.05)
+
+    store_models = DoubleMLModelStore(cache_size=2) if use_model_store else True
+    dml_obj.fit(store_models=store_models)
+
+    # manual aggregation of the fold-wise predictions
+    preds_manual = dict()
+    for learner in dml_obj.params_names:
+        fold_preds = list()
+        for fold_model in dml_obj.models[learner]['d'][0]:
+            if learner == 'ml_m' and model == 'irm':
+                fold_preds.append(fold_model.predict_proba(new_data.x)[:, 1])
+            else:
+                fold_preds.append(fold_model.predict(new_data.x))
+        preds_manual[learner] = np.column_stack(fold_preds)
+
+    res_dict = {'dml_obj': dml_obj,
+                'new_data': new_data,
+                'preds_manual': preds_manual,
+                'preds': dml_obj.predict_nuisance(new_data.x),
+                'preds_chunked': dml_obj.predict_nuisance(new_data.data, chunk_size=40, n_jobs=2),
+                'preds_median': dml_obj.predict_nuisance(new_data.x, aggregate='median')}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_predict_nuisance(dml_predict_nuisance_fixture):
+    preds = dml_predict_nuisance_fixture['preds']
+    preds_manual = dml_predict_nuisance_fixture['preds_manual']
+    assert set(preds.keys()) == set(dml_predict_nuisance_fixture['dml_obj'].params_names)
+    for learner, pred in preds.items():
+        assert pred.shape == (150, 1, 1)
+        assert np.allclose(pred[:, 0, 0], np.mean(preds_manual[learner], axis=1))
+        assert np.allclose(dml_predict_nuisance_fixture['preds_median'][learner][:, 0, 0],
+                           np.median(preds_manual[learner], axis=1))
+        # the chunked and parallel predictions are identical
+        assert np.allclose(pred, dml_predict_nuisance_fixture['preds_chunked'][learner])
+
+
+@pytest.mark.ci
+def test_dml_predict_nuisance_cate(dml_predict_nuisance_fixture, model):
+    dml_obj = dml_predict_nuisance_fixture['dml_obj']
+    new_data = dml_predict_nuisance_fixture['new_data']
+    preds = {learner: pred[:, 0, 0] for learner, pred in dml_predict_nuisance_fixture['preds'].items()}
+    y = new_data.y
+    d = new_data.d
+    basis = pd.DataFrame({'const': np.ones(new_data.n_obs), 'x1': new_data.x[:, 0]})
+
+    cate = dml_obj.cate(basis, new_data=new_data, chunk_size=50)
+    if model == 'plr':
+        blp_manual = DoubleMLBLP(y - preds['ml_l'], basis=basis.mul(d - preds['ml_m'], axis=0)).fit()
+    else:
+        m_hat = np.clip(preds['ml_m'], 0.05, 0.95)
+        orth_signal = preds['ml_g1'] - preds['ml_g0'] + d * (y - preds['ml_g1']) / m_hat \
+            - (1. - d) * (y - preds['ml_g0']) / (1. - m_hat)
+        blp_manual = DoubleMLBLP(orth_signal, basis=basis).fit()
+    assert np.allclose(cate.blp_model.params, blp_manual.blp_model.params)
+    assert np.allclose(cate.blp_omega, blp_manual.blp_omega)
+
+    groups = pd.DataFrame({'group': np.where(new_data.x[:, 0] > 0, 'high', 'low')})
+    gate = dml_obj.gate(groups, new_data=new_data)
+    assert gate.blp_model.params.shape == (2, )
+
+
+@pytest.mark.ci
+def test_dml_predict_nuisance_chunks_load_once(monkeypatch):
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    new_x = make_plr_CCDDHNR2018(n_obs=100, dim_x=5, return_type='array')[0]
+    dml_obj = dml.DoubleMLPLR(dml_data, LinearRegression(), LinearRegression(), n_folds=2, n_rep=2)
+    dml_obj.fit(store_models=DoubleMLModelStore(cache_size=0))
+    preds = dml_obj.predict_nuisance(new_x)
+
+    # without cache, each stored model is loaded from disk once (and not once per chunk)
+    n_loads = list()
+    load = DoubleMLModelStore.load
+
+    def counting_load(store, key):
+        n_loads.append(key)
+        return load(store, key)
+    monkeypatch.setattr(DoubleMLModelStore, 'load', counting_load)
+    preds_chunked = dml_obj.predict_nuisance(new_x, chunk_size=7)
+    assert len(n_loads) == len(set(n_loads)) == 2 * 2 * 2
+    for learner, pred in preds.items():
+        assert np.allclose(pred, preds_chunked[learner])
+
+
+@pytest.mark.ci
+def test_dml_predict_nuisance_exceptions():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_obj = dml.DoubleMLPLR(dml_data, LinearRegression(), LinearRegression(), n_folds=2)
+
+    msg = r'Apply fit\(\) with store_models=True before predict_nuisance\(\).'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.predict_nuisance(dml_data.x)
+
+    dml_obj.fit(store_models=True)
+    msg = r'The learners have to be a subset of \[\'ml_l\', \'ml_m\'\]. Learners \[\'ml_g\'\] provided.'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.predict_nuisance(dml_data.x, learners=['ml_g'])
+    msg = 'aggregate must be "mean" or "median". Got max.'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.predict_nuisance(dml_data.x, aggregate='max')
+    msg = 'chunk_size must be larger or equal to 1. 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.predict_nuisance(dml_data.x, chunk_size=0)
+    msg = 'new_x has to have 5 columns. Array with 4 columns was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.predict_nuisance(dml_data.x[:, :4])
+    msg = r'new_x has to contain the covariates .* Columns \[\'X5\'\] are missing.'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.predict_nuisance(dml_data.data.drop(columns='X5'))
+    msg = 'new_data must be of DoubleMLData type.'
+    with pytest.raises(TypeError, match=msg):
+        dml_obj.cate(pd.DataFrame({'const': np.ones(100)}), new_data=dml_data.data)
+
+    dml_obj.fit(store_models=True, multi_output=True)
+    msg = 'Nuisance predictions for new data not implemented for multi-output nuisance models.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_obj.predict_nuisance(dml_data.x)
+
+    dml_data_irm = make_irm_data(n_obs=100, dim_x=5)
+    dml_irm = dml.DoubleMLIRM(dml_data_irm, LinearRegression(), LogisticRegression(), n_folds=2,
+                              weights=np.full(100, 0.5))
+    dml_irm.fit(store_models=True)
+    msg = 'Evaluation on new data not implemented for weighted scores.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_irm.cate(pd.DataFrame({'const': np.ones(100)}), new_data=dml_data_irm)
+
+    dml_iivm = dml.DoubleMLIIVM(dml.datasets.make_iivm_data(n_obs=100, dim_x=5), LinearRegression(),
+                                LogisticRegression(), LogisticRegression(), n_folds=2)
+    dml_iivm.fit(store_models=True)
+    msg = 'Nuisance predictions for new data not implemented for DoubleMLIIVM.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_iivm.predict_nuisance(dml_data.x)
@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import LinearRegression, LogisticRegression, Lasso
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data, make_ssm_data
+from doubleml.utils import DoubleMLRecorder
+
+
+@pytest.fixture(scope='module',
+                params=['plr', 'irm'])
+def model(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_refit_fixture(model):
+    n_folds = 3
+    n_rep = 2
+    np.random.seed(3141)
+    if model == 'plr':
+        dml_data = make_plr_CCDDHNR2018(n_obs=300, dim_x=5)
+        ml_m_new = Lasso(alpha=0.1)
+        dml_obj = dml.DoubleMLPLR(dml_data, LinearRegression(), LinearRegression(), n_folds=n_folds, n_rep=n_rep)
+        dml_obj_new = dml.DoubleMLPLR(dml_data, LinearRegression(), ml_m_new, n_folds=n_folds, n_rep=n_rep,
+                                      draw_sample_splitting=False)
+    else:
+        dml_data = make_irm_data(n_obs=300, dim_x=5)
+        ml_m_new = LogisticRegression(C=0.1)
+        dml_obj = dml.DoubleMLIRM(dml_data, LinearRegression(), LogisticRegression(), n_folds=n_folds, n_rep=n_rep)
+        dml_obj_new = dml.DoubleMLIRM(dml_data, LinearRegression(), ml_m_new, n_folds=n_folds, n_rep=n_rep,
+                                      draw_sample_splitting=False)
+    dml_obj_new.set_sample_splitting(dml_obj.smpls)
+    dml_obj_new.fit()
+    dml_obj_new.sensitivity_analysis()
+
+    dml_obj.fit(store_models=True)
+    predictions = {learner: dml_obj.predictions[learner].copy() for learner in dml_obj.params_names}
+    nuisance_loss = {learner: dml_obj.nuisance_loss[learner].copy() for learner in dml_obj.params_names}
+    models = {learner: dml_obj.models[learner]['d'] for learner in dml_obj.params_names}
+
+    recorder = DoubleMLRecorder(trace_memory=False)
+    dml_obj.set_callbacks([recorder])
+    dml_obj.refit(['ml_m'], ml_learners={'ml_m': ml_m_new})
+    dml_obj.sensitivity_analysis()
+
+    res_dict = {'dml_obj': dml_obj,
+                'dml_obj_new': dml_obj_new,
+                'predictions': predictions,
+                'nuisance_loss': nuisance_loss,
+                'models': models,
+                'recorder': recorder}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_refit_estimates(dml_refit_fixture):
+    dml_obj = dml_refit_fixture['dml_obj']
+    dml_obj_new = dml_refit_fixture['dml_obj_new']
+    assert np.allclose(dml_obj.all_coef, dml_obj_new.all_coef)
+    assert np.allclose(dml_obj.all_se, dml_obj_new.all_se)
+    assert np.allclose(dml_obj.psi, dml_obj_new.psi)
+    for key in ['theta', 'se', 'ci']:
+        for bound in ['lower', 'upper']:
+            assert np.allclose(dml_obj.sensitivity_params[key][bound], dml_obj_new.sensitivity_params[key][bound])
+    assert np.allclose(dml_obj.framework.all_thetas, dml_obj_new.framework.all_thetas)
+
+
+@pytest.mark.ci
+def test_dml_refit_nuisance(dml_refit_fixture):
+    dml_obj = dml_refit_fixture['dml_obj']
+    dml_obj_new = dml_refit_fixture['dml_obj_new']
+    for learner in dml_obj.params_names:
+        assert np.allclose(dml_obj.predictions[learner], dml_obj_new.predictions[learner], equal_nan=True)
+        assert np.allclose(dml_obj.nuisance_loss[learner], dml_obj_new.nuisance_loss[learner])
+        assert np.array_equal(dml_obj.nuisance_targets[learner], dml_obj_new.nuisance_targets[learner], equal_nan=True)
+        if learner == 'ml_m':
+            assert not np.allclose(dml_obj.predictions[learner], dml_refit_fixture['predictions'][learner])
+            assert all(model is not None for fold_models in dml_obj.models[learner]['d'] for model in fold_models)
+        else:
+            # the predictions, losses and models of the other nuisance functions are reused
+            assert np.array_equal(dml_obj.predictions[learner], dml_refit_fixture['predictions'][learner],
+                                  equal_nan=True)
+            assert np.array_equal(dml_obj.nuisance_loss[learner], dml_refit_fixture['nuisance_loss'][learner])
+            assert dml_obj.models[learner]['d'] is dml_refit_fixture['models'][learner]
+
+
+@pytest.mark.ci
+def test_dml_refit_only_selected_learners(dml_refit_fixture):
+    df = dml_refit_fixture['recorder'].records
+    assert set(df.loc[df['event'] == 'nuisance', 'learner']) == {'ml_m'}
+
+
+@pytest.mark.ci
+def test_dml_refit_exceptions():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_obj = dml.DoubleMLPLR(dml_data, LinearRegression(), LinearRegression(), n_folds=2)
+
+    msg = r'Apply fit\(\) with store_predictions=True before refit\(\).'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.refit(['ml_m'])
+
+    dml_obj.fit()
+    msg = r"The learners have to be a non-empty subset of \['ml_l', 'ml_m'\]. Learners \['ml_g'\] provided."
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.refit(['ml_g'])
+    with pytest.raises(ValueError, match='The learners have to be a non-empty subset of'):
+        dml_obj.refit('ml_m')
+    msg = "ml_learners must be a dictionary. Lasso()"
+    with pytest.raises(TypeError, match=msg):
+        dml_obj.refit(['ml_m'], ml_learners=Lasso())
+    msg = r"Invalid learner key ml_g. Valid learner keys are \['ml_l', 'ml_m'\]."
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.refit(['ml_m'], ml_learners={'ml_g': Lasso()})
+    msg = r"The nuisance functions \['ml_l'\] depend on ml_l and have to be refitted."
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.refit(['ml_m'], ml_learners={'ml_l': Lasso()})
+    msg = r'The learner ml_m has to be a regressor. LogisticRegression\(\) was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.refit(['ml_m'], ml_learners={'ml_m': LogisticRegression()})
+
+    dml_data_ssm = make_ssm_data(n_obs=100, dim_x=5)
+    dml_ssm = dml.DoubleMLSSM(dml_data_ssm, LinearRegression(), LogisticRegression(), LogisticRegression(), n_folds=2)
+    dml_ssm.fit()
+    msg = 'Partial refit not implemented for DoubleMLSSM.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_ssm.refit(['ml_m'])
@@ -469,3 +469,6 @@ def test_policytree():
     assert isinstance(policy_tree, DoubleMLPolicyTree)
     predict_features = pd.DataFrame(np.random.normal(size=(5, 2)), columns=features.keys())
     assert isinstance(policy_tree.predict(predict_features), pd.DataFrame)
+    policy_tree_exact = dml_irm.policy_tree(features, depth=2, method='exact', n_bins=10)
+    assert isinstance(policy_tree_exact, DoubleMLPolicyTree)
+    assert isinstance(policy_tree_exact.predict(predict_features), pd.DataFrame)
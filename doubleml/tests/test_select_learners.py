@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+
+from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
+from sklearn.linear_model import Lasso, LinearRegression, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+from doubleml.utils._estimation import _dml_cv_predict, _dml_cv_predict_select
+
+
+@pytest.fixture(scope='module',
+                params=['loss', 'stacking'])
+def method(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_irm_select_fixture(method):
+    n_folds = 3
+    n_rep = 2
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=500, dim_x=5)
+    candidates = {'ml_g': [Lasso(alpha=0.05), RandomForestRegressor(n_estimators=20, max_depth=3, random_state=42)],
+                  'ml_m': [LogisticRegression(), RandomForestClassifier(n_estimators=20, max_depth=3, random_state=42)]}
+
+    # no trimming such that the propensity predictions of the candidates are compared
+    dml_irm_obj = dml.DoubleMLIRM(dml_data, Lasso(), LogisticRegression(), n_folds=n_folds, n_rep=n_rep,
+                                  trimming_threshold=1e-12)
+    dml_irm_obj.select_learners(candidates, method=method, store_models=True)
+
+    # manual: cross-fitting of each candidate on the same sample splitting
+    candidate_objs = list()
+    for i_candidate in range(2):
+        dml_irm_candidate = dml.DoubleMLIRM(dml_data, candidates['ml_g'][i_candidate], candidates['ml_m'][i_candidate],
+                                            n_folds=n_folds, n_rep=n_rep, trimming_threshold=1e-12,
+                                            draw_sample_splitting=False)
+        dml_irm_candidate.set_sample_splitting(dml_irm_obj.smpls)
+        dml_irm_candidate.fit()
+        candidate_objs.append(dml_irm_candidate)
+
+    res_dict = {'dml_irm_obj': dml_irm_obj,
+                'candidate_objs': candidate_objs,
+                'candidates': candidates,
+                'method': method,
+                'n_folds': n_folds,
+                'n_rep': n_rep}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_irm_select_losses(dml_irm_select_fixture):
+    dml_irm_obj = dml_irm_select_fixture['dml_irm_obj']
+    candidate_objs = dml_irm_select_fixture['candidate_objs']
+    learner_selection = dml_irm_obj.learner_selection
+    assert set(learner_selection.keys()) == {'ml_g0', 'ml_g1', 'ml_m'}
+    for learner in ['ml_g0', 'ml_g1', 'ml_m']:
+        loss_manual = np.stack([candidate_obj.nuisance_loss[learner] for candidate_obj in candidate_objs], axis=2)
+        assert learner_selection[learner]['loss'].shape == (dml_irm_select_fixture['n_rep'], 1, 2)
+        assert np.allclose(learner_selection[learner]['loss'], loss_manual)
+
+
+@pytest.mark.ci
+def test_dml_irm_select_weights(dml_irm_select_fixture):
+    learner_selection = dml_irm_select_fixture['dml_irm_obj'].learner_selection
+    for learner in ['ml_g0', 'ml_g1', 'ml_m']:
+        weights = learner_selection[learner]['weights']
+        assert np.all(weights >= 0)
+        assert np.allclose(np.sum(weights, axis=2), 1.0)
+        if dml_irm_select_fixture['method'] == 'loss':
+            assert np.array_equal(np.argmax(weights, axis=2), np.argmin(learner_selection[learner]['loss'], axis=2))
+            assert np.all(np.isin(weights, [0.0, 1.0]))
+
+
+@pytest.mark.ci
+def test_dml_irm_select_predictions(dml_irm_select_fixture):
+    dml_irm_obj = dml_irm_select_fixture['dml_irm_obj']
+    candidate_objs = dml_irm_select_fixture['candidate_objs']
+    for learner in ['ml_g0', 'ml_g1', 'ml_m']:
+        weights = dml_irm_obj.learner_selection[learner]['weights']
+        preds_manual = np.stack([candidate_obj.predictions[learner] for candidate_obj in candidate_objs], axis=3)
+        assert np.allclose(dml_irm_obj.predictions[learner], np.sum(preds_manual * weights[np.newaxis, :, :, :], axis=3))
+    if dml_irm_select_fixture['method'] == 'loss':
+        assert np.allclose(dml_irm_obj.nuisance_loss['ml_m'], np.min(dml_irm_obj.learner_selection['ml_m']['loss'], axis=2))
+
+
+@pytest.mark.ci
+def test_dml_irm_select_models(dml_irm_select_fixture):
+    dml_irm_obj = dml_irm_select_fixture['dml_irm_obj']
+    models = dml_irm_obj.models['ml_m']['d']
+    assert len(models) == dml_irm_select_fixture['n_rep']
+    for i_rep, rep_models in enumerate(models):
+        assert len(rep_models) == dml_irm_select_fixture['n_folds']
+        x = dml_irm_obj._dml_data.x[:5, :]
+        weights = dml_irm_obj.learner_selection['ml_m']['weights'][i_rep, 0, :]
+        _, test_index = dml_irm_obj.smpls[i_rep][0]
+        assert np.allclose(rep_models[0].predict_proba(dml_irm_obj._dml_data.x[test_index, :])[:, 1],
+                           dml_irm_obj.predictions['ml_m'][test_index, i_rep, 0])
+        assert rep_models[0].predict_proba(x).shape == (5, 2)
+        assert np.isclose(np.sum(weights), 1.0)
+    # the learners of the model are not replaced
+    assert isinstance(dml_irm_obj.learner['ml_g'], Lasso)
+
+
+@pytest.mark.ci
+def test_dml_plr_select_single_candidate():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=2)
+    dml_plr_obj.select_learners({'ml_l': [LinearRegression()]})
+    dml_plr_obj_lm = dml.DoubleMLPLR(dml_data, LinearRegression(), Lasso(), n_folds=2,
+                                     draw_sample_splitting=False)
+    dml_plr_obj_lm.set_sample_splitting(dml_plr_obj.smpls)
+    dml_plr_obj_lm.fit()
+    assert np.allclose(dml_plr_obj.coef, dml_plr_obj_lm.coef)
+    assert set(dml_plr_obj.learner_selection.keys()) == {'ml_l'}
+
+    # a later fit uses the learners of the model
+    dml_plr_obj.fit()
+    assert dml_plr_obj.learner_selection is None
+
+
+@pytest.mark.ci
+def test_dml_cv_predict_select_explicit_candidates():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    candidates = [Lasso(alpha=0.5), LinearRegression()]
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=2)
+    dml_plr_obj.select_learners({'ml_l': candidates}, method='stacking')
+    # the candidates are only passed to the nuisance estimation of the model during select_learners()
+    assert dml_plr_obj._fused_tuning is None
+
+    res = _dml_cv_predict_select(candidates, dml_data.x, dml_data.y, smpls=dml_plr_obj.smpls[0],
+                                 selection_method='stacking')
+    assert np.allclose(res['preds'], dml_plr_obj.predictions['ml_l'][:, 0, 0])
+    assert np.allclose(res['selection']['loss'], dml_plr_obj.learner_selection['ml_l']['loss'][0, 0])
+    assert np.allclose(res['selection']['weights'], dml_plr_obj.learner_selection['ml_l']['weights'][0, 0])
+
+    # without candidates the learner of the model is cross-fitted
+    res = _dml_cv_predict(Lasso(), dml_data.x, dml_data.y, smpls=dml_plr_obj.smpls[0], learner_name='ml_l')
+    dml_plr_obj.fit()
+    assert np.allclose(res['preds'], dml_plr_obj.predictions['ml_l'][:, 0, 0])
+
+
+@pytest.mark.ci
+def test_dml_select_learners_exceptions():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=2)
+
+    msg = r"Invalid candidates \{'ml_r': \[Lasso\(\)\]\}. candidates must be a dictionary. Valid keys are ml_l and ml_m."
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.select_learners({'ml_r': [Lasso()]})
+    msg = 'The candidates for ml_l must be a non-empty list. Lasso'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.select_learners({'ml_l': Lasso()})
+    msg = 'The candidates for ml_l must be a non-empty list. \\[\\] was passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.select_learners({'ml_l': []})
+    msg = 'The candidates for ml_l have to be of type regressor. LogisticRegression'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.select_learners({'ml_l': [Lasso(), LogisticRegression()]})
+    msg = 'method must be "loss" or "stacking". Got mean.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr_obj.select_learners({'ml_l': [Lasso()]}, method='mean')
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.model_selection import HalvingGridSearchCV, HalvingRandomSearchCV
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_pliv_CHS2015
+
+
+@pytest.fixture(scope='module',
+                params=[True, False])
+def tune_on_folds(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=['halving_grid_search', 'halving_randomized_search'])
+def search_mode(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_halving_fixture(tune_on_folds, search_mode):
+    n_folds = 2
+    n_rep = 1
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=300, dim_x=5)
+    ml_l = RandomForestRegressor(max_depth=2, random_state=42)
+    ml_m = Lasso()
+    param_grids = {'ml_l': {'max_features': [0.5, 1.0], 'min_samples_leaf': [1, 5, 10]},
+                   'ml_m': {'alpha': np.linspace(0.05, 0.95, 10)}}
+    halving_params = {'ml_l': {'resource': 'n_estimators', 'min_resources': 5, 'max_resources': 40}}
+
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, ml_l, ml_m, n_folds=n_folds, n_rep=n_rep)
+    np.random.seed(3141)
+    tune_res = dml_plr_obj.tune(param_grids, tune_on_folds=tune_on_folds, search_mode=search_mode,
+                                n_iter_randomized_search=4, halving_params=halving_params, return_tune_res=True)
+    dml_plr_obj.fit()
+
+    res_dict = {'dml_plr_obj': dml_plr_obj,
+                'tune_res': tune_res[0][0]['tune_res'] if tune_on_folds else tune_res[0]['tune_res'],
+                'param_grids': param_grids,
+                'tune_on_folds': tune_on_folds,
+                'search_mode': search_mode,
+                'n_folds': n_folds,
+                'n_rep': n_rep}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_halving_search(dml_plr_halving_fixture):
+    search_class = {'halving_grid_search': HalvingGridSearchCV,
+                    'halving_randomized_search': HalvingRandomSearchCV}[dml_plr_halving_fixture['search_mode']]
+    tune_res = dml_plr_halving_fixture['tune_res']
+    n_searches = dml_plr_halving_fixture['n_folds'] if dml_plr_halving_fixture['tune_on_folds'] else 1
+    for key in ['l_tune', 'm_tune']:
+        assert len(tune_res[key]) == n_searches
+        assert all(isinstance(search, search_class) for search in tune_res[key])
+
+    # ml_l is evaluated with increasing number of trees, ml_m with increasing number of samples
+    for search in tune_res['l_tune']:
+        assert search.resource == 'n_estimators'
+        assert search.n_resources_[0] == 5
+        assert max(search.n_resources_) <= 40
+        assert search.best_estimator_.n_estimators == search.n_resources_[-1]
+    for search in tune_res['m_tune']:
+        assert search.resource == 'n_samples'
+        assert len(search.n_resources_) > 1
+    if dml_plr_halving_fixture['search_mode'] == 'halving_randomized_search':
+        assert all(search.n_candidates_[0] == 4 for search in tune_res['m_tune'])
+
+
+@pytest.mark.ci
+def test_dml_plr_halving_params(dml_plr_halving_fixture):
+    dml_plr_obj = dml_plr_halving_fixture['dml_plr_obj']
+    param_grids = dml_plr_halving_fixture['param_grids']
+    n_rep = dml_plr_halving_fixture['n_rep']
+    n_folds = dml_plr_halving_fixture['n_folds']
+    # the number of trees is tuned as the resource of the successive halving
+    tuned_params = {'ml_l': set(param_grids['ml_l'].keys()) | {'n_estimators'},
+                    'ml_m': set(param_grids['ml_m'].keys())}
+    for learner in ['ml_l', 'ml_m']:
+        params = dml_plr_obj.params[learner]['d']
+        assert len(params) == n_rep
+        assert all(len(rep_params) == n_folds for rep_params in params)
+        for best_params in [fold_params for rep_params in params for fold_params in rep_params]:
+            assert set(best_params.keys()) == tuned_params[learner]
+    assert np.isfinite(dml_plr_obj.coef).all()
+
+
+@pytest.mark.ci
+def test_dml_pliv_partial_xz_halving():
+    np.random.seed(3141)
+    dml_data = make_pliv_CHS2015(n_obs=200, dim_x=5, dim_z=2)
+    dml_pliv_obj = dml.DoubleMLPLIV._partialXZ(dml_data, Lasso(), Lasso(), Lasso(), n_folds=2)
+    param_grids = {'ml_l': {'alpha': [0.05, 0.1, 0.5]},
+                   'ml_m': {'alpha': [0.05, 0.1, 0.5]},
+                   'ml_r': {'alpha': [0.05, 0.1, 0.5]}}
+    tune_res = dml_pliv_obj.tune(param_grids, tune_on_folds=True, search_mode='halving_grid_search',
+                                 halving_params={'ml_r': {'factor': 2}}, return_tune_res=True)
+    r_tune = tune_res[0][0]['tune_res']['r_tune']
+    assert all(isinstance(search, HalvingGridSearchCV) for search in r_tune)
+    assert all(search.factor == 2 for search in r_tune)
+    assert all(search.factor == 3 for search in tune_res[0][0]['tune_res']['l_tune'])
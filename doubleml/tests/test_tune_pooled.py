@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+from sklearn.model_selection import KFold, GridSearchCV, RandomizedSearchCV
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+
+@pytest.fixture(scope='module',
+                params=['partialling out', 'IV-type'])
+def score(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_pooled_fixture(score):
+    n_folds = 3
+    n_folds_tune = 4
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    param_grids = {'ml_l': {'alpha': np.linspace(0.05, 0.95, 5)},
+                   'ml_m': {'alpha': np.linspace(0.05, 0.95, 5)},
+                   'ml_g': {'alpha': np.linspace(0.05, 0.95, 5)}}
+    ml_g = Lasso() if score == 'IV-type' else None
+
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), ml_g, n_folds=n_folds, score=score)
+    np.random.seed(42)
+    tune_res = dml_plr_obj.tune(param_grids, tune_on_folds=True, n_folds_tune=n_folds_tune, n_jobs_cv=2,
+                                return_tune_res=True)
+    dml_plr_obj.fit()
+
+    # reference: standard search per fold with the inner splits of the pooled search (the inner splits of all folds
+    # are drawn before the candidates are evaluated in worker processes)
+    np.random.seed(42)
+    train_inds = [train_index for (train_index, _) in dml_plr_obj.smpls[0]]
+    learners = [('l_tune', 'ml_l', dml_data.y), ('m_tune', 'ml_m', dml_data.d)]
+    inner_splits = {key: [list(KFold(n_splits=n_folds_tune, shuffle=True).split(train_index))
+                          for train_index in train_inds]
+                    for key, _, _ in learners}
+    tune_res_manual = dict()
+    for key, learner, target in learners:
+        tune_res_manual[key] = list()
+        for idx, train_index in enumerate(train_inds):
+            search = GridSearchCV(Lasso(), param_grids[learner], cv=inner_splits[key][idx])
+            tune_res_manual[key].append(search.fit(dml_data.x[train_index, :], target[train_index]))
+
+    res_dict = {'dml_plr_obj': dml_plr_obj,
+                'tune_res': tune_res[0][0]['tune_res'],
+                'tune_res_manual': tune_res_manual,
+                'n_folds': n_folds}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_pooled_tune(dml_plr_pooled_fixture):
+    dml_plr_obj = dml_plr_pooled_fixture['dml_plr_obj']
+    tune_res = dml_plr_pooled_fixture['tune_res']
+    for learner, key in [('ml_l', 'l_tune'), ('ml_m', 'm_tune')]:
+        assert dml_plr_obj.params[learner]['d'][0] == [search.best_params_ for search in tune_res[key]]
+    if 'ml_g' in dml_plr_obj.params_names:
+        assert len(tune_res['g_tune']) == dml_plr_pooled_fixture['n_folds']
+    assert np.isfinite(dml_plr_obj.coef).all()
+
+
+@pytest.mark.ci
+def test_dml_plr_pooled_tune_res(dml_plr_pooled_fixture):
+    tune_res = dml_plr_pooled_fixture['tune_res']
+    tune_res_manual = dml_plr_pooled_fixture['tune_res_manual']
+    n_folds = dml_plr_pooled_fixture['n_folds']
+    for key in tune_res_manual.keys():
+        assert len(tune_res[key]) == n_folds
+        for search, search_manual in zip(tune_res[key], tune_res_manual[key]):
+            assert isinstance(search, GridSearchCV)
+            assert search.best_params_ == search_manual.best_params_
+            assert search.best_index_ == search_manual.best_index_
+            assert np.isclose(search.best_score_, search_manual.best_score_)
+            for result in ['mean_test_score', 'std_test_score', 'rank_test_score', 'split0_test_score']:
+                assert np.allclose(search.cv_results_[result], search_manual.cv_results_[result])
+            assert np.allclose(search.best_estimator_.coef_, search_manual.best_estimator_.coef_)
+            x = np.ones((2, search.n_features_in_))
+            assert np.allclose(search.predict(x), search_manual.predict(x))
+
+
+@pytest.mark.ci
+def test_dml_irm_pooled_randomized_tune():
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=200, dim_x=5)
+    dml_irm_obj = dml.DoubleMLIRM(dml_data, Lasso(), LogisticRegression(), n_folds=2)
+    param_grids = {'ml_g': {'alpha': np.linspace(0.05, 0.95, 10)},
+                   'ml_m': {'C': np.linspace(0.1, 2.0, 10)}}
+    tune_res = dml_irm_obj.tune(param_grids, tune_on_folds=True, search_mode='randomized_search',
+                                n_iter_randomized_search=3, n_jobs_cv=2, scoring_methods={'ml_m': 'neg_log_loss'},
+                                return_tune_res=True)
+    m_tune = tune_res[0][0]['tune_res']['m_tune']
+    assert all(isinstance(search, RandomizedSearchCV) for search in m_tune)
+    assert all(len(search.cv_results_['params']) == 3 for search in m_tune)
+    assert all(search.best_params_['C'] in param_grids['ml_m']['C'] for search in m_tune)
+    assert all(search.scorer_._score_func.__name__ == 'log_loss' for search in m_tune)
+    dml_irm_obj.fit()
+    assert np.isfinite(dml_irm_obj.coef).all()
@@ -8,6 +8,11 @@ from .resampling import DoubleMLResampling, DoubleMLClusterResampling
 from .blp import DoubleMLBLP
 from .policytree import DoubleMLPolicyTree
 from .gain_statistics import gain_statistics
+from .instrumentation import DoubleMLCallback, DoubleMLRecorder
+from .model_store import DoubleMLModelStore, DoubleMLModelHandle
+from .nuisance_store import DoubleMLNuisanceStore
+from .resources import DoubleMLResourceManager
+from .tuning_cache import DoubleMLTuningCache
 
 __all__ = [
     "DMLDummyRegressor",
@@ -16,5 +21,12 @@ __all__ = [
     "DoubleMLClusterResampling",
     "DoubleMLBLP",
     "DoubleMLPolicyTree",
-    "gain_statistics"
+    "gain_statistics",
+    "DoubleMLCallback",
+    "DoubleMLRecorder",
+    "DoubleMLModelStore",
+    "DoubleMLModelHandle",
+    "DoubleMLNuisanceStore",
+    "DoubleMLResourceManager",
+    "DoubleMLTuningCache"
 ]
@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+
+from scipy import sparse
+from scipy.stats import norm, t
+
+from ._estimation import _aggregate_coefs_and_ses
+
+# number of rows (observations or grid points) which are processed at once
+_BLP_CHUNK_SIZE = 65536
+
+
+def _chunks(n_rows, chunk_size=None):
+    if chunk_size is None:
+        chunk_size = _BLP_CHUNK_SIZE
+    return [slice(start, min(start + chunk_size, n_rows)) for start in range(0, n_rows, chunk_size)]
+
+
+class _OLSResults:
+    # numpy-native ordinary least squares with the attributes of statsmodels' RegressionResults which are used for the
+    # best linear predictor (params, bse, tvalues, pvalues, conf_int, cov_params, cov_type, predict and fittedvalues)
+    def __init__(self, params, cov, fittedvalues, df_resid, cov_type, use_t, names, all_params=None, all_cov=None):
+        self._names = names
+        self.cov_type = cov_type
+        # parameters and covariances of the single repetitions (only for several orthogonal signals)
+        self.all_params = all_params
+        self.all_cov = all_cov
+        self.params = pd.Series(params, index=names)
+        self._cov = cov
+        self.fittedvalues = fittedvalues
+        self.df_resid = df_resid
+        self.use_t = use_t
+        self.bse = pd.Series(np.sqrt(np.diag(cov)), index=names)
+        self.tvalues = self.params / self.bse
+        if use_t:
+            self.pvalues = pd.Series(2 * t.sf(np.abs(self.tvalues), df_resid), index=names)
+        else:
+            self.pvalues = pd.Series(2 * norm.sf(np.abs(self.tvalues)), index=names)
+
+    def cov_params(self):
+        return pd.DataFrame(self._cov, index=self._names, columns=self._names)
+
+    def conf_int(self, alpha=0.05):
+        q = t.ppf(1 - alpha / 2, self.df_resid) if self.use_t else norm.ppf(1 - alpha / 2)
+        return pd.DataFrame({0: self.params - q * self.bse, 1: self.params + q * self.bse})
+
+    def predict(self, exog):
+        return np.asarray(exog, dtype=np.float64) @ self.params.to_numpy()
+
+
+def _fit_ols_signals(y, x, cov_type):
+    # QR-based least squares for all signals (columns of y) with one factorization of the basis; the sandwich
+    # covariances (HC0-HC3) are accumulated in row chunks. As in statsmodels, rank deficient bases are handled via the
+    # pseudo-inverse, which is obtained from the singular value decomposition of the (small) triangular factor
+    n_obs, n_params = x.shape
+    q, r = np.linalg.qr(x)
+    u_r, s_r, vt_r = np.linalg.svd(r)
+    # rank tolerance of np.linalg.matrix_rank
+    rank = int(np.sum(s_r > np.max(s_r, initial=0.0) * max(x.shape) * np.finfo(np.float64).eps))
+    # orthonormal basis of the column space of x and the factor w of the pseudo-inverse (pinv(x) = w @ q.T)
+    q = q @ u_r[:, :rank]
+    w = vt_r[:rank, :].T / s_r[:rank]
+    params = w @ (q.T @ y)
+    bread = w @ w.T
+    resid = y - x @ params
+    df_resid = n_obs - rank
+
+    if cov_type == 'nonrobust':
+        cov = bread[np.newaxis, :, :] * (np.sum(np.square(resid), axis=0) / df_resid)[:, np.newaxis, np.newaxis]
+    else:
+        meat = np.zeros((y.shape[1], n_params, n_params))
+        for chunk in _chunks(n_obs):
+            weights = np.square(resid[chunk, :])
+            if cov_type in ['HC2', 'HC3']:
+                leverage = np.sum(np.square(q[chunk, :]), axis=1)[:, np.newaxis]
+                weights = weights / (1 - leverage) if cov_type == 'HC2' else weights / np.square(1 - leverage)
+            meat += np.einsum('ik,ir,il->rkl', x[chunk, :], weights, x[chunk, :])
+        cov = bread[np.newaxis, :, :] @ meat @ bread[np.newaxis, :, :]
+        if cov_type == 'HC1':
+            cov = cov * n_obs / df_resid
+    return params, cov, df_resid
+
+
+def _fit_group_means(y, codes, n_groups, cov_type):
+    # least squares for a basis of mutually exclusive group dummies (observations without group have the code -1): the
+    # coefficients are the group means and the covariances are diagonal, such that the dummies are never materialized
+    n_obs = y.shape[0]
+    in_group = codes >= 0
+    group_codes = codes[in_group]
+    n_group = np.bincount(group_codes, minlength=n_groups).astype(np.float64)
+    # empty groups (zero columns of the basis) get a coefficient and variance of zero as with the pseudo-inverse
+    inv_n_group = np.divide(1.0, n_group, out=np.zeros(n_groups), where=n_group > 0)
+    params = np.column_stack([np.bincount(group_codes, weights=y[in_group, i_rep], minlength=n_groups)
+                              for i_rep in range(y.shape[1])]) * inv_n_group[:, np.newaxis]
+    resid = y.copy()
+    resid[in_group, :] -= params[group_codes, :]
+    df_resid = n_obs - int(np.sum(n_group > 0))
+
+    if cov_type == 'nonrobust':
+        variances = (np.sum(np.square(resid), axis=0) / df_resid)[:, np.newaxis] * inv_n_group[np.newaxis, :]
+    else:
+        weights = np.square(resid[in_group, :])
+        # the leverage of an observation is the inverse of the size of its group
+        if cov_type in ['HC2', 'HC3']:
+            leverage = 1.0 / n_group[group_codes][:, np.newaxis]
+            weights = weights / (1 - leverage) if cov_type == 'HC2' else weights / np.square(1 - leverage)
+        variances = np.vstack([np.bincount(group_codes, weights=weights[:, i_rep], minlength=n_groups)
+                               for i_rep in range(y.shape[1])]) * np.square(inv_n_group)[np.newaxis, :]
+        if cov_type == 'HC1':
+            variances = variances * n_obs / df_resid
+    cov = variances[:, :, np.newaxis] * np.eye(n_groups)[np.newaxis, :, :]
+    return params, cov, df_resid
+
+
+def _group_codes(basis):
+    # integer codes of a basis of mutually exclusive dummy columns (-1 for observations without group) or None if the
+    # basis is not of this form
+    if all(isinstance(dtype, pd.SparseDtype) for dtype in basis.dtypes):
+        dummies = basis.sparse.to_coo()
+        rows, cols, values = dummies.row, dummies.col, dummies.data
+    else:
+        np_basis = basis.to_numpy()
+        rows, cols = np.nonzero(np_basis)
+        values = np_basis[rows, cols]
+    if (not np.all(values == 1)) or (np.unique(rows).shape[0] != rows.shape[0]):
+        return None
+    codes = np.full(basis.shape[0], -1)
+    codes[rows] = cols
+    return codes
+
+
+def _group_dummies(groups):
+    # sparse dummy coding of a single column of groups (with the column names of pd.get_dummies with prefix 'Group'),
+    # which only stores the group memberships instead of the dense (n_obs, n_groups) matrix
+    categorical = pd.Categorical(groups.iloc[:, 0])
+    in_group = categorical.codes >= 0
+    dummies = sparse.csc_matrix((np.ones(np.sum(in_group)), (np.flatnonzero(in_group), categorical.codes[in_group])),
+                                shape=(groups.shape[0], len(categorical.categories)))
+    return pd.DataFrame.sparse.from_spmatrix(dummies, index=groups.index,
+                                             columns=[f'Group_{category}' for category in categorical.categories])
+
+
+def _fit_ols(y, x, names, cov_type='HC0', use_t=None, codes=None):
+    # y is of shape (n_obs,) or (n_obs, n_rep) and x of shape (n_obs, d) or, for bases which differ between the
+    # repetitions, (n_rep, n_obs, d); for group dummies the group codes can be supplied instead of x
+    if codes is not None:
+        params, cov, df_resid = _fit_group_means(y.reshape(codes.shape[0], -1), codes, len(names), cov_type)
+    elif x.ndim == 2:
+        params, cov, df_resid = _fit_ols_signals(y.reshape(x.shape[0], -1), x, cov_type)
+    else:
+        fits = [_fit_ols_signals(y[:, [i_rep]], x[i_rep], cov_type) for i_rep in range(x.shape[0])]
+        params = np.hstack([fit[0] for fit in fits])
+        cov = np.concatenate([fit[1] for fit in fits])
+        df_resid = fits[0][2]
+
+    def fitted(coefs):
+        if codes is not None:
+            return np.where(codes >= 0, coefs[codes], 0.0)
+        return x @ coefs if x.ndim == 2 else np.median(x @ coefs, axis=0)
+
+    # as in statsmodels the t-distribution is used for the nonrobust covariance by default
+    if use_t is None:
+        use_t = cov_type == 'nonrobust'
+    if y.ndim == 1:
+        return _OLSResults(params[:, 0], cov[0], fitted(params[:, 0]), df_resid, cov_type, use_t, names)
+
+    # aggregation over the repetitions with the median rule of the parameter estimates, i.e., the covariance is the
+    # (elementwise) median of the covariances and the outer products of the deviations from the median parameters
+    agg_params, _ = _aggregate_coefs_and_ses(params, np.sqrt(np.diagonal(cov, axis1=1, axis2=2)).T,
+                                             np.ones(params.shape[0]))
+    deviations = params - agg_params[:, np.newaxis]
+    agg_cov = np.median(cov + np.einsum('kr,lr->rkl', deviations, deviations), axis=0)
+    return _OLSResults(agg_params, agg_cov, fitted(agg_params), df_resid, cov_type, use_t, names,
+                       all_params=params, all_cov=cov)
+
+
+def _omega_root(omega):
+    # cholesky factor of the covariance (with a symmetric square root as fallback for singular covariances)
+    if np.array_equal(omega, np.diag(np.diagonal(omega))):
+        return np.diag(np.sqrt(np.clip(np.diagonal(omega), 0, None)))
+    try:
+        return np.linalg.cholesky(omega)
+    except np.linalg.LinAlgError:
+        eigenvalues, eigenvectors = np.linalg.eigh(omega)
+        return eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
@@ -62,6 +62,17 @@ def _check_bool(value, name):
                         f' {str(value)} of type {str(type(value))} was passed.')
 
 
+def _check_dtype(dtype):
+    try:
+        valid_dtype = (dtype is not None) and (np.dtype(dtype) in [np.float32, np.float64])
+    except TypeError:
+        valid_dtype = False
+    if not valid_dtype:
+        raise ValueError('dtype must be "float32" or "float64". '
+                         f'Got {str(dtype)}.')
+    return
+
+
 def _check_is_partition(smpls, n_obs):
     test_indices = np.concatenate([test_index for _, test_index in smpls])
     if len(test_indices) != n_obs:
@@ -1,18 +1,31 @@
 import numpy as np
 import warnings
-from scipy.optimize import minimize_scalar
+from scipy.optimize import minimize_scalar, nnls
+from scipy.linalg import solve
+from scipy.stats import rankdata
 
 from sklearn.model_selection import cross_val_predict
 from sklearn.base import clone
+from sklearn.linear_model import LinearRegression, Ridge, ElasticNet
+from sklearn.kernel_ridge import KernelRidge
 from sklearn.preprocessing import LabelEncoder
+from sklearn.ensemble._forest import _generate_unsampled_indices, _get_n_samples_bootstrap
+from sklearn.utils.validation import has_fit_parameter
 from sklearn.model_selection import KFold, GridSearchCV, RandomizedSearchCV
-from sklearn.metrics import root_mean_squared_error, log_loss
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingGridSearchCV, HalvingRandomSearchCV
+from sklearn.metrics import root_mean_squared_error, log_loss, check_scoring
 
-from statsmodels.nonparametric.kde import KDEUnivariate
-
-from joblib import Parallel, delayed
+from functools import partial
+from joblib import Parallel, delayed, effective_n_jobs
 
 from ._checks import _check_is_partition
+from .model_store import DoubleMLModelHandle
+from ._instrumentation import _get_instrumentation, _stage, _timed_call
+from ._nuisance_store import _get_nuisance_store
+from ._resources import _get_resources, _cap_n_jobs, _call_with_thread_limit
+from ._tuning_cache import _get_tuning_cache
+from ._fused_tuning import _EarlyStoppingLearner, _StackedLearner
 
 
 def _assure_2d_array(x):
@@ -46,18 +59,504 @@ def _fit(estimator, x, y, train_index, idx=None):
     return estimator, idx
 
 
+def _fit_folds(fit_fun, fold_args, n_jobs=None, learner_name=None):
+    # fit the learners of all folds (in parallel); with active callbacks the fits are reported as 'fit_fold' events
+    parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
+    resources = _get_resources()
+    if (resources is not None) & (n_jobs not in [None, 1]):
+        # with an active resource manager the threads in the worker processes are limited to the budget of a fold
+        fit_fun = partial(_call_with_thread_limit, fit_fun, resources.n_cores)
+    instrumentation = _get_instrumentation()
+    if instrumentation is None:
+        fitted_models = parallel(delayed(fit_fun)(*args) for args in fold_args)
+    elif (n_jobs is None) or (n_jobs == 1):
+        fitted_models = list()
+        for idx, args in enumerate(fold_args):
+            with _stage('fit_fold', learner=learner_name, fold=idx):
+                fitted_models.append(fit_fun(*args))
+    else:
+        # fits in worker processes are measured in the workers and reported afterwards
+        fits_and_stats = parallel(delayed(_timed_call)(fit_fun, args, instrumentation.trace_memory)
+                                  for args in fold_args)
+        fitted_models = list()
+        for idx, (fitted_model, stats) in enumerate(fits_and_stats):
+            info = {**instrumentation.info, 'learner': learner_name, 'fold': idx}
+            instrumentation.notify_start('fit_fold', info)
+            instrumentation.notify_end('fit_fold', info, stats)
+            fitted_models.append(fitted_model)
+    return fitted_models
+
+
+def _is_linear_downdating_learner(estimator):
+    # ordinary least squares and ridge regression admit closed-form cross-fitting via downdating of the Gram matrix
+    if type(estimator) not in (LinearRegression, Ridge):
+        return False
+    if estimator.get_params()['positive']:
+        return False
+    if isinstance(estimator, Ridge) and not np.isscalar(estimator.alpha):
+        return False
+    return True
+
+
+def _dml_cv_predict_linear(estimator, x, y, smpls, max_condition_number=1e10):
+    # the Gram matrix X'X and X'y are accumulated once over the training observations; the training fold quantities are
+    # obtained by subtracting the contribution of the respective test fold, such that K small solves yield all predictions
+    n_obs = x.shape[0]
+    y_is_1d = (np.ndim(y) == 1)
+    y_2d = np.asarray(y, dtype=float).reshape(n_obs, -1)
+    x = np.asarray(x, dtype=float)
+    if not (np.all(np.isfinite(x)) and np.all(np.isfinite(y_2d))):
+        # missing values are left to the input validation of the learner
+        return None
+    params = estimator.get_params()
+    fit_intercept = params['fit_intercept']
+    alpha = params.get('alpha', 0.)
+
+    # every training fold has to consist of all training observations which are not in the test fold (this includes
+    # conditional samples like in the IRM model, where the training observations are restricted to a subgroup)
+    is_train = np.zeros(n_obs, dtype=bool)
+    for train_index, _ in smpls:
+        is_train[train_index] = True
+    fold_train_test = list()
+    for train_index, test_index in smpls:
+        train_test_index = test_index[is_train[test_index]]
+        is_fold_train = np.zeros(n_obs, dtype=bool)
+        is_fold_train[train_index] = True
+        if np.any(is_fold_train[test_index]) or (len(train_index) + len(train_test_index) != np.sum(is_train)):
+            return None
+        fold_train_test.append(train_test_index)
+
+    if fit_intercept:
+        # centering improves the conditioning of the Gram matrix and leaves the predictions unchanged
+        x_shift = np.mean(x[is_train, :], axis=0)
+        y_shift = np.mean(y_2d[is_train, :], axis=0)
+    else:
+        x_shift = np.zeros(x.shape[1])
+        y_shift = np.zeros(y_2d.shape[1])
+
+    def _design(index):
+        x_index = x[index, :] - x_shift
+        if fit_intercept:
+            x_index = np.column_stack((np.ones(len(index)), x_index))
+        return x_index
+
+    fold_gram = list()
+    fold_xty = list()
+    for train_test_index in fold_train_test:
+        x_train_test = _design(train_test_index)
+        fold_gram.append(x_train_test.T @ x_train_test)
+        fold_xty.append(x_train_test.T @ (y_2d[train_test_index, :] - y_shift))
+    gram = np.sum(fold_gram, axis=0)
+    xty = np.sum(fold_xty, axis=0)
+
+    penalty = alpha * np.eye(gram.shape[0])
+    if fit_intercept:
+        penalty[0, 0] = 0.
+
+    preds = np.full(y_2d.shape, np.nan)
+    for idx, (_, test_index) in enumerate(smpls):
+        train_gram = gram - fold_gram[idx] + penalty
+        if np.linalg.cond(train_gram) > max_condition_number:
+            # (nearly) singular systems are left to the standard least squares solvers
+            return None
+        coef = solve(train_gram, xty - fold_xty[idx], assume_a='pos')
+        preds[test_index, :] = _design(test_index) @ coef + y_shift
+
+    if y_is_1d:
+        preds = preds[:, 0]
+    return preds
+
+
+def _is_oob_learner(estimator, est_params=None):
+    # bagged ensembles with bootstrap samples provide out-of-bag predictions (ensembles without bootstrap, e.g.
+    # sklearn.ensemble.ExtraTreesRegressor with its default bootstrap=False, are cross-fitted)
+    if not (hasattr(estimator, 'oob_score') and hasattr(estimator, 'bootstrap')):
+        return False
+    return bool({**estimator.get_params(deep=False), **(est_params or dict())}['bootstrap'])
+
+
+def _n_oob_estimators(estimator, n_samples):
+    # number of estimators of a fitted bagged ensemble for which each training observation is out of bag
+    n_oob = np.zeros(n_samples, dtype=int)
+    if hasattr(estimator, 'estimators_samples_'):
+        samples = estimator.estimators_samples_
+    else:
+        # forests of older scikit-learn versions only store the random states of the bootstrap samples
+        n_samples_bootstrap = _get_n_samples_bootstrap(n_samples, estimator.max_samples)
+        samples = [np.setdiff1d(np.arange(n_samples),
+                                _generate_unsampled_indices(this_estimator.random_state, n_samples, n_samples_bootstrap))
+                   for this_estimator in estimator.estimators_]
+    for this_samples in samples:
+        is_oob = np.ones(n_samples, dtype=bool)
+        is_oob[this_samples] = False
+        n_oob += is_oob
+    return n_oob
+
+
+def _dml_oob_predict(estimator, x, y, smpls, est_params=None, method='predict', return_models=False):
+    # one ensemble is fitted on all training observations; the out-of-bag predictions are used for the training
+    # observations and regular predictions for the test observations which are not part of the training sample
+    n_obs = x.shape[0]
+    is_train = np.zeros(n_obs, dtype=bool)
+    for train_index, _ in smpls:
+        is_train[train_index] = True
+    train_index = np.where(is_train)[0]
+    test_index = np.unique(np.concatenate([test_index for _, test_index in smpls]))
+
+    oob_estimator = clone(estimator)
+    if est_params is not None:
+        oob_estimator.set_params(**est_params)
+    oob_estimator.set_params(oob_score=True)
+
+    if method == 'predict_proba':
+        y = LabelEncoder().fit_transform(np.asarray(y))
+    with warnings.catch_warnings():
+        # observations without out-of-bag prediction are handled below
+        warnings.filterwarnings('ignore', message='Some inputs do not have OOB scores')
+        oob_estimator.fit(x[train_index, :], y[train_index])
+
+    oob_preds = np.full(n_obs, np.nan)
+    if method == 'predict_proba':
+        oob_preds[train_index] = oob_estimator.oob_decision_function_[:, 1]
+    else:
+        oob_preds[train_index] = oob_estimator.oob_prediction_
+
+    # training observations which are in the bootstrap samples of all estimators have no out-of-bag prediction (e.g.
+    # for few estimators or a small max_samples); these observations are cross-fitted with the folds of smpls
+    is_not_oob = np.zeros(n_obs, dtype=bool)
+    is_not_oob[train_index] = _n_oob_estimators(oob_estimator, len(train_index)) == 0
+    if np.any(is_not_oob[test_index]):
+        for fold_train_index, fold_test_index in smpls:
+            fold_not_oob_index = fold_test_index[is_not_oob[fold_test_index]]
+            if len(fold_not_oob_index) == 0:
+                continue
+            fold_estimator = clone(oob_estimator).set_params(oob_score=False)
+            fold_estimator.fit(x[fold_train_index, :], y[fold_train_index])
+            if method == 'predict_proba':
+                oob_preds[fold_not_oob_index] = fold_estimator.predict_proba(x[fold_not_oob_index, :])[:, 1]
+            else:
+                oob_preds[fold_not_oob_index] = fold_estimator.predict(x[fold_not_oob_index, :])
+
+    test_not_train_index = test_index[~is_train[test_index]]
+    if len(test_not_train_index) > 0:
+        pred_fun = getattr(oob_estimator, method)
+        if method == 'predict_proba':
+            oob_preds[test_not_train_index] = pred_fun(x[test_not_train_index, :])[:, 1]
+        else:
+            oob_preds[test_not_train_index] = pred_fun(x[test_not_train_index, :])
+
+    preds = np.full(n_obs, np.nan)
+    preds[test_index] = oob_preds[test_index]
+    targets = np.full(n_obs, np.nan)
+    targets[test_index] = y[test_index]
+
+    res = {'preds': preds,
+           'targets': targets,
+           'models': None}
+    if return_models:
+        # the same ensemble is used for all folds
+        res['models'] = [oob_estimator] * len(smpls)
+    return res
+
+
+# regressors with squared loss and without loss or criterion parameter (weighted least squares, with the sample
+# weights of the elastic net rescaled to the number of observations)
+_SQUARED_LOSS_LEARNERS = (LinearRegression, Ridge, ElasticNet, KernelRidge)
+
+
+def _is_compressible_learner(estimator, est_params=None, classification=False):
+    # learners whose fit with frequency weights equals the fit on the duplicated observations: for classification the
+    # compressed observations are identical rows (exact for weighted sums of the losses of the observations), for
+    # regression the pattern-wise mean is used as target, which is only exact for squared loss; bootstrap or
+    # subsampling of the observations, minimum numbers of observations (e.g. per leaf), internal cross-validation and
+    # stochastic optimization over shuffled observations count the unique patterns instead
+    if not has_fit_parameter(estimator, 'sample_weight'):
+        return False
+    if (est_params is None) or isinstance(est_params, dict):
+        est_params = [est_params]
+    for params in est_params:
+        params = {**estimator.get_params(deep=False), **(params or dict())}
+        if params.get('bootstrap', False) or (params.get('subsample', 1.0) not in [None, 1.0]) \
+                or (params.get('min_samples_leaf', 1) != 1) or (params.get('min_samples_split', 2) != 2) \
+                or ('min_child_samples' in params) or params.get('shuffle', False) or ('cv' in params) \
+                or params.get('probability', False):
+            return False
+        if classification:
+            continue
+        if ('loss' in params) or ('criterion' in params):
+            if (params.get('loss', 'squared_error') != 'squared_error') \
+                    or (params.get('criterion', 'squared_error') not in ['squared_error', 'friedman_mse']):
+                return False
+        elif not isinstance(estimator, _SQUARED_LOSS_LEARNERS):
+            return False
+    return True
+
+
+def _fit_compressed(estimator, x, y, train_index, x_groups, classification, idx=None):
+    # collapse the training observations into unique covariate patterns (and targets for classification) with the
+    # frequencies as sample weights; for regression the pattern-wise mean is used as target (exact for squared loss);
+    # y can contain several (stacked) targets in its columns
+    train_groups = x_groups[train_index]
+    if classification & (y.ndim == 1):
+        train_groups = train_groups * (np.max(y) + 1) + y[train_index]
+    elif classification:
+        _, train_groups = np.unique(np.column_stack([train_groups, y[train_index]]), axis=0, return_inverse=True)
+        train_groups = train_groups.reshape(-1)
+    _, first_index, inverse, counts = np.unique(train_groups, return_index=True, return_inverse=True,
+                                                return_counts=True)
+    if classification:
+        y_compressed = y[train_index][first_index]
+    elif y.ndim == 1:
+        y_compressed = np.bincount(inverse, weights=y[train_index]) / counts
+    else:
+        y_compressed = np.column_stack([np.bincount(inverse, weights=y[train_index, i_target])
+                                        for i_target in range(y.shape[1])]) / counts[:, np.newaxis]
+    estimator.fit(x[train_index[first_index], :], y_compressed, sample_weight=counts)
+    return estimator, idx
+
+
+def _dml_compressed_predict(estimator, x, y, smpls, x_groups,
+                            n_jobs=None, est_params=None, method='predict', return_models=False, learner_name=None):
+    n_obs = x.shape[0]
+    classification = method == 'predict_proba'
+    y = np.asarray(y)
+    if classification:
+        y = LabelEncoder().fit_transform(y)
+
+    if (est_params is None) or isinstance(est_params, dict):
+        fold_params = [est_params] * len(smpls)
+    else:
+        assert len(est_params) == len(smpls), 'provide one parameter setting per fold'
+        fold_params = est_params
+
+    fitted_models = _fit_folds(_fit_compressed,
+                               [(clone(estimator) if fold_params[idx] is None
+                                 else clone(estimator).set_params(**fold_params[idx]),
+                                 x, y, train_index, x_groups, classification, idx)
+                                for idx, (train_index, _) in enumerate(smpls)],
+                               n_jobs=n_jobs, learner_name=learner_name)
+
+    preds = np.full(n_obs, np.nan)
+    targets = np.full(n_obs, np.nan)
+    for idx, (train_index, test_index) in enumerate(smpls):
+        assert idx == fitted_models[idx][1]
+        pred_fun = getattr(fitted_models[idx][0], method)
+        # predict once per unique covariate pattern and expand to the test observations
+        _, first_index, inverse = np.unique(x_groups[test_index], return_index=True, return_inverse=True)
+        with _stage('predict_fold', learner=learner_name, fold=idx):
+            if classification:
+                preds[test_index] = pred_fun(x[test_index[first_index], :])[:, 1][inverse]
+            else:
+                preds[test_index] = pred_fun(x[test_index[first_index], :])[inverse]
+        targets[test_index] = y[test_index]
+
+    res = {'preds': preds,
+           'targets': targets,
+           'models': None}
+    if return_models:
+        res['models'] = [xx[0] for xx in fitted_models]
+    return res
+
+
 def _dml_cv_predict(estimator, x, y, smpls=None,
-                    n_jobs=None, est_params=None, method='predict', return_train_preds=False, return_models=False):
+                    n_jobs=None, est_params=None, method='predict', return_train_preds=False, return_models=False,
+                    cross_fit='kfold', x_groups=None, learner_name=None, fused_tuning=None):
+    # nuisance functions with an active nuisance store are only cross-fitted once (fold-specific targets and
+    # predictions on the training folds are not stored); with fused tuning (parameter grids, early stopping or learner
+    # candidates of the fitted model) the nuisance function is tuned, early stopped or selected within the cross-fitting
+    store = _get_nuisance_store()
+    tune_learner = (fused_tuning is not None) and fused_tuning.tunes(learner_name)
+    select_learner = (fused_tuning is not None) and fused_tuning.selects(learner_name)
+    early_stopping = (fused_tuning is not None) and fused_tuning.stops_early(learner_name, estimator)
+    use_store = (store is not None) & (not return_train_preds) & (not isinstance(y, list)) & (not tune_learner) \
+        & (not select_learner) & (not early_stopping)
+    if use_store:
+        key = store._key(estimator, x, y, smpls, est_params, method, cross_fit, x_groups)
+        res = store._get(key, y, smpls, return_models)
+        if res is not None:
+            return res
+
+    # learners with their own parallelism are capped to the core budget of an active resource manager
+    estimator = _cap_n_jobs(estimator)
+    with _stage('nuisance', learner=learner_name):
+        if tune_learner:
+            res = _dml_cv_predict_tuned(estimator, x, y, smpls=smpls, n_jobs=n_jobs, est_params=est_params,
+                                        method=method, return_train_preds=return_train_preds,
+                                        return_models=return_models, cross_fit=cross_fit, learner_name=learner_name,
+                                        fused_tuning=fused_tuning)
+        elif select_learner:
+            res = _dml_cv_predict_select(fused_tuning.candidates[learner_name], x, y, smpls=smpls, n_jobs=n_jobs,
+                                         method=method, return_train_preds=return_train_preds,
+                                         return_models=return_models, learner_name=learner_name,
+                                         selection_method=fused_tuning.selection_method)
+            fused_tuning.record('selection', learner_name, res.pop('selection'))
+        elif early_stopping:
+            res = _dml_cv_predict_early_stopping(estimator, x, y, smpls=smpls, n_jobs=n_jobs, est_params=est_params,
+                                                 method=method, return_train_preds=return_train_preds,
+                                                 return_models=return_models, cross_fit=cross_fit,
+                                                 learner_name=learner_name, fused_tuning=fused_tuning)
+        else:
+            res = _dml_cv_predict_folds(estimator, x, y, smpls=smpls, n_jobs=n_jobs, est_params=est_params,
+                                        method=method, return_train_preds=return_train_preds,
+                                        return_models=return_models, cross_fit=cross_fit, x_groups=x_groups,
+                                        learner_name=learner_name)
+    if use_store:
+        store._set(key, res)
+    return res
+
+
+def _dml_cv_predict_wrapped(wrapper, x, y, smpls, n_jobs, est_params, method, return_train_preds, cross_fit,
+                            learner_name):
+    # cross-fitting of a meta-estimator (e.g. a grid search) for the learner; the parameters of the learner are passed
+    # to the wrapped estimator and the fitted meta-estimators of all folds are returned with the (fold) parameters
+    if est_params is None:
+        wrapper_params = None
+    elif isinstance(est_params, dict):
+        wrapper_params = {'estimator__' + key: value for key, value in est_params.items()}
+    else:
+        wrapper_params = [{'estimator__' + key: value for key, value in fold_params.items()}
+                          for fold_params in est_params]
+    res = _dml_cv_predict_folds(wrapper, x, y, smpls=smpls, n_jobs=n_jobs, est_params=wrapper_params, method=method,
+                                return_train_preds=return_train_preds, return_models=True, cross_fit=cross_fit,
+                                learner_name=learner_name)
+
+    if (est_params is None) or isinstance(est_params, dict):
+        fold_params = [est_params or dict()] * len(res['models'])
+    else:
+        fold_params = est_params
+    return res, fold_params
+
+
+def _dml_cv_predict_tuned(estimator, x, y, smpls, n_jobs, est_params, method, return_train_preds, return_models,
+                          cross_fit, learner_name, fused_tuning):
+    # the learner is replaced by a (grid, randomized or halving) search which is fitted on each training fold; the
+    # refitted best estimator predicts the test fold directly (parameters which are set for the learner are used for
+    # all candidates)
+    search = _get_search(estimator, fused_tuning.param_grids[learner_name], fused_tuning.scoring_methods.get(learner_name),
+                         fused_tuning.n_folds_tune, None, fused_tuning.search_mode,
+                         fused_tuning.n_iter_randomized_search, fused_tuning.halving_params.get(learner_name))
+    res, fold_params = _dml_cv_predict_wrapped(search, x, y, smpls, n_jobs, est_params, method, return_train_preds,
+                                               cross_fit, learner_name)
+    fused_tuning.record('tuned_params', learner_name, [{**params, **model.best_params_}
+                                                       for params, model in zip(fold_params, res['models'])])
+    res['models'] = [model.best_estimator_ for model in res['models']] if return_models else None
+    return res
+
+
+def _dml_cv_predict_early_stopping(estimator, x, y, smpls, n_jobs, est_params, method, return_train_preds,
+                                   return_models, cross_fit, learner_name, fused_tuning):
+    # the number of iterations is determined by early stopping on an inner validation split of each training fold
+    learner = _EarlyStoppingLearner(estimator, refit=fused_tuning.early_stopping == 'refit')
+    res, fold_params = _dml_cv_predict_wrapped(learner, x, y, smpls, n_jobs, est_params, method, return_train_preds,
+                                               cross_fit, learner_name)
+    fused_tuning.record('early_stopping_params', learner_name, [{**params, **model.iteration_params_}
+                                                                for params, model in zip(fold_params, res['models'])])
+    res['models'] = [model.estimator_ for model in res['models']] if return_models else None
+    return res
+
+
+def _dml_cv_predict_select(candidates, x, y, smpls=None, n_jobs=None, method='predict', return_train_preds=False,
+                           return_models=False, learner_name=None, selection_method='loss'):
+    # all candidates are fitted on all training folds in one (parallel) pass; the predictions of the candidate with the
+    # smallest loss or a non-negative combination of the candidates are used for the nuisance function (the losses and
+    # weights of the candidates are returned with the key 'selection')
+    if isinstance(y, list):
+        raise NotImplementedError(f'Learner selection not implemented for {learner_name} with fold-specific targets.')
+    n_obs = x.shape[0]
+    n_candidates = len(candidates)
+    y_fit = LabelEncoder().fit_transform(np.asarray(y)) if method == 'predict_proba' else y
+    fitted_models = _fit_folds(_fit,
+                               [(clone(candidate), x, y_fit, train_index, (i_candidate, idx))
+                                for i_candidate, candidate in enumerate(candidates)
+                                for idx, (train_index, _) in enumerate(smpls)],
+                               n_jobs=n_jobs, learner_name=learner_name)
+    models = [[model for model, (i_model, _) in fitted_models if i_model == i_candidate]
+              for i_candidate in range(n_candidates)]
+
+    def _predict(model, x_pred):
+        return model.predict_proba(x_pred)[:, 1] if method == 'predict_proba' else model.predict(x_pred)
+
+    preds = np.full((n_obs, n_candidates), np.nan)
+    targets = np.full(n_obs, np.nan)
+    for idx, (_, test_index) in enumerate(smpls):
+        for i_candidate in range(n_candidates):
+            preds[test_index, i_candidate] = _predict(models[i_candidate][idx], x[test_index, :])
+        targets[test_index] = y_fit[test_index]
+
+    # the losses are evaluated on the test observations from the domain of the training folds (e.g. the untreated
+    # observations for conditional sample splits)
+    in_domain = np.zeros(n_obs, dtype=bool)
+    for train_index, _ in smpls:
+        in_domain[train_index] = True
+    eval_obs = in_domain & ~np.isnan(targets)
+    if not np.any(eval_obs):
+        eval_obs = ~np.isnan(targets)
+    if method == 'predict_proba':
+        eval_preds = np.clip(preds[eval_obs, :], 1e-15, 1 - 1e-15)
+        eval_targets = targets[eval_obs][:, np.newaxis]
+        losses = -np.mean(eval_targets * np.log(eval_preds) + (1 - eval_targets) * np.log(1 - eval_preds), axis=0)
+    else:
+        losses = np.sqrt(np.mean(np.power(targets[eval_obs][:, np.newaxis] - preds[eval_obs, :], 2), axis=0))
+
+    weights = np.zeros(n_candidates)
+    if selection_method == 'stacking':
+        weights = nnls(preds[eval_obs, :], targets[eval_obs])[0]
+    if np.sum(weights) > 0:
+        weights = weights / np.sum(weights)
+    else:
+        weights[np.argmin(losses)] = 1.0
+    res = {'preds': np.full(n_obs, np.nan), 'targets': targets, 'models': None,
+           'selection': {'loss': losses, 'weights': weights}}
+    for idx, (_, test_index) in enumerate(smpls):
+        res['preds'][test_index] = preds[test_index, :] @ weights
+    selected = [i_candidate for i_candidate in range(n_candidates) if weights[i_candidate] > 0]
+    fold_models = [models[selected[0]][idx] if len(selected) == 1 else
+                   _StackedLearner([models[i_candidate][idx] for i_candidate in selected], weights[selected])
+                   for idx in range(len(smpls))]
+    if return_train_preds:
+        res['train_preds'] = [_predict(fold_models[idx], x[train_index, :]) for idx, (train_index, _) in enumerate(smpls)]
+        res['train_targets'] = [y_fit[train_index] for train_index, _ in smpls]
+    if return_models:
+        res['models'] = fold_models
+    return res
+
+
+def _dml_cv_predict_folds(estimator, x, y, smpls=None,
+                          n_jobs=None, est_params=None, method='predict', return_train_preds=False, return_models=False,
+                          cross_fit='kfold', x_groups=None, learner_name=None):
     n_obs = x.shape[0]
 
     smpls_is_partition = _check_is_partition(smpls, n_obs)
     fold_specific_params = (est_params is not None) & (not isinstance(est_params, dict))
     fold_specific_target = isinstance(y, list)
+    if (cross_fit == 'oob') and (not fold_specific_params) and (not fold_specific_target) and (not return_train_preds) \
+            and _is_oob_learner(estimator, est_params):
+        return _dml_oob_predict(estimator, x, y, smpls, est_params=est_params, method=method,
+                                return_models=return_models)
+    if (x_groups is not None) and (not fold_specific_target) and (not return_train_preds) \
+            and _is_compressible_learner(estimator, est_params, method == 'predict_proba'):
+        return _dml_compressed_predict(estimator, x, y, smpls, x_groups, n_jobs=n_jobs, est_params=est_params,
+                                       method=method, return_models=return_models, learner_name=learner_name)
+
+    # with active callbacks the folds are fitted manually to report the fits of the single folds
     manual_cv_predict = (not smpls_is_partition) | return_train_preds | fold_specific_params | fold_specific_target \
-        | return_models
+        | return_models | (_get_instrumentation() is not None)
+    # with an active resource manager parallel folds are fitted manually to limit the threads in the worker processes
+    parallel_resources = (_get_resources() is not None) & (n_jobs not in [None, 1])
 
     res = {'models': None}
-    if not manual_cv_predict:
+    linear_downdating = (not manual_cv_predict) & (method == 'predict')
+    if linear_downdating:
+        linear_estimator = clone(estimator) if est_params is None else clone(estimator).set_params(**est_params)
+        linear_downdating = _is_linear_downdating_learner(linear_estimator)
+    if linear_downdating:
+        preds = _dml_cv_predict_linear(linear_estimator, x, y, smpls)
+        # fall back to the standard cross-fitting for (nearly) singular designs
+        linear_downdating = preds is not None
+    if linear_downdating:
+        res['preds'] = preds
+        res['targets'] = np.copy(y)
+    elif not (manual_cv_predict | parallel_resources):
         if est_params is None:
             # if there are no parameters set we redirect to the standard method
             preds = cross_val_predict(clone(estimator), x, y, cv=smpls, n_jobs=n_jobs, method=method)
@@ -83,8 +582,6 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
             le = LabelEncoder()
             y = le.fit_transform(y)
 
-        parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
-
         if fold_specific_target:
             y_list = list()
             for idx, (train_index, _) in enumerate(smpls):
@@ -96,19 +593,17 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
             y_list = [y] * len(smpls)
 
         if est_params is None:
-            fitted_models = parallel(delayed(_fit)(
-                clone(estimator), x, y_list[idx], train_index, idx)
-                                     for idx, (train_index, test_index) in enumerate(smpls))
+            fold_estimators = [clone(estimator) for _ in smpls]
         elif isinstance(est_params, dict):
             # warnings.warn("Using the same (hyper-)parameters for all folds")
-            fitted_models = parallel(delayed(_fit)(
-                clone(estimator).set_params(**est_params), x, y_list[idx], train_index, idx)
-                                     for idx, (train_index, test_index) in enumerate(smpls))
+            fold_estimators = [clone(estimator).set_params(**est_params) for _ in smpls]
         else:
             assert len(est_params) == len(smpls), 'provide one parameter setting per fold'
-            fitted_models = parallel(delayed(_fit)(
-                clone(estimator).set_params(**est_params[idx]), x, y_list[idx], train_index, idx)
-                                     for idx, (train_index, test_index) in enumerate(smpls))
+            fold_estimators = [clone(estimator).set_params(**est_params[idx]) for idx in range(len(smpls))]
+        fitted_models = _fit_folds(_fit,
+                                   [(fold_estimators[idx], x, y_list[idx], train_index, idx)
+                                    for idx, (train_index, _) in enumerate(smpls)],
+                                   n_jobs=n_jobs, learner_name=learner_name)
 
         preds = np.full(n_obs, np.nan)
         targets = np.full(n_obs, np.nan)
@@ -117,10 +612,11 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
         for idx, (train_index, test_index) in enumerate(smpls):
             assert idx == fitted_models[idx][1]
             pred_fun = getattr(fitted_models[idx][0], method)
-            if method == 'predict_proba':
-                preds[test_index] = pred_fun(x[test_index, :])[:, 1]
-            else:
-                preds[test_index] = pred_fun(x[test_index, :])
+            with _stage('predict_fold', learner=learner_name, fold=idx):
+                if method == 'predict_proba':
+                    preds[test_index] = pred_fun(x[test_index, :])[:, 1]
+                else:
+                    preds[test_index] = pred_fun(x[test_index, :])
 
             if fold_specific_target:
                 # targets not available for fold specific target
@@ -146,23 +642,368 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
     return res
 
 
+def _is_multi_output_learner(learner):
+    # check the estimator tags whether the learner natively supports multiple targets
+    try:
+        from sklearn.utils import get_tags
+        return bool(get_tags(learner).target_tags.multi_output)
+    except ImportError:
+        if not hasattr(learner, '_get_tags'):
+            return False
+        tags = learner._get_tags()
+        return bool(tags.get('multioutput', False) or tags.get('multioutput_only', False))
+
+
+def _is_same_param_value(value_a, value_b):
+    # parameter values are compared element-wise for arrays and recursively for nested estimators, parameter
+    # dictionaries and (fold-specific) lists of parameters
+    if hasattr(value_a, 'get_params') or hasattr(value_b, 'get_params'):
+        return hasattr(value_a, 'get_params') and hasattr(value_b, 'get_params') \
+            and _is_same_learner_spec(value_a, value_b)
+    if isinstance(value_a, np.ndarray) or isinstance(value_b, np.ndarray):
+        return np.array_equal(value_a, value_b)
+    if isinstance(value_a, dict) or isinstance(value_b, dict):
+        return isinstance(value_a, dict) and isinstance(value_b, dict) and (value_a.keys() == value_b.keys()) \
+            and all(_is_same_param_value(value_a[key], value_b[key]) for key in value_a)
+    if isinstance(value_a, (list, tuple)) or isinstance(value_b, (list, tuple)):
+        return (type(value_a) is type(value_b)) and (len(value_a) == len(value_b)) \
+            and all(_is_same_param_value(a, b) for a, b in zip(value_a, value_b))
+    return bool(value_a == value_b)
+
+
+def _is_same_learner_spec(learner_a, learner_b):
+    if type(learner_a) is not type(learner_b):
+        return False
+    # nested estimators (e.g. pipelines or meta-estimators) are compared recursively
+    return _is_same_param_value(learner_a.get_params(deep=False), learner_b.get_params(deep=False))
+
+
+def _dml_cv_predict_stacked(estimator, x, y_dict, smpls=None,
+                            n_jobs=None, est_params=None, method='predict', return_models=False, x_groups=None,
+                            learner_name=None):
+    # fit one multi-output model per fold on the column-wise stacked targets sharing x and the sample splits; as for
+    # single targets, the training observations are compressed to the unique covariate patterns if x_groups is supplied
+    n_obs = x.shape[0]
+    target_names = list(y_dict.keys())
+    smpls_is_partition = _check_is_partition(smpls, n_obs)
+    if not smpls_is_partition:
+        assert len(smpls) == 1
+
+    estimator = _cap_n_jobs(estimator)
+    y = np.column_stack([np.asarray(y_dict[name]) for name in target_names])
+    if method == 'predict_proba':
+        y = np.column_stack([LabelEncoder().fit_transform(y[:, i_target]) for i_target in range(y.shape[1])])
+
+    if (est_params is None) or isinstance(est_params, dict):
+        fold_params = [est_params] * len(smpls)
+    else:
+        assert len(est_params) == len(smpls), 'provide one parameter setting per fold'
+        fold_params = est_params
+
+    compressed = (x_groups is not None) and _is_compressible_learner(estimator, est_params, method == 'predict_proba')
+    preds = None
+    if (not compressed) and smpls_is_partition and (not return_models) and (method == 'predict') \
+            and all(params == fold_params[0] for params in fold_params):
+        linear_estimator = clone(estimator) if fold_params[0] is None else clone(estimator).set_params(**fold_params[0])
+        if _is_linear_downdating_learner(linear_estimator):
+            # all targets are handled by the same closed-form solves
+            preds = _dml_cv_predict_linear(linear_estimator, x, y, smpls)
+
+    if preds is None:
+        if compressed:
+            fitted_models = _fit_folds(_fit_compressed,
+                                       [(clone(estimator) if fold_params[idx] is None
+                                         else clone(estimator).set_params(**fold_params[idx]),
+                                         x, y, train_index, x_groups, method == 'predict_proba', idx)
+                                        for idx, (train_index, _) in enumerate(smpls)],
+                                       n_jobs=n_jobs, learner_name=learner_name)
+        else:
+            fitted_models = _fit_folds(_fit,
+                                       [(clone(estimator) if fold_params[idx] is None
+                                         else clone(estimator).set_params(**fold_params[idx]),
+                                         x, y, train_index, idx)
+                                        for idx, (train_index, _) in enumerate(smpls)],
+                                       n_jobs=n_jobs, learner_name=learner_name)
+
+        preds = np.full((n_obs, len(target_names)), np.nan)
+        for idx, (train_index, test_index) in enumerate(smpls):
+            assert idx == fitted_models[idx][1]
+            pred_fun = getattr(fitted_models[idx][0], method)
+            # with compression the predictions are evaluated once per unique covariate pattern of the test fold
+            if compressed:
+                _, first_index, inverse = np.unique(x_groups[test_index], return_index=True, return_inverse=True)
+                pred_index = test_index[first_index]
+            else:
+                pred_index, inverse = test_index, np.arange(len(test_index))
+            with _stage('predict_fold', learner=learner_name, fold=idx):
+                if method == 'predict_proba':
+                    probas = pred_fun(x[pred_index, :])
+                    if not isinstance(probas, list):
+                        probas = [probas]
+                    preds[test_index, :] = np.column_stack([proba[:, 1] for proba in probas])[inverse, :]
+                else:
+                    preds[test_index, :] = pred_fun(x[pred_index, :]).reshape(len(pred_index), -1)[inverse, :]
+
+    if return_models:
+        fold_ids = [xx[1] for xx in fitted_models]
+        if not np.all(fold_ids == np.arange(len(smpls))):
+            raise RuntimeError('export of fitted models failed')
+        models = [xx[0] for xx in fitted_models]
+    else:
+        models = None
+
+    res = dict()
+    for i_target, name in enumerate(target_names):
+        if smpls_is_partition:
+            targets = np.copy(y_dict[name])
+        else:
+            targets = np.full(n_obs, np.nan)
+            targets[smpls[0][1]] = np.asarray(y_dict[name])[smpls[0][1]]
+        res[name] = {'preds': preds[:, i_target],
+                     'targets': targets,
+                     'models': models}
+    return res
+
+
+def _dml_cv_predict_multi_output(learners, x, targets, smpls=None,
+                                 n_jobs=None, est_params=None, methods=None, return_models=False, cross_fit='kfold',
+                                 x_groups=None, fused_tuning=None):
+    # learners, targets, est_params and methods are dictionaries with the nuisance names as keys; nuisance
+    # functions with an identical learner specification are fitted jointly if the learner supports multiple targets
+    nuisance_names = list(targets.keys())
+    if est_params is None:
+        est_params = {name: None for name in nuisance_names}
+    if methods is None:
+        methods = {name: 'predict' for name in nuisance_names}
+
+    groups = list()
+    for name in nuisance_names:
+        for group in groups:
+            ref_name = group[0]
+            if (cross_fit == 'kfold') and _is_multi_output_learner(learners[name]) \
+                    and _is_same_learner_spec(learners[name], learners[ref_name]) \
+                    and (methods[name] == methods[ref_name]) \
+                    and _is_same_param_value(est_params[name], est_params[ref_name]):
+                group.append(name)
+                break
+        else:
+            groups.append([name])
+
+    res = dict()
+    for group in groups:
+        if len(group) == 1:
+            name = group[0]
+            res[name] = _dml_cv_predict(learners[name], x, targets[name], smpls=smpls, n_jobs=n_jobs,
+                                        est_params=est_params[name], method=methods[name],
+                                        return_models=return_models, cross_fit=cross_fit, x_groups=x_groups,
+                                        learner_name=name, fused_tuning=fused_tuning)
+        else:
+            # the jointly fitted nuisance functions are reported with the combined learner name, e.g. 'ml_l+ml_m'
+            learner_name = '+'.join(group)
+            with _stage('nuisance', learner=learner_name):
+                res.update(_dml_cv_predict_stacked(learners[group[0]], x, {name: targets[name] for name in group},
+                                                   smpls=smpls, n_jobs=n_jobs, est_params=est_params[group[0]],
+                                                   method=methods[group[0]], return_models=return_models,
+                                                   x_groups=x_groups, learner_name=learner_name))
+    return res
+
+
+def _predict_chunk(model, x, method):
+    if method == 'predict_proba':
+        return model.predict_proba(x)[:, 1]
+    else:
+        return model.predict(x)
+
+
+def _predict_chunks(model, x, method, chunk_size):
+    # the model is sent to the worker (or loaded from a model store) once and evaluated on all row chunks
+    if isinstance(model, DoubleMLModelHandle):
+        model = model.load()
+    preds = np.full(x.shape[0], np.nan)
+    for start in range(0, x.shape[0], chunk_size):
+        preds[start:(start + chunk_size)] = _predict_chunk(model, x[start:(start + chunk_size)], method)
+    return preds
+
+
+def _dml_ensemble_predict(model_groups, x, methods, aggregate='mean', chunk_size=None, n_jobs=None):
+    # predict new observations with groups of fitted models (e.g. the fold models of a repetition) and aggregate the
+    # predictions within each group; models which appear in several groups or folds (out-of-bag) are evaluated once
+    n_obs = x.shape[0]
+    unique_models = dict()
+    for models, method in zip(model_groups, methods):
+        for model in models:
+            unique_models.setdefault(id(model), (model, method))
+    model_ids = list(unique_models.keys())
+    group_cols = [[model_ids.index(id(model)) for model in models] for models in model_groups]
+
+    if chunk_size is None:
+        chunk_size = max(n_obs, 1)
+    preds = np.zeros((n_obs, len(model_groups)))
+    model_preds = dict()
+    # each model is one task which loops over the row chunks; the tasks are dispatched in batches of the number of
+    # workers such that (for the mean) only the predictions of the running tasks and the groups are held in memory
+    unique_models = list(unique_models.values())
+    batch_size = effective_n_jobs(n_jobs)
+    with Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs') as parallel:
+        for batch_start in range(0, len(unique_models), batch_size):
+            batch_preds = parallel(delayed(_predict_chunks)(model, x, method, chunk_size)
+                                   for model, method in unique_models[batch_start:(batch_start + batch_size)])
+            for i_model, pred in enumerate(batch_preds, start=batch_start):
+                if aggregate == 'mean':
+                    for i_group, cols in enumerate(group_cols):
+                        if i_model in cols:
+                            preds[:, i_group] += pred * (cols.count(i_model) / len(cols))
+                else:
+                    model_preds[i_model] = pred
+    if aggregate == 'median':
+        for i_group, cols in enumerate(group_cols):
+            preds[:, i_group] = np.median(np.column_stack([model_preds[i_model] for i_model in cols]), axis=1)
+    return preds
+
+
+def _get_search(learner, param_grid, scoring_method, n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search,
+                halving_params=None):
+    if halving_params is None:
+        halving_params = dict()
+    if search_mode in ['halving_grid_search', 'halving_randomized_search']:
+        # successive halving requires the same folds in all iterations
+        tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True, random_state=np.random.randint(np.iinfo(np.int32).max))
+    else:
+        tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
+    if search_mode == 'grid_search':
+        search = GridSearchCV(learner, param_grid,
+                              scoring=scoring_method,
+                              cv=tune_resampling, n_jobs=n_jobs_cv)
+    elif search_mode == 'randomized_search':
+        search = RandomizedSearchCV(learner, param_grid,
+                                    scoring=scoring_method,
+                                    cv=tune_resampling, n_jobs=n_jobs_cv,
+                                    n_iter=n_iter_randomized_search)
+    elif search_mode == 'halving_grid_search':
+        # successive halving: all candidates are evaluated with few resources (samples or e.g. n_estimators) and
+        # only the best candidates are evaluated with increasing resources
+        search = HalvingGridSearchCV(learner, param_grid,
+                                     scoring=scoring_method,
+                                     cv=tune_resampling, n_jobs=n_jobs_cv,
+                                     **halving_params)
+    else:
+        assert search_mode == 'halving_randomized_search'
+        search = HalvingRandomSearchCV(learner, param_grid,
+                                       scoring=scoring_method,
+                                       cv=tune_resampling, n_jobs=n_jobs_cv,
+                                       n_candidates=n_iter_randomized_search,
+                                       **halving_params)
+    return search
+
+
 def _dml_tune(y, x, train_inds,
               learner, param_grid, scoring_method,
-              n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search):
-    tune_res = list()
+              n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search, halving_params=None):
+    learner = _cap_n_jobs(learner)
+    # with an active tuning cache only the searches which are not cached are performed
+    cache = _get_tuning_cache()
+    if cache is None:
+        cached = [None] * len(train_inds)
+        search_param_grid = param_grid
+    else:
+        spec_key = cache._spec_key(learner, param_grid, scoring_method, n_folds_tune, search_mode,
+                                   n_iter_randomized_search, halving_params)
+        keys = [cache._key(spec_key, x, y, train_index) for train_index in train_inds]
+        cached = [cache._get(key) for key in keys]
+        search_param_grid = cache._warm_start_param_grid(spec_key, param_grid, search_mode)
+
+    tune_res = [None] * len(train_inds)
+    missing = [idx for idx, entry in enumerate(cached) if entry is None]
+    if (n_jobs_cv not in [None, 1]) & (len(missing) > 1) & (search_mode in ['grid_search', 'randomized_search']):
+        searches = _dml_tune_pooled(y, x, [train_inds[idx] for idx in missing], learner, search_param_grid,
+                                    scoring_method, n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+    else:
+        searches = list()
+        for idx in missing:
+            g_grid_search = _get_search(learner, search_param_grid, scoring_method, n_folds_tune, n_jobs_cv,
+                                        search_mode, n_iter_randomized_search, halving_params)
+            with _stage('tune_fold', fold=idx):
+                searches.append(g_grid_search.fit(x[train_inds[idx], :], y[train_inds[idx]]))
+    for idx, search in zip(missing, searches):
+        tune_res[idx] = search
+        if cache is not None:
+            cache._set(keys[idx], spec_key, search)
+
+    # for cached searches only the best candidate is refitted
+    hits = [idx for idx, entry in enumerate(cached) if entry is not None]
+    if len(hits) > 0:
+        fitted_models = _fit_folds(_fit,
+                                   [(clone(learner).set_params(**cached[idx]['best_params']), x, y, train_inds[idx], idx)
+                                    for idx in hits],
+                                   n_jobs=n_jobs_cv)
+        for fitted_model, idx in fitted_models:
+            search = _get_search(learner, param_grid, scoring_method, n_folds_tune, n_jobs_cv,
+                                 search_mode, n_iter_randomized_search, halving_params)
+            tune_res[idx] = _set_search_results(search, cached[idx]['cv_results'], cached[idx]['best_index'],
+                                                cached[idx]['best_params'], fitted_model, cached[idx]['n_splits'])
+
+    return tune_res
+
+
+def _set_search_results(search, cv_results, best_index, best_params, best_estimator, n_splits):
+    # results of an unfitted search object are set such that it can be used as if it had been fitted
+    search.cv_results_ = cv_results
+    search.best_index_ = best_index
+    search.best_params_ = best_params
+    search.best_score_ = cv_results['mean_test_score'][best_index]
+    search.best_estimator_ = best_estimator
+    search.scorer_ = check_scoring(search.estimator, scoring=search.scoring)
+    search.multimetric_ = False
+    search.n_splits_ = n_splits
+    return search
+
+
+def _dml_tune_pooled(y, x, train_inds,
+                     learner, param_grid, scoring_method,
+                     n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search):
+    # fold-specific tuning in one pool of jobs: a single search evaluates all candidates on the inner splits of all
+    # folds (x is shared with the workers via memory mapping), the best candidates are refitted per fold afterwards
+    fold_splits = list()
     for train_index in train_inds:
         tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
-        if search_mode == 'grid_search':
-            g_grid_search = GridSearchCV(learner, param_grid,
-                                         scoring=scoring_method,
-                                         cv=tune_resampling, n_jobs=n_jobs_cv)
-        else:
-            assert search_mode == 'randomized_search'
-            g_grid_search = RandomizedSearchCV(learner, param_grid,
-                                               scoring=scoring_method,
-                                               cv=tune_resampling, n_jobs=n_jobs_cv,
-                                               n_iter=n_iter_randomized_search)
-        tune_res.append(g_grid_search.fit(x[train_index, :], y[train_index]))
+        fold_splits.append([(train_index[inner_train], train_index[inner_test])
+                            for inner_train, inner_test in tune_resampling.split(train_index)])
+    pooled_search = _get_search(learner, param_grid, scoring_method, n_folds_tune, n_jobs_cv,
+                                search_mode, n_iter_randomized_search)
+    pooled_search.set_params(cv=[split for splits in fold_splits for split in splits], refit=False)
+    with _stage('tune_pooled'):
+        pooled_search.fit(x, y)
+    pooled_results = pooled_search.cv_results_
+
+    fold_results = list()
+    for idx in range(len(train_inds)):
+        first_split = idx * n_folds_tune
+        split_scores = np.column_stack([pooled_results[f'split{first_split + i_split}_test_score']
+                                        for i_split in range(n_folds_tune)])
+        mean_scores = np.mean(split_scores, axis=1)
+        # candidates with failed fits are ranked last
+        ranks = rankdata(-np.nan_to_num(mean_scores, nan=-np.inf), method='min').astype(np.int32)
+        cv_results = {key: value for key, value in pooled_results.items() if key.startswith('param')}
+        cv_results.update({f'split{i_split}_test_score': split_scores[:, i_split] for i_split in range(n_folds_tune)})
+        cv_results.update({'mean_test_score': mean_scores,
+                           'std_test_score': np.std(split_scores, axis=1),
+                           'rank_test_score': ranks})
+        best_index = int(np.argmin(ranks))
+        fold_results.append({'cv_results': cv_results, 'best_index': best_index,
+                             'best_params': pooled_results['params'][best_index]})
+
+    fitted_models = _fit_folds(_fit,
+                               [(clone(learner).set_params(**res['best_params']), x, y, train_index, idx)
+                                for idx, (train_index, res) in enumerate(zip(train_inds, fold_results))],
+                               n_jobs=n_jobs_cv)
+
+    # fitted search objects per fold as returned by the standard tuning
+    tune_res = list()
+    for idx, res in enumerate(fold_results):
+        fold_search = _get_search(learner, param_grid, scoring_method, n_folds_tune, n_jobs_cv,
+                                  search_mode, n_iter_randomized_search)
+        tune_res.append(_set_search_results(fold_search, res['cv_results'], res['best_index'], res['best_params'],
+                                            fitted_models[idx][0], n_folds_tune))
 
     return tune_res
 
@@ -237,6 +1078,7 @@ def _get_bracket_guess(score, coef_start, coef_bounds):
 
 
 def _default_kde(u, weights):
+    from statsmodels.nonparametric.kde import KDEUnivariate
     dens = KDEUnivariate(u)
     dens.fit(kernel='gau', bw='silverman', weights=weights, fft=False)
 
@@ -273,6 +1115,9 @@ def _aggregate_coefs_and_ses(all_coefs, all_ses, var_scaling_factors):
 
 def _var_est(psi, psi_deriv, smpls, is_cluster_data,
              cluster_vars=None, smpls_cluster=None, n_folds_per_cluster=None):
+    # accumulate in double precision also for scores stored in single precision
+    psi = np.asarray(psi, dtype=np.float64)
+    psi_deriv = np.asarray(psi_deriv, dtype=np.float64)
 
     if not is_cluster_data:
         # psi and psi_deriv should be of shape (n_obs, ...)
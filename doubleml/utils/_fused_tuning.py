@@ -0,0 +1,101 @@
+from sklearn.base import BaseEstimator, clone
+
+
+def _is_early_stopping_learner(learner):
+    # learners which hold out a validation fraction of the training data to stop the iterations (e.g. boosting)
+    params = learner.get_params(deep=False)
+    return ('validation_fraction' in params) & ('n_iter_no_change' in params)
+
+
+class _EarlyStoppingLearner(BaseEstimator):
+    # fits the learner with early stopping on an inner validation split of the training data; with refit=True the
+    # learner is refitted on all training data with the found number of iterations
+    def __init__(self, estimator, refit=False):
+        self.estimator = estimator
+        self.refit = refit
+
+    @property
+    def _estimator_type(self):
+        return getattr(self.estimator, '_estimator_type', None)
+
+    @staticmethod
+    def _iteration_params(learner):
+        # gradient boosting counts the boosting stages, all other learners (e.g. histogram-based boosting) the iterations
+        if hasattr(learner, 'n_estimators_'):
+            return {'n_estimators': learner.n_estimators_, 'n_iter_no_change': None}
+        return {'max_iter': learner.n_iter_, 'early_stopping': False}
+
+    def fit(self, x, y):
+        params = self.estimator.get_params(deep=False)
+        if 'early_stopping' in params:
+            early_stopping_params = {'early_stopping': True}
+        else:
+            early_stopping_params = {'n_iter_no_change': 10} if params['n_iter_no_change'] is None else dict()
+        self.estimator_ = clone(self.estimator).set_params(**early_stopping_params).fit(x, y)
+        self.iteration_params_ = self._iteration_params(self.estimator_)
+        if self.refit:
+            self.estimator_ = clone(self.estimator).set_params(**self.iteration_params_).fit(x, y)
+        if hasattr(self.estimator_, 'classes_'):
+            self.classes_ = self.estimator_.classes_
+        return self
+
+    def predict(self, x):
+        return self.estimator_.predict(x)
+
+    def predict_proba(self, x):
+        return self.estimator_.predict_proba(x)
+
+
+class _StackedLearner:
+    # non-negative combination of the fitted candidate learners of a fold
+    def __init__(self, estimators, weights):
+        self.estimators = estimators
+        self.weights = weights
+
+    def predict(self, x):
+        return sum(weight * estimator.predict(x) for estimator, weight in zip(self.estimators, self.weights) if weight > 0)
+
+    def predict_proba(self, x):
+        return sum(weight * estimator.predict_proba(x)
+                   for estimator, weight in zip(self.estimators, self.weights) if weight > 0)
+
+
+class _FusedTuning:
+    # parameter grids (with the search settings of tune()), learner candidates per nuisance function (params_names) and
+    # early stopping settings of a fit; it is passed explicitly to the cross-fitting of the nuisance functions and the
+    # results of each nuisance function are recorded for the current repetition and treatment variable and collected
+    # afterwards
+    def __init__(self, param_grids=None, scoring_methods=None, n_folds_tune=5, search_mode='grid_search',
+                 n_iter_randomized_search=100, halving_params=None, early_stopping=False, candidates=None,
+                 selection_method='loss'):
+        self.param_grids = dict() if param_grids is None else param_grids
+        self.scoring_methods = dict() if scoring_methods is None else scoring_methods
+        self.n_folds_tune = n_folds_tune
+        self.search_mode = search_mode
+        self.n_iter_randomized_search = n_iter_randomized_search
+        self.halving_params = dict() if halving_params is None else halving_params
+        self.early_stopping = early_stopping
+        self.candidates = dict() if candidates is None else candidates
+        self.selection_method = selection_method
+        self.records = {'tuned_params': dict(), 'early_stopping_params': dict(), 'selection': dict()}
+        self.results = {'tuned_params': dict(), 'early_stopping_params': dict(), 'selection': dict()}
+
+    def tunes(self, learner_name):
+        return learner_name in self.param_grids
+
+    def selects(self, learner_name):
+        return learner_name in self.candidates
+
+    def stops_early(self, learner_name, learner):
+        # tuned learners are not early stopped
+        return (self.early_stopping is not False) and (not self.tunes(learner_name)) and \
+            (not self.selects(learner_name)) and _is_early_stopping_learner(learner)
+
+    def record(self, kind, learner_name, result):
+        self.records[kind][learner_name] = result
+
+    def collect(self, i_rep, d_col):
+        for kind, records in self.records.items():
+            for learner_name, result in records.items():
+                self.results[kind].setdefault(learner_name, dict()).setdefault(d_col, dict())[i_rep] = result
+        self.records = {kind: dict() for kind in self.records}
@@ -0,0 +1,118 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# state of the callbacks of the DoubleML model which is currently fitted, tuned or bootstrapped
+_active_instrumentation = ContextVar('doubleml_instrumentation', default=None)
+
+
+class _StageTimer:
+    def __init__(self, parent=None):
+        self._parent = parent
+        self._peak = 0
+        self._start_memory = None
+
+    def start(self):
+        self._wall_time = time.perf_counter()
+        self._cpu_time = time.process_time()
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            # the peak of the enclosing stage has to be saved before the peak is reset for this stage
+            if self._parent is not None:
+                self._parent.update_peak(peak)
+            tracemalloc.reset_peak()
+            self._start_memory = current
+            self._peak = current
+        return self
+
+    def update_peak(self, peak):
+        self._peak = max(self._peak, peak)
+
+    def stop(self):
+        stats = {'wall_time': time.perf_counter() - self._wall_time,
+                 'cpu_time': time.process_time() - self._cpu_time,
+                 'peak_memory': None}
+        if (self._start_memory is not None) and tracemalloc.is_tracing():
+            peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            if self._parent is not None:
+                self._parent.update_peak(peak)
+            stats['peak_memory'] = peak - self._start_memory
+        return stats
+
+
+class _InstrumentationState:
+    def __init__(self, callbacks):
+        self.callbacks = callbacks
+        self.info = {'rep': None, 'treatment': None, 'learner': None, 'fold': None}
+        self.timers = list()
+
+    @property
+    def trace_memory(self):
+        return any(callback.trace_memory for callback in self.callbacks)
+
+    def notify_start(self, event, info):
+        for callback in self.callbacks:
+            callback.on_start(event, info)
+
+    def notify_end(self, event, info, stats):
+        for callback in self.callbacks:
+            callback.on_end(event, info, stats)
+
+
+def _get_instrumentation():
+    return _active_instrumentation.get()
+
+
+@contextmanager
+def _instrumentation(callbacks):
+    # activate the callbacks; nested calls (e.g. fit of the models within DoubleMLAPOS) use the outer state
+    state = _active_instrumentation.get()
+    if (state is not None) or (not callbacks):
+        yield state
+        return
+
+    state = _InstrumentationState(callbacks)
+    start_tracing = state.trace_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    token = _active_instrumentation.set(state)
+    try:
+        yield state
+    finally:
+        _active_instrumentation.reset(token)
+        if start_tracing:
+            tracemalloc.stop()
+
+
+@contextmanager
+def _stage(event, **info):
+    state = _active_instrumentation.get()
+    if state is None:
+        yield
+        return
+
+    stage_info = {**state.info, **info}
+    state.notify_start(event, stage_info)
+    timer = _StageTimer(parent=state.timers[-1] if state.timers else None).start()
+    state.timers.append(timer)
+    try:
+        yield
+    finally:
+        state.timers.pop()
+    state.notify_end(event, stage_info, timer.stop())
+
+
+def _timed_call(fun, args, trace_memory=False):
+    # measure a call in a (parallel) worker process, where the state of the callbacks is not available
+    start_tracing = trace_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    try:
+        timer = _StageTimer().start()
+        res = fun(*args)
+        stats = timer.stop()
+    finally:
+        if start_tracing:
+            tracemalloc.stop()
+    return res, stats
@@ -0,0 +1,23 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# nuisance store of the DoubleML model which is currently fitted
+_active_nuisance_store = ContextVar('doubleml_nuisance_store', default=None)
+
+
+def _get_nuisance_store():
+    return _active_nuisance_store.get()
+
+
+@contextmanager
+def _nuisance_store(store):
+    # activate the store; models without a store (e.g. nested fits) use the store of the outer fit
+    if store is None:
+        yield _active_nuisance_store.get()
+        return
+
+    token = _active_nuisance_store.set(store)
+    try:
+        yield store
+    finally:
+        _active_nuisance_store.reset(token)
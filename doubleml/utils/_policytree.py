@@ -0,0 +1,187 @@
+import numpy as np
+
+# maximal number of cells of the two-dimensional reward histograms which are evaluated at once
+_POLICY_TREE_CHUNK_SIZE = 2 ** 22
+
+
+def _split_points(x, n_bins=None):
+    # thresholds of the candidate splits (x <= threshold) and the bin index of each observation, such that
+    # x <= thresholds[b] is equivalent to bins <= b; without n_bins all midpoints of distinct values are candidates
+    if n_bins is None:
+        values, bins = np.unique(x, return_inverse=True)
+        thresholds = (values[:-1] + values[1:]) / 2
+    else:
+        thresholds = np.unique(np.quantile(x, np.linspace(0, 1, n_bins + 1)[1:-1]))
+        # the maximum is not a valid split point
+        thresholds = thresholds[thresholds < np.max(x)]
+        bins = np.searchsorted(thresholds, x, side='left')
+    return thresholds, bins.reshape(-1)
+
+
+def _leaf(reward_sum):
+    # the treatment is assigned if the sum of the orthogonal signal (the reward of the treatment) is positive
+    return max(reward_sum, 0.0), {'action': int(reward_sum > 0)}
+
+
+def _split_values(prefix_rewards, total_rewards):
+    # policy value of the best depth-one tree for each split (treatment is assigned to the leaves with positive rewards)
+    return np.maximum(prefix_rewards, 0.0) + np.maximum(total_rewards - prefix_rewards, 0.0)
+
+
+class _ExactPolicyTree:
+    # exhaustive search of the optimal policy tree of a given depth, which maximizes the sum of the orthogonal signal of
+    # the treated observations; the features are sorted (or binned) once and each split search uses cumulative sums
+    def __init__(self, depth=2, min_samples_leaf=8, n_bins=None):
+        self.depth = depth
+        self.min_samples_leaf = min_samples_leaf
+        self.n_bins = n_bins
+
+    def fit(self, x, signal):
+        x = np.asarray(x, dtype=np.float64)
+        self._signal = np.asarray(signal, dtype=np.float64)
+        split_points = [_split_points(x[:, j], self.n_bins) for j in range(x.shape[1])]
+        self._thresholds = [thresholds for thresholds, _ in split_points]
+        self._bins = [bins for _, bins in split_points]
+        self.value_, self.tree_ = self._search(np.arange(x.shape[0]), self.depth)
+        del self._signal, self._bins
+        return self
+
+    def _search(self, idx, depth):
+        if depth == 0:
+            return _leaf(np.sum(self._signal[idx]))
+        if depth == 1:
+            return self._search_depth_one(idx)
+        if depth == 2:
+            return self._search_depth_two(idx)
+
+        best_value, best_node = self._search(idx, depth - 1)
+        m = self.min_samples_leaf
+        for j, bins in enumerate(self._bins):
+            idx_bins = bins[idx]
+            n_left = np.cumsum(np.bincount(idx_bins, minlength=len(self._thresholds[j]) + 1))[:-1]
+            for b in np.flatnonzero((n_left >= m) & (idx.shape[0] - n_left >= m)):
+                is_left = idx_bins <= b
+                left_value, left_node = self._search(idx[is_left], depth - 1)
+                right_value, right_node = self._search(idx[~is_left], depth - 1)
+                if left_value + right_value > best_value:
+                    best_value = left_value + right_value
+                    best_node = self._node(j, b, left_node, right_node)
+        return best_value, best_node
+
+    def _node(self, feature, split, left, right):
+        return {'feature': feature, 'threshold': self._thresholds[feature][split], 'left': left, 'right': right}
+
+    def _search_depth_one(self, idx):
+        signal = self._signal[idx]
+        total = np.sum(signal)
+        best_value, best_node = _leaf(total)
+        m = self.min_samples_leaf
+        for j, bins in enumerate(self._bins):
+            n_splits = len(self._thresholds[j])
+            idx_bins = bins[idx]
+            prefix_rewards = np.cumsum(np.bincount(idx_bins, weights=signal, minlength=n_splits + 1))[:-1]
+            n_left = np.cumsum(np.bincount(idx_bins, minlength=n_splits + 1))[:-1]
+            values = np.where((n_left >= m) & (idx.shape[0] - n_left >= m), _split_values(prefix_rewards, total), -np.inf)
+            if values.shape[0] > 0:
+                b = np.argmax(values)
+                if values[b] > best_value:
+                    best_value = values[b]
+                    best_node = self._node(j, b, _leaf(prefix_rewards[b])[1], _leaf(total - prefix_rewards[b])[1])
+        return best_value, best_node
+
+    def _search_depth_two(self, idx):
+        # for each split of the first feature, the best depth-one trees of both children are found from the
+        # two-dimensional histograms of the rewards over the bins of the first and the second feature
+        signal = self._signal[idx]
+        total = np.sum(signal)
+        n_obs = idx.shape[0]
+        best_value, best_node = self._search_depth_one(idx)
+        m = self.min_samples_leaf
+        for j, bins in enumerate(self._bins):
+            n_splits = len(self._thresholds[j])
+            idx_bins = bins[idx]
+            left_totals = np.cumsum(np.bincount(idx_bins, weights=signal, minlength=n_splits + 1))[:-1]
+            n_left = np.cumsum(np.bincount(idx_bins, minlength=n_splits + 1))[:-1]
+            valid = (n_left >= m) & (n_obs - n_left >= m)
+            if not np.any(valid):
+                continue
+
+            # best children (-1 indicates a leaf)
+            children = {'left': [np.maximum(left_totals, 0.0), np.full(n_splits, -1), np.zeros(n_splits, dtype=int)],
+                        'right': [np.maximum(total - left_totals, 0.0), np.full(n_splits, -1),
+                                  np.zeros(n_splits, dtype=int)]}
+            # observations sorted by the bins of the first feature such that each chunk of splits is a slice
+            order = np.argsort(idx_bins, kind='stable')
+            bins_ordered = idx_bins[order]
+            signal_ordered = signal[order]
+            bin_starts = np.searchsorted(bins_ordered, np.arange(n_splits + 2))
+            for j2, bins2 in enumerate(self._bins):
+                n_bins2 = len(self._thresholds[j2]) + 1
+                if n_bins2 == 1:
+                    continue
+                bins2_ordered = bins2[idx][order]
+                column_rewards = np.bincount(bins2_ordered, weights=signal_ordered, minlength=n_bins2)
+                column_counts = np.bincount(bins2_ordered, minlength=n_bins2)
+                carry_rewards = np.zeros(n_bins2)
+                carry_counts = np.zeros(n_bins2)
+                chunk_size = max(_POLICY_TREE_CHUNK_SIZE // n_bins2, 1)
+                for start in range(0, n_splits, chunk_size):
+                    stop = min(start + chunk_size, n_splits)
+                    rows = slice(bin_starts[start], bin_starts[stop])
+                    cells = (bins_ordered[rows] - start) * n_bins2 + bins2_ordered[rows]
+                    # reward and count histograms of the left children for the splits start, ..., stop - 1
+                    rewards = np.bincount(cells, weights=signal_ordered[rows],
+                                          minlength=(stop - start) * n_bins2).reshape(-1, n_bins2)
+                    counts = np.bincount(cells, minlength=(stop - start) * n_bins2).reshape(-1, n_bins2)
+                    rewards = np.cumsum(rewards, axis=0) + carry_rewards
+                    counts = np.cumsum(counts, axis=0) + carry_counts
+                    carry_rewards, carry_counts = rewards[-1, :], counts[-1, :]
+
+                    for side in ['left', 'right']:
+                        if side == 'left':
+                            side_rewards, side_counts = rewards, counts
+                        else:
+                            side_rewards, side_counts = column_rewards - rewards, column_counts - counts
+                        prefix_rewards = np.cumsum(side_rewards, axis=1)[:, :-1]
+                        prefix_counts = np.cumsum(side_counts, axis=1)[:, :-1]
+                        side_totals = np.sum(side_rewards, axis=1, keepdims=True)
+                        side_n = np.sum(side_counts, axis=1, keepdims=True)
+                        values = np.where((prefix_counts >= m) & (side_n - prefix_counts >= m),
+                                          _split_values(prefix_rewards, side_totals), -np.inf)
+                        b2 = np.argmax(values, axis=1)
+                        b2_values = values[np.arange(stop - start), b2]
+                        side_best = children[side]
+                        improved = b2_values > side_best[0][start:stop]
+                        side_best[0][start:stop][improved] = b2_values[improved]
+                        side_best[1][start:stop][improved] = j2
+                        side_best[2][start:stop][improved] = b2[improved]
+
+            values = np.where(valid, children['left'][0] + children['right'][0], -np.inf)
+            b = np.argmax(values)
+            if values[b] > best_value:
+                best_value = values[b]
+                is_left = idx_bins <= b
+                best_node = self._node(j, b, self._child(idx[is_left], children['left'], b),
+                                       self._child(idx[~is_left], children['right'], b))
+        return best_value, best_node
+
+    def _child(self, idx, best_children, split):
+        total = np.sum(self._signal[idx])
+        j2, b2 = best_children[1][split], best_children[2][split]
+        if j2 == -1:
+            return _leaf(total)[1]
+        left_rewards = np.sum(self._signal[idx][self._bins[j2][idx] <= b2])
+        return self._node(j2, b2, _leaf(left_rewards)[1], _leaf(total - left_rewards)[1])
+
+    def predict(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        predictions = np.zeros(x.shape[0], dtype=int)
+        nodes = [(self.tree_, np.arange(x.shape[0]))]
+        while nodes:
+            node, idx = nodes.pop()
+            if 'action' in node:
+                predictions[idx] = node['action']
+            else:
+                is_left = x[idx, node['feature']] <= node['threshold']
+                nodes += [(node['left'], idx[is_left]), (node['right'], idx[~is_left])]
+        return predictions
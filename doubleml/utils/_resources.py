@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sklearn.base import clone
+from threadpoolctl import threadpool_limits
+
+# resource manager providing the core budget of the current (model-, fold- or learner-level) task
+_active_resources = ContextVar('doubleml_resources', default=None)
+
+
+def _get_resources():
+    return _active_resources.get()
+
+
+@contextmanager
+def _resources(manager):
+    # activate the core budget of a task; tasks without a budget (e.g. sequential nested fits) use the outer one
+    if manager is None:
+        yield _active_resources.get()
+        return
+
+    token = _active_resources.set(manager)
+    try:
+        yield manager
+    finally:
+        _active_resources.reset(token)
+
+
+def _split_resources(n_tasks, n_jobs):
+    # without an active resource manager the number of jobs is used as passed
+    manager = _active_resources.get()
+    if manager is None:
+        return n_jobs, None
+    return manager.split(n_tasks, n_jobs)
+
+
+@contextmanager
+def _limit_threads(manager):
+    # restrict the BLAS / OpenMP threads of the current process to the core budget and activate the budget
+    if manager is None:
+        yield
+        return
+
+    with threadpool_limits(limits=manager.n_cores), _resources(manager):
+        yield
+
+
+def _cap_n_jobs(estimator):
+    # learners with their own parallelism use at most the core budget of the current task
+    manager = _active_resources.get()
+    if (manager is None) or ('n_jobs' not in estimator.get_params(deep=False)):
+        return estimator
+    n_jobs = estimator.get_params(deep=False)['n_jobs']
+    if (n_jobs is None) or (0 < n_jobs <= manager.n_cores):
+        return estimator
+    return clone(estimator).set_params(n_jobs=manager.n_cores)
+
+
+def _call_with_thread_limit(fun, n_threads, *args):
+    # executed in the worker processes such that the limits apply to the fitted learners
+    with threadpool_limits(limits=n_threads):
+        return fun(*args)
@@ -0,0 +1,23 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# tuning cache of the DoubleML model which is currently tuned
+_active_tuning_cache = ContextVar('doubleml_tuning_cache', default=None)
+
+
+def _get_tuning_cache():
+    return _active_tuning_cache.get()
+
+
+@contextmanager
+def _tuning_cache(cache):
+    # activate the cache; models without a cache (e.g. nested tuning) use the cache of the outer tuning
+    if cache is None:
+        yield _active_tuning_cache.get()
+        return
+
+    token = _active_tuning_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_tuning_cache.reset(token)
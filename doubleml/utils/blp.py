@@ -1,4 +1,3 @@
-import statsmodels.api as sm
 import numpy as np
 import pandas as pd
 import warnings
@@ -6,6 +5,8 @@ import warnings
 from scipy.stats import norm
 from scipy.linalg import sqrtm
 
+from ._blp import _fit_ols, _omega_root, _chunks, _group_codes
+
 
 class DoubleMLBLP:
     """Best linear predictor (BLP) for DoubleML with orthogonal signals.
@@ -14,8 +15,10 @@ class DoubleMLBLP:
     Parameters
     ----------
     orth_signal : :class:`numpy.array`
-        The orthogonal signal to be predicted. Has to be of shape ``(n_obs,)``,
-        where ``n_obs`` is the number of observations.
+        The orthogonal signal to be predicted. Has to be of shape ``(n_obs,)`` or ``(n_obs, n_rep)``,
+        where ``n_obs`` is the number of observations and ``n_rep`` the number of repetitions of the cross-fitting.
+        For several repetitions, the best linear predictor is estimated for all signals with the ``'numpy'`` backend
+        (see :meth:`fit`) and the coefficients and covariances are aggregated with the median.
 
     basis : :class:`pandas.DataFrame`
         The basis for estimating the best linear predictor. Has to have the shape ``(n_obs, d)``,
@@ -24,19 +27,28 @@ class DoubleMLBLP:
     is_gate : bool
         Indicates whether the basis is constructed for GATEs (dummy-basis).
         Default is ``False``.
+
+    basis_weights : None or :class:`numpy.array`
+        Weights of the observations which multiply the basis in the regression of the orthogonal signal, i.e., the
+        signal of each repetition is regressed on ``basis_weights[:, i_rep] * basis`` (e.g. the partialled out
+        treatment for the PLR). Has to have the same shape as ``orth_signal``. The coefficients still refer to the
+        (unweighted) ``basis``, such that :meth:`confint` is evaluated for the unweighted basis. For GATEs, the
+        weighted basis is no dummy basis, such that the group effects are not computed as group means.
+        Default is ``None``.
     """
 
     def __init__(self,
                  orth_signal,
                  basis,
-                 is_gate=False):
+                 is_gate=False,
+                 basis_weights=None):
 
         if not isinstance(orth_signal, np.ndarray):
             raise TypeError('The signal must be of np.ndarray type. '
                             f'Signal of type {str(type(orth_signal))} was passed.')
 
-        if orth_signal.ndim != 1:
-            raise ValueError('The signal must be of one dimensional. '
+        if orth_signal.ndim not in [1, 2]:
+            raise ValueError('The signal must be of one or two dimensional. '
                              f'Signal of dimensions {str(orth_signal.ndim)} was passed.')
 
         if not isinstance(basis, pd.DataFrame):
@@ -47,13 +59,24 @@ class DoubleMLBLP:
             raise ValueError('Invalid pd.DataFrame: '
                              'Contains duplicate column names.')
 
+        if basis_weights is not None:
+            if not isinstance(basis_weights, np.ndarray):
+                raise TypeError('The basis weights must be of np.ndarray type. '
+                                f'Basis weights of type {str(type(basis_weights))} were passed.')
+            if basis_weights.shape != orth_signal.shape:
+                raise ValueError('The basis weights must have the same shape as the signal '
+                                 f'{str(orth_signal.shape)}. Basis weights of shape {str(basis_weights.shape)} were '
+                                 'passed.')
+
         self._orth_signal = orth_signal
         self._basis = basis
         self._is_gate = is_gate
+        self._basis_weights = basis_weights
 
         # initialize the score and the covariance
         self._blp_model = None
         self._blp_omega = None
+        self._backend = None
 
     def __str__(self):
         class_name = self.__class__.__name__
@@ -84,6 +107,13 @@ class DoubleMLBLP:
         """
         return self._basis
 
+    @property
+    def basis_weights(self):
+        """
+        Weights of the basis.
+        """
+        return self._basis_weights
+
     @property
     def blp_omega(self):
         """
@@ -110,7 +140,7 @@ class DoubleMLBLP:
                                       columns=col_names)
         return df_summary
 
-    def fit(self, cov_type='HC0', **kwargs):
+    def fit(self, cov_type='HC0', backend=None, **kwargs):
         """
         Estimate DoubleMLBLP models.
 
@@ -118,19 +148,74 @@ class DoubleMLBLP:
         ----------
         cov_type : str
             The covariance type to be used in the estimation. Default is ``'HC0'``.
-            See :meth:`statsmodels.regression.linear_model.OLS.fit` for more information.
+            See :meth:`statsmodels.regression.linear_model.OLS.fit` for more information. For the ``'numpy'``
+            backend only ``'nonrobust'``, ``'HC0'``, ``'HC1'``, ``'HC2'`` and ``'HC3'`` are supported.
+
+        backend : None or str
+            A str (``'statsmodels'`` or ``'numpy'``) specifying how the best linear predictor is estimated. For
+            ``'numpy'`` the coefficients are computed via a QR decomposition of the basis (with the pseudo-inverse
+            for rank deficient bases as in statsmodels) and the covariance (``cov_type`` ``'nonrobust'``, ``'HC0'``,
+            ``'HC1'``, ``'HC2'`` or ``'HC3'``) is accumulated in chunks of rows, which avoids the overhead of
+            statsmodels for large bases. Joint confidence intervals are then based
+            on the Cholesky factor of the covariance. The ``summary`` is the same for both backends.
+            Orthogonal signals of several repetitions (two-dimensional ``orth_signal``) are only supported by the
+            ``'numpy'`` backend. For GATEs of mutually exclusive groups, the ``'numpy'`` backend computes the group
+            means and their (diagonal) covariance from the group codes, such that the dummy basis can be sparse (as
+            constructed by ``gate()``). ``None`` means ``'numpy'`` for several orthogonal signals and
+            ``'statsmodels'`` otherwise.
+            Default is ``None``.
 
         **kwargs: dict
-            Additional keyword arguments to be passed to :meth:`statsmodels.regression.linear_model.OLS.fit`.
+            Additional keyword arguments to be passed to :meth:`statsmodels.regression.linear_model.OLS.fit`. For the
+            ``'numpy'`` backend only ``use_t`` is supported.
 
         Returns
         -------
         self : object
         """
+        several_signals = self._orth_signal.ndim == 2
+        if backend is None:
+            backend = 'numpy' if several_signals else 'statsmodels'
+        if (not isinstance(backend, str)) | (backend not in ['statsmodels', 'numpy']):
+            raise ValueError('backend must be None, "statsmodels" or "numpy". '
+                             f'Got {str(backend)}.')
+        if several_signals and backend == 'statsmodels':
+            raise ValueError('The statsmodels backend does not support orthogonal signals of several repetitions. '
+                             'Use backend "numpy" (or None).')
+
+        if backend == 'numpy':
+            setting = 'for orthogonal signals of several repetitions' if several_signals else 'for the numpy backend'
+            valid_cov_types = ['nonrobust', 'HC0', 'HC1', 'HC2', 'HC3']
+            if cov_type not in valid_cov_types:
+                raise ValueError(f'cov_type must be "nonrobust", "HC0", "HC1", "HC2" or "HC3" {setting}. '
+                                 f'Got {str(cov_type)}.')
+            if not all(key == 'use_t' for key in kwargs):
+                raise ValueError(f'Only use_t is supported as additional keyword argument {setting}. '
+                                 f'Got {", ".join(kwargs.keys())}.')
+            # GATEs of mutually exclusive groups are estimated as group means without the dummy matrix
+            codes = _group_codes(self._basis) if self._is_gate and self._basis_weights is None else None
+            if codes is not None:
+                self._blp_model = _fit_ols(self._orth_signal.astype(np.float64), None, names=self._basis.columns,
+                                           cov_type=cov_type, codes=codes, **kwargs)
+            else:
+                np_basis = self._basis.to_numpy(dtype=np.float64)
+                if self._basis_weights is not None:
+                    basis_weights = self._basis_weights.reshape(np_basis.shape[0], -1).astype(np.float64)
+                    np_basis = np_basis[np.newaxis, :, :] * basis_weights.T[:, :, np.newaxis]
+                    if not several_signals:
+                        np_basis = np_basis[0]
+                self._blp_model = _fit_ols(self._orth_signal.astype(np.float64), np_basis,
+                                           names=self._basis.columns, cov_type=cov_type, **kwargs)
+        else:
+            import statsmodels.api as sm
 
-        # fit the best-linear-predictor of the orthogonal signal with respect to the grid
-        self._blp_model = sm.OLS(self._orth_signal, self._basis).fit(cov_type=cov_type, **kwargs)
+            basis = self._basis
+            if self._basis_weights is not None:
+                basis = basis.mul(self._basis_weights, axis=0)
+            # fit the best-linear-predictor of the orthogonal signal with respect to the grid
+            self._blp_model = sm.OLS(self._orth_signal, basis).fit(cov_type=cov_type, **kwargs)
         self._blp_omega = self._blp_model.cov_params().to_numpy()
+        self._backend = backend
 
         return self
 
@@ -189,8 +274,8 @@ class DoubleMLBLP:
         # define basis if none is supplied
         if basis is None:
             if self._is_gate:
-                # reduce to unique groups
-                basis = pd.DataFrame(np.diag(v=np.full((self._basis.shape[1]), True)))
+                # reduce to unique groups (the basis of the groups is the identity matrix, which is not constructed)
+                basis = pd.DataFrame(index=pd.RangeIndex(self._basis.shape[1]))
                 gate_names = list(self._basis.columns.values)
             else:
                 if joint:
@@ -212,20 +297,32 @@ class DoubleMLBLP:
         elif not list(basis.columns.values) == list(self._basis.columns.values):
             raise ValueError('Invalid basis: DataFrame has to have the exact same number and ordering of columns.')
 
-        # blp of the orthogonal signal
-        g_hat = self._blp_model.predict(basis)
-
-        np_basis = basis.to_numpy()
-        # calculate se for basis elements
-        blp_se = np.sqrt((np.dot(np_basis, self._blp_omega) * np_basis).sum(axis=1))
+        # the blp of the orthogonal signal and the se for the basis elements are evaluated in chunks of grid points
+        n_points = basis.shape[0]
+        g_hat = np.full(n_points, np.nan)
+        blp_se = np.full(n_points, np.nan)
+        if joint:
+            normal_samples = np.random.normal(size=[self._basis.shape[1], n_rep_boot])
+            omega_root = sqrtm(self._blp_omega) if self._backend == 'statsmodels' else _omega_root(self._blp_omega)
+            root_samples = np.dot(omega_root, normal_samples)
+            max_abs_t = np.full(n_points, np.nan)
+        if gate_names is not None:
+            g_hat = self._blp_model.params.to_numpy()
+            blp_se = np.sqrt(np.diagonal(self._blp_omega))
+            if joint:
+                max_abs_t = np.max(np.abs(np.multiply(root_samples.T, (1.0 / blp_se))), axis=0)
+        else:
+            np_basis = basis.to_numpy()
+            for chunk in _chunks(n_points):
+                g_hat[chunk] = self._blp_model.predict(np_basis[chunk, :])
+                blp_se[chunk] = np.sqrt((np.dot(np_basis[chunk, :], self._blp_omega) * np_basis[chunk, :]).sum(axis=1))
+                if joint:
+                    bootstrap_samples = np.multiply(np.dot(np_basis[chunk, :], root_samples).T, (1.0 / blp_se[chunk]))
+                    max_abs_t[chunk] = np.max(np.abs(bootstrap_samples), axis=0)
 
         if joint:
             # calculate the maximum t-statistic with bootstrap
-            normal_samples = np.random.normal(size=[basis.shape[1], n_rep_boot])
-            bootstrap_samples = np.multiply(np.dot(np_basis, np.dot(sqrtm(self._blp_omega), normal_samples)).T,
-                                            (1.0 / blp_se))
-
-            max_t_stat = np.quantile(np.max(np.abs(bootstrap_samples), axis=0), q=level)
+            max_t_stat = np.quantile(max_abs_t, q=level)
 
             # Lower simultaneous CI
             g_hat_lower = g_hat - max_t_stat * blp_se
@@ -0,0 +1,121 @@
+import pandas as pd
+
+
+class DoubleMLCallback:
+    """Base class for instrumentation callbacks of DoubleML models.
+
+    Callbacks are registered via ``set_callbacks()`` of a DoubleML model and are notified at the start and the end of
+    the stages of ``fit()``, ``tune()`` and ``bootstrap()``. The following events are emitted:
+
+    - ``'fit_fold'``: fit of a nuisance learner on a training fold,
+    - ``'predict_fold'``: prediction of a nuisance learner on a test fold,
+    - ``'nuisance'``: complete cross-fitting of a nuisance learner,
+    - ``'score'``: solving the score for the causal parameter,
+    - ``'var_est'``: variance estimation,
+    - ``'framework'``: construction of the :class:`doubleml.DoubleMLFramework`,
+    - ``'bootstrap'``: multiplier bootstrap,
+    - ``'tune'`` and ``'tune_fold'``: hyperparameter tuning (overall and per training fold).
+
+    Subclasses overwrite ``on_start()`` and / or ``on_end()``.
+
+    Parameters
+    ----------
+    trace_memory : bool
+        Indicates whether the peak memory of the stages should be measured with :mod:`tracemalloc`. Tracing memory
+        allocations slows down the estimation.
+        Default is ``False``.
+    """
+
+    def __init__(self, trace_memory=False):
+        if not isinstance(trace_memory, bool):
+            raise TypeError('trace_memory must be True or False. '
+                            f'Got {str(trace_memory)}.')
+        self._trace_memory = trace_memory
+
+    @property
+    def trace_memory(self):
+        """
+        Indicates whether the peak memory of the stages is measured.
+        """
+        return self._trace_memory
+
+    def on_start(self, event, info):
+        """
+        Called at the start of a stage.
+
+        Parameters
+        ----------
+        event : str
+            The name of the stage.
+
+        info : dict
+            The context of the stage with keys ``'rep'``, ``'treatment'``, ``'learner'`` and ``'fold'``
+            (``None`` if not applicable).
+        """
+        pass
+
+    def on_end(self, event, info, stats):
+        """
+        Called at the end of a stage.
+
+        Parameters
+        ----------
+        event : str
+            The name of the stage.
+
+        info : dict
+            The context of the stage with keys ``'rep'``, ``'treatment'``, ``'learner'`` and ``'fold'``
+            (``None`` if not applicable).
+
+        stats : dict
+            The measurements of the stage with keys ``'wall_time'`` and ``'cpu_time'`` (in seconds) and
+            ``'peak_memory'`` (in bytes, ``None`` if memory is not traced).
+        """
+        pass
+
+
+class DoubleMLRecorder(DoubleMLCallback):
+    """Instrumentation callback recording wall time, CPU time and peak memory of all stages.
+
+    Note that fits in parallel worker processes (``n_jobs_cv > 1``) are measured in the workers, i.e., their CPU time
+    is not part of the CPU time of the enclosing stages.
+
+    Parameters
+    ----------
+    trace_memory : bool
+        Indicates whether the peak memory of the stages should be measured with :mod:`tracemalloc`.
+        Default is ``True``.
+
+    Examples
+    --------
+    >>> import doubleml as dml
+    >>> from doubleml.datasets import make_plr_CCDDHNR2018
+    >>> from doubleml.utils import DoubleMLRecorder
+    >>> from sklearn.linear_model import LassoCV
+    >>> obj_dml_data = make_plr_CCDDHNR2018(n_obs=200)
+    >>> dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, LassoCV(), LassoCV())
+    >>> dml_plr_obj = dml_plr_obj.set_callbacks([DoubleMLRecorder()]).fit()
+    >>> df_records = dml_plr_obj.instrumentation
+    """
+
+    def __init__(self, trace_memory=True):
+        super().__init__(trace_memory=trace_memory)
+        self._records = list()
+
+    @property
+    def records(self):
+        """
+        A :class:`pandas.DataFrame` with one row per recorded stage.
+        """
+        columns = ['event', 'rep', 'treatment', 'learner', 'fold', 'wall_time', 'cpu_time', 'peak_memory']
+        return pd.DataFrame(self._records, columns=columns)
+
+    def reset(self):
+        """
+        Delete all records.
+        """
+        self._records = list()
+        return self
+
+    def on_end(self, event, info, stats):
+        self._records.append({'event': event, **info, **stats})
@@ -0,0 +1,212 @@
+import os
+import shutil
+import tempfile
+import uuid
+import warnings
+import weakref
+from collections import OrderedDict
+
+import joblib
+
+
+class DoubleMLModelStore:
+    """Disk-backed storage of fitted nuisance models.
+
+    If passed as ``store_models`` to ``fit()`` of a DoubleML model, each fitted nuisance model is serialized with
+    :func:`joblib.dump` to ``path`` as soon as the nuisance estimation for a repetition and treatment variable is
+    completed. ``models`` then contains :class:`DoubleMLModelHandle` objects which load the models on access. The most
+    recently used models are kept in memory.
+
+    Copies of the store (e.g. of pickled DoubleML models) share the files of ``path``. Only a store with an explicit
+    ``path`` keeps the models beyond the process which created it: the temporary directory of a store without ``path``
+    is removed as soon as the original store is garbage collected (at the latest when the process exits), such that
+    the handles of an unpickled copy cannot be loaded anymore.
+
+    Parameters
+    ----------
+    path : None or str
+        The directory where the models are stored. If ``None`` a temporary directory is created which is removed if the
+        store is garbage collected. To reload pickled models in another session an explicit ``path`` is required.
+        Default is ``None``.
+
+    cache_size : int
+        The number of loaded models which are kept in memory (least recently used models are evicted first).
+        Default is ``8``.
+
+    mmap_mode : None or str
+        Passed to :func:`joblib.load`. With ``'r'`` the numpy arrays of the models (e.g. the nodes of trees) are
+        memory-mapped instead of being loaded into memory.
+        Default is ``'r'``.
+
+    Examples
+    --------
+    >>> import doubleml as dml
+    >>> from doubleml.datasets import make_plr_CCDDHNR2018
+    >>> from doubleml.utils import DoubleMLModelStore
+    >>> from sklearn.ensemble import RandomForestRegressor
+    >>> obj_dml_data = make_plr_CCDDHNR2018(n_obs=200)
+    >>> ml = RandomForestRegressor(n_estimators=20, max_depth=3)
+    >>> dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, ml, ml)
+    >>> dml_plr_obj = dml_plr_obj.fit(store_models=DoubleMLModelStore(cache_size=2))
+    >>> importances = dml_plr_obj.models['ml_l']['d'][0][0].feature_importances_
+    """
+
+    def __init__(self, path=None, cache_size=8, mmap_mode='r'):
+        if (path is not None) and (not isinstance(path, (str, os.PathLike))):
+            raise TypeError('path must be None or a str. '
+                            f'{str(path)} of type {str(type(path))} was passed.')
+        if (not isinstance(cache_size, int)) or isinstance(cache_size, bool):
+            raise TypeError('cache_size must be an integer. '
+                            f'{str(cache_size)} of type {str(type(cache_size))} was passed.')
+        if cache_size < 0:
+            raise ValueError('cache_size must be non-negative. '
+                             f'{str(cache_size)} was passed.')
+        if mmap_mode not in [None, 'r', 'r+', 'c']:
+            raise ValueError('mmap_mode must be None, "r", "r+" or "c". '
+                             f'Got {str(mmap_mode)}.')
+
+        self._temporary = path is None
+        if path is None:
+            self._path = tempfile.mkdtemp(prefix='doubleml_models_')
+            # remove the temporary directory with the store (copies in parallel workers do not own the directory)
+            self._finalizer = weakref.finalize(self, shutil.rmtree, self._path, ignore_errors=True)
+        else:
+            self._path = os.fspath(path)
+            os.makedirs(self._path, exist_ok=True)
+            self._finalizer = None
+        self._cache_size = cache_size
+        self._mmap_mode = mmap_mode
+        self._cache = OrderedDict()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        state['_finalizer'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._temporary and (not os.path.isdir(self._path)):
+            warnings.warn(f'The temporary directory {self._path} of the DoubleMLModelStore was removed with the '
+                          'original store. The stored models cannot be loaded; use a DoubleMLModelStore with an explicit '
+                          'path to keep the models beyond the process.')
+
+    @property
+    def path(self):
+        """
+        The directory where the models are stored.
+        """
+        return self._path
+
+    @property
+    def cache_size(self):
+        """
+        The number of loaded models which are kept in memory.
+        """
+        return self._cache_size
+
+    @property
+    def cached_keys(self):
+        """
+        The keys of the models which are currently kept in memory (from least to most recently used).
+        """
+        return list(self._cache.keys())
+
+    def save(self, model):
+        """
+        Serialize a model to the store.
+
+        Parameters
+        ----------
+        model : estimator
+            The fitted model.
+
+        Returns
+        -------
+        handle : :class:`DoubleMLModelHandle`
+            A handle which loads the model on access.
+        """
+        # unique keys allow to share the store between models fitted in parallel processes
+        key = uuid.uuid4().hex
+        joblib.dump(model, self._file(key))
+        return DoubleMLModelHandle(self, key)
+
+    def load(self, key):
+        """
+        Load a model from the store.
+
+        Parameters
+        ----------
+        key : str
+            The key of the model.
+
+        Returns
+        -------
+        model : estimator
+            The fitted model.
+        """
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        if self._temporary and (not os.path.isfile(self._file(key))):
+            raise FileNotFoundError(f'The model {key} is not available in the temporary directory {self._path}. The '
+                                    'temporary directory of a DoubleMLModelStore is removed with the original store; '
+                                    'use an explicit path to keep the models beyond the process.')
+        model = joblib.load(self._file(key), mmap_mode=self._mmap_mode)
+        if self._cache_size > 0:
+            self._cache[key] = model
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return model
+
+    def clear_cache(self):
+        """
+        Remove all loaded models from memory.
+        """
+        self._cache = OrderedDict()
+        return self
+
+    def _file(self, key):
+        return os.path.join(self._path, key + '.joblib')
+
+
+class DoubleMLModelHandle:
+    """Lazy handle of a fitted nuisance model in a :class:`DoubleMLModelStore`.
+
+    The model is loaded on access; attributes and methods (e.g. ``predict()`` or ``feature_importances_``) are
+    forwarded to the loaded model.
+
+    Parameters
+    ----------
+    store : :class:`DoubleMLModelStore`
+        The store of the model.
+
+    key : str
+        The key of the model.
+    """
+
+    def __init__(self, store, key):
+        self._store = store
+        self._key = key
+
+    @property
+    def key(self):
+        """
+        The key of the model.
+        """
+        return self._key
+
+    def load(self):
+        """
+        Load the fitted model.
+        """
+        return self._store.load(self._key)
+
+    def __getattr__(self, name):
+        # private attributes are not forwarded (e.g. to avoid recursions while unpickling)
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(key={self._key!r})'
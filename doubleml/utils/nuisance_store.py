@@ -0,0 +1,90 @@
+import numpy as np
+from joblib import hash as joblib_hash
+
+
+class DoubleMLNuisanceStore:
+    """Store of cross-fitted nuisance predictions which can be shared between DoubleML models.
+
+    The store is registered via ``set_nuisance_store()`` of one or several DoubleML models. Each cross-fitted nuisance
+    function is identified by its target, the conditioning subset and the sample splitting (i.e., the training and
+    test indices of all folds), the features, the learner (class and parameters, including fold-specific parameters),
+    the prediction method and whether duplicate covariate patterns are compressed (``compress_duplicates`` of the
+    data backend). Nuisance functions which are shared by several models, e.g., the propensity score of a
+    binary treatment in :class:`doubleml.DoubleMLPLR`, :class:`doubleml.DoubleMLIRM` and :class:`doubleml.DoubleMLAPO`
+    or the conditional outcome regressions of :class:`doubleml.DoubleMLIRM` and :class:`doubleml.DoubleMLAPO`, are
+    therefore only fitted once if the models use the same sample splitting.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import doubleml as dml
+    >>> from doubleml.datasets import make_irm_data
+    >>> from doubleml.utils import DoubleMLNuisanceStore
+    >>> from sklearn.linear_model import LinearRegression, LogisticRegression
+    >>> np.random.seed(3141)
+    >>> obj_dml_data = make_irm_data(n_obs=500)
+    >>> store = DoubleMLNuisanceStore()
+    >>> dml_irm_obj = dml.DoubleMLIRM(obj_dml_data, LinearRegression(), LogisticRegression())
+    >>> dml_irm_obj = dml_irm_obj.set_nuisance_store(store).fit()
+    >>> dml_apo_obj = dml.DoubleMLAPO(obj_dml_data, LinearRegression(), LogisticRegression(), treatment_level=1,
+    ...                               draw_sample_splitting=False)
+    >>> dml_apo_obj = dml_apo_obj.set_sample_splitting(dml_irm_obj.smpls).set_nuisance_store(store).fit()
+    >>> store.n_fits, store.n_hits
+    (3, 3)
+    """
+
+    def __init__(self):
+        self._entries = dict()
+        self._n_fits = 0
+        self._n_hits = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def n_fits(self):
+        """
+        The number of cross-fitted nuisance functions which have been added to the store.
+        """
+        return self._n_fits
+
+    @property
+    def n_hits(self):
+        """
+        The number of nuisance functions which have been served from the store.
+        """
+        return self._n_hits
+
+    def clear(self):
+        """
+        Remove all stored nuisance predictions.
+        """
+        self._entries = dict()
+        return self
+
+    @staticmethod
+    def _key(estimator, x, y, smpls, est_params, method, cross_fit, x_groups=None):
+        # the target is compared as float such that e.g. boolean treatment indicators match binary treatments; the
+        # groups are determined by x, i.e., only the compression state is part of the key (e.g. compressed fits of
+        # bootstrap learners differ from fits on all observations)
+        return joblib_hash((type(estimator).__module__, type(estimator).__name__, estimator.get_params(deep=True),
+                            est_params, method, cross_fit, x_groups is not None, x, np.asarray(y, dtype=np.float64),
+                            [(train_index, test_index) for train_index, test_index in smpls]))
+
+    def _get(self, key, y, smpls, return_models):
+        entry = self._entries.get(key)
+        if (entry is None) or (return_models and entry['models'] is None):
+            return None
+        self._n_hits += 1
+        # the targets are recovered from the target of the requesting model
+        targets = np.full(len(y), np.nan)
+        for _, test_index in smpls:
+            targets[test_index] = y[test_index]
+        return {'preds': np.copy(entry['preds']),
+                'targets': targets,
+                'models': entry['models'] if return_models else None}
+
+    def _set(self, key, res):
+        self._n_fits += 1
+        self._entries[key] = {'preds': np.copy(res['preds']),
+                              'models': res['models']}
@@ -1,9 +1,11 @@
 import numpy as np
 import pandas as pd
 
-from sklearn.tree import DecisionTreeClassifier, plot_tree
+from sklearn.tree import DecisionTreeClassifier
 from sklearn.utils.validation import check_is_fitted
 
+from ._policytree import _ExactPolicyTree
+
 
 class DoubleMLPolicyTree:
     """Policy Tree fitting for DoubleML.
@@ -22,10 +24,24 @@ class DoubleMLPolicyTree:
     depth : int
         The depth of the policy tree that will be built. Default is ``2``.
 
+    method : str
+        A str (``'greedy'`` or ``'exact'``) specifying how the policy tree is learned. For ``'greedy'`` a weighted
+        :class:`sklearn.tree.DecisionTreeClassifier` is fitted on the sign of the orthogonal signal. For ``'exact'``
+        the tree (of depth ``1``, ``2`` or ``3``) which maximizes the sum of the orthogonal signal over the treated
+        observations is found by an exhaustive search over all splits, where each split search is based on cumulative
+        sums of the signal over the pre-sorted features.
+        Default is ``'greedy'``.
+
+    n_bins : None or int
+        The number of quantile bins of each feature whose edges are the candidate split points of the ``'exact'``
+        search. ``None`` means that all midpoints of distinct feature values are candidates, which is recommended for
+        small samples only (the depth-two search is quadratic in the number of distinct values).
+        Default is ``None``.
+
     **tree_params : dict
         Parameters that are forwarded to the :class:`sklearn.tree.DecisionTreeClassifier`.
         Note that by default we perform minimal pruning by setting the ``ccp_alpha = 0.01`` and
-        ``min_samples_leaf = 8``. This can be adjusted.
+        ``min_samples_leaf = 8``. This can be adjusted. For ``method='exact'`` only ``min_samples_leaf`` is supported.
 
     """
 
@@ -33,6 +49,8 @@ class DoubleMLPolicyTree:
                  orth_signal,
                  features,
                  depth=2,
+                 method='greedy',
+                 n_bins=None,
                  **tree_params):
 
         if not isinstance(orth_signal, np.ndarray):
@@ -51,17 +69,39 @@ class DoubleMLPolicyTree:
             raise ValueError('Invalid pd.DataFrame: '
                              'Contains duplicate column names.')
 
+        valid_methods = ['greedy', 'exact']
+        if (not isinstance(method, str)) | (method not in valid_methods):
+            raise ValueError('method must be "greedy" or "exact". '
+                             f'Got {str(method)}.')
+
+        if n_bins is not None:
+            if method != 'exact':
+                raise ValueError('n_bins is only supported for method "exact".')
+            if (not isinstance(n_bins, int)) | (isinstance(n_bins, bool)) or n_bins < 2:
+                raise ValueError('n_bins must be None or an integer larger than 1. '
+                                 f'Got {str(n_bins)}.')
+
         self._orth_signal = orth_signal
         self._features = features
         self._depth = depth
+        self._method = method
         self._tree_params = tree_params
 
-        self._tree_params.setdefault("ccp_alpha", .01)
-        self._tree_params.setdefault("min_samples_leaf", 8)
-
         # initialize tree
-        self._policy_tree = DecisionTreeClassifier(max_depth=self._depth,
-                                                   **self._tree_params)
+        if method == 'exact':
+            if depth not in [1, 2, 3]:
+                raise ValueError('depth must be 1, 2 or 3 for method "exact". '
+                                 f'Got {str(depth)}.')
+            if not all(key == 'min_samples_leaf' for key in tree_params):
+                raise ValueError('Only min_samples_leaf is supported as tree parameter for method "exact". '
+                                 f'Got {", ".join(tree_params.keys())}.')
+            self._tree_params.setdefault("min_samples_leaf", 8)
+            self._policy_tree = _ExactPolicyTree(depth=self._depth, n_bins=n_bins, **self._tree_params)
+        else:
+            self._tree_params.setdefault("ccp_alpha", .01)
+            self._tree_params.setdefault("min_samples_leaf", 8)
+            self._policy_tree = DecisionTreeClassifier(max_depth=self._depth,
+                                                       **self._tree_params)
 
     def __str__(self):
         class_name = self.__class__.__name__
@@ -78,6 +118,13 @@ class DoubleMLPolicyTree:
         """
         return self._policy_tree
 
+    @property
+    def method(self):
+        """
+        Method to learn the policy tree (``'greedy'`` or ``'exact'``).
+        """
+        return self._method
+
     @property
     def orth_signal(self):
         """
@@ -108,6 +155,10 @@ class DoubleMLPolicyTree:
         -------
         self : object
         """
+        if self._method == 'exact':
+            self._policy_tree.fit(self._features.to_numpy(dtype=np.float64), self._orth_signal)
+            return self
+
         bin_signal = (np.sign(self._orth_signal) + 1) / 2
         abs_signal = np.abs(self._orth_signal)
 
@@ -126,7 +177,10 @@ class DoubleMLPolicyTree:
         -------
         self : object
         """
+        from sklearn.tree import plot_tree
         check_is_fitted(self._policy_tree, msg='Policy Tree not yet fitted. Call fit before plot_tree.')
+        if self._method == 'exact':
+            raise NotImplementedError('plot_tree not implemented for method "exact".')
 
         artists = plot_tree(self.policy_tree, feature_names=list(self._features.keys()), filled=True,
                             class_names=["No Treatment", "Treatment"], impurity=False)
@@ -157,6 +211,9 @@ class DoubleMLPolicyTree:
             raise KeyError(f'The features must have the keys {self._features.keys()}. '
                            f'Features with keys {features.keys()} were passed.')
 
-        predictions = self.policy_tree.predict(features)
+        if self._method == 'exact':
+            predictions = self.policy_tree.predict(features[self._features.columns].to_numpy(dtype=np.float64))
+        else:
+            predictions = self.policy_tree.predict(features)
 
         return features.assign(pred_treatment=predictions.astype(int))
@@ -0,0 +1,109 @@
+import joblib
+
+from ._resources import _active_resources
+
+
+class DoubleMLResourceManager:
+    """Core budget for nested parallelism.
+
+    DoubleML models can be parallelized on several levels: over the models of :class:`doubleml.DoubleMLAPOS` and
+    :class:`doubleml.DoubleMLQTE` (``n_jobs_models``), over the folds of the cross-fitting and tuning (``n_jobs_cv``)
+    and within the learners (``n_jobs`` of the learner and multi-threaded BLAS / OpenMP routines). If the resource
+    manager is active (used as a context manager), the total core budget ``n_cores`` is split across these levels:
+    every level runs at most as many parallel jobs as its budget allows and passes the remaining cores per job on to
+    the next level. As without a resource manager, ``None`` runs the jobs of a level serially (and passes the whole
+    budget on), i.e., parallel jobs have to be requested explicitly (e.g. ``n_jobs_cv=-1`` for all cores of the
+    budget). The threads of BLAS / OpenMP libraries are limited with :mod:`threadpoolctl` within the workers and the
+    ``n_jobs`` of learners is capped by the budget of their fold. The budget is honored by ``fit()``, ``tune()`` and
+    ``bootstrap()``.
+
+    Parameters
+    ----------
+    n_cores : None or int
+        The total number of cores. If ``None`` all available cores (see :func:`joblib.cpu_count`) are used.
+        Default is ``None``.
+
+    Examples
+    --------
+    >>> import doubleml as dml
+    >>> from doubleml.datasets import make_irm_data
+    >>> from doubleml.utils import DoubleMLResourceManager
+    >>> from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
+    >>> obj_dml_data = make_irm_data(n_obs=200)
+    >>> ml_g = RandomForestRegressor(n_estimators=20, n_jobs=-1)
+    >>> ml_m = RandomForestClassifier(n_estimators=20, n_jobs=-1)
+    >>> dml_irm_obj = dml.DoubleMLIRM(obj_dml_data, ml_g, ml_m, n_folds=2)
+    >>> with DoubleMLResourceManager(n_cores=1):
+    ...     dml_irm_obj = dml_irm_obj.fit(store_models=True)
+    >>> dml_irm_obj.models['ml_g0']['d'][0][0].n_jobs
+    1
+    """
+
+    def __init__(self, n_cores=None):
+        if n_cores is None:
+            n_cores = joblib.cpu_count()
+        if (not isinstance(n_cores, int)) or isinstance(n_cores, bool):
+            raise TypeError('n_cores must be None or an integer. '
+                            f'{str(n_cores)} of type {str(type(n_cores))} was passed.')
+        if n_cores < 1:
+            raise ValueError('n_cores must be larger or equal to 1. '
+                             f'{str(n_cores)} was passed.')
+        self._n_cores = n_cores
+        self._tokens = list()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(n_cores={self.n_cores})'
+
+    def __enter__(self):
+        self._tokens.append(_active_resources.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _active_resources.reset(self._tokens.pop())
+        return False
+
+    @property
+    def n_cores(self):
+        """
+        The total number of cores.
+        """
+        return self._n_cores
+
+    def split(self, n_tasks=None, n_jobs=None):
+        """
+        Split the core budget across parallel tasks.
+
+        Parameters
+        ----------
+        n_tasks : None or int
+            The number of tasks. If ``None`` the number of tasks is unknown.
+            Default is ``None``.
+
+        n_jobs : None or int
+            The requested number of parallel jobs. ``None`` means ``1`` and negative values are interpreted as in
+            :class:`joblib.Parallel`. The number of jobs is capped by ``n_cores`` and ``n_tasks``.
+            Default is ``None``.
+
+        Returns
+        -------
+        n_jobs : int
+            The number of parallel jobs.
+
+        resources : :class:`doubleml.utils.DoubleMLResourceManager`
+            The resource manager with the core budget of each job.
+        """
+        if (n_tasks is not None) and ((not isinstance(n_tasks, int)) or (n_tasks < 1)):
+            raise ValueError('n_tasks must be None or a positive integer. '
+                             f'{str(n_tasks)} was passed.')
+        if (n_jobs is not None) and ((not isinstance(n_jobs, int)) or (n_jobs == 0)):
+            raise ValueError('n_jobs must be None or a non-zero integer. '
+                             f'{str(n_jobs)} was passed.')
+
+        if n_jobs is None:
+            n_jobs = 1
+        elif n_jobs < 0:
+            n_jobs = max(self.n_cores + 1 + n_jobs, 1)
+        n_jobs = min(n_jobs, self.n_cores)
+        if n_tasks is not None:
+            n_jobs = min(n_jobs, n_tasks)
+        return n_jobs, DoubleMLResourceManager(n_cores=max(self.n_cores // n_jobs, 1))
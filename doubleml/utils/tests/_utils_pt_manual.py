@@ -10,3 +10,20 @@ def fit_policytree(orth_signal, features, depth):
                                                                       sample_weight=np.abs(orth_signal))
 
     return policytree_model
+
+
+def policy_value_exact(orth_signal, features, depth, min_samples_leaf=8):
+    # exhaustive recursion over all splits at midpoints of distinct values
+    value = max(np.sum(orth_signal), 0.0)
+    if depth == 0:
+        return value
+    for j in range(features.shape[1]):
+        values = np.unique(features[:, j])
+        for threshold in (values[:-1] + values[1:]) / 2:
+            is_left = features[:, j] <= threshold
+            if (np.sum(is_left) >= min_samples_leaf) & (np.sum(~is_left) >= min_samples_leaf):
+                value = max(value,
+                            policy_value_exact(orth_signal[is_left], features[is_left, :], depth - 1, min_samples_leaf)
+                            + policy_value_exact(orth_signal[~is_left], features[~is_left, :], depth - 1,
+                                                 min_samples_leaf))
+    return value
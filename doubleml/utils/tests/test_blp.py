@@ -4,6 +4,7 @@ import pytest
 import copy
 
 import doubleml as dml
+from doubleml.utils._blp import _group_dummies
 from ._utils_blp_manual import fit_blp, blp_confint
 
 
@@ -143,9 +144,9 @@ def test_doubleml_exception_blp():
     msg = "The signal must be of np.ndarray type. Signal of type <class 'int'> was passed."
     with pytest.raises(TypeError, match=msg):
         dml.DoubleMLBLP(orth_signal=1, basis=random_basis)
-    msg = 'The signal must be of one dimensional. Signal of dimensions 2 was passed.'
+    msg = 'The signal must be of one or two dimensional. Signal of dimensions 3 was passed.'
     with pytest.raises(ValueError, match=msg):
-        dml.DoubleMLBLP(orth_signal=np.array([[1], [2]]), basis=random_basis)
+        dml.DoubleMLBLP(orth_signal=np.array([[[1]], [[2]]]), basis=random_basis)
     msg = "The basis must be of DataFrame type. Basis of type <class 'int'> was passed."
     with pytest.raises(TypeError, match=msg):
         dml.DoubleMLBLP(orth_signal=signal, basis=1)
@@ -181,3 +182,238 @@ def test_doubleml_exception_blp():
     msg = 'Invalid basis: DataFrame has to have the exact same number and ordering of columns.'
     with pytest.raises(ValueError, match=msg):
         dml_blp_confint.confint(basis=pd.DataFrame(np.array([[1, 2, 3], [4, 5, 6]]), columns=['x_1', 'x_2', 'x_3']))
+
+
+@pytest.fixture(scope='module')
+def dml_blp_numpy_fixture(ci_joint, cov_type, use_t):
+    n = 200
+    kwargs = {'cov_type': cov_type, 'use_t': use_t}
+
+    np.random.seed(42)
+    random_basis = pd.DataFrame(np.random.normal(0, 1, size=(n, 3)), columns=['a', 'b', 'c'])
+    random_signal = np.random.normal(0, 1, size=(n, ))
+    grid = pd.DataFrame(np.random.normal(0, 1, size=(20, 3)), columns=['a', 'b', 'c'])
+
+    blp = dml.DoubleMLBLP(random_signal, random_basis).fit(**kwargs)
+    blp_numpy = dml.DoubleMLBLP(random_signal, random_basis).fit(backend='numpy', **kwargs)
+
+    np.random.seed(42)
+    ci = blp.confint(grid, joint=ci_joint, n_rep_boot=1000)
+    np.random.seed(42)
+    ci_numpy = blp_numpy.confint(grid, joint=ci_joint, n_rep_boot=1000)
+
+    res_dict = {'blp': blp,
+                'blp_numpy': blp_numpy,
+                'ci': ci,
+                'ci_numpy': ci_numpy,
+                'ci_joint': ci_joint}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_blp_numpy_summary(dml_blp_numpy_fixture):
+    summary = dml_blp_numpy_fixture['blp'].summary
+    summary_numpy = dml_blp_numpy_fixture['blp_numpy'].summary
+    assert list(summary_numpy.columns) == list(summary.columns)
+    assert list(summary_numpy.index) == list(summary.index)
+    assert np.allclose(summary_numpy.to_numpy(), summary.to_numpy(), rtol=1e-9, atol=1e-10)
+    assert np.allclose(dml_blp_numpy_fixture['blp_numpy'].blp_omega, dml_blp_numpy_fixture['blp'].blp_omega,
+                       rtol=1e-9, atol=1e-12)
+    assert np.allclose(dml_blp_numpy_fixture['blp_numpy'].blp_model.fittedvalues,
+                       dml_blp_numpy_fixture['blp'].blp_model.fittedvalues)
+
+
+@pytest.mark.ci
+def test_dml_blp_numpy_confint(dml_blp_numpy_fixture):
+    ci = dml_blp_numpy_fixture['ci']
+    ci_numpy = dml_blp_numpy_fixture['ci_numpy']
+    assert list(ci_numpy.columns) == list(ci.columns)
+    assert np.allclose(ci_numpy['effect'], ci['effect'])
+    if dml_blp_numpy_fixture['ci_joint']:
+        # the bootstrap is based on the cholesky factor instead of the symmetric square root of the covariance
+        assert np.allclose(ci_numpy.to_numpy(), ci.to_numpy(), rtol=0.05)
+    else:
+        assert np.allclose(ci_numpy.to_numpy(), ci.to_numpy(), rtol=1e-9, atol=1e-10)
+
+
+@pytest.mark.ci
+def test_dml_blp_chunked_confint(monkeypatch):
+    np.random.seed(42)
+    random_basis = pd.DataFrame(np.random.normal(0, 1, size=(100, 3)))
+    random_signal = np.random.normal(0, 1, size=(100, ))
+    blp = dml.DoubleMLBLP(random_signal, random_basis).fit(backend='numpy', cov_type='HC3')
+    np.random.seed(42)
+    ci = blp.confint(random_basis, joint=True, n_rep_boot=200)
+
+    # evaluation of the observations (fit) and grid points (confint) in small chunks
+    monkeypatch.setattr('doubleml.utils._blp._BLP_CHUNK_SIZE', 7)
+    blp_chunked = dml.DoubleMLBLP(random_signal, random_basis).fit(backend='numpy', cov_type='HC3')
+    np.random.seed(42)
+    ci_chunked = blp_chunked.confint(random_basis, joint=True, n_rep_boot=200)
+    assert np.allclose(blp_chunked.blp_omega, blp.blp_omega)
+    assert np.allclose(ci_chunked, ci)
+
+
+@pytest.mark.ci
+def test_dml_blp_numpy_rank_deficient(cov_type):
+    n = 200
+    np.random.seed(42)
+    collinear_basis = pd.DataFrame(np.random.normal(0, 1, size=(n, 3)), columns=['a', 'b', 'c'])
+    collinear_basis['d'] = collinear_basis['a']
+    random_signal = np.random.normal(0, 1, size=(n, ))
+
+    # as statsmodels, the numpy backend uses the pseudo-inverse of the basis
+    blp = dml.DoubleMLBLP(random_signal, collinear_basis).fit(cov_type=cov_type)
+    blp_numpy = dml.DoubleMLBLP(random_signal, collinear_basis).fit(cov_type=cov_type, backend='numpy')
+    assert blp_numpy.blp_model.df_resid == blp.blp_model.df_resid == n - 3
+    assert np.allclose(blp_numpy.summary.to_numpy(), blp.summary.to_numpy())
+    assert np.allclose(blp_numpy.blp_omega, blp.blp_omega)
+    assert np.isclose(blp_numpy.blp_model.params['a'], blp_numpy.blp_model.params['d'])
+    np.random.seed(42)
+    ci = blp.confint(collinear_basis.iloc[:10, :], joint=True, n_rep_boot=200)
+    np.random.seed(42)
+    ci_numpy = blp_numpy.confint(collinear_basis.iloc[:10, :], joint=True, n_rep_boot=200)
+    assert np.allclose(ci_numpy['effect'], ci['effect'])
+    assert np.all(np.isfinite(ci_numpy.to_numpy()))
+
+    # empty groups of the GATEs correspond to zero columns of the basis
+    groups = pd.DataFrame(pd.Categorical(np.random.choice(['a', 'b'], size=n), categories=['a', 'b', 'c']))
+    sparse_dummies = _group_dummies(groups)
+    blp = dml.DoubleMLBLP(random_signal, sparse_dummies.sparse.to_dense(), is_gate=True).fit(cov_type=cov_type)
+    blp_grouped = dml.DoubleMLBLP(random_signal, sparse_dummies, is_gate=True).fit(cov_type=cov_type, backend='numpy')
+    assert blp_grouped.blp_model.df_resid == blp.blp_model.df_resid == n - 2
+    assert np.allclose(blp_grouped.blp_model.params, blp.blp_model.params)
+    assert np.allclose(blp_grouped.blp_omega, blp.blp_omega)
+    assert blp_grouped.blp_model.params['Group_c'] == 0.0
+
+
+@pytest.mark.ci
+def test_doubleml_exception_blp_numpy():
+    random_basis = pd.DataFrame(np.random.normal(0, 1, size=(10, 3)))
+    signal = np.random.normal(0, 1, size=(10, ))
+    blp = dml.DoubleMLBLP(orth_signal=signal, basis=random_basis)
+
+    msg = 'backend must be None, "statsmodels" or "numpy". Got sklearn.'
+    with pytest.raises(ValueError, match=msg):
+        blp.fit(backend='sklearn')
+    msg = 'cov_type must be "nonrobust", "HC0", "HC1", "HC2" or "HC3" for the numpy backend. Got cluster.'
+    with pytest.raises(ValueError, match=msg):
+        blp.fit(cov_type='cluster', backend='numpy')
+    msg = 'Only use_t is supported as additional keyword argument for the numpy backend. Got cov_kwds.'
+    with pytest.raises(ValueError, match=msg):
+        blp.fit(backend='numpy', cov_kwds={})
+
+    # statsmodels-only options for orthogonal signals of several repetitions
+    blp = dml.DoubleMLBLP(orth_signal=np.column_stack((signal, signal)), basis=random_basis)
+    msg = (r'The statsmodels backend does not support orthogonal signals of several repetitions. '
+           r'Use backend "numpy" \(or None\).')
+    with pytest.raises(ValueError, match=msg):
+        blp.fit(backend='statsmodels')
+    msg = ('cov_type must be "nonrobust", "HC0", "HC1", "HC2" or "HC3" for orthogonal signals of several repetitions. '
+           'Got HAC.')
+    with pytest.raises(ValueError, match=msg):
+        blp.fit(cov_type='HAC')
+    msg = 'Only use_t is supported as additional keyword argument for orthogonal signals of several repetitions. Got cov_kwds.'
+    with pytest.raises(ValueError, match=msg):
+        blp.fit(cov_kwds={})
+
+    msg = "The basis weights must be of np.ndarray type. Basis weights of type <class 'list'> were passed."
+    with pytest.raises(TypeError, match=msg):
+        dml.DoubleMLBLP(orth_signal=signal, basis=random_basis, basis_weights=list(signal))
+    msg = r'The basis weights must have the same shape as the signal \(10,\). Basis weights of shape \(10, 2\) were passed.'
+    with pytest.raises(ValueError, match=msg):
+        dml.DoubleMLBLP(orth_signal=signal, basis=random_basis, basis_weights=np.ones((10, 2)))
+
+
+@pytest.mark.ci
+def test_dml_blp_multiple_signals(cov_type):
+    n = 100
+    n_rep = 3
+    np.random.seed(42)
+    random_basis = pd.DataFrame(np.random.normal(0, 1, size=(n, 3)), columns=['a', 'b', 'c'])
+    random_signals = np.random.normal(0, 1, size=(n, n_rep))
+    weights = np.random.normal(0, 1, size=(n, n_rep))
+
+    blp = dml.DoubleMLBLP(random_signals, random_basis).fit(cov_type=cov_type)
+    blp_weighted = dml.DoubleMLBLP(random_signals, random_basis, basis_weights=weights).fit(cov_type=cov_type)
+
+    for model, basis_weights in [(blp, np.ones((n, n_rep))), (blp_weighted, weights)]:
+        # manual: separate fit for each repetition and aggregation with the median
+        fits = [dml.DoubleMLBLP(random_signals[:, i_rep], random_basis.mul(basis_weights[:, i_rep], axis=0)).fit(
+            cov_type=cov_type) for i_rep in range(n_rep)]
+        all_params = np.column_stack([fit.blp_model.params for fit in fits])
+        params = np.median(all_params, axis=1)
+        cov = np.median(np.stack([fit.blp_omega + np.outer(fit.blp_model.params - params, fit.blp_model.params - params)
+                                  for fit in fits]), axis=0)
+        assert model._backend == 'numpy'
+        assert np.allclose(model.blp_model.all_params, all_params)
+        assert np.allclose(model.blp_model.params, params)
+        assert np.allclose(model.blp_omega, cov)
+        assert model.summary.shape == (3, 6)
+        assert model.confint(random_basis.iloc[:10, :], joint=True, n_rep_boot=100).shape == (10, 3)
+
+
+@pytest.mark.ci
+def test_dml_blp_basis_weights(cov_type):
+    n = 100
+    np.random.seed(42)
+    random_basis = pd.DataFrame(np.random.normal(0, 1, size=(n, 3)), columns=['a', 'b', 'c'])
+    random_signal = np.random.normal(0, 1, size=(n, ))
+    weights = np.random.normal(0, 1, size=(n, ))
+    grid = pd.DataFrame(np.random.normal(0, 1, size=(10, 3)), columns=['a', 'b', 'c'])
+
+    # the coefficients refer to the unweighted basis for both backends and any number of repetitions
+    blp_manual = dml.DoubleMLBLP(random_signal, random_basis.mul(weights, axis=0)).fit(cov_type=cov_type)
+    blp = dml.DoubleMLBLP(random_signal, random_basis, basis_weights=weights).fit(cov_type=cov_type)
+    blp_numpy = dml.DoubleMLBLP(random_signal, random_basis, basis_weights=weights).fit(cov_type=cov_type,
+                                                                                        backend='numpy')
+    blp_rep = dml.DoubleMLBLP(np.column_stack((random_signal, random_signal)), random_basis,
+                              basis_weights=np.column_stack((weights, weights))).fit(cov_type=cov_type)
+    assert blp.basis is random_basis
+    assert blp_rep._backend == 'numpy'
+    for model in [blp, blp_numpy, blp_rep]:
+        assert np.allclose(model.blp_model.params, blp_manual.blp_model.params)
+        assert np.allclose(model.blp_omega, blp_manual.blp_omega)
+        assert np.allclose(model.confint()['effect'], blp_manual.blp_model.params)
+        assert np.allclose(model.confint(grid), blp_manual.confint(grid))
+
+    # the weighted dummy basis of a GATE is not fitted as group means
+    groups = pd.DataFrame(np.random.choice(['a', 'b'], size=n))
+    dummies = _group_dummies(groups)
+    gate = dml.DoubleMLBLP(random_signal, dummies, is_gate=True, basis_weights=weights)
+    gate.fit(cov_type=cov_type, backend='numpy')
+    gate_manual = dml.DoubleMLBLP(random_signal, dummies.sparse.to_dense().mul(weights, axis=0),
+                                  is_gate=True).fit(cov_type=cov_type)
+    assert np.allclose(gate.confint(), gate_manual.confint())
+
+
+@pytest.mark.ci
+def test_dml_blp_grouped_gate(cov_type):
+    n = 200
+    np.random.seed(42)
+    # observations of the missing group do not belong to any group
+    groups = pd.DataFrame(np.random.choice(['a', 'b', 'c', None], size=n))
+    dummies = pd.get_dummies(groups, prefix='Group', prefix_sep='_')
+    sparse_dummies = _group_dummies(groups)
+    assert list(sparse_dummies.columns) == list(dummies.columns)
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in sparse_dummies.dtypes)
+    random_signal = np.random.normal(0, 1, size=(n, ))
+
+    blp = dml.DoubleMLBLP(random_signal, dummies, is_gate=True).fit(cov_type=cov_type)
+    blp_grouped = dml.DoubleMLBLP(random_signal, sparse_dummies, is_gate=True).fit(cov_type=cov_type, backend='numpy')
+    assert np.allclose(blp_grouped.summary.to_numpy(), blp.summary.to_numpy())
+    assert np.allclose(blp_grouped.blp_omega, blp.blp_omega)
+    assert np.allclose(blp_grouped.blp_model.fittedvalues, blp.blp_model.fittedvalues)
+    np.random.seed(42)
+    ci = blp.confint(joint=True, n_rep_boot=200)
+    np.random.seed(42)
+    ci_grouped = blp_grouped.confint(joint=True, n_rep_boot=200)
+    assert list(ci_grouped.index) == list(dummies.columns)
+    assert np.allclose(ci_grouped.to_numpy(), ci.to_numpy())
+
+    # several repetitions are aggregated as for the dense basis
+    random_signals = np.random.normal(0, 1, size=(n, 3))
+    blp_dense = dml.DoubleMLBLP(random_signals, dummies).fit(cov_type=cov_type)
+    blp_grouped = dml.DoubleMLBLP(random_signals, sparse_dummies, is_gate=True).fit(cov_type=cov_type)
+    assert np.allclose(blp_grouped.blp_model.all_params, blp_dense.blp_model.all_params)
+    assert np.allclose(blp_grouped.blp_omega, blp_dense.blp_omega)
@@ -0,0 +1,149 @@
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018
+from doubleml.utils import DoubleMLModelStore, DoubleMLModelHandle
+
+
+@pytest.fixture(scope='module',
+                params=[False, True])
+def multi_output(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_plr_model_store_fixture(multi_output, tmp_path_factory):
+    n_folds = 3
+    n_rep = 2
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    ml = RandomForestRegressor(n_estimators=10, max_depth=3, random_state=42)
+
+    dml_plr = dml.DoubleMLPLR(dml_data, ml, ml, n_folds=n_folds, n_rep=n_rep)
+    dml_plr.fit(store_models=True, multi_output=multi_output)
+
+    model_store = DoubleMLModelStore(path=str(tmp_path_factory.mktemp('models')), cache_size=2)
+    dml_plr_store = dml.DoubleMLPLR(dml_data, ml, ml, n_folds=n_folds, n_rep=n_rep, draw_sample_splitting=False)
+    dml_plr_store.set_sample_splitting(dml_plr.smpls)
+    dml_plr_store.fit(store_models=model_store, multi_output=multi_output)
+
+    res_dict = {'dml_plr': dml_plr,
+                'dml_plr_store': dml_plr_store,
+                'model_store': model_store,
+                'x': dml_data.x,
+                'n_folds': n_folds,
+                'n_rep': n_rep}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_plr_model_store_coef(dml_plr_model_store_fixture):
+    assert np.allclose(dml_plr_model_store_fixture['dml_plr'].all_coef,
+                       dml_plr_model_store_fixture['dml_plr_store'].all_coef)
+
+
+@pytest.mark.ci
+def test_dml_plr_model_store_handles(dml_plr_model_store_fixture, multi_output):
+    dml_plr = dml_plr_model_store_fixture['dml_plr']
+    dml_plr_store = dml_plr_model_store_fixture['dml_plr_store']
+    model_store = dml_plr_model_store_fixture['model_store']
+    x = dml_plr_model_store_fixture['x']
+
+    for learner in ['ml_l', 'ml_m']:
+        assert len(dml_plr_store.models[learner]['d']) == dml_plr_model_store_fixture['n_rep']
+        for i_rep, fold_models in enumerate(dml_plr_store.models[learner]['d']):
+            assert len(fold_models) == dml_plr_model_store_fixture['n_folds']
+            for i_fold, handle in enumerate(fold_models):
+                assert isinstance(handle, DoubleMLModelHandle)
+                model = dml_plr.models[learner]['d'][i_rep][i_fold]
+                assert np.allclose(handle.predict(x), model.predict(x))
+                assert np.allclose(handle.feature_importances_, model.feature_importances_)
+                assert len(model_store.cached_keys) <= 2
+
+    # models shared by several learners are stored only once
+    n_models = 2 * dml_plr_model_store_fixture['n_rep'] * dml_plr_model_store_fixture['n_folds']
+    if multi_output:
+        n_models = n_models // 2
+        assert dml_plr_store.models['ml_l']['d'][0][0] is dml_plr_store.models['ml_m']['d'][0][0]
+    assert len(os.listdir(model_store.path)) == n_models
+
+
+@pytest.mark.ci
+def test_model_store_lru():
+    np.random.seed(3141)
+    x = np.random.normal(size=(50, 3))
+    y = x[:, 0] + np.random.normal(size=50)
+    model_store = DoubleMLModelStore(cache_size=2)
+    handles = [model_store.save(LinearRegression().fit(x, y * (i + 1))) for i in range(3)]
+    assert model_store.cached_keys == []
+
+    for handle in handles:
+        handle.load()
+    assert model_store.cached_keys == [handles[1].key, handles[2].key]
+    # the loaded model is reused and marked as recently used
+    assert handles[1].load() is handles[1].load()
+    assert model_store.cached_keys == [handles[2].key, handles[1].key]
+    assert np.allclose(handles[2].coef_, 3 * handles[0].coef_)
+
+    model_store.clear_cache()
+    assert model_store.cached_keys == []
+
+    # copies (e.g. in parallel workers) share the files but neither the cache nor the temporary directory
+    model_store_copy = pickle.loads(pickle.dumps(model_store))
+    assert model_store_copy.path == model_store.path
+    assert np.allclose(model_store_copy.load(handles[0].key).coef_, handles[0].coef_)
+    path = model_store.path
+    del model_store_copy
+    assert os.path.isdir(path)
+
+
+@pytest.mark.ci
+def test_model_store_temporary_dir_pickled(tmp_path):
+    np.random.seed(3141)
+    x = np.random.normal(size=(50, 3))
+    y = x[:, 0] + np.random.normal(size=50)
+    model_store = DoubleMLModelStore()
+    handle = model_store.save(LinearRegression().fit(x, y))
+    pickled_handle = pickle.dumps(handle)
+    path = model_store.path
+
+    # the temporary directory is removed with the original store, i.e., pickled handles cannot be loaded anymore
+    del handle, model_store
+    assert not os.path.isdir(path)
+    msg = (f'The temporary directory {path} of the DoubleMLModelStore was removed with the original store. The stored '
+           'models cannot be loaded; use a DoubleMLModelStore with an explicit path to keep the models beyond the '
+           'process.')
+    with pytest.warns(UserWarning, match=msg):
+        handle_copy = pickle.loads(pickled_handle)
+    msg = f'The model {handle_copy.key} is not available in the temporary directory {path}.'
+    with pytest.raises(FileNotFoundError, match=msg):
+        handle_copy.load()
+
+    # models of a store with an explicit path are kept
+    model_store = DoubleMLModelStore(path=str(tmp_path))
+    pickled_handle = pickle.dumps(model_store.save(LinearRegression().fit(x, y)))
+    del model_store
+    assert np.allclose(pickle.loads(pickled_handle).coef_, LinearRegression().fit(x, y).coef_)
+
+
+@pytest.mark.ci
+def test_model_store_exceptions():
+    msg = 'path must be None or a str. 1 of type <class \'int\'> was passed.'
+    with pytest.raises(TypeError, match=msg):
+        _ = DoubleMLModelStore(path=1)
+    msg = 'cache_size must be an integer. 0.5 of type <class \'float\'> was passed.'
+    with pytest.raises(TypeError, match=msg):
+        _ = DoubleMLModelStore(cache_size=0.5)
+    msg = 'cache_size must be non-negative. -1 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        _ = DoubleMLModelStore(cache_size=-1)
+    msg = 'mmap_mode must be None, "r", "r\\+" or "c". Got w.'
+    with pytest.raises(ValueError, match=msg):
+        _ = DoubleMLModelStore(mmap_mode='w')
@@ -5,7 +5,7 @@ import copy
 
 import doubleml as dml
 
-from ._utils_pt_manual import fit_policytree
+from ._utils_pt_manual import fit_policytree, policy_value_exact
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.exceptions import NotFittedError
 
@@ -102,3 +102,99 @@ def test_doubleml_exception_policytree():
     msg = 'Policy Tree not yet fitted. Call fit before plot_tree.'
     with pytest.raises(NotFittedError, match=msg):
         dml_policytree_plot.plot_tree()
+
+
+@pytest.fixture(scope='module',
+                params=[1, 4])
+def min_samples_leaf(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_policytree_exact_fixture(depth, min_samples_leaf):
+    n = 40 if depth < 3 else 20
+    np.random.seed(42)
+    random_x_var = pd.DataFrame(np.random.normal(0, 1, size=(n, 2)), columns=['a', 'b'])
+    # discrete feature with ties
+    random_x_var['b'] = np.round(random_x_var['b'])
+    random_signal = np.random.normal(0, 1, size=(n, )) + random_x_var['a'].to_numpy() * random_x_var['b'].to_numpy()
+
+    policy_tree = dml.DoubleMLPolicyTree(random_signal, random_x_var, depth, method='exact',
+                                         min_samples_leaf=min_samples_leaf).fit()
+    policy_tree_greedy = dml.DoubleMLPolicyTree(random_signal, random_x_var, depth,
+                                                min_samples_leaf=min_samples_leaf, ccp_alpha=0.0).fit()
+
+    res_dict = {'policy_tree': policy_tree,
+                'policy_tree_greedy': policy_tree_greedy,
+                'value_manual': policy_value_exact(random_signal, random_x_var.to_numpy(), depth, min_samples_leaf),
+                'features': random_x_var,
+                'signal': random_signal}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_policytree_exact_value(dml_policytree_exact_fixture):
+    policy_tree = dml_policytree_exact_fixture['policy_tree']
+    assert np.isclose(policy_tree.policy_tree.value_, dml_policytree_exact_fixture['value_manual'])
+
+    # the value is attained by the predicted policy and at least as large as the value of the greedy tree
+    signal = dml_policytree_exact_fixture['signal']
+    features = dml_policytree_exact_fixture['features']
+    pred = policy_tree.predict(features[['b', 'a']])
+    assert list(pred.columns) == ['b', 'a', 'pred_treatment']
+    assert np.isclose(np.sum(signal * pred['pred_treatment']), dml_policytree_exact_fixture['value_manual'])
+    pred_greedy = dml_policytree_exact_fixture['policy_tree_greedy'].predict(features)['pred_treatment']
+    assert np.sum(signal * pred['pred_treatment']) >= np.sum(signal * pred_greedy) - 1e-12
+
+
+@pytest.mark.ci
+def test_dml_policytree_exact_bins():
+    n = 2000
+    np.random.seed(42)
+    random_x_var = pd.DataFrame(np.random.normal(0, 1, size=(n, 3)))
+    random_signal = np.random.normal(0, 1, size=(n, )) + random_x_var[0].to_numpy()
+
+    policy_tree = dml.DoubleMLPolicyTree(random_signal, random_x_var, 2, method='exact', n_bins=16).fit()
+    assert policy_tree.method == 'exact'
+    # the splits are quantiles of the features
+    node = policy_tree.policy_tree.tree_
+    quantiles = np.quantile(random_x_var[node['feature']], np.linspace(0, 1, 17)[1:-1])
+    assert np.any(np.isclose(node['threshold'], quantiles))
+
+    # the value is bounded by the value of the exact search over all split points
+    policy_tree_all = dml.DoubleMLPolicyTree(random_signal, random_x_var.iloc[:, :1], 2, method='exact').fit()
+    policy_tree_binned = dml.DoubleMLPolicyTree(random_signal, random_x_var.iloc[:, :1], 2, method='exact',
+                                                n_bins=16).fit()
+    assert policy_tree_binned.policy_tree.value_ <= policy_tree_all.policy_tree.value_ + 1e-9
+    assert policy_tree_binned.policy_tree.value_ > 0.9 * policy_tree_all.policy_tree.value_
+
+
+@pytest.mark.ci
+def test_doubleml_exception_policytree_exact():
+    random_features = pd.DataFrame(np.random.normal(0, 1, size=(2, 3)), columns=['a', 'b', 'c'])
+    signal = np.array([1, 2])
+
+    msg = 'method must be "greedy" or "exact". Got optimal.'
+    with pytest.raises(ValueError, match=msg):
+        dml.DoubleMLPolicyTree(orth_signal=signal, features=random_features, method='optimal')
+    msg = 'n_bins is only supported for method "exact".'
+    with pytest.raises(ValueError, match=msg):
+        dml.DoubleMLPolicyTree(orth_signal=signal, features=random_features, n_bins=10)
+    msg = 'n_bins must be None or an integer larger than 1. Got 1.'
+    with pytest.raises(ValueError, match=msg):
+        dml.DoubleMLPolicyTree(orth_signal=signal, features=random_features, method='exact', n_bins=1)
+    msg = 'depth must be 1, 2 or 3 for method "exact". Got 4.'
+    with pytest.raises(ValueError, match=msg):
+        dml.DoubleMLPolicyTree(orth_signal=signal, features=random_features, depth=4, method='exact')
+    msg = 'Only min_samples_leaf is supported as tree parameter for method "exact". Got ccp_alpha.'
+    with pytest.raises(ValueError, match=msg):
+        dml.DoubleMLPolicyTree(orth_signal=signal, features=random_features, method='exact', ccp_alpha=0.01)
+
+    dml_policytree_exact = dml.DoubleMLPolicyTree(orth_signal=signal, features=random_features, method='exact')
+    msg = 'Policy Tree not yet fitted. Call fit before predict.'
+    with pytest.raises(NotFittedError, match=msg):
+        dml_policytree_exact.predict(random_features)
+    dml_policytree_exact.fit()
+    msg = 'plot_tree not implemented for method "exact".'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_policytree_exact.plot_tree()
@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import LinearRegression, LogisticRegression, Lasso
+from sklearn.ensemble import RandomForestRegressor
+from threadpoolctl import threadpool_info
+
+import doubleml as dml
+from doubleml.datasets import make_irm_data, make_plr_CCDDHNR2018
+from doubleml.utils import DoubleMLResourceManager
+from doubleml.utils._resources import _get_resources
+
+
+class _ThreadRecordingRegressor(LinearRegression):
+    def fit(self, X, y, sample_weight=None):
+        self.n_threads_ = max([lib['num_threads'] for lib in threadpool_info()], default=1)
+        return super().fit(X, y, sample_weight=sample_weight)
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('n_cores, n_tasks, n_jobs, expected',
+                         [(8, None, None, (1, 8)),
+                          (8, 5, None, (1, 8)),
+                          (8, 2, None, (1, 8)),
+                          (8, 5, 2, (2, 4)),
+                          (8, 2, -1, (2, 4)),
+                          (8, None, 16, (8, 1)),
+                          (8, None, -1, (8, 1)),
+                          (8, None, -3, (6, 1)),
+                          (8, 3, -1, (3, 2)),
+                          (1, 5, None, (1, 1))])
+def test_resource_manager_split(n_cores, n_tasks, n_jobs, expected):
+    n_jobs, resources = DoubleMLResourceManager(n_cores).split(n_tasks, n_jobs)
+    assert (n_jobs, resources.n_cores) == expected
+
+
+@pytest.mark.ci
+def test_resource_manager_context():
+    assert _get_resources() is None
+    resources = DoubleMLResourceManager(4)
+    with resources as outer:
+        assert _get_resources() is outer
+        with DoubleMLResourceManager(2) as inner:
+            assert _get_resources() is inner
+        # re-entering the same manager
+        with resources:
+            assert _get_resources() is resources
+        assert _get_resources() is outer
+    assert _get_resources() is None
+    assert repr(resources) == 'DoubleMLResourceManager(n_cores=4)'
+
+
+@pytest.mark.ci
+def test_resource_manager_fit():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    ml = RandomForestRegressor(n_estimators=10, max_depth=3, random_state=42, n_jobs=-1)
+
+    np.random.seed(3141)
+    dml_plr = dml.DoubleMLPLR(dml_data, ml, ml, n_folds=2)
+    dml_plr.fit()
+
+    np.random.seed(3141)
+    dml_plr_resources = dml.DoubleMLPLR(dml_data, ml, ml, n_folds=2)
+    with DoubleMLResourceManager(n_cores=2):
+        dml_plr_resources.fit(store_models=True)
+    assert np.allclose(dml_plr.coef, dml_plr_resources.coef)
+    assert np.allclose(dml_plr.se, dml_plr_resources.se)
+    # without n_jobs_cv the folds are fitted serially and each learner uses the whole budget
+    assert all(model.n_jobs == 2 for model in dml_plr_resources.models['ml_l']['d'][0])
+
+    with DoubleMLResourceManager(n_cores=2):
+        dml_plr_resources.fit(n_jobs_cv=-1, store_models=True)
+    assert np.allclose(dml_plr.coef, dml_plr_resources.coef)
+    # the folds are fitted in parallel, each learner uses the remaining core
+    assert all(model.n_jobs == 1 for model in dml_plr_resources.models['ml_l']['d'][0])
+    assert ml.n_jobs == -1
+
+    with DoubleMLResourceManager(n_cores=1):
+        dml_plr_resources.fit(n_jobs_cv=-1)
+        dml_plr_resources.bootstrap()
+    assert np.allclose(dml_plr.coef, dml_plr_resources.coef)
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('n_jobs_cv', [None, 1, -1])
+def test_resource_manager_thread_limits(n_jobs_cv):
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(dml_data, _ThreadRecordingRegressor(), _ThreadRecordingRegressor(), n_folds=2)
+    with DoubleMLResourceManager(n_cores=2):
+        dml_plr.fit(n_jobs_cv=n_jobs_cv, store_models=True)
+    # only the explicitly requested parallel folds split the budget
+    expected = 1 if n_jobs_cv == -1 else 2
+    for learner in ['ml_l', 'ml_m']:
+        assert all(model.n_threads_ <= expected for model in dml_plr.models[learner]['d'][0])
+
+
+@pytest.mark.ci
+def test_resource_manager_apos_qte():
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=200, dim_x=5)
+    n_folds = 2
+
+    np.random.seed(3141)
+    dml_apos = dml.DoubleMLAPOS(dml_data, LinearRegression(), LogisticRegression(), treatment_levels=[0, 1],
+                                n_folds=n_folds)
+    dml_apos.fit()
+    np.random.seed(3141)
+    dml_apos_resources = dml.DoubleMLAPOS(dml_data, LinearRegression(), LogisticRegression(), treatment_levels=[0, 1],
+                                          n_folds=n_folds)
+    with DoubleMLResourceManager(n_cores=2):
+        dml_apos_resources.fit()
+    assert np.allclose(dml_apos.coef, dml_apos_resources.coef)
+    assert np.allclose(dml_apos.se, dml_apos_resources.se)
+
+    np.random.seed(3141)
+    dml_qte = dml.DoubleMLQTE(dml_data, LogisticRegression(), LogisticRegression(), quantiles=[0.25, 0.75],
+                              n_folds=n_folds)
+    dml_qte.fit()
+    np.random.seed(3141)
+    dml_qte_resources = dml.DoubleMLQTE(dml_data, LogisticRegression(), LogisticRegression(), quantiles=[0.25, 0.75],
+                                        n_folds=n_folds)
+    with DoubleMLResourceManager(n_cores=1):
+        dml_qte_resources.fit(n_jobs_models=2)
+    assert np.allclose(dml_qte.coef, dml_qte_resources.coef)
+    assert np.allclose(dml_qte.se, dml_qte_resources.se)
+
+
+@pytest.mark.ci
+def test_resource_manager_tune():
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_plr = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=2)
+    param_grids = {'ml_l': {'alpha': [0.05, 0.1]}, 'ml_m': {'alpha': [0.05, 0.1]}}
+    with DoubleMLResourceManager(n_cores=2):
+        res = dml_plr.tune(param_grids, return_tune_res=True)
+    assert res[0]['params']['ml_l'][0]['alpha'] in [0.05, 0.1]
+
+
+@pytest.mark.ci
+def test_resource_manager_exceptions():
+    msg = "n_cores must be None or an integer. 1.5 of type <class 'float'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        DoubleMLResourceManager(n_cores=1.5)
+    msg = 'n_cores must be larger or equal to 1. 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLResourceManager(n_cores=0)
+    msg = 'n_tasks must be None or a positive integer. 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLResourceManager(n_cores=2).split(n_tasks=0)
+    msg = 'n_jobs must be None or a non-zero integer. 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        DoubleMLResourceManager(n_cores=2).split(n_jobs=0)
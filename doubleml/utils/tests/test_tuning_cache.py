@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso, LogisticRegression
+from sklearn.model_selection import GridSearchCV
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+from doubleml.utils import DoubleMLTuningCache
+
+
+@pytest.fixture(scope='module',
+                params=[True, False])
+def tune_on_folds(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[1, 2])
+def n_jobs_cv(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_tuning_cache_fixture(tmp_path_factory, tune_on_folds, n_jobs_cv):
+    n_folds = 2
+    np.random.seed(3141)
+    dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    param_grids = {'ml_l': {'alpha': np.linspace(0.05, 0.95, 5)},
+                   'ml_m': {'alpha': np.linspace(0.05, 0.95, 5)}}
+    path = tmp_path_factory.mktemp('tuning_cache')
+
+    cache = DoubleMLTuningCache(path=path)
+    np.random.seed(3141)
+    dml_plr_obj = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=n_folds)
+    tune_res = dml_plr_obj.tune(param_grids, tune_on_folds=tune_on_folds, n_jobs_cv=n_jobs_cv,
+                                return_tune_res=True, tuning_cache=cache)
+
+    # a new cache on the same directory (e.g. in a later run)
+    cache_reloaded = DoubleMLTuningCache(path=path)
+    np.random.seed(3141)
+    dml_plr_obj_cached = dml.DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=n_folds)
+    tune_res_cached = dml_plr_obj_cached.tune(param_grids, tune_on_folds=tune_on_folds, n_jobs_cv=n_jobs_cv,
+                                              return_tune_res=True, tuning_cache=cache_reloaded)
+
+    res_dict = {'dml_plr_obj': dml_plr_obj,
+                'dml_plr_obj_cached': dml_plr_obj_cached,
+                'tune_res': tune_res[0][0]['tune_res'] if tune_on_folds else tune_res[0]['tune_res'],
+                'tune_res_cached': tune_res_cached[0][0]['tune_res'] if tune_on_folds else tune_res_cached[0]['tune_res'],
+                'cache': cache,
+                'cache_reloaded': cache_reloaded,
+                'n_searches': 2 * n_folds if tune_on_folds else 2}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_tuning_cache_hits(dml_tuning_cache_fixture):
+    n_searches = dml_tuning_cache_fixture['n_searches']
+    cache = dml_tuning_cache_fixture['cache']
+    cache_reloaded = dml_tuning_cache_fixture['cache_reloaded']
+    assert (cache.n_searches, cache.n_hits) == (n_searches, 0)
+    assert (cache_reloaded.n_searches, cache_reloaded.n_hits) == (0, n_searches)
+    assert len(cache) == len(cache_reloaded) == n_searches
+
+
+@pytest.mark.ci
+def test_dml_tuning_cache_results(dml_tuning_cache_fixture):
+    dml_plr_obj = dml_tuning_cache_fixture['dml_plr_obj']
+    dml_plr_obj_cached = dml_tuning_cache_fixture['dml_plr_obj_cached']
+    for learner in ['ml_l', 'ml_m']:
+        assert dml_plr_obj.params[learner] == dml_plr_obj_cached.params[learner]
+
+    tune_res = dml_tuning_cache_fixture['tune_res']
+    tune_res_cached = dml_tuning_cache_fixture['tune_res_cached']
+    for key in ['l_tune', 'm_tune']:
+        for search, search_cached in zip(tune_res[key], tune_res_cached[key]):
+            assert isinstance(search_cached, GridSearchCV)
+            assert search.best_params_ == search_cached.best_params_
+            assert search.best_score_ == search_cached.best_score_
+            assert np.array_equal(search.cv_results_['mean_test_score'], search_cached.cv_results_['mean_test_score'])
+            x = np.ones((2, search.n_features_in_))
+            assert np.allclose(search.predict(x), search_cached.predict(x))
+
+
+@pytest.mark.ci
+def test_dml_tuning_cache_shared():
+    np.random.seed(3141)
+    dml_data = make_irm_data(n_obs=200, dim_x=5)
+    param_grids = {'ml_g': {'alpha': [0.05, 0.1, 0.5]},
+                   'ml_m': {'C': [0.1, 1.0]}}
+    cache = DoubleMLTuningCache()
+    dml_irm_obj = dml.DoubleMLIRM(dml_data, Lasso(), LogisticRegression(), n_folds=2)
+    dml_irm_obj.tune(param_grids, tune_on_folds=True, tuning_cache=cache)
+    assert (cache.n_searches, cache.n_hits) == (6, 0)
+
+    # the outcome regressions and the propensity score of the APO are the same searches as in the IRM
+    dml_apo_obj = dml.DoubleMLAPO(dml_data, Lasso(), LogisticRegression(), treatment_level=1, n_folds=2,
+                                  draw_sample_splitting=False)
+    dml_apo_obj.set_sample_splitting(dml_irm_obj.smpls)
+    dml_apo_obj.tune(param_grids, tune_on_folds=True, tuning_cache=cache)
+    assert (cache.n_searches, cache.n_hits) == (6, 6)
+    for learner in dml_irm_obj.params_names:
+        assert dml_irm_obj.params[learner] == dml_apo_obj.params[learner]
+
+    # a different learner specification is tuned separately
+    dml_irm_obj_2 = dml.DoubleMLIRM(dml_data, Lasso(max_iter=500), LogisticRegression(), n_folds=2,
+                                    draw_sample_splitting=False)
+    dml_irm_obj_2.set_sample_splitting(dml_irm_obj.smpls)
+    dml_irm_obj_2.tune(param_grids, tune_on_folds=True, tuning_cache=cache)
+    assert (cache.n_searches, cache.n_hits) == (10, 8)
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.ci
+def test_dml_tuning_cache_warm_start():
+    param_grids = {'ml_l': {'alpha': np.linspace(0.05, 0.95, 10)},
+                   'ml_m': {'alpha': np.linspace(0.05, 0.95, 10)}}
+    cache = DoubleMLTuningCache(warm_start=True)
+    np.random.seed(3141)
+    dml_plr_obj = dml.DoubleMLPLR(make_plr_CCDDHNR2018(n_obs=200, dim_x=5), Lasso(), Lasso(), n_folds=2)
+    tune_res = dml_plr_obj.tune(param_grids, search_mode='randomized_search', n_iter_randomized_search=4,
+                                return_tune_res=True, tuning_cache=cache)
+    assert tune_res[0]['tune_res']['l_tune'][0].param_distributions == param_grids['ml_l']
+    best_alpha = tune_res[0]['tune_res']['l_tune'][0].best_params_['alpha']
+
+    # new data: the search is repeated with half of the candidates from the region of the latest best candidate
+    dml_plr_obj = dml.DoubleMLPLR(make_plr_CCDDHNR2018(n_obs=200, dim_x=5), Lasso(), Lasso(), n_folds=2)
+    tune_res = dml_plr_obj.tune(param_grids, search_mode='randomized_search', n_iter_randomized_search=4,
+                                return_tune_res=True, tuning_cache=cache)
+    assert cache.n_hits == 0
+    param_distributions = tune_res[0]['tune_res']['l_tune'][0].param_distributions
+    assert len(param_distributions) == 2
+    assert param_distributions[0] == param_grids['ml_l']
+    region = param_distributions[1]['alpha']
+    assert best_alpha in region
+    assert 1 <= len(region) <= 3
+    assert np.all(np.diff(region) > 0)
+
+
+@pytest.mark.ci
+def test_dml_tuning_cache_exceptions():
+    msg = "path must be None or a str. 1 of type <class 'int'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        DoubleMLTuningCache(path=1)
+    msg = 'warm_start must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        DoubleMLTuningCache(warm_start=1)
+
+    np.random.seed(3141)
+    dml_plr_obj = dml.DoubleMLPLR(make_plr_CCDDHNR2018(n_obs=100, dim_x=5), Lasso(), Lasso(), n_folds=2)
+    param_grids = {'ml_l': {'alpha': [0.05, 0.1]}, 'ml_m': {'alpha': [0.05, 0.1]}}
+    msg = "tuning_cache must be a DoubleMLTuningCache or None. 1 of type <class 'int'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_plr_obj.tune(param_grids, tuning_cache=1)
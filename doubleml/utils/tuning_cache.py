@@ -0,0 +1,174 @@
+import os
+
+import joblib
+import numpy as np
+
+
+class DoubleMLTuningCache:
+    """Cache of hyperparameter tuning results.
+
+    If passed as ``tuning_cache`` to ``tune()`` of a DoubleML model, the best hyperparameters and the cross-validation
+    results of each search are stored. A search is identified by the learner (class and parameters), the parameter grid,
+    the scoring method, the search mode and its settings as well as a fingerprint of the features and the target on the
+    training indices of the fold. If the same search is requested again (e.g. in a later run on unchanged data or by
+    another model or learner with the same target and subsample), only the best candidate is refitted. Since the
+    learner names are not part of the identification, the results are shared between learners, e.g., the outcome
+    regressions of :class:`doubleml.DoubleMLIRM` and :class:`doubleml.DoubleMLAPO`.
+
+    Parameters
+    ----------
+    path : None or str
+        The directory where the results are stored persistently. If ``None`` the results are only kept in memory.
+        Default is ``None``.
+
+    warm_start : bool
+        Indicates whether randomized searches (``search_mode='randomized_search'`` or
+        ``'halving_randomized_search'``) which are not cached are warm started. In this case, half of the candidates
+        are sampled from the region of the best candidate of the latest search with the same specification (i.e., the
+        neighbouring values in the list of values of each parameter).
+        Default is ``False``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import doubleml as dml
+    >>> from doubleml.datasets import make_plr_CCDDHNR2018
+    >>> from doubleml.utils import DoubleMLTuningCache
+    >>> from sklearn.linear_model import Lasso
+    >>> np.random.seed(3141)
+    >>> obj_dml_data = make_plr_CCDDHNR2018(n_obs=200)
+    >>> cache = DoubleMLTuningCache()
+    >>> param_grids = {'ml_l': {'alpha': [0.05, 0.1, 0.5]}, 'ml_m': {'alpha': [0.05, 0.1, 0.5]}}
+    >>> dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso())
+    >>> dml_plr_obj = dml_plr_obj.tune(param_grids, tuning_cache=cache)
+    >>> dml_plr_obj = dml_plr_obj.tune(param_grids, tuning_cache=cache)
+    >>> cache.n_searches, cache.n_hits
+    (2, 2)
+    """
+
+    def __init__(self, path=None, warm_start=False):
+        if (path is not None) and (not isinstance(path, (str, os.PathLike))):
+            raise TypeError('path must be None or a str. '
+                            f'{str(path)} of type {str(type(path))} was passed.')
+        if not isinstance(warm_start, bool):
+            raise TypeError('warm_start must be True or False. '
+                            f'Got {str(warm_start)}.')
+        if path is None:
+            self._path = None
+        else:
+            self._path = os.fspath(path)
+            os.makedirs(self._path, exist_ok=True)
+        self._warm_start = warm_start
+        self._entries = dict()
+        self._n_searches = 0
+        self._n_hits = 0
+
+    def __len__(self):
+        keys = set(self._entries.keys())
+        if self._path is not None:
+            keys.update(file[:-len('.joblib')] for file in os.listdir(self._path) if file.endswith('.joblib'))
+        # the latest best parameters per search specification are no search results
+        return len([key for key in keys if not key.startswith('spec_')])
+
+    @property
+    def path(self):
+        """
+        The directory where the results are stored (``None`` if the results are only kept in memory).
+        """
+        return self._path
+
+    @property
+    def warm_start(self):
+        """
+        Indicates whether randomized searches are warm started.
+        """
+        return self._warm_start
+
+    @property
+    def n_searches(self):
+        """
+        The number of searches which have been added to the cache.
+        """
+        return self._n_searches
+
+    @property
+    def n_hits(self):
+        """
+        The number of searches which have been served from the cache.
+        """
+        return self._n_hits
+
+    def clear(self):
+        """
+        Remove all cached tuning results (including the files in ``path``).
+        """
+        self._entries = dict()
+        if self._path is not None:
+            for file in os.listdir(self._path):
+                if file.endswith('.joblib'):
+                    os.remove(os.path.join(self._path, file))
+        return self
+
+    @staticmethod
+    def _spec_key(learner, param_grid, scoring_method, n_folds_tune, search_mode, n_iter_randomized_search,
+                  halving_params):
+        if search_mode not in ['randomized_search', 'halving_randomized_search']:
+            n_iter_randomized_search = None
+        return joblib.hash((type(learner).__module__, type(learner).__name__, learner.get_params(deep=True),
+                            param_grid, scoring_method, n_folds_tune, search_mode, n_iter_randomized_search,
+                            halving_params))
+
+    @staticmethod
+    def _key(spec_key, x, y, train_index):
+        # the target is compared as float such that e.g. boolean treatment indicators match binary treatments
+        return joblib.hash((spec_key, x[train_index, :], np.asarray(y[train_index], dtype=np.float64)))
+
+    def _file(self, key):
+        return os.path.join(self._path, key + '.joblib')
+
+    def _load(self, key):
+        if key in self._entries:
+            return self._entries[key]
+        if (self._path is None) or (not os.path.exists(self._file(key))):
+            return None
+        entry = joblib.load(self._file(key))
+        self._entries[key] = entry
+        return entry
+
+    def _save(self, key, entry):
+        self._entries[key] = entry
+        if self._path is not None:
+            joblib.dump(entry, self._file(key))
+
+    def _get(self, key):
+        entry = self._load(key)
+        if entry is not None:
+            self._n_hits += 1
+        return entry
+
+    def _set(self, key, spec_key, search):
+        self._n_searches += 1
+        self._save(key, {'best_params': search.best_params_,
+                         'best_index': search.best_index_,
+                         'cv_results': search.cv_results_,
+                         'n_splits': search.n_splits_})
+        self._save('spec_' + spec_key, {'best_params': search.best_params_})
+
+    def _warm_start_param_grid(self, spec_key, param_grid, search_mode):
+        if (not self._warm_start) | (search_mode not in ['randomized_search', 'halving_randomized_search']) \
+                | (not isinstance(param_grid, dict)):
+            return param_grid
+        latest = self._load('spec_' + spec_key)
+        if latest is None:
+            return param_grid
+
+        # the region of the latest best candidate consists of the neighbouring values of each parameter
+        region = dict()
+        for name, values in param_grid.items():
+            best_positions = [] if hasattr(values, 'rvs') or (name not in latest['best_params']) else \
+                [i_value for i_value, value in enumerate(values) if value == latest['best_params'][name]]
+            if len(best_positions) == 0:
+                region[name] = values
+            else:
+                region[name] = list(values)[max(best_positions[0] - 1, 0):best_positions[0] + 2]
+        return [param_grid, region]
@@ -29,6 +29,7 @@ setup(
         'scikit-learn',
         'statsmodels',
         'plotly',
+        'threadpoolctl',
     ],
     python_requires=">=3.9",
     classifiers=[